@@ -0,0 +1,81 @@
+#!/bin/bash
+
+# Run the offline micro-benchmarks in tests/benchmarks
+# Saves baselines and fails when results regress past a threshold
+
+# Default settings
+MODE="compare"   # Can be "compare", "save" or "run"
+STORAGE="tests/benchmarks/baselines"
+THRESHOLD="${BENCHMARK_THRESHOLD:-mean:15%}"
+FILTER=""        # Benchmark filter using pytest's -k option
+
+# Parse command line arguments
+while [[ $# -gt 0 ]]; do
+  case $1 in
+    --save)
+      MODE="save"
+      shift
+      ;;
+    --compare)
+      MODE="compare"
+      shift
+      ;;
+    --run)
+      MODE="run"
+      shift
+      ;;
+    --threshold)
+      THRESHOLD="$2"
+      shift
+      shift
+      ;;
+    -k)
+      FILTER="$2"
+      shift
+      shift
+      ;;
+    --help)
+      echo "Usage: $0 [options]"
+      echo "Options:"
+      echo "  --compare              Compare against the latest saved baseline (default)"
+      echo "  --save                 Run and save the results as the new baseline"
+      echo "  --run                  Run without saving or comparing"
+      echo "  --threshold EXPR       Regression that fails the comparison (default: mean:15%,"
+      echo "                         or \$BENCHMARK_THRESHOLD)"
+      echo "  -k \"PATTERN\"         Only run benchmarks matching the given pattern"
+      echo "  --help                 Show this help message"
+      exit 0
+      ;;
+    *)
+      echo "Unknown option: $1"
+      echo "Use --help for usage information"
+      exit 1
+      ;;
+  esac
+done
+
+ARGS=(
+  tests/benchmarks
+  --benchmark-only
+  --benchmark-storage="file://$STORAGE"
+  --benchmark-sort=name
+  --benchmark-columns=min,mean,median,stddev,rounds
+)
+if [[ -n "$FILTER" ]]; then
+  ARGS+=(-k "$FILTER")
+fi
+
+case $MODE in
+  "save")
+    ARGS+=(--benchmark-autosave)
+    ;;
+  "compare")
+    if compgen -G "$STORAGE/*/*.json" > /dev/null; then
+      ARGS+=(--benchmark-compare "--benchmark-compare-fail=$THRESHOLD")
+    else
+      echo "No baseline found in $STORAGE; run with --save first. Running without comparison."
+    fi
+    ;;
+esac
+
+uv run --with pytest-benchmark pytest "${ARGS[@]}"
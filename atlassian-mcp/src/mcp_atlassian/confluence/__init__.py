@@ -1,28 +1,35 @@
 """Confluence API integration module.
 
 This module provides access to Confluence content through the Model Context Protocol.
+
+Only the configuration is imported with the package. The client classes pull
+in the atlassian client, the markup converters and every model, so they are
+imported on first access to keep server start-up fast.
 """
 
-from .client import ConfluenceClient
-from .comments import CommentsMixin
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .config import ConfluenceConfig
-from .labels import LabelsMixin
-from .pages import PagesMixin
-from .search import SearchMixin
-from .spaces import SpacesMixin
-from .users import UsersMixin
 
+if TYPE_CHECKING:
+    from .client import ConfluenceClient
+    from .fetcher import ConfluenceFetcher
 
-class ConfluenceFetcher(
-    SearchMixin, SpacesMixin, PagesMixin, CommentsMixin, LabelsMixin, UsersMixin
-):
-    """Main entry point for Confluence operations, providing backward compatibility.
+_LAZY_IMPORTS = {
+    "ConfluenceClient": ".client",
+    "ConfluenceFetcher": ".fetcher",
+}
 
-    This class combines functionality from various mixins to maintain the same
-    API as the original ConfluenceFetcher class.
-    """
 
-    pass
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = ["ConfluenceFetcher", "ConfluenceConfig", "ConfluenceClient"]
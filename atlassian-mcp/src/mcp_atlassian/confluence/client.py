@@ -7,8 +7,11 @@ from atlassian import Confluence
 from requests import Session
 
 from ..exceptions import MCPAtlassianAuthenticationError
+from ..utils.coalesce import configure_request_coalescing
+from ..utils.http import configure_connection_pool, configure_request_metrics
 from ..utils.logging import get_masked_session_headers, log_config_param, mask_sensitive
 from ..utils.oauth import configure_oauth_session
+from ..utils.rate_limit import configure_rate_limiting
 from ..utils.ssl import configure_ssl_verification
 from .config import ConfluenceConfig
 
@@ -32,6 +35,9 @@ class ConfluenceClient:
         """
         self.config = config or ConfluenceConfig.from_env()
 
+        # Base URL the API calls go to (OAuth goes through the Atlassian gateway)
+        api_url = self.config.url
+
         # Initialize the Confluence client based on auth type
         if self.config.auth_type == "oauth":
             if not self.config.oauth_config or not self.config.oauth_config.cloud_id:
@@ -96,6 +102,35 @@ class ConfluenceClient:
             ssl_verify=self.config.ssl_verify,
         )
 
+        # Record per-endpoint request counts and latencies
+        configure_request_metrics(
+            service_name="Confluence", session=self.confluence._session
+        )
+
+        # Share pooled connections for the site across client instances
+        configure_connection_pool(
+            service_name="Confluence",
+            url=api_url,
+            session=self.confluence._session,
+            settings=self.config.connection_pool_settings,
+        )
+
+        # Pace requests and retry throttled calls. Must run after SSL setup so
+        # the rate-limit adapter wraps the adapter mounted for the site.
+        configure_rate_limiting(
+            service_name="Confluence",
+            url=api_url,
+            session=self.confluence._session,
+            settings=self.config.rate_limit_settings,
+        )
+
+        # Collapse identical concurrent GETs (outermost, so followers skip
+        # rate limiting and never open a connection)
+        if self.config.request_coalescing:
+            configure_request_coalescing(
+                service_name="Confluence", url=api_url, session=self.confluence._session
+            )
+
         # Proxy configuration
         proxies = {}
         if self.config.http_proxy:
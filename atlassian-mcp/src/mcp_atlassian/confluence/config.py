@@ -5,12 +5,20 @@ import os
 from dataclasses import dataclass
 from typing import Literal
 
-from ..utils.env import get_custom_headers, is_env_ssl_verify
+from ..utils.env import (
+    get_custom_headers,
+    get_env_float,
+    get_env_int,
+    is_env_ssl_verify,
+    is_env_truthy,
+)
+from ..utils.http import ConnectionPoolSettings
 from ..utils.oauth import (
     BYOAccessTokenOAuthConfig,
     OAuthConfig,
     get_oauth_config_from_env,
 )
+from ..utils.rate_limit import RateLimitSettings
 from ..utils.urls import is_atlassian_cloud_url
 
 
@@ -36,6 +44,23 @@ class ConfluenceConfig:
     no_proxy: str | None = None  # Comma-separated list of hosts to bypass proxy
     socks_proxy: str | None = None  # SOCKS proxy URL (optional)
     custom_headers: dict[str, str] | None = None  # Custom HTTP headers
+    rate_limit_rps: float | None = None  # Client-side request rate (None = unlimited)
+    rate_limit_burst: int = 10  # Requests allowed in a burst above the rate
+    max_retries: int = 3  # Retries for throttled or failed idempotent requests
+    circuit_breaker_threshold: int = 5  # Consecutive failures before failing fast
+    circuit_breaker_reset_seconds: float = 30.0  # Wait before probing the site again
+    http_pool_connections: int = 10  # Host pools cached per connection adapter
+    http_pool_maxsize: int = 20  # Connections kept open per host
+    http_pool_block: bool = False  # Wait for a free connection when the pool is full
+    http_keep_alive: bool = True  # Reuse connections between requests
+    http_connect_timeout: float | None = None  # Connect timeout in seconds
+    http_read_timeout: float | None = None  # Read timeout in seconds
+    request_coalescing: bool = True  # Share responses of identical in-flight GETs
+    page_cache: bool = True  # Reuse converted page content while the version matches
+    page_cache_ttl: float = (
+        0.0  # Seconds cached pages are served without a version check
+    )
+    export_dir: str | None = None  # Root directory space exports may write under
 
     @property
     def is_cloud(self) -> bool:
@@ -66,6 +91,37 @@ class ConfluenceConfig:
         """
         return self.ssl_verify
 
+    @property
+    def connection_pool_settings(self) -> ConnectionPoolSettings:
+        """Connection pool and timeout settings for the HTTP session.
+
+        Returns:
+            ConnectionPoolSettings built from this configuration
+        """
+        return ConnectionPoolSettings(
+            pool_connections=self.http_pool_connections,
+            pool_maxsize=self.http_pool_maxsize,
+            pool_block=self.http_pool_block,
+            keep_alive=self.http_keep_alive,
+            connect_timeout=self.http_connect_timeout,
+            read_timeout=self.http_read_timeout,
+        )
+
+    @property
+    def rate_limit_settings(self) -> RateLimitSettings:
+        """Rate limiting and retry settings for the HTTP session.
+
+        Returns:
+            RateLimitSettings built from this configuration
+        """
+        return RateLimitSettings(
+            requests_per_second=self.rate_limit_rps,
+            burst=self.rate_limit_burst,
+            max_retries=self.max_retries,
+            circuit_failure_threshold=self.circuit_breaker_threshold,
+            circuit_reset_timeout=self.circuit_breaker_reset_seconds,
+        )
+
     @classmethod
     def from_env(cls) -> "ConfluenceConfig":
         """Create configuration from environment variables.
@@ -127,6 +183,41 @@ class ConfluenceConfig:
         # Custom headers - service-specific only
         custom_headers = get_custom_headers("CONFLUENCE_CUSTOM_HEADERS")
 
+        # Connection pooling and timeouts
+        http_pool_connections = get_env_int(
+            "CONFLUENCE_HTTP_POOL_CONNECTIONS", 10, minimum=1
+        )
+        http_pool_maxsize = get_env_int("CONFLUENCE_HTTP_POOL_MAXSIZE", 20, minimum=1)
+        http_pool_block = is_env_truthy("CONFLUENCE_HTTP_POOL_BLOCK")
+        http_keep_alive = is_env_truthy("CONFLUENCE_HTTP_KEEP_ALIVE", "true")
+        http_connect_timeout = get_env_float(
+            "CONFLUENCE_HTTP_CONNECT_TIMEOUT", None, minimum=0.1
+        )
+        http_read_timeout = get_env_float(
+            "CONFLUENCE_HTTP_READ_TIMEOUT", None, minimum=0.1
+        )
+
+        # Share identical concurrent GETs between callers with the same credentials
+        request_coalescing = is_env_truthy("CONFLUENCE_REQUEST_COALESCING", "true")
+
+        # Converted page content cache, revalidated by page version
+        page_cache = is_env_truthy("CONFLUENCE_PAGE_CACHE", "true")
+        page_cache_ttl = get_env_float("CONFLUENCE_PAGE_CACHE_TTL", 0.0, minimum=0.0)
+
+        # Space exports are only written below this directory (unset disables them)
+        export_dir = os.getenv("CONFLUENCE_EXPORT_DIR") or None
+
+        # Rate limiting and retries
+        rate_limit_rps = get_env_float("CONFLUENCE_RATE_LIMIT_RPS", None, minimum=0.1)
+        rate_limit_burst = get_env_int("CONFLUENCE_RATE_LIMIT_BURST", 10, minimum=1)
+        max_retries = get_env_int("CONFLUENCE_MAX_RETRIES", 3, minimum=0)
+        circuit_breaker_threshold = get_env_int(
+            "CONFLUENCE_CIRCUIT_BREAKER_THRESHOLD", 5, minimum=1
+        )
+        circuit_breaker_reset_seconds = get_env_float(
+            "CONFLUENCE_CIRCUIT_BREAKER_RESET_SECONDS", 30.0, minimum=1.0
+        )
+
         return cls(
             url=url,
             auth_type=auth_type,
@@ -141,6 +232,21 @@ class ConfluenceConfig:
             no_proxy=no_proxy,
             socks_proxy=socks_proxy,
             custom_headers=custom_headers,
+            rate_limit_rps=rate_limit_rps,
+            rate_limit_burst=rate_limit_burst,
+            max_retries=max_retries,
+            circuit_breaker_threshold=circuit_breaker_threshold,
+            circuit_breaker_reset_seconds=circuit_breaker_reset_seconds,
+            http_pool_connections=http_pool_connections,
+            http_pool_maxsize=http_pool_maxsize,
+            http_pool_block=http_pool_block,
+            http_keep_alive=http_keep_alive,
+            http_connect_timeout=http_connect_timeout,
+            http_read_timeout=http_read_timeout,
+            request_coalescing=request_coalescing,
+            page_cache=page_cache,
+            page_cache_ttl=page_cache_ttl,
+            export_dir=export_dir,
         )
 
     def is_auth_configured(self) -> bool:
@@ -0,0 +1,271 @@
+"""Module for exporting Confluence spaces to local Markdown files."""
+
+import json
+import logging
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from ..models.confluence import ConfluencePage
+from ..utils.concurrency import map_concurrently
+from .client import ConfluenceClient
+
+logger = logging.getLogger("mcp-atlassian")
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = 1
+
+# Page listing size and parallel page reads during an export
+EXPORT_LIST_PAGE_SIZE = 100
+EXPORT_FETCH_CONCURRENCY = 8
+EXPORT_PAGE_EXPAND = "body.storage,version,ancestors"
+
+
+def _slugify(title: str) -> str:
+    """Return a file-name friendly form of a page title."""
+    slug = re.sub(r"[^\w-]+", "-", title, flags=re.UNICODE).strip("-").lower()
+    return slug[:80] or "page"
+
+
+def _front_matter(entry: dict[str, Any]) -> str:
+    """Return YAML front matter describing an exported page.
+
+    Values are written as JSON scalars, which are valid YAML.
+    """
+    fields = {
+        "title": entry["title"],
+        "confluence_id": entry["id"],
+        "version": entry["version"]["number"],
+        "url": entry.get("url"),
+    }
+    lines = [
+        f"{key}: {json.dumps(value, ensure_ascii=False)}"
+        for key, value in fields.items()
+    ]
+    return "---\n" + "\n".join(lines) + "\n---\n\n"
+
+
+class ExportMixin(ConfluenceClient):
+    """Mixin for exporting Confluence spaces."""
+
+    def export_space(
+        self, space_key: str, target_dir: str, *, force: bool = False
+    ) -> dict[str, Any]:
+        """
+        Export the pages of a space as Markdown files with a manifest.
+
+        Every page is written to ``<slug>-<page id>.md`` in ``target_dir`` as
+        soon as it is converted. ``target_dir`` is resolved against the
+        configured ``export_dir`` and must stay inside it. ``manifest.json`` records the version of each
+        exported page, so later exports into the same directory only download
+        and convert pages whose ``version.number`` changed, and remove the
+        files of pages that no longer exist. Pages that fail to export keep
+        their previous manifest entry and are retried on the next run.
+
+        Args:
+            space_key: The key of the space to export
+            target_dir: The directory to write the Markdown files and manifest
+                to, relative to ``export_dir`` unless absolute
+            force: Re-export every page regardless of the manifest (keyword-only)
+
+        Returns:
+            Dictionary with the export counts and the pages that failed
+
+        Raises:
+            ValueError: If exports are not configured, ``target_dir`` lies
+                outside ``export_dir``, or it holds a manifest that is not an
+                export of this space
+        """
+        target_path = self._resolve_export_dir(target_dir)
+        target_dir = str(target_path)
+        target_path.mkdir(parents=True, exist_ok=True)
+
+        manifest_path = target_path / MANIFEST_NAME
+        previous = self._read_manifest(manifest_path, space_key)
+
+        pages = self._list_space_pages(space_key)
+        logger.info(f"Exporting space {space_key}: {len(pages)} pages listed")
+
+        entries: dict[str, dict[str, Any]] = {}
+        changed = []
+        for page in pages:
+            page_id = str(page.get("id"))
+            version = page.get("version", {}).get("number")
+            old = previous.get(page_id)
+            if (
+                not force
+                and old is not None
+                and old.get("version", {}).get("number") == version
+                and (target_path / old["path"]).is_file()
+            ):
+                entries[page_id] = old
+            else:
+                changed.append(page_id)
+
+        def export_page(page_id: str) -> dict[str, Any] | Exception:
+            try:
+                return self._export_page(page_id, space_key, target_path)
+            except Exception as e:  # noqa: BLE001 - reported per page
+                logger.warning(f"Failed to export page {page_id}: {e}")
+                return e
+
+        results = map_concurrently(
+            export_page,
+            changed,
+            max_workers=EXPORT_FETCH_CONCURRENCY,
+            thread_name_prefix="confluence-export",
+        )
+
+        failed = []
+        for page_id, result in zip(changed, results, strict=True):
+            old = previous.get(page_id)
+            if isinstance(result, Exception):
+                failed.append({"id": page_id, "error": str(result)})
+                if old is not None:
+                    entries[page_id] = old
+                continue
+            if old is not None and old["path"] != result["path"]:
+                (target_path / old["path"]).unlink(missing_ok=True)
+            entries[page_id] = result
+
+        removed = [page_id for page_id in previous if page_id not in entries]
+        for page_id in removed:
+            (target_path / previous[page_id]["path"]).unlink(missing_ok=True)
+
+        self._write_manifest(manifest_path, space_key, entries)
+
+        return {
+            "success": not failed,
+            "space_key": space_key,
+            "target_dir": target_dir,
+            "manifest": str(manifest_path),
+            "total": len(pages),
+            "exported": len(changed) - len(failed),
+            "unchanged": len(pages) - len(changed),
+            "removed": len(removed),
+            "failed": failed,
+        }
+
+    def _resolve_export_dir(self, target_dir: str) -> Path:
+        """Return the absolute export directory, refusing paths outside the root."""
+        if not self.config.export_dir:
+            msg = "Space export is disabled; set CONFLUENCE_EXPORT_DIR to enable it"
+            raise ValueError(msg)
+        root = Path(self.config.export_dir).resolve()
+        target_path = (root / target_dir).resolve()
+        if target_path != root and root not in target_path.parents:
+            msg = f"target_dir must be inside the export directory {root}"
+            raise ValueError(msg)
+        return target_path
+
+    def _list_space_pages(self, space_key: str) -> list[dict[str, Any]]:
+        """Return the ID, title and version of every current page in a space."""
+        pages: list[dict[str, Any]] = []
+        while True:
+            batch = self.confluence.get_all_pages_from_space(
+                space=space_key,
+                start=len(pages),
+                limit=EXPORT_LIST_PAGE_SIZE,
+                status="current",
+                expand="version",
+            )
+            pages.extend(batch or [])
+            if len(batch or []) < EXPORT_LIST_PAGE_SIZE:
+                return pages
+
+    def _export_page(
+        self, page_id: str, space_key: str, target_path: Path
+    ) -> dict[str, Any]:
+        """Download, convert and write one page.
+
+        Returns:
+            The manifest entry of the written page
+        """
+        page = self.confluence.get_page_by_id(
+            page_id=page_id, expand=EXPORT_PAGE_EXPAND
+        )
+        page.setdefault("space", {"key": space_key})
+        _, markdown = self.preprocessor.process_html_content(
+            page.get("body", {}).get("storage", {}).get("value", ""),
+            space_key=space_key,
+            confluence_client=self.confluence,
+        )
+        model = ConfluencePage.from_api_response(
+            page,
+            base_url=self.config.url,
+            include_body=False,
+            is_cloud=self.config.is_cloud,
+        )
+        ancestors = page.get("ancestors") or []
+        entry = {
+            "id": model.id,
+            "title": model.title,
+            "path": f"{_slugify(model.title)}-{model.id}.md",
+            "version": {
+                "number": model.version.number if model.version else None,
+                "when": model.version.when if model.version else None,
+            },
+            "parent_id": str(ancestors[-1].get("id")) if ancestors else None,
+            "url": model.url,
+        }
+        (target_path / entry["path"]).write_text(
+            _front_matter(entry) + markdown.strip() + "\n", encoding="utf-8"
+        )
+        return entry
+
+    @staticmethod
+    def _read_manifest(path: Path, space_key: str) -> dict[str, dict[str, Any]]:
+        """Return the page entries of an existing manifest, keyed by page ID.
+
+        Raises:
+            ValueError: If ``path`` exists but is not a manifest written by this
+                exporter for ``space_key``, so it is never overwritten
+        """
+        if not path.exists():
+            return {}
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            msg = f"Refusing to overwrite unreadable {path}: {e}"
+            raise ValueError(msg) from e
+        pages = manifest.get("pages") if isinstance(manifest, dict) else None
+        if (
+            not isinstance(pages, list)
+            or manifest.get("format") != MANIFEST_FORMAT
+            or not all(isinstance(entry, dict) and "id" in entry for entry in pages)
+        ):
+            msg = f"Refusing to overwrite {path}, which is not an export manifest"
+            raise ValueError(msg)
+        if manifest.get("space_key") != space_key:
+            msg = (
+                f"{path.parent} holds an export of space "
+                f"{manifest.get('space_key')}, not {space_key}"
+            )
+            raise ValueError(msg)
+        # Only plain file names are ever written, so anything else is not ours
+        return {
+            str(entry["id"]): entry
+            for entry in pages
+            if isinstance(entry.get("path"), str)
+            and entry["path"] == Path(entry["path"]).name
+            and not entry["path"].startswith(".")
+        }
+
+    @staticmethod
+    def _write_manifest(
+        path: Path, space_key: str, entries: dict[str, dict[str, Any]]
+    ) -> None:
+        """Write the manifest next to the exported files, replacing it atomically."""
+        manifest = {
+            "format": MANIFEST_FORMAT,
+            "space_key": space_key,
+            "exported_at": datetime.now(timezone.utc).isoformat(),
+            "pages": sorted(entries.values(), key=lambda entry: entry["path"]),
+        }
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(
+            json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+        os.replace(tmp_path, path)
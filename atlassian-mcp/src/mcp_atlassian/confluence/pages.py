@@ -1,17 +1,58 @@
 """Module for Confluence page operations."""
 
+import copy
 import logging
+import time
+from dataclasses import dataclass
+from typing import Any
 
 import requests
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.confluence import ConfluencePage
+from ..utils.cache import (
+    confluence_page_tag,
+    credential_scope,
+    get_cache,
+    invalidate_tags,
+)
+from ..utils.concurrency import map_concurrently
+from ..utils.metrics import counter
 from .client import ConfluenceClient
+from .utils import next_search_position
 from .v2_adapter import ConfluenceV2Adapter
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Converted pages are kept this long; each reuse is revalidated by version
+PAGE_CONTENT_RETENTION = 6 * 60 * 60
+PAGE_CONTENT_MAXSIZE = 512
+PAGE_EXPAND = "body.storage,version,space,children.attachment"
+
+# Page tree walks: parallel child listings per level and request page sizes
+TREE_FETCH_CONCURRENCY = 8
+TREE_CHILDREN_PAGE_SIZE = 200
+TREE_SEARCH_PAGE_SIZE = 100
+
+PAGE_CONTENT_FETCHES = counter(
+    "confluence_page_content_fetches_total",
+    "Page content loads from Confluence by result ('full' downloaded and "
+    "converted the body, 'not_modified' reused the cached conversion after a "
+    "version check).",
+    ("result",),
+)
+
+
+@dataclass(frozen=True)
+class _PageContentEntry:
+    """Converted page content with the version it was converted from."""
+
+    version: int
+    page: dict[str, Any]  # Page metadata without the body
+    content: str
+    validated_at: float
+
 
 class PagesMixin(ConfluenceClient):
     """Mixin for Confluence page operations."""
@@ -48,33 +89,7 @@ class PagesMixin(ConfluenceClient):
             Exception: If there is an error retrieving the page
         """
         try:
-            # Use v2 API for OAuth authentication, v1 API for token/basic auth
-            v2_adapter = self._v2_adapter
-            if v2_adapter:
-                logger.debug(
-                    f"Using v2 API for OAuth authentication to get page '{page_id}'"
-                )
-                page = v2_adapter.get_page(
-                    page_id=page_id,
-                    expand="body.storage,version,space,children.attachment",
-                )
-            else:
-                logger.debug(
-                    f"Using v1 API for token/basic authentication to get page '{page_id}'"
-                )
-                page = self.confluence.get_page_by_id(
-                    page_id=page_id,
-                    expand="body.storage,version,space,children.attachment",
-                )
-
-            space_key = page.get("space", {}).get("key", "")
-            content = page["body"]["storage"]["value"]
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key, confluence_client=self.confluence
-            )
-
-            # Use the appropriate content format based on the convert_to_markdown flag
-            page_content = processed_markdown if convert_to_markdown else processed_html
+            page, page_content = self._load_page_content(page_id, convert_to_markdown)
 
             # Create and return the ConfluencePage model
             return ConfluencePage.from_api_response(
@@ -106,6 +121,104 @@ class PagesMixin(ConfluenceClient):
             )
             raise Exception(f"Error retrieving page content: {str(e)}") from e
 
+    def _fetch_page_content(
+        self, page_id: str, convert_to_markdown: bool
+    ) -> tuple[dict[str, Any], str]:
+        """Download a page with its body and convert the body.
+
+        Args:
+            page_id: The ID of the page to retrieve
+            convert_to_markdown: Convert to markdown instead of cleaned HTML
+
+        Returns:
+            The page data and its converted content
+        """
+        # Use v2 API for OAuth authentication, v1 API for token/basic auth
+        v2_adapter = self._v2_adapter
+        if v2_adapter:
+            logger.debug(
+                f"Using v2 API for OAuth authentication to get page '{page_id}'"
+            )
+            page = v2_adapter.get_page(page_id=page_id, expand=PAGE_EXPAND)
+        else:
+            logger.debug(
+                f"Using v1 API for token/basic authentication to get page '{page_id}'"
+            )
+            page = self.confluence.get_page_by_id(page_id=page_id, expand=PAGE_EXPAND)
+
+        space_key = page.get("space", {}).get("key", "")
+        content = page["body"]["storage"]["value"]
+        processed_html, processed_markdown = self.preprocessor.process_html_content(
+            content, space_key=space_key, confluence_client=self.confluence
+        )
+
+        # Use the appropriate content format based on the convert_to_markdown flag
+        return page, processed_markdown if convert_to_markdown else processed_html
+
+    def _get_page_version(self, page_id: str) -> int | None:
+        """Return the current version number of a page without its body."""
+        v2_adapter = self._v2_adapter
+        if v2_adapter:
+            return v2_adapter.get_page_version(page_id)
+        page = self.confluence.get_page_by_id(page_id=page_id, expand="version")
+        return (page or {}).get("version", {}).get("number")
+
+    def _load_page_content(
+        self, page_id: str, convert_to_markdown: bool
+    ) -> tuple[dict[str, Any], str]:
+        """Return page data and converted content, reusing cached conversions.
+
+        Converted content is cached per credentials, page and conversion
+        option together with the page version it came from. Entries younger
+        than ``page_cache_ttl`` are served directly; older ones are reused
+        only if a version-only request shows the page unchanged, which skips
+        both the body download and the HTML conversion. Webhooks and writes
+        drop entries through the page's cache tag.
+
+        Args:
+            page_id: The ID of the page to retrieve
+            convert_to_markdown: Convert to markdown instead of cleaned HTML
+
+        Returns:
+            The page data and its converted content
+        """
+        if not self.config.page_cache:
+            return self._fetch_page_content(page_id, convert_to_markdown)
+
+        cache = get_cache(
+            "confluence-page-content",
+            maxsize=PAGE_CONTENT_MAXSIZE,
+            ttl=PAGE_CONTENT_RETENTION,
+        )
+        cache_key = (credential_scope(self.config), page_id, convert_to_markdown)
+        tags = [confluence_page_tag(page_id)]
+        entry: _PageContentEntry | None = cache.get(cache_key)
+        now = time.monotonic()
+        if entry is not None:
+            ttl = self.config.page_cache_ttl
+            if ttl and now - entry.validated_at < ttl:
+                return copy.deepcopy(entry.page), entry.content
+            if self._get_page_version(page_id) == entry.version:
+                PAGE_CONTENT_FETCHES.inc(result="not_modified")
+                cache.set(
+                    cache_key,
+                    _PageContentEntry(entry.version, entry.page, entry.content, now),
+                    tags,
+                )
+                return copy.deepcopy(entry.page), entry.content
+
+        PAGE_CONTENT_FETCHES.inc(result="full")
+        page, content = self._fetch_page_content(page_id, convert_to_markdown)
+        version = page.get("version", {}).get("number")
+        if version is not None:
+            metadata = {key: value for key, value in page.items() if key != "body"}
+            cache.set(
+                cache_key,
+                _PageContentEntry(version, copy.deepcopy(metadata), content, now),
+                tags,
+            )
+        return page, content
+
     def get_page_ancestors(self, page_id: str) -> list[ConfluencePage]:
         """
         Get ancestors (parent pages) of a specific page.
@@ -284,6 +397,7 @@ class PagesMixin(ConfluenceClient):
         is_markdown: bool = True,
         enable_heading_anchors: bool = False,
         content_representation: str | None = None,
+        return_content: bool = True,
     ) -> ConfluencePage:
         """
         Create a new page in a Confluence space.
@@ -296,6 +410,8 @@ class PagesMixin(ConfluenceClient):
             is_markdown: Whether the body content is in markdown format (default: True, keyword-only)
             enable_heading_anchors: Whether to enable automatic heading anchor generation (default: False, keyword-only)
             content_representation: Content format when is_markdown=False ('wiki' or 'storage', keyword-only)
+            return_content: Whether to include the page content in the result; when False
+                only the ID, title, version and URL are filled in (keyword-only)
 
         Returns:
             ConfluencePage model containing the new page's data
@@ -341,12 +457,19 @@ class PagesMixin(ConfluenceClient):
                     representation=representation,
                 )
 
-            # Get the new page content
+            # Build the new page from the create response
             page_id = result.get("id")
             if not page_id:
                 raise ValueError("Create page response did not contain an ID")
 
-            return self.get_page_content(page_id)
+            return self._page_from_write_response(
+                result,
+                body,
+                final_body,
+                is_markdown=is_markdown,
+                representation=representation,
+                return_content=return_content,
+            )
         except Exception as e:
             logger.error(
                 f"Error creating page '{title}' in space {space_key}: {str(e)}"
@@ -367,6 +490,7 @@ class PagesMixin(ConfluenceClient):
         parent_id: str | None = None,
         enable_heading_anchors: bool = False,
         content_representation: str | None = None,
+        return_content: bool = True,
     ) -> ConfluencePage:
         """
         Update an existing page in Confluence.
@@ -381,6 +505,8 @@ class PagesMixin(ConfluenceClient):
             parent_id: Optional new parent page ID (keyword-only)
             enable_heading_anchors: Whether to enable automatic heading anchor generation (default: False, keyword-only)
             content_representation: Content format when is_markdown=False ('wiki' or 'storage', keyword-only)
+            return_content: Whether to include the page content in the result; when False
+                only the ID, title, version and URL are filled in (keyword-only)
 
         Returns:
             ConfluencePage model containing the updated page's data
@@ -433,14 +559,83 @@ class PagesMixin(ConfluenceClient):
                 if parent_id:
                     update_kwargs["parent_id"] = parent_id
 
-                self.confluence.update_page(**update_kwargs)
-
-            # After update, refresh the page data
-            return self.get_page_content(page_id)
+                response = self.confluence.update_page(**update_kwargs)
+
+            invalidate_tags([confluence_page_tag(page_id)])
+            if not isinstance(response, dict) or not response.get("id"):
+                # Nothing usable came back, so read the page again
+                return self.get_page_content(page_id)
+            return self._page_from_write_response(
+                response,
+                body,
+                final_body,
+                is_markdown=is_markdown,
+                representation=representation,
+                return_content=return_content,
+            )
         except Exception as e:
             logger.error(f"Error updating page {page_id}: {str(e)}")
             raise Exception(f"Failed to update page {page_id}: {str(e)}") from e
 
+    def _page_from_write_response(
+        self,
+        response: dict[str, Any],
+        body: str,
+        final_body: str,
+        *,
+        is_markdown: bool,
+        representation: str,
+        return_content: bool,
+    ) -> ConfluencePage:
+        """Build the result of a create or update from the write response.
+
+        The page content comes from what was sent rather than from another
+        read: markdown input is returned as given and storage input is
+        converted locally. Only wiki markup, whose storage form is produced
+        by the server, relies on the body in the response and falls back to
+        reading the page when it is missing.
+
+        Args:
+            response: The create or update response in v1 format
+            body: The body passed by the caller
+            final_body: The body that was sent to Confluence
+            is_markdown: Whether ``body`` is markdown
+            representation: The representation ``final_body`` was sent in
+            return_content: Whether to fill in the page content
+
+        Returns:
+            ConfluencePage model for the written page
+        """
+        if not return_content:
+            return ConfluencePage.from_api_response(
+                response,
+                base_url=self.config.url,
+                include_body=False,
+                is_cloud=self.config.is_cloud,
+            )
+
+        if is_markdown:
+            content = body
+        else:
+            storage = final_body if representation == "storage" else None
+            if storage is None:
+                storage = response.get("body", {}).get("storage", {}).get("value")
+            if storage is None:
+                return self.get_page_content(str(response["id"]))
+            space_key = response.get("space", {}).get("key", "")
+            _, content = self.preprocessor.process_html_content(
+                storage, space_key=space_key, confluence_client=self.confluence
+            )
+
+        return ConfluencePage.from_api_response(
+            response,
+            base_url=self.config.url,
+            include_body=True,
+            content_override=content,
+            content_format="markdown",
+            is_cloud=self.config.is_cloud,
+        )
+
     def get_page_children(
         self,
         page_id: str,
@@ -517,6 +712,198 @@ class PagesMixin(ConfluenceClient):
             logger.debug("Full exception details:", exc_info=True)
             return []
 
+    def get_page_tree(
+        self, page_id: str, *, max_depth: int = 3, max_pages: int = 500
+    ) -> dict[str, Any]:
+        """
+        Get the descendants of a page as a compact tree.
+
+        A single CQL ``ancestor =`` search is tried first. When the whole
+        subtree fits within ``max_pages`` it is built from that paginated
+        search, which takes one request per hundred pages. Larger subtrees
+        are walked breadth-first instead, listing the children of each level
+        concurrently, so that the pages closest to the root are kept when
+        ``max_pages`` cuts the walk short.
+
+        Args:
+            page_id: The ID of the root page
+            max_depth: Number of levels below the root to include (keyword-only)
+            max_pages: Maximum number of descendants to include (keyword-only)
+
+        Returns:
+            Dictionary with the ``root`` node, the ``page_count`` of included
+            descendants, whether the tree was ``truncated`` and the ``method``
+            used. Every node has ``id``, ``title``, ``version``,
+            ``child_count`` and ``children``; ``child_count`` is None for
+            nodes whose children were not listed.
+
+        Raises:
+            ValueError: If the page ID is not numeric
+        """
+        if not str(page_id).isdigit():
+            msg = f"Invalid page ID: {page_id}"
+            raise ValueError(msg)
+
+        root = self._tree_node(
+            self.confluence.get_page_by_id(page_id=page_id, expand="version") or {}
+        )
+        root["id"] = str(page_id)
+
+        descendants = None
+        if max_depth > 1:
+            try:
+                descendants = self._search_descendants(page_id, max_pages)
+            except HTTPError as e:
+                logger.warning(
+                    f"Descendant search for page {page_id} failed, "
+                    f"listing children instead: {e}"
+                )
+
+        if descendants is not None:
+            count = self._build_tree_from_descendants(root, descendants, max_depth)
+            return {
+                "root": root,
+                "page_count": count,
+                "truncated": False,
+                "method": "cql",
+            }
+
+        count, truncated = self._walk_page_tree(root, max_depth, max_pages)
+        return {
+            "root": root,
+            "page_count": count,
+            "truncated": truncated,
+            "method": "children",
+        }
+
+    @staticmethod
+    def _tree_node(page: dict[str, Any]) -> dict[str, Any]:
+        """Return the compact tree node for a page."""
+        return {
+            "id": str(page.get("id", "")),
+            "title": page.get("title", ""),
+            "version": page.get("version", {}).get("number"),
+            "child_count": None,
+            "children": [],
+        }
+
+    def _search_descendants(
+        self, page_id: str, max_pages: int
+    ) -> list[dict[str, Any]] | None:
+        """Return all descendant pages with their ancestors via CQL.
+
+        Returns None without reading further when the search reports more
+        than ``max_pages`` descendants.
+        """
+        cql = f"ancestor = {page_id} AND type = page"
+        params: dict[str, Any] = {
+            "cql": cql,
+            "limit": TREE_SEARCH_PAGE_SIZE,
+            "expand": "content.ancestors,content.version",
+        }
+        response = self.confluence.get("rest/api/search", params=params) or {}
+        total = response.get("totalSize")
+        if not isinstance(total, int) or total > max_pages:
+            return None
+
+        items = list(response.get("results", []))
+        position = next_search_position(response)
+        while position and len(items) < total:
+            start, cursor = position
+            params = {**params, "start": start}
+            if cursor:
+                params["cursor"] = cursor
+            response = self.confluence.get("rest/api/search", params=params) or {}
+            if not response.get("results"):
+                break
+            items.extend(response["results"])
+            position = next_search_position(response)
+        return [item["content"] for item in items if item.get("content")]
+
+    def _build_tree_from_descendants(
+        self, root: dict[str, Any], pages: list[dict[str, Any]], max_depth: int
+    ) -> int:
+        """Link searched descendants under ``root`` by their last ancestor.
+
+        Child counts cover every descendant found, including those below
+        ``max_depth`` that are left out of the tree.
+
+        Returns:
+            Number of descendants added to the tree
+        """
+        children_by_parent: dict[str, list[dict[str, Any]]] = {}
+        for page in pages:
+            if ancestors := page.get("ancestors"):
+                parent_id = str(ancestors[-1].get("id"))
+                children_by_parent.setdefault(parent_id, []).append(page)
+
+        count = 0
+        frontier = [root]
+        for depth in range(max_depth + 1):
+            next_frontier = []
+            for node in frontier:
+                children = children_by_parent.get(node["id"], [])
+                node["child_count"] = len(children)
+                if depth == max_depth:
+                    continue
+                for child in children:
+                    child_node = self._tree_node(child)
+                    node["children"].append(child_node)
+                    next_frontier.append(child_node)
+            count += len(next_frontier)
+            frontier = next_frontier
+        return count
+
+    def _list_child_pages(self, page_id: str) -> list[dict[str, Any]]:
+        """Return all child pages of a page with their versions."""
+        children: list[dict[str, Any]] = []
+        while True:
+            results = self.confluence.get_page_child_by_type(
+                page_id=page_id,
+                type="page",
+                start=len(children),
+                limit=TREE_CHILDREN_PAGE_SIZE,
+                expand="version",
+            )
+            if isinstance(results, dict):
+                results = results.get("results", [])
+            children.extend(results or [])
+            if len(results or []) < TREE_CHILDREN_PAGE_SIZE:
+                return children
+
+    def _walk_page_tree(
+        self, root: dict[str, Any], max_depth: int, max_pages: int
+    ) -> tuple[int, bool]:
+        """Fill in the tree below ``root`` one level at a time.
+
+        Returns:
+            Number of descendants added and whether ``max_pages`` cut the
+            walk short
+        """
+        count = 0
+        frontier = [root]
+        for _ in range(max_depth):
+            if not frontier:
+                break
+            listings = map_concurrently(
+                lambda node: self._list_child_pages(node["id"]),
+                frontier,
+                max_workers=TREE_FETCH_CONCURRENCY,
+                thread_name_prefix="confluence-tree",
+            )
+            next_frontier = []
+            for node, children in zip(frontier, listings, strict=True):
+                node["child_count"] = len(children)
+                for child in children:
+                    if count >= max_pages:
+                        return count, True
+                    child_node = self._tree_node(child)
+                    node["children"].append(child_node)
+                    next_frontier.append(child_node)
+                    count += 1
+            frontier = next_frontier
+        return count, False
+
     def delete_page(self, page_id: str) -> bool:
         """
         Delete a Confluence page by its ID.
@@ -1,6 +1,13 @@
 """Module for Confluence search operations."""
 
+import base64
+import binascii
+import json
 import logging
+from typing import Any
+
+import requests
+from requests.exceptions import HTTPError
 
 from ..models.confluence import (
     ConfluencePage,
@@ -8,12 +15,46 @@ from ..models.confluence import (
     ConfluenceUserSearchResult,
     ConfluenceUserSearchResults,
 )
-from ..utils.decorators import handle_atlassian_api_errors
+from ..utils.concurrency import map_concurrently
+from ..utils.decorators import handle_atlassian_api_errors, raise_for_auth_error
 from .client import ConfluenceClient
-from .utils import quote_cql_identifier_if_needed
+from .utils import next_search_position, quote_cql_identifier_if_needed
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Parallel page reads when search hits are filled in with their full content
+SEARCH_CONTENT_CONCURRENCY = 4
+
+
+def _encode_page_token(cql: str, start: int, cursor: str | None) -> str:
+    """Pack the position of the next result page into an opaque token."""
+    position: dict[str, Any] = {"cql": cql, "start": start}
+    if cursor:
+        position["cursor"] = cursor
+    raw = json.dumps(position, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_page_token(token: str, cql: str) -> tuple[int, str | None]:
+    """Return the start offset and cursor stored in a page token.
+
+    Raises:
+        ValueError: If the token is malformed or was issued for another query
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        start = int(position["start"])
+        cursor = position.get("cursor")
+        token_cql = position["cql"]
+    except (binascii.Error, UnicodeError, KeyError, TypeError, ValueError) as e:
+        msg = "Invalid page_token"
+        raise ValueError(msg) from e
+    if token_cql != cql:
+        msg = "page_token was issued for a different query"
+        raise ValueError(msg)
+    return start, cursor
+
 
 class SearchMixin(ConfluenceClient):
     """Mixin for Confluence search operations."""
@@ -38,6 +79,44 @@ class SearchMixin(ConfluenceClient):
             MCPAtlassianAuthenticationError: If authentication fails with the
                 Confluence API (401/403)
         """
+        return self.search_page(cql, limit=limit, spaces_filter=spaces_filter).results
+
+    def search_page(
+        self,
+        cql: str,
+        limit: int = 10,
+        spaces_filter: str | None = None,
+        *,
+        page_token: str | None = None,
+        include_content: int = 0,
+    ) -> ConfluenceSearchResult:
+        """
+        Return one page of CQL search results and a token for the next one.
+
+        Result pages shorter than ``limit`` are topped up by following the
+        next link of the response, so large result sets can be walked with
+        ``page_token`` regardless of how the server splits them.
+
+        Args:
+            cql: Confluence Query Language string
+            limit: Maximum number of results to return
+            spaces_filter: Optional comma-separated list of space keys to filter by,
+                overrides config
+            page_token: Token from a previous call with the same query to
+                continue after its results (keyword-only)
+            include_content: Number of leading results whose full page content
+                is fetched and converted to markdown instead of the search
+                excerpt (keyword-only)
+
+        Returns:
+            ConfluenceSearchResult with the results and ``next_page_token``,
+            which is None on the last page
+
+        Raises:
+            ValueError: If the page token is invalid or belongs to another query
+            MCPAtlassianAuthenticationError: If authentication fails with the
+                Confluence API (401/403)
+        """
         # Use spaces_filter parameter if provided, otherwise fall back to config
         filter_to_use = spaces_filter or self.config.spaces_filter
 
@@ -60,22 +139,44 @@ class SearchMixin(ConfluenceClient):
 
             logger.info(f"Applied spaces filter to query: {cql}")
 
-        # Execute the CQL search query
-        results = self.confluence.cql(cql=cql, limit=limit)
+        try:
+            # Execute the CQL search query, following next links until full
+            if page_token:
+                start, cursor = _decode_page_token(page_token, cql)
+                results = self._search_from(cql, limit, start, cursor)
+            else:
+                results = self.confluence.cql(cql=cql, limit=limit)
+            items = list(results.get("results", []))
+            position = next_search_position(results)
+            while position and items and len(items) < limit:
+                response = self._search_from(cql, limit - len(items), *position)
+                if not response.get("results"):
+                    position = None
+                    break
+                items.extend(response["results"])
+                position = next_search_position(response)
+        except HTTPError as http_err:
+            raise_for_auth_error(http_err, "Confluence API")
+            logger.error(f"HTTP error during search_page: {http_err}")
+            raise
+        except requests.RequestException as e:
+            logger.error(f"Network error during search_page: {str(e)}")
+            raise
 
         # Convert the response to a search result model
         search_result = ConfluenceSearchResult.from_api_response(
-            results,
+            {**results, "results": items},
             base_url=self.config.url,
             cql_query=cql,
             is_cloud=self.config.is_cloud,
         )
+        if position:
+            search_result.next_page_token = _encode_page_token(cql, *position)
 
         # Process result excerpts as content
-        processed_pages = []
         for page in search_result.results:
             # Get the excerpt from the original search results
-            for result_item in results.get("results", []):
+            for result_item in items:
                 if result_item.get("content", {}).get("id") == page.id:
                     excerpt = result_item.get("excerpt", "")
                     if excerpt:
@@ -90,10 +191,46 @@ class SearchMixin(ConfluenceClient):
                         page.content = processed_markdown
                     break
 
-            processed_pages.append(page)
+        if include_content > 0:
+            self._include_page_content(search_result.results[:include_content])
+
+        # Return the result pages with processed content
+        return search_result
+
+    def _search_from(
+        self, cql: str, limit: int, start: int, cursor: str | None
+    ) -> dict[str, Any]:
+        """Request the search results page starting at ``start``/``cursor``."""
+        params: dict[str, Any] = {"cql": cql, "limit": limit, "start": start}
+        if cursor:
+            params["cursor"] = cursor
+        return self.confluence.get("rest/api/search", params=params) or {}
+
+    def _include_page_content(self, pages: list[ConfluencePage]) -> None:
+        """Replace the excerpts of search hits with their converted page content.
 
-        # Return the list of result pages with processed content
-        return processed_pages
+        Pages are read concurrently. A page that cannot be read keeps its
+        excerpt, so one failure does not fail the whole search.
+        """
+
+        def load(page: ConfluencePage) -> ConfluencePage | None:
+            try:
+                return self.get_page_content(page.id)  # type: ignore[attr-defined]
+            except Exception as e:  # noqa: BLE001 - keep the excerpt instead
+                logger.warning(f"Could not load content of page {page.id}: {e}")
+                return None
+
+        candidates = [page for page in pages if page.type in ("page", "blogpost")]
+        loaded = map_concurrently(
+            load,
+            candidates,
+            max_workers=SEARCH_CONTENT_CONCURRENCY,
+            thread_name_prefix="confluence-search",
+        )
+        for page, full_page in zip(candidates, loaded, strict=True):
+            if full_page is not None:
+                page.content = full_page.content
+                page.content_format = full_page.content_format
 
     @handle_atlassian_api_errors("Confluence API")
     def search_user(
@@ -1,6 +1,8 @@
 """Utility functions specific to Confluence operations."""
 
 import logging
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
 
 from .constants import RESERVED_CQL_WORDS
 
@@ -64,3 +66,29 @@ def quote_cql_identifier_if_needed(identifier: str) -> str:
         # Return the original identifier if no quoting is needed
         logger.debug(f"Identifier '{identifier}' does not need quoting.")
         return identifier
+
+
+def next_search_position(response: dict[str, Any]) -> tuple[int, str | None] | None:
+    """Return where the search results page after ``response`` starts.
+
+    Cloud links the next page with a ``cursor`` in ``_links.next``; Server and
+    Data Center use ``start``. Responses without a next link fall back to the
+    offset when ``totalSize`` shows more results.
+
+    Args:
+        response: A ``rest/api/search`` or ``rest/api/content/search`` response
+
+    Returns:
+        The start offset and cursor of the next page, or None on the last page
+    """
+    start = int(response.get("start") or 0)
+    size = int(response.get("size", len(response.get("results", []))) or 0)
+    if next_link := response.get("_links", {}).get("next"):
+        query = parse_qs(urlsplit(next_link).query)
+        cursor = query.get("cursor", [None])[0]
+        next_start = query.get("start", [None])[0]
+        return (int(next_start) if next_start else start + size), cursor
+    total = response.get("totalSize")
+    if size and isinstance(total, int) and start + size < total:
+        return start + size, None
+    return None
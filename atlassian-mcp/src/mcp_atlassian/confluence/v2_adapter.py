@@ -11,8 +11,39 @@ from typing import Any
 import requests
 from requests.exceptions import HTTPError
 
+from ..utils.cache import (
+    TaggedTTLCache,
+    confluence_page_version_tag,
+    confluence_space_tag,
+    get_cache,
+)
+
 logger = logging.getLogger("mcp-atlassian")
 
+# Space keys and IDs are fixed for the life of a space, so lookups in either
+# direction are kept for a long time
+SPACE_ID_CACHE_TTL = 24 * 60 * 60
+SPACE_ID_CACHE_MAXSIZE = 2048
+# Last version seen per page; a stale one only costs a retried update (409)
+PAGE_VERSION_CACHE_TTL = 60 * 60
+PAGE_VERSION_CACHE_MAXSIZE = 8192
+
+
+def _space_cache() -> TaggedTTLCache:
+    return get_cache(
+        "confluence-v2-space-ids",
+        maxsize=SPACE_ID_CACHE_MAXSIZE,
+        ttl=SPACE_ID_CACHE_TTL,
+    )
+
+
+def _page_version_cache() -> TaggedTTLCache:
+    return get_cache(
+        "confluence-v2-page-versions",
+        maxsize=PAGE_VERSION_CACHE_MAXSIZE,
+        ttl=PAGE_VERSION_CACHE_TTL,
+    )
+
 
 class ConfluenceV2Adapter:
     """Adapter for Confluence REST API v2 operations when using OAuth."""
@@ -27,6 +58,22 @@ class ConfluenceV2Adapter:
         self.session = session
         self.base_url = base_url
 
+    def _remember_space(self, space_key: str, space_id: str) -> None:
+        """Cache a space's key and ID in both directions."""
+        cache = _space_cache()
+        tags = [confluence_space_tag(space_key), confluence_space_tag(space_id)]
+        cache.set((self.base_url, "id", space_key), space_id, tags)
+        cache.set((self.base_url, "key", space_id), space_key, tags)
+
+    def _remember_page_version(self, page_id: Any, version: Any) -> None:
+        """Record the latest known version of a page from an API response."""
+        if page_id and isinstance(version, int):
+            _page_version_cache().set(
+                (self.base_url, str(page_id)),
+                version,
+                [confluence_page_version_tag(str(page_id))],
+            )
+
     def _get_space_id(self, space_key: str) -> str:
         """Get space ID from space key using v2 API.
 
@@ -39,6 +86,9 @@ class ConfluenceV2Adapter:
         Raises:
             ValueError: If space not found or API error
         """
+        cached = _space_cache().get((self.base_url, "id", space_key))
+        if cached:
+            return cached
         try:
             # Use v2 spaces endpoint to get space ID
             url = f"{self.base_url}/api/v2/spaces"
@@ -57,6 +107,7 @@ class ConfluenceV2Adapter:
             if not space_id:
                 raise ValueError(f"No ID found for space '{space_key}'")
 
+            self._remember_space(space_key, str(space_id))
             return space_id
 
         except HTTPError as e:
@@ -117,6 +168,9 @@ class ConfluenceV2Adapter:
 
             result = response.json()
             logger.debug(f"Successfully created page '{title}' with v2 API")
+            self._remember_page_version(
+                result.get("id"), result.get("version", {}).get("number")
+            )
 
             # Convert v2 response to v1-compatible format for consistency
             return self._convert_v2_to_v1_format(result, space_key)
@@ -130,9 +184,11 @@ class ConfluenceV2Adapter:
             logger.error(f"Error creating page '{title}': {e}")
             raise ValueError(f"Failed to create page '{title}': {e}") from e
 
-    def _get_page_version(self, page_id: str) -> int:
+    def get_page_version(self, page_id: str) -> int:
         """Get the current version number of a page.
 
+        Fetches only the page metadata, without the body.
+
         Args:
             page_id: The ID of the page
 
@@ -144,9 +200,8 @@ class ConfluenceV2Adapter:
         """
         try:
             url = f"{self.base_url}/api/v2/pages/{page_id}"
-            params = {"body-format": "storage"}
 
-            response = self.session.get(url, params=params)
+            response = self.session.get(url)
             response.raise_for_status()
 
             data = response.json()
@@ -155,6 +210,7 @@ class ConfluenceV2Adapter:
             if version_number is None:
                 raise ValueError(f"No version number found for page '{page_id}'")
 
+            self._remember_page_version(page_id, version_number)
             return version_number
 
         except HTTPError as e:
@@ -190,9 +246,10 @@ class ConfluenceV2Adapter:
             ValueError: If page update fails
         """
         try:
-            # Get current version and increment it
-            current_version = self._get_page_version(page_id)
-            new_version = current_version + 1
+            # Build on the last version seen, looking it up only when unknown
+            current_version = _page_version_cache().get((self.base_url, page_id))
+            if current_version is None:
+                current_version = self.get_page_version(page_id)
 
             # Prepare request data for v2 API
             data = {
@@ -204,7 +261,7 @@ class ConfluenceV2Adapter:
                     "value": body,
                 },
                 "version": {
-                    "number": new_version,
+                    "number": current_version + 1,
                 },
             }
 
@@ -215,10 +272,20 @@ class ConfluenceV2Adapter:
             # Make the v2 API call
             url = f"{self.base_url}/api/v2/pages/{page_id}"
             response = self.session.put(url, json=data)
+            if response.status_code == 409:
+                # The page changed since the version we built on; retry once
+                # on top of its current version
+                logger.debug(f"Page '{page_id}' version conflict, retrying update")
+                current_version = self.get_page_version(page_id)
+                data["version"]["number"] = current_version + 1
+                response = self.session.put(url, json=data)
             response.raise_for_status()
 
             result = response.json()
             logger.debug(f"Successfully updated page '{title}' with v2 API")
+            self._remember_page_version(
+                page_id, result.get("version", {}).get("number", current_version + 1)
+            )
 
             # Convert v2 response to v1-compatible format for consistency
             # For update, we need to extract space key from the result
@@ -248,6 +315,9 @@ class ConfluenceV2Adapter:
         Raises:
             ValueError: If space not found or API error
         """
+        cached = _space_cache().get((self.base_url, "key", space_id))
+        if cached:
+            return cached
         try:
             # Use v2 spaces endpoint to get space key
             url = f"{self.base_url}/api/v2/spaces/{space_id}"
@@ -261,6 +331,7 @@ class ConfluenceV2Adapter:
             if not space_key:
                 raise ValueError(f"No key found for space ID '{space_id}'")
 
+            self._remember_space(space_key, str(space_id))
             return space_key
 
         except HTTPError as e:
@@ -301,6 +372,9 @@ class ConfluenceV2Adapter:
 
             v2_response = response.json()
             logger.debug(f"Successfully retrieved page '{page_id}' with v2 API")
+            self._remember_page_version(
+                page_id, v2_response.get("version", {}).get("number")
+            )
 
             # Get space key from space ID
             space_id = v2_response.get("spaceId")
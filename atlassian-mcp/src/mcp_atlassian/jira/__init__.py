@@ -1,71 +1,39 @@
 """Jira API module for mcp_atlassian.
 
 This module provides various Jira API client implementations.
-"""
 
-# flake8: noqa
+Only the configuration is imported with the package. The client classes pull
+in the atlassian client, the markup converters and every model, so they are
+imported on first access to keep server start-up fast.
+"""
 
-# Re-export the Jira class for backward compatibility
-from atlassian.jira import Jira
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .client import JiraClient
-from .comments import CommentsMixin
 from .config import JiraConfig
-from .epics import EpicsMixin
-from .fields import FieldsMixin
-from .formatting import FormattingMixin
-from .issues import IssuesMixin
-from .links import LinksMixin
-from .projects import ProjectsMixin
-from .search import SearchMixin
-from .sprints import SprintsMixin
-from .transitions import TransitionsMixin
-from .users import UsersMixin
-from .worklog import WorklogMixin
-from .boards import BoardsMixin
-from .attachments import AttachmentsMixin
 
+if TYPE_CHECKING:
+    from atlassian.jira import Jira
 
-class JiraFetcher(
-    ProjectsMixin,
-    FieldsMixin,
-    FormattingMixin,
-    TransitionsMixin,
-    WorklogMixin,
-    EpicsMixin,
-    CommentsMixin,
-    SearchMixin,
-    IssuesMixin,
-    UsersMixin,
-    BoardsMixin,
-    SprintsMixin,
-    AttachmentsMixin,
-    LinksMixin,
-):
-    """
-    The main Jira client class providing access to all Jira operations.
+    from .client import JiraClient
+    from .fetcher import JiraFetcher
 
-    This class inherits from multiple mixins that provide specific functionality:
-    - ProjectsMixin: Project-related operations
-    - FieldsMixin: Field-related operations
-    - FormattingMixin: Content formatting utilities
-    - TransitionsMixin: Issue transition operations
-    - WorklogMixin: Worklog operations
-    - EpicsMixin: Epic operations
-    - CommentsMixin: Comment operations
-    - SearchMixin: Search operations
-    - IssuesMixin: Issue operations
-    - UsersMixin: User operations
-    - BoardsMixin: Board operations
-    - SprintsMixin: Sprint operations
-    - AttachmentsMixin: Attachment download operations
-    - LinksMixin: Issue link operations
+_LAZY_IMPORTS = {
+    # Re-export the Jira class for backward compatibility
+    "Jira": "atlassian.jira",
+    "JiraClient": ".client",
+    "JiraFetcher": ".fetcher",
+}
 
-    The class structure is designed to maintain backward compatibility while
-    improving code organization and maintainability.
-    """
 
-    pass
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = ["JiraFetcher", "JiraConfig", "JiraClient", "Jira"]
@@ -1,17 +1,115 @@
 """Attachment operations for Jira API."""
 
 import logging
+import mimetypes
 import os
+import uuid
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from ..models.jira import JiraAttachment
+from ..utils.concurrency import map_concurrently
 from .client import JiraClient
 from .protocols import AttachmentsOperationsProto
 
 # Configure logging
 logger = logging.getLogger("mcp-jira")
 
+# Size of the blocks read from disk while streaming a multipart body
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class MultipartFileStream:
+    """A ``multipart/form-data`` body that reads the attached files lazily.
+
+    ``requests`` buffers the whole payload in memory when files are passed via
+    ``files=``. This object instead exposes a ``read``/``len`` interface, so the
+    HTTP stack sends it with a ``Content-Length`` header while pulling one chunk
+    at a time from disk. Every file becomes a ``file`` part, which is the shape
+    the Jira attachments endpoint expects for single and multi-file uploads.
+    """
+
+    def __init__(self, file_paths: list[str], field_name: str = "file") -> None:
+        """Prepare the part headers and compute the total body length.
+
+        Args:
+            file_paths: Absolute paths of the files to send, in part order
+            field_name: Form field name used for every part
+        """
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._segments: list[bytes | str] = []
+        for file_path in file_paths:
+            filename = os.path.basename(file_path)
+            mime_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            quoted_name = (
+                filename.replace("\\", "\\\\")
+                .replace('"', "%22")
+                .replace("\r", "%0D")
+                .replace("\n", "%0A")
+            )
+            header = (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{field_name}"; '
+                f'filename="{quoted_name}"\r\n'
+                f"Content-Type: {mime_type}\r\n\r\n"
+            ).encode()
+            self._segments.extend([header, file_path, b"\r\n"])
+        self._segments.append(f"--{self.boundary}--\r\n".encode())
+
+        self.len = sum(
+            len(segment) if isinstance(segment, bytes) else os.path.getsize(segment)
+            for segment in self._segments
+        )
+        self._segment_index = 0
+        self._buffer = b""
+        self._current_file: BinaryIO | None = None
+
+    def __len__(self) -> int:
+        return self.len
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+    def _next_block(self, size: int) -> bytes:
+        """Return the next block of at most ``size`` bytes, or b"" at the end."""
+        while self._segment_index < len(self._segments):
+            segment = self._segments[self._segment_index]
+            if isinstance(segment, bytes):
+                self._segment_index += 1
+                return segment
+            if self._current_file is None:
+                self._current_file = open(segment, "rb")
+            block = self._current_file.read(size)
+            if block:
+                return block
+            self._current_file.close()
+            self._current_file = None
+            self._segment_index += 1
+        return b""
+
+    def read(self, size: int | None = -1) -> bytes:
+        """Read up to ``size`` bytes of the encoded body (all if negative)."""
+        block_size = UPLOAD_CHUNK_SIZE if size is None or size < 0 else size
+        while size is None or size < 0 or len(self._buffer) < size:
+            block = self._next_block(block_size)
+            if not block:
+                break
+            self._buffer += block
+        if size is None or size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def close(self) -> None:
+        """Close the file currently being streamed, if any."""
+        if self._current_file is not None:
+            self._current_file.close()
+            self._current_file = None
+
 
 class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
     """Mixin for Jira attachment operations."""
@@ -163,6 +261,46 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             "failed": failed,
         }
 
+    def _post_attachment_files(
+        self, issue_key: str, file_paths: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Send one streamed multipart request attaching the given files.
+
+        Args:
+            issue_key: The Jira issue key (e.g., 'PROJ-123')
+            file_paths: Absolute paths of existing files to attach
+
+        Returns:
+            The attachment objects returned by Jira, in upload order
+
+        Raises:
+            HTTPError: If Jira rejects the upload
+        """
+        path = f"{self.jira.resource_url('issue')}/{issue_key}/attachments"
+        url = self.jira.url_joiner(self.jira.url, path)
+        body = MultipartFileStream(file_paths)
+        try:
+            response = self.jira._session.post(
+                url,
+                data=body,
+                headers={
+                    "Accept": "application/json",
+                    "Content-Type": body.content_type,
+                    "X-Atlassian-Token": "no-check",
+                },
+                timeout=self.jira.timeout,
+                verify=self.jira.verify_ssl,
+            )
+        finally:
+            body.close()
+        response.raise_for_status()
+
+        attachments = response.json()
+        if isinstance(attachments, dict):
+            attachments = [attachments]
+        return attachments if isinstance(attachments, list) else []
+
     def upload_attachment(self, issue_key: str, file_path: str) -> dict[str, Any]:
         """
         Upload a single attachment to a Jira issue.
@@ -194,12 +332,10 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
 
             logger.info(f"Uploading attachment from {file_path} to issue {issue_key}")
 
-            # Use the Jira API to upload the file
+            # Stream the file to Jira without loading it into memory
             filename = os.path.basename(file_path)
-            with open(file_path, "rb") as file:
-                attachment = self.jira.add_attachment(
-                    issue_key=issue_key, filename=file_path
-                )
+            attachments = self._post_attachment_files(issue_key, [file_path])
+            attachment = attachments[0] if attachments else None
 
             if attachment:
                 file_size = os.path.getsize(file_path)
@@ -227,18 +363,81 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             logger.error(f"Error uploading attachment: {error_msg}")
             return {"success": False, "error": error_msg}
 
-    def upload_attachments(
+    def _upload_attachment_batch(
         self, issue_key: str, file_paths: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Upload several files in one multipart request and report per-file status.
+
+        Jira returns the created attachments in part order, so each file is
+        matched to the attachment at the same position. If the request fails,
+        every file in the batch is reported as failed with the same error.
+
+        Args:
+            issue_key: The Jira issue key (e.g., 'PROJ-123')
+            file_paths: Absolute paths of existing files to attach
+
+        Returns:
+            A list of per-file upload results in the same shape as
+            ``upload_attachment``
+        """
+        if len(file_paths) == 1:
+            return [self.upload_attachment(issue_key, file_paths[0])]
+
+        logger.info(
+            f"Uploading batch of {len(file_paths)} attachments to issue {issue_key}"
+        )
+        try:
+            attachments = self._post_attachment_files(issue_key, file_paths)
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Error uploading attachment batch: {error_msg}")
+            return [{"success": False, "error": error_msg} for _ in file_paths]
+
+        results = []
+        for index, file_path in enumerate(file_paths):
+            filename = os.path.basename(file_path)
+            attachment = attachments[index] if index < len(attachments) else None
+            if isinstance(attachment, dict):
+                results.append(
+                    {
+                        "success": True,
+                        "issue_key": issue_key,
+                        "filename": filename,
+                        "size": attachment.get("size", os.path.getsize(file_path)),
+                        "id": attachment.get("id"),
+                    }
+                )
+            else:
+                error_msg = f"Failed to upload attachment {filename} to {issue_key}"
+                results.append({"success": False, "error": error_msg})
+        return results
+
+    def upload_attachments(
+        self,
+        issue_key: str,
+        file_paths: list[str],
+        max_concurrency: int | None = None,
+        batch_size: int | None = None,
     ) -> dict[str, Any]:
         """
         Upload multiple attachments to a Jira issue.
 
+        Files are streamed from disk and uploaded concurrently. Optionally,
+        several files can be grouped into a single multipart request, which
+        Jira accepts on the attachments endpoint.
+
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             file_paths: List of paths to files to upload
+            max_concurrency: Maximum number of upload requests in flight
+                (defaults to ``JiraConfig.attachment_upload_concurrency``)
+            batch_size: Number of files sent per multipart request
+                (defaults to ``JiraConfig.attachment_upload_batch_size``)
 
         Returns:
-            A dictionary with upload results
+            A dictionary with upload results, including a per-file ``results``
+            list in the same order as ``file_paths``
         """
         if not issue_key:
             logger.error("No issue key provided for attachment upload")
@@ -248,15 +447,58 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             logger.error("No file paths provided for attachment upload")
             return {"success": False, "error": "No file paths provided"}
 
-        logger.info(f"Uploading {len(file_paths)} attachments to issue {issue_key}")
+        max_concurrency = max_concurrency or self.config.attachment_upload_concurrency
+        batch_size = batch_size or self.config.attachment_upload_batch_size
 
-        # Upload each attachment
-        uploaded = []
-        failed = []
+        logger.info(
+            f"Uploading {len(file_paths)} attachments to issue {issue_key} "
+            f"(concurrency: {max_concurrency}, batch size: {batch_size})"
+        )
 
-        for file_path in file_paths:
-            result = self.upload_attachment(issue_key, file_path)
+        # Files that are missing are reported without issuing a request; the
+        # remaining ones are grouped into multipart batches.
+        results: list[dict[str, Any] | None] = [None] * len(file_paths)
+        batches: list[list[int]] = []
+        current_batch: list[int] = []
+        for index, file_path in enumerate(file_paths):
+            if batch_size > 1:
+                absolute_path = os.path.abspath(file_path) if file_path else ""
+                if not absolute_path or not os.path.exists(absolute_path):
+                    results[index] = {
+                        "success": False,
+                        "error": f"File not found: {absolute_path or file_path}",
+                    }
+                    continue
+            current_batch.append(index)
+            if len(current_batch) >= batch_size:
+                batches.append(current_batch)
+                current_batch = []
+        if current_batch:
+            batches.append(current_batch)
+
+        def upload_batch(batch: list[int]) -> list[dict[str, Any]]:
+            if len(batch) == 1:
+                return [self.upload_attachment(issue_key, file_paths[batch[0]])]
+            return self._upload_attachment_batch(
+                issue_key, [os.path.abspath(file_paths[i]) for i in batch]
+            )
+
+        batch_results = map_concurrently(
+            upload_batch,
+            batches,
+            max_workers=max_concurrency,
+            thread_name_prefix="jira-attachment-upload",
+        )
+        for batch, batch_result in zip(batches, batch_results, strict=True):
+            for index, result in zip(batch, batch_result, strict=True):
+                results[index] = result
 
+        uploaded = []
+        failed = []
+        per_file = []
+        for file_path, result in zip(file_paths, results, strict=True):
+            result = result or {"success": False, "error": "Upload was not attempted"}
+            filename = result.get("filename") or os.path.basename(file_path)
             if result.get("success"):
                 uploaded.append(
                     {
@@ -265,6 +507,15 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
                         "id": result.get("id"),
                     }
                 )
+                per_file.append(
+                    {
+                        "path": file_path,
+                        "filename": filename,
+                        "status": "uploaded",
+                        "size": result.get("size"),
+                        "id": result.get("id"),
+                    }
+                )
             else:
                 failed.append(
                     {
@@ -272,6 +523,14 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
                         "error": result.get("error"),
                     }
                 )
+                per_file.append(
+                    {
+                        "path": file_path,
+                        "filename": filename,
+                        "status": "failed",
+                        "error": result.get("error"),
+                    }
+                )
 
         return {
             "success": True,
@@ -279,4 +538,5 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             "total": len(file_paths),
             "uploaded": uploaded,
             "failed": failed,
+            "results": per_file,
         }
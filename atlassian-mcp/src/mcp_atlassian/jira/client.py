@@ -2,6 +2,7 @@
 
 import logging
 import os
+from collections.abc import Callable, Iterator
 from typing import Any, Literal
 
 from atlassian import Jira
@@ -9,12 +10,19 @@ from requests import Session
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.preprocessing import JiraPreprocessor
+from mcp_atlassian.utils.coalesce import configure_request_coalescing
+from mcp_atlassian.utils.concurrency import InstrumentedThreadPoolExecutor
+from mcp_atlassian.utils.http import (
+    configure_connection_pool,
+    configure_request_metrics,
+)
 from mcp_atlassian.utils.logging import (
     get_masked_session_headers,
     log_config_param,
     mask_sensitive,
 )
 from mcp_atlassian.utils.oauth import configure_oauth_session
+from mcp_atlassian.utils.rate_limit import configure_rate_limiting
 from mcp_atlassian.utils.ssl import configure_ssl_verification
 
 from .config import JiraConfig
@@ -22,6 +30,11 @@ from .config import JiraConfig
 # Configure logging
 logger = logging.getLogger("mcp-jira")
 
+# startAt pagination of the Agile API (boards, sprints)
+AGILE_PAGE_SIZE = 50  # Default (and on most sites maximum) page size
+AGILE_PAGE_CONCURRENCY = 4  # Pages fetched in parallel once the total is known
+AGILE_MAX_ITEMS = 1000  # Hard cap on items returned by a single listing
+
 
 class JiraClient:
     """Base client for Jira API interactions."""
@@ -45,6 +58,9 @@ class JiraClient:
         # Load configuration from environment variables if not provided
         self.config = config or JiraConfig.from_env()
 
+        # Base URL the API calls go to (OAuth goes through the Atlassian gateway)
+        api_url = self.config.url
+
         # Initialize the Jira client based on auth type
         if self.config.auth_type == "oauth":
             if not self.config.oauth_config or not self.config.oauth_config.cloud_id:
@@ -110,6 +126,33 @@ class JiraClient:
             ssl_verify=self.config.ssl_verify,
         )
 
+        # Record per-endpoint request counts and latencies
+        configure_request_metrics(service_name="Jira", session=self.jira._session)
+
+        # Share pooled connections for the site across client instances
+        configure_connection_pool(
+            service_name="Jira",
+            url=api_url,
+            session=self.jira._session,
+            settings=self.config.connection_pool_settings,
+        )
+
+        # Pace requests and retry throttled calls. Must run after SSL setup so
+        # the rate-limit adapter wraps the adapter mounted for the site.
+        configure_rate_limiting(
+            service_name="Jira",
+            url=api_url,
+            session=self.jira._session,
+            settings=self.config.rate_limit_settings,
+        )
+
+        # Collapse identical concurrent GETs (outermost, so followers skip
+        # rate limiting and never open a connection)
+        if self.config.request_coalescing:
+            configure_request_coalescing(
+                service_name="Jira", url=api_url, session=self.jira._session
+            )
+
         # Proxy configuration
         proxies = {}
         if self.config.http_proxy:
@@ -284,6 +327,119 @@ class JiraClient:
 
         return all_results
 
+    def iter_offset_pages(
+        self,
+        fetch_page: Callable[[int, int], Any],
+        start: int = 0,
+        limit: int = AGILE_PAGE_SIZE,
+        values_key: str = "values",
+        page_size: int = AGILE_PAGE_SIZE,
+    ) -> Iterator[dict]:
+        """
+        Yield the pages of a `startAt`/`maxResults` paginated listing in order.
+
+        The first page is fetched on its own. If it reports a `total`, the
+        remaining pages are fetched concurrently and yielded as they become
+        available in order; otherwise pages are followed one by one until
+        `isLast`. The page size actually returned by the server is used as the
+        stride, since sites may cap `maxResults` below what was requested.
+
+        Args:
+            fetch_page: Callable taking (startAt, maxResults) and returning
+                the decoded response of one page
+            start: Index of the first item to return
+            limit: Maximum number of items to return, capped at AGILE_MAX_ITEMS
+            values_key: Response key holding the page items
+            page_size: Number of items requested per page
+
+        Yields:
+            Page responses, in listing order
+
+        Raises:
+            TypeError: If a page is not a JSON object
+        """
+        limit = max(0, min(limit, AGILE_MAX_ITEMS))
+
+        def fetch(offset: int, size: int) -> dict:
+            page = fetch_page(offset, size)
+            if not isinstance(page, dict):
+                msg = f"Unexpected page type from paginated Jira listing: {type(page)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return page
+
+        page = fetch(start, min(limit, page_size))
+        yield page
+        received = len(page.get(values_key) or [])
+        if not received or received >= limit:
+            return
+
+        total = page.get("total")
+        if isinstance(total, int):
+            end = min(start + limit, total)
+            offsets = list(range(start + received, end, received))
+            if not offsets:
+                return
+            logger.debug(
+                f"Fetching {len(offsets)} more pages of {received} items concurrently"
+            )
+            with InstrumentedThreadPoolExecutor(
+                max_workers=min(AGILE_PAGE_CONCURRENCY, len(offsets)),
+                thread_name_prefix="jira-page",
+            ) as executor:
+                yield from executor.map(
+                    lambda offset: fetch(offset, min(received, end - offset)), offsets
+                )
+            return
+
+        # No total (e.g. board sprints): follow pages until the last one
+        fetched = received
+        while not page.get("isLast", True) and fetched < limit:
+            page = fetch(start + fetched, min(received, limit - fetched))
+            yield page
+            count = len(page.get(values_key) or [])
+            if not count:
+                return
+            fetched += count
+
+    def get_offset_paged(
+        self,
+        fetch_page: Callable[[int, int], Any],
+        start: int = 0,
+        limit: int = AGILE_PAGE_SIZE,
+        values_key: str = "values",
+        page_size: int = AGILE_PAGE_SIZE,
+    ) -> dict:
+        """
+        Fetch a `startAt` paginated listing and merge its pages into one response.
+
+        The merged response keeps the first page's `startAt` and `total`, so
+        callers can resume from `startAt + len(values)` as a cursor.
+
+        Args:
+            fetch_page: Callable taking (startAt, maxResults) and returning
+                the decoded response of one page
+            start: Index of the first item to return
+            limit: Maximum number of items to return, capped at AGILE_MAX_ITEMS
+            values_key: Response key holding the page items
+            page_size: Number of items requested per page
+
+        Returns:
+            The first page's response with the items of every page
+        """
+        pages = list(
+            self.iter_offset_pages(fetch_page, start, limit, values_key, page_size)
+        )
+        merged = dict(pages[0])
+        if len(pages) > 1:
+            merged[values_key] = [
+                item for page in pages for item in page.get(values_key) or []
+            ][: min(limit, AGILE_MAX_ITEMS)]
+            merged["maxResults"] = len(merged[values_key])
+            if "isLast" in pages[-1]:
+                merged["isLast"] = pages[-1]["isLast"]
+        return merged
+
     def create_version(
         self,
         project: str,
@@ -5,12 +5,20 @@ import os
 from dataclasses import dataclass
 from typing import Literal
 
-from ..utils.env import get_custom_headers, is_env_ssl_verify
+from ..utils.env import (
+    get_custom_headers,
+    get_env_float,
+    get_env_int,
+    is_env_ssl_verify,
+    is_env_truthy,
+)
+from ..utils.http import ConnectionPoolSettings
 from ..utils.oauth import (
     BYOAccessTokenOAuthConfig,
     OAuthConfig,
     get_oauth_config_from_env,
 )
+from ..utils.rate_limit import RateLimitSettings
 from ..utils.urls import is_atlassian_cloud_url
 
 
@@ -36,6 +44,25 @@ class JiraConfig:
     no_proxy: str | None = None  # Comma-separated list of hosts to bypass proxy
     socks_proxy: str | None = None  # SOCKS proxy URL (optional)
     custom_headers: dict[str, str] | None = None  # Custom HTTP headers
+    attachment_upload_concurrency: int = 4  # Parallel attachment upload requests
+    attachment_upload_batch_size: int = 1  # Files sent per multipart request
+    rate_limit_rps: float | None = None  # Client-side request rate (None = unlimited)
+    rate_limit_burst: int = 10  # Requests allowed in a burst above the rate
+    max_retries: int = 3  # Retries for throttled or failed idempotent requests
+    circuit_breaker_threshold: int = 5  # Consecutive failures before failing fast
+    circuit_breaker_reset_seconds: float = 30.0  # Wait before probing the site again
+    http_pool_connections: int = 10  # Host pools cached per connection adapter
+    http_pool_maxsize: int = 20  # Connections kept open per host
+    http_pool_block: bool = False  # Wait for a free connection when the pool is full
+    http_keep_alive: bool = True  # Reuse connections between requests
+    http_connect_timeout: float | None = None  # Connect timeout in seconds
+    http_read_timeout: float | None = None  # Read timeout in seconds
+    request_coalescing: bool = True  # Share responses of identical in-flight GETs
+    mirror_projects: str | None = None  # Project keys to mirror locally for search
+    mirror_path: str | None = None  # Directory for mirror databases (None = memory)
+    mirror_sync_interval: float = 60.0  # Seconds between incremental mirror syncs
+    mirror_max_lag: float = 600.0  # Max mirror staleness before using the API
+    project_cache_ttl: float = 300.0  # Seconds project catalog data stays fresh
 
     @property
     def is_cloud(self) -> bool:
@@ -66,6 +93,37 @@ class JiraConfig:
         """
         return self.ssl_verify
 
+    @property
+    def connection_pool_settings(self) -> ConnectionPoolSettings:
+        """Connection pool and timeout settings for the HTTP session.
+
+        Returns:
+            ConnectionPoolSettings built from this configuration
+        """
+        return ConnectionPoolSettings(
+            pool_connections=self.http_pool_connections,
+            pool_maxsize=self.http_pool_maxsize,
+            pool_block=self.http_pool_block,
+            keep_alive=self.http_keep_alive,
+            connect_timeout=self.http_connect_timeout,
+            read_timeout=self.http_read_timeout,
+        )
+
+    @property
+    def rate_limit_settings(self) -> RateLimitSettings:
+        """Rate limiting and retry settings for the HTTP session.
+
+        Returns:
+            RateLimitSettings built from this configuration
+        """
+        return RateLimitSettings(
+            requests_per_second=self.rate_limit_rps,
+            burst=self.rate_limit_burst,
+            max_retries=self.max_retries,
+            circuit_failure_threshold=self.circuit_breaker_threshold,
+            circuit_reset_timeout=self.circuit_breaker_reset_seconds,
+        )
+
     @classmethod
     def from_env(cls) -> "JiraConfig":
         """Create configuration from environment variables.
@@ -127,6 +185,49 @@ class JiraConfig:
         # Custom headers - service-specific only
         custom_headers = get_custom_headers("JIRA_CUSTOM_HEADERS")
 
+        # Attachment upload tuning
+        attachment_upload_concurrency = get_env_int(
+            "JIRA_ATTACHMENT_UPLOAD_CONCURRENCY", 4, minimum=1
+        )
+        attachment_upload_batch_size = get_env_int(
+            "JIRA_ATTACHMENT_UPLOAD_BATCH_SIZE", 1, minimum=1
+        )
+
+        # Connection pooling and timeouts
+        http_pool_connections = get_env_int("JIRA_HTTP_POOL_CONNECTIONS", 10, minimum=1)
+        http_pool_maxsize = get_env_int("JIRA_HTTP_POOL_MAXSIZE", 20, minimum=1)
+        http_pool_block = is_env_truthy("JIRA_HTTP_POOL_BLOCK")
+        http_keep_alive = is_env_truthy("JIRA_HTTP_KEEP_ALIVE", "true")
+        http_connect_timeout = get_env_float(
+            "JIRA_HTTP_CONNECT_TIMEOUT", None, minimum=0.1
+        )
+        http_read_timeout = get_env_float("JIRA_HTTP_READ_TIMEOUT", None, minimum=0.1)
+
+        # Share identical concurrent GETs between callers with the same credentials
+        request_coalescing = is_env_truthy("JIRA_REQUEST_COALESCING", "true")
+
+        # Local issue mirror for searches over a few hot projects
+        mirror_projects = os.getenv("JIRA_MIRROR_PROJECTS") or None
+        mirror_path = os.getenv("JIRA_MIRROR_PATH") or None
+        mirror_sync_interval = get_env_float(
+            "JIRA_MIRROR_SYNC_INTERVAL", 60.0, minimum=5.0
+        )
+        mirror_max_lag = get_env_float("JIRA_MIRROR_MAX_LAG", 600.0, minimum=5.0)
+
+        # Project catalog cache (projects, components, versions, issue counts)
+        project_cache_ttl = get_env_float("JIRA_PROJECT_CACHE_TTL", 300.0, minimum=0.0)
+
+        # Rate limiting and retries
+        rate_limit_rps = get_env_float("JIRA_RATE_LIMIT_RPS", None, minimum=0.1)
+        rate_limit_burst = get_env_int("JIRA_RATE_LIMIT_BURST", 10, minimum=1)
+        max_retries = get_env_int("JIRA_MAX_RETRIES", 3, minimum=0)
+        circuit_breaker_threshold = get_env_int(
+            "JIRA_CIRCUIT_BREAKER_THRESHOLD", 5, minimum=1
+        )
+        circuit_breaker_reset_seconds = get_env_float(
+            "JIRA_CIRCUIT_BREAKER_RESET_SECONDS", 30.0, minimum=1.0
+        )
+
         return cls(
             url=url,
             auth_type=auth_type,
@@ -141,6 +242,25 @@ class JiraConfig:
             no_proxy=no_proxy,
             socks_proxy=socks_proxy,
             custom_headers=custom_headers,
+            attachment_upload_concurrency=attachment_upload_concurrency,
+            attachment_upload_batch_size=attachment_upload_batch_size,
+            rate_limit_rps=rate_limit_rps,
+            rate_limit_burst=rate_limit_burst,
+            max_retries=max_retries,
+            circuit_breaker_threshold=circuit_breaker_threshold,
+            circuit_breaker_reset_seconds=circuit_breaker_reset_seconds,
+            http_pool_connections=http_pool_connections,
+            http_pool_maxsize=http_pool_maxsize,
+            http_pool_block=http_pool_block,
+            http_keep_alive=http_keep_alive,
+            http_connect_timeout=http_connect_timeout,
+            http_read_timeout=http_read_timeout,
+            request_coalescing=request_coalescing,
+            mirror_projects=mirror_projects,
+            mirror_path=mirror_path,
+            mirror_sync_interval=mirror_sync_interval,
+            mirror_max_lag=mirror_max_lag,
+            project_cache_ttl=project_cache_ttl,
         )
 
     def is_auth_configured(self) -> bool:
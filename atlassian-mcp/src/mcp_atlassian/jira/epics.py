@@ -4,6 +4,8 @@ import logging
 from typing import Any
 
 from ..models.jira import JiraIssue
+from ..utils.cache import JIRA_FIELDS_TAG, get_cache, jira_project_tag
+from ..utils.concurrency import first_accepted
 from .client import JiraClient
 from .protocols import (
     FieldsOperationsProto,
@@ -14,6 +16,26 @@ from .protocols import (
 
 logger = logging.getLogger("mcp-jira")
 
+# Equivalent epic child lookup strategies raced at once, and how long the
+# strategy that worked for a project is remembered
+EPIC_STRATEGY_CONCURRENCY = 5
+EPIC_STRATEGY_TTL = 24 * 60 * 60
+
+# Epic Link field IDs commonly used across Jira instances
+COMMON_EPIC_LINK_FIELDS = [
+    "customfield_10014",  # Common in Jira Cloud
+    "customfield_10008",  # Common in Jira Server
+    "customfield_10100",
+    "customfield_10001",
+    "customfield_10002",
+    "customfield_10003",
+    "customfield_10004",
+    "customfield_10005",
+    "customfield_10006",
+    "customfield_10007",
+    "customfield_11703",  # Added based on error message
+]
+
 
 class EpicsMixin(
     JiraClient,
@@ -485,154 +507,69 @@ class EpicsMixin(
                     )
                     raise ValueError(error_msg)
 
-            # Track which methods we've tried
-            tried_methods = set()
-            issues = []
-
-            # Find the Epic Link field
             field_ids = self.get_field_ids_to_epic()
             epic_link_field = self._find_epic_link_field(field_ids)
+            tiers = self._epic_child_strategies(epic_key, epic_link_field)
+            strategies = {name: jql for tier in tiers for name, jql in tier.items()}
 
-            # METHOD 1: Try with 'issueFunction in issuesScopedToEpic' - this works in many Jira instances
-            if "issueFunction" not in tried_methods:
-                tried_methods.add("issueFunction")
-                try:
-                    jql = f'issueFunction in issuesScopedToEpic("{epic_key}")'
-                    logger.info(f"Trying to get epic issues with issueFunction: {jql}")
-
-                    search_result = self.search_issues(jql, start=start, limit=limit)
-                    if search_result:
-                        logger.info(
-                            f"Successfully found {len(search_result.issues)} issues for epic {epic_key} using issueFunction"
-                        )
-                        return search_result.issues
-                except Exception as e:
-                    # Log exception but continue with fallback
-                    logger.warning(
-                        f"Error searching epic issues with issueFunction: {str(e)}"
-                    )
+            project_key = epic_key.rsplit("-", 1)[0].upper()
+            strategy_cache = get_cache(
+                "jira-epic-child-strategy", maxsize=1024, ttl=EPIC_STRATEGY_TTL
+            )
+            cache_key = (self.config.url, project_key)
 
-            # METHOD 2: Try using parent relationship - common in many Jira setups
-            if "parent" not in tried_methods:
-                tried_methods.add("parent")
-                try:
-                    jql = f'parent = "{epic_key}"'
-                    logger.info(
-                        f"Trying to get epic issues with parent relationship: {jql}"
-                    )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using parent relationship"
-                        )
-                        return issues
-                except Exception as parent_error:
-                    logger.warning(
-                        f"Error with parent relationship approach: {str(parent_error)}"
-                    )
+            def search_with(name: str) -> list[JiraIssue]:
+                logger.info(
+                    f"Trying to get epic issues with {name}: {strategies[name]}"
+                )
+                return self._get_epic_issues_by_jql(
+                    epic_key, strategies[name], start, limit
+                )
 
-            # METHOD 3: If we found an Epic Link field, try using it
-            if epic_link_field and "epicLinkField" not in tried_methods:
-                tried_methods.add("epicLinkField")
+            # Go straight to the strategy that worked for this project before.
+            # An empty result may just mean an empty epic, so try the others.
+            remembered = strategy_cache.get(cache_key)
+            if remembered in strategies:
                 try:
-                    jql = f'"{epic_link_field}" = "{epic_key}"'
-                    logger.info(
-                        f"Trying to get epic issues with epic link field: {jql}"
-                    )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
+                    issues = search_with(remembered)
                     if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using epic link field {epic_link_field}"
-                        )
                         return issues
                 except Exception as e:
                     logger.warning(
-                        f"Error using epic link field {epic_link_field}: {str(e)}"
+                        f"Remembered epic strategy {remembered} failed: {str(e)}"
                     )
 
-            # METHOD 4: Try using 'Epic Link' as a textual field name
-            if "epicLinkName" not in tried_methods:
-                tried_methods.add("epicLinkName")
-                try:
-                    jql = f'"Epic Link" = "{epic_key}"'
-                    logger.info(
-                        f"Trying to get epic issues with 'Epic Link' field name: {jql}"
+            # Strategies find different sets of issues (direct children, all
+            # descendants, linked issues), so they are tried in priority order
+            # and only the equivalent ones within a tier are raced
+            for tier in tiers:
+                candidates = [name for name in tier if name != remembered]
+                winner = first_accepted(
+                    search_with,
+                    candidates,
+                    accept=bool,
+                    max_workers=EPIC_STRATEGY_CONCURRENCY,
+                    thread_name_prefix="jira-epic",
+                )
+                if winner is None:
+                    continue
+                name, issues = winner
+                logger.info(
+                    f"Successfully found {len(issues)} issues for epic {epic_key} using {name}"
+                )
+                strategy_cache.set(
+                    cache_key,
+                    name,
+                    tags=[JIRA_FIELDS_TAG, jira_project_tag(project_key)],
+                )
+                if name.startswith("field:"):
+                    # Cache this successful field ID for future use
+                    if self._field_ids_cache is None:
+                        self._field_ids_cache = []
+                    self._field_ids_cache.append(
+                        {"id": name.split(":", 1)[1], "name": "epic_link"}
                     )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using 'Epic Link' field name"
-                        )
-                        return issues
-                except Exception as e:
-                    logger.warning(f"Error using 'Epic Link' field name: {str(e)}")
-
-            # METHOD 5: Try using issue links with a specific link type
-            if "issueLinks" not in tried_methods:
-                tried_methods.add("issueLinks")
-                try:
-                    # Try to find issues linked to this epic with standard link types
-                    link_types = ["relates to", "blocks", "is blocked by", "is part of"]
-                    for link_type in link_types:
-                        jql = f'issueLink = "{link_type}" and issueLink = "{epic_key}"'
-                        logger.info(
-                            f"Trying to get epic issues with issue links: {jql}"
-                        )
-                        try:
-                            issues = self._get_epic_issues_by_jql(
-                                epic_key, jql, start, limit
-                            )
-                            if issues:
-                                logger.info(
-                                    f"Successfully found {len(issues)} issues for epic {epic_key} using issue links with type '{link_type}'"
-                                )
-                                return issues
-                        except Exception:
-                            # Just try the next link type
-                            continue
-                except Exception as e:
-                    logger.warning(f"Error using issue links approach: {str(e)}")
-
-            # METHOD 6: Last resort - try each common Epic Link field ID directly
-            if "commonFields" not in tried_methods:
-                tried_methods.add("commonFields")
-                common_epic_fields = [
-                    "customfield_10014",
-                    "customfield_10008",
-                    "customfield_10100",
-                    "customfield_10001",
-                    "customfield_10002",
-                    "customfield_10003",
-                    "customfield_10004",
-                    "customfield_10005",
-                    "customfield_10006",
-                    "customfield_10007",
-                    "customfield_11703",
-                ]
-
-                for field_id in common_epic_fields:
-                    try:
-                        jql = f'"{field_id}" = "{epic_key}"'
-                        logger.info(
-                            f"Trying to get epic issues with common field ID: {jql}"
-                        )
-                        issues = self._get_epic_issues_by_jql(
-                            epic_key, jql, start, limit
-                        )
-                        if issues:
-                            logger.info(
-                                f"Successfully found {len(issues)} issues for epic {epic_key} using field ID {field_id}"
-                            )
-                            # Cache this successful field ID for future use
-                            if self._field_ids_cache is None:
-                                self._field_ids_cache = []
-                            self._field_ids_cache.append(
-                                {"id": field_id, "name": "epic_link"}
-                            )
-                            return issues
-                    except Exception:
-                        # Just try the next field ID
-                        continue
+                return issues
 
             # If we've tried everything and found no issues, return an empty list
             logger.warning(
@@ -648,6 +585,51 @@ class EpicsMixin(
             logger.error(f"Error getting issues for epic {epic_key}: {str(e)}")
             raise Exception(f"Error getting epic issues: {str(e)}") from e
 
+    def _epic_child_strategies(
+        self, epic_key: str, epic_link_field: str | None
+    ) -> list[dict[str, str]]:
+        """
+        Build the JQL queries that may find the children of an epic.
+
+        The queries are grouped into tiers in priority order. Queries in the
+        same tier find the same issues (e.g. the Epic Link field by ID and by
+        name), so they can be raced; queries in different tiers may not
+        (``parent`` finds direct children, ``childIssuesOf`` all descendants).
+
+        Args:
+            epic_key: The key of the epic
+            epic_link_field: The Epic Link field ID, if known
+
+        Returns:
+            List of tiers, each mapping strategy names to JQL queries
+        """
+        epic_link = {}
+        if epic_link_field:
+            epic_link["epicLinkField"] = f'"{epic_link_field}" = "{epic_key}"'
+        epic_link["epicLinkName"] = f'"Epic Link" = "{epic_key}"'
+        tiers = [
+            {"issueFunction": f'issueFunction in issuesScopedToEpic("{epic_key}")'},
+            {"parent": f'parent = "{epic_key}"'},
+            epic_link,
+            {"childIssuesOf": f'issue in childIssuesOf("{epic_key}")'},
+        ]
+        for link_type in ["relates to", "blocks", "is blocked by", "is part of"]:
+            tiers.append(
+                {
+                    f"issueLink:{link_type}": (
+                        f'issueLink = "{link_type}" and issueLink = "{epic_key}"'
+                    )
+                }
+            )
+        tiers.append(
+            {
+                f"field:{field_id}": f'"{field_id}" = "{epic_key}"'
+                for field_id in COMMON_EPIC_LINK_FIELDS
+                if field_id != epic_link_field
+            }
+        )
+        return tiers
+
     def _find_epic_link_field(self, field_ids: dict[str, str]) -> str | None:
         """
         Find the Epic Link field with fallback mechanisms.
@@ -679,24 +661,9 @@ class EpicsMixin(
                 )
                 return field_id
 
-        # Look for any customfield that might be an epic link
-        # Common epic link field IDs across different Jira instances
-        known_epic_fields = [
-            "customfield_10014",  # Common in Jira Cloud
-            "customfield_10008",  # Common in Jira Server
-            "customfield_10100",
-            "customfield_10001",
-            "customfield_10002",
-            "customfield_10003",
-            "customfield_10004",
-            "customfield_10005",
-            "customfield_10006",
-            "customfield_10007",
-            "customfield_11703",  # Added based on error message
-        ]
-
-        # Check if any of these known fields exist in our field IDs values
-        for field_id in known_epic_fields:
+        # Look for any customfield that might be an epic link: check if any
+        # of the commonly used field IDs exist in our field IDs values
+        for field_id in COMMON_EPIC_LINK_FIELDS:
             if field_id in field_ids.values():
                 logger.info(f"Using known epic link field ID: {field_id}")
                 return field_id
@@ -0,0 +1,58 @@
+"""The combined Jira client used by the MCP tools."""
+
+from .attachments import AttachmentsMixin
+from .boards import BoardsMixin
+from .comments import CommentsMixin
+from .epics import EpicsMixin
+from .fields import FieldsMixin
+from .formatting import FormattingMixin
+from .issues import IssuesMixin
+from .links import LinksMixin
+from .projects import ProjectsMixin
+from .search import SearchMixin
+from .sprints import SprintsMixin
+from .transitions import TransitionsMixin
+from .users import UsersMixin
+from .worklog import WorklogMixin
+
+
+class JiraFetcher(
+    ProjectsMixin,
+    FieldsMixin,
+    FormattingMixin,
+    TransitionsMixin,
+    WorklogMixin,
+    EpicsMixin,
+    CommentsMixin,
+    SearchMixin,
+    IssuesMixin,
+    UsersMixin,
+    BoardsMixin,
+    SprintsMixin,
+    AttachmentsMixin,
+    LinksMixin,
+):
+    """
+    The main Jira client class providing access to all Jira operations.
+
+    This class inherits from multiple mixins that provide specific functionality:
+    - ProjectsMixin: Project-related operations
+    - FieldsMixin: Field-related operations
+    - FormattingMixin: Content formatting utilities
+    - TransitionsMixin: Issue transition operations
+    - WorklogMixin: Worklog operations
+    - EpicsMixin: Epic operations
+    - CommentsMixin: Comment operations
+    - SearchMixin: Search operations
+    - IssuesMixin: Issue operations
+    - UsersMixin: User operations
+    - BoardsMixin: Board operations
+    - SprintsMixin: Sprint operations
+    - AttachmentsMixin: Attachment download operations
+    - LinksMixin: Issue link operations
+
+    The class structure is designed to maintain backward compatibility while
+    improving code organization and maintainability.
+    """
+
+    pass
@@ -0,0 +1,804 @@
+"""Local SQLite mirror of Jira issues for configured projects.
+
+Dashboards and agent loops tend to run the same searches over the same few
+projects again and again. When ``JIRA_MIRROR_PROJECTS`` is set, issues from
+those projects are synced into a local SQLite store using ``updated``-based
+JQL deltas, and ``search_issues`` answers a supported subset of JQL from the
+store instead of calling Jira:
+
+- ``project``, ``key``/``issuekey``: ``=``, ``!=``, ``IN``, ``NOT IN``
+- ``status``, ``assignee``, ``labels``: the same, plus ``IS [NOT] EMPTY``
+- ``created``, ``updated``: ``=``, ``>``, ``>=``, ``<``, ``<=`` with absolute
+  dates (``"2024-01-31"``, ``"2024/01/31 10:00"``) or relative offsets
+  (``-7d``, ``-2w``, ``-4h``, ``-30m``)
+- ``text``, ``summary``, ``description``: ``~`` (all words, substring match)
+- clauses joined with ``AND`` (parentheses allowed) and ``ORDER BY`` on
+  ``created``, ``updated`` or ``key``
+
+Anything else (``OR``, functions such as ``currentUser()``, other fields, or
+queries not restricted to mirrored projects) falls back to the live API.
+Absolute dates are interpreted as UTC, while Jira uses the user's time zone.
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from ..utils.cache import credential_scope
+from ..utils.metrics import counter, gauge, register_collector
+
+logger = logging.getLogger("mcp-jira")
+
+# Fetch every issue of a project again at this interval so deleted or moved
+# issues (which never show up in an ``updated`` delta) are dropped
+FULL_SYNC_INTERVAL = 24 * 60 * 60
+
+MIRROR_QUERIES = counter(
+    "jira_mirror_queries_total",
+    "jira_search calls by where they were answered ('local' mirror or "
+    "'remote' API) and why.",
+    ("result", "reason"),
+)
+MIRROR_LAG = gauge(
+    "jira_mirror_freshness_lag_seconds",
+    "Seconds since the mirrored project was last synced.",
+    ("project",),
+)
+MIRROR_ISSUES = gauge(
+    "jira_mirror_issues",
+    "Issues held in the local mirror, by project.",
+    ("project",),
+)
+MIRROR_SYNCS = counter(
+    "jira_mirror_syncs_total",
+    "Mirror sync runs by kind (full/delta) and outcome.",
+    ("kind", "outcome"),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    issue_key TEXT PRIMARY KEY,
+    issue_id TEXT,
+    project TEXT NOT NULL,
+    issue_num INTEGER,
+    status TEXT COLLATE NOCASE,
+    assignee_id TEXT COLLATE NOCASE,
+    assignee_name TEXT COLLATE NOCASE,
+    assignee_email TEXT COLLATE NOCASE,
+    summary TEXT,
+    description TEXT,
+    created REAL,
+    updated REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_issues_project_updated ON issues (project, updated);
+CREATE INDEX IF NOT EXISTS idx_issues_status ON issues (status);
+CREATE INDEX IF NOT EXISTS idx_issues_assignee ON issues (assignee_id);
+CREATE INDEX IF NOT EXISTS idx_issues_created ON issues (created);
+CREATE TABLE IF NOT EXISTS issue_labels (
+    issue_key TEXT NOT NULL,
+    label TEXT NOT NULL COLLATE NOCASE
+);
+CREATE INDEX IF NOT EXISTS idx_issue_labels_label ON issue_labels (label, issue_key);
+CREATE INDEX IF NOT EXISTS idx_issue_labels_key ON issue_labels (issue_key);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    last_sync REAL,
+    last_full_sync REAL
+);
+"""
+
+
+class UnsupportedJQLError(ValueError):
+    """The JQL uses syntax the mirror cannot evaluate locally."""
+
+
+@dataclass
+class MirrorQuery:
+    """A JQL query translated to SQL over the mirror tables."""
+
+    where: list[str] = field(default_factory=list)
+    params: list[Any] = field(default_factory=list)
+    projects: set[str] | None = None  # Projects the query is restricted to
+    order_by: list[str] = field(default_factory=list)
+
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<op>!=|!~|>=|<=|=|~|>|<|\(|\)|,)
+      | (?P<word>[^\s"'=!~<>(),]+)
+    )""",
+    re.VERBOSE,
+)
+
+_RELATIVE_DATE_RE = re.compile(r"^([+-]?)(\d+)([wdhm])$", re.IGNORECASE)
+_UNIT_SECONDS = {"w": 604800, "d": 86400, "h": 3600, "m": 60}
+_ABSOLUTE_DATE_FORMATS = ("%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M", "%Y-%m-%d", "%Y/%m/%d")
+
+_LIST_FIELDS = {
+    "project": "project",
+    "key": "issue_key",
+    "issuekey": "issue_key",
+    "status": "status",
+}
+_DATE_FIELDS = {"created": "created", "updated": "updated"}
+_TEXT_FIELDS = {
+    "text": ("summary", "description"),
+    "summary": ("summary",),
+    "description": ("description",),
+}
+_ORDER_FIELDS = {
+    "created": ("created",),
+    "updated": ("updated",),
+    "key": ("project", "issue_num"),
+    "issuekey": ("project", "issue_num"),
+}
+
+
+def _tokenize(jql: str) -> list[tuple[str, str]]:
+    tokens = []
+    position = 0
+    jql = jql.strip()
+    while position < len(jql):
+        match = _TOKEN_RE.match(jql, position)
+        if not match or match.end() == position:
+            raise UnsupportedJQLError(f"Cannot tokenize JQL at: {jql[position:]}")
+        position = match.end()
+        kind = match.lastgroup or ""
+        value = match.group(kind)
+        if kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        tokens.append((kind, value))
+    return tokens
+
+
+def _parse_date(value: str, now: float) -> float:
+    relative = _RELATIVE_DATE_RE.match(value)
+    if relative:
+        sign, amount, unit = relative.groups()
+        offset = int(amount) * _UNIT_SECONDS[unit.lower()]
+        return now - offset if sign == "-" else now + offset
+    for date_format in _ABSOLUTE_DATE_FORMATS:
+        try:
+            # Jira would use the user's time zone; UTC is the closest neutral choice
+            parsed = datetime.strptime(value, date_format)  # noqa: DTZ007
+        except ValueError:
+            continue
+        return parsed.replace(tzinfo=timezone.utc).timestamp()
+    raise UnsupportedJQLError(f"Unsupported date value: {value}")
+
+
+class _Parser:
+    """Recursive-descent parser for the supported JQL subset."""
+
+    def __init__(self, jql: str, now: float) -> None:
+        self.tokens = _tokenize(jql)
+        self.position = 0
+        self.now = now
+        self.query = MirrorQuery()
+
+    def peek(self, offset: int = 0) -> tuple[str, str] | None:
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def peek_keyword(self, *keywords: str) -> bool:
+        token = self.peek()
+        return token is not None and token[0] == "word" and token[1].upper() in keywords
+
+    def take(self) -> tuple[str, str]:
+        token = self.peek()
+        if token is None:
+            raise UnsupportedJQLError("Unexpected end of JQL")
+        self.position += 1
+        return token
+
+    def expect(self, value: str) -> None:
+        kind, token = self.take()
+        if token.upper() != value:
+            raise UnsupportedJQLError(f"Expected '{value}', got '{token}'")
+
+    def value(self) -> str:
+        kind, token = self.take()
+        if kind == "op":
+            raise UnsupportedJQLError(f"Expected a value, got '{token}'")
+        if kind == "word" and self.peek() == ("op", "("):
+            raise UnsupportedJQLError(f"JQL functions are not supported: {token}()")
+        return token
+
+    def value_list(self) -> list[str]:
+        self.expect("(")
+        values = [self.value()]
+        while self.peek() == ("op", ","):
+            self.take()
+            values.append(self.value())
+        self.expect(")")
+        return values
+
+    def parse(self) -> MirrorQuery:
+        if self.peek() is not None and not self.peek_keyword("ORDER"):
+            self.clauses()
+        if self.peek_keyword("ORDER"):
+            self.take()
+            self.expect("BY")
+            self.order_by()
+        if self.peek() is not None:
+            raise UnsupportedJQLError(f"Unsupported JQL near '{self.peek()[1]}'")
+        return self.query
+
+    def clauses(self) -> None:
+        self.term()
+        while self.peek_keyword("AND"):
+            self.take()
+            self.term()
+        if self.peek_keyword("OR", "NOT"):
+            raise UnsupportedJQLError("OR/NOT are not supported by the mirror")
+
+    def term(self) -> None:
+        if self.peek() == ("op", "("):
+            self.take()
+            self.clauses()
+            self.expect(")")
+        else:
+            self.clause()
+
+    def order_by(self) -> None:
+        while True:
+            kind, name = self.take()
+            columns = _ORDER_FIELDS.get(name.lower())
+            if kind == "op" or columns is None:
+                raise UnsupportedJQLError(f"Cannot order by '{name}' locally")
+            direction = "ASC"
+            if self.peek_keyword("ASC", "DESC"):
+                direction = self.take()[1].upper()
+            self.query.order_by.extend(f"{column} {direction}" for column in columns)
+            if self.peek() != ("op", ","):
+                break
+            self.take()
+
+    def operator(self) -> str:
+        kind, token = self.take()
+        if kind == "op":
+            return token
+        keyword = token.upper()
+        if keyword == "NOT" and self.peek_keyword("IN"):
+            self.take()
+            return "NOT IN"
+        if keyword == "IS" and self.peek_keyword("NOT"):
+            self.take()
+            return "IS NOT"
+        if keyword in ("IN", "IS"):
+            return keyword
+        raise UnsupportedJQLError(f"Unsupported operator '{token}'")
+
+    def add(self, sql: str, *params: Any) -> None:
+        self.query.where.append(sql)
+        self.query.params.extend(params)
+
+    def clause(self) -> None:
+        kind, name = self.take()
+        if kind == "op":
+            raise UnsupportedJQLError(f"Expected a field, got '{name}'")
+        field_name = name.lower()
+        op = self.operator()
+
+        if op in ("IS", "IS NOT"):
+            if not self.peek_keyword("EMPTY", "NULL"):
+                raise UnsupportedJQLError("IS only supports EMPTY/NULL")
+            self.take()
+            self.empty_clause(field_name, negate=op == "IS NOT")
+        elif field_name in _LIST_FIELDS or field_name in ("assignee", "labels"):
+            if op in ("=", "!="):
+                values = [self.value()]
+            elif op in ("IN", "NOT IN"):
+                values = self.value_list()
+            else:
+                raise UnsupportedJQLError(f"Unsupported operator {op} for {name}")
+            self.list_clause(field_name, values, negate=op in ("!=", "NOT IN"))
+        elif field_name in _DATE_FIELDS:
+            if op not in ("=", ">", ">=", "<", "<="):
+                raise UnsupportedJQLError(f"Unsupported operator {op} for {name}")
+            timestamp = _parse_date(self.value(), self.now)
+            self.add(f"{_DATE_FIELDS[field_name]} {op} ?", timestamp)
+        elif field_name in _TEXT_FIELDS:
+            if op != "~":
+                raise UnsupportedJQLError(f"Unsupported operator {op} for {name}")
+            self.text_clause(_TEXT_FIELDS[field_name], self.value())
+        else:
+            raise UnsupportedJQLError(f"Field '{name}' is not mirrored")
+
+    def empty_clause(self, field_name: str, *, negate: bool) -> None:
+        if field_name == "assignee":
+            column = "assignee_id"
+        elif field_name in ("summary", "description"):
+            column = field_name
+        elif field_name == "labels":
+            exists = (
+                "EXISTS (SELECT 1 FROM issue_labels l "
+                "WHERE l.issue_key = issues.issue_key)"
+            )
+            self.add(exists if negate else f"NOT {exists}")
+            return
+        else:
+            raise UnsupportedJQLError(f"Unsupported EMPTY check on '{field_name}'")
+        self.add(f"{column} IS NOT NULL" if negate else f"{column} IS NULL")
+
+    def list_clause(self, field_name: str, values: list[str], *, negate: bool) -> None:
+        placeholders = ", ".join("?" for _ in values)
+        in_op = "NOT IN" if negate else "IN"
+        if field_name == "assignee":
+            # Like Jira, negative matches never include unassigned issues
+            if negate:
+                self.add(
+                    "(assignee_id IS NOT NULL "
+                    f"AND assignee_id {in_op} ({placeholders}) "
+                    f"AND COALESCE(assignee_name, '') {in_op} ({placeholders}) "
+                    f"AND COALESCE(assignee_email, '') {in_op} ({placeholders}))",
+                    *values * 3,
+                )
+            else:
+                self.add(
+                    f"(assignee_id IN ({placeholders}) "
+                    f"OR assignee_name IN ({placeholders}) "
+                    f"OR assignee_email IN ({placeholders}))",
+                    *values * 3,
+                )
+        elif field_name == "labels":
+            exists = (
+                "EXISTS (SELECT 1 FROM issue_labels l WHERE l.issue_key = "  # noqa: S608
+                f"issues.issue_key AND l.label IN ({placeholders}))"
+            )
+            if negate:
+                # Issues without any labels do not match negative label clauses
+                self.add(f"NOT {exists}", *values)
+                self.add(
+                    "EXISTS (SELECT 1 FROM issue_labels l "
+                    "WHERE l.issue_key = issues.issue_key)"
+                )
+            else:
+                self.add(exists, *values)
+        else:
+            column = _LIST_FIELDS[field_name]
+            if column in ("project", "issue_key"):
+                values = [value.upper() for value in values]
+            self.add(f"{column} {in_op} ({placeholders})", *values)
+            if column == "project" and not negate:
+                projects = set(values)
+                if self.query.projects is not None:
+                    projects &= self.query.projects
+                self.query.projects = projects
+
+    def text_clause(self, columns: tuple[str, ...], term: str) -> None:
+        words = [word for word in re.split(r"\s+", term.replace("*", " ")) if word]
+        if not words:
+            raise UnsupportedJQLError("Empty text search")
+        for word in words:
+            pattern = "%" + word.replace("%", r"\%").replace("_", r"\_") + "%"
+            self.add(
+                "("
+                + " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in columns)
+                + ")",
+                *[pattern] * len(columns),
+            )
+
+
+def parse_jql(jql: str, now: float | None = None) -> MirrorQuery:
+    """Translate a JQL query into a mirror query.
+
+    Args:
+        jql: JQL query string
+        now: Reference time for relative dates (defaults to the current time)
+
+    Returns:
+        The translated query
+
+    Raises:
+        UnsupportedJQLError: If the query uses unsupported syntax
+    """
+    return _Parser(jql, time.time() if now is None else now).parse()
+
+
+def _timestamp(value: Any) -> float | None:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(str(value), "%Y-%m-%dT%H:%M:%S.%f%z").timestamp()
+    except ValueError:
+        try:
+            return datetime.fromisoformat(str(value)).timestamp()
+        except ValueError:
+            return None
+
+
+def _plain_text(value: Any) -> str | None:
+    """Flatten plain or ADF (Cloud v3) text to a searchable string."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        parts = [value.get("text", "")] if isinstance(value.get("text"), str) else []
+        parts.extend(_plain_text(child) or "" for child in value.get("content", []))
+        return " ".join(part for part in parts if part)
+    if isinstance(value, list):
+        return " ".join(_plain_text(item) or "" for item in value)
+    return str(value)
+
+
+class IssueMirror:
+    """SQLite-backed store of issues for a set of mirrored projects."""
+
+    def __init__(
+        self,
+        path: str,
+        projects: list[str],
+        sync_interval: float = 60.0,
+        max_lag: float = 600.0,
+    ) -> None:
+        self.path = path
+        self.projects = [project.strip().upper() for project in projects if project]
+        self.sync_interval = sync_interval
+        self.max_lag = max_lag
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._sync_thread: threading.Thread | None = None
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock:
+            self._connection.executescript(_SCHEMA)
+
+    # Sync
+
+    def _sync_state(self) -> dict[str, tuple[float | None, float | None]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT project, last_sync, last_full_sync FROM sync_state"
+            ).fetchall()
+        return {
+            row["project"]: (row["last_sync"], row["last_full_sync"]) for row in rows
+        }
+
+    def lag(self, now: float | None = None) -> dict[str, float]:
+        """Return seconds since the last successful sync of each project."""
+        now = time.time() if now is None else now
+        state = self._sync_state()
+        return {
+            project: now - state[project][0]
+            if state.get(project, (None, None))[0] is not None
+            else math.inf
+            for project in self.projects
+        }
+
+    def needs_sync(self) -> bool:
+        """Whether any project is due for a delta sync."""
+        return any(lag >= self.sync_interval for lag in self.lag().values())
+
+    def is_fresh(self) -> bool:
+        """Whether every project was synced within the allowed lag."""
+        return all(lag <= self.max_lag for lag in self.lag().values())
+
+    def sync(self, fetch: Callable[[str], list[dict[str, Any]]]) -> int:
+        """Bring every mirrored project up to date.
+
+        Uses ``updated >= -<n>m`` deltas since the previous sync (relative
+        dates avoid time-zone ambiguity) and periodically a full sync to drop
+        issues that were deleted or moved to another project.
+
+        Args:
+            fetch: Returns all raw issues (with all fields) matching a JQL query
+
+        Returns:
+            Number of issues written
+        """
+        written = 0
+        with self._sync_lock:
+            state = self._sync_state()
+            for project in self.projects:
+                last_sync, last_full_sync = state.get(project, (None, None))
+                started = time.time()
+                full = (
+                    last_sync is None
+                    or last_full_sync is None
+                    or started - last_full_sync >= FULL_SYNC_INTERVAL
+                )
+                jql = f'project = "{project}"'
+                if not full:
+                    # One minute of overlap covers JQL's minute granularity
+                    minutes = math.ceil((started - last_sync) / 60) + 1
+                    jql += f" AND updated >= -{minutes}m"
+                jql += " ORDER BY updated ASC"
+                kind = "full" if full else "delta"
+                try:
+                    issues = fetch(jql)
+                except Exception:
+                    MIRROR_SYNCS.inc(kind=kind, outcome="error")
+                    raise
+                self._store(project, issues, started, full=full)
+                MIRROR_SYNCS.inc(kind=kind, outcome="ok")
+                written += len(issues)
+                logger.debug(f"Mirror {kind} sync of {project}: {len(issues)} issues")
+        return written
+
+    def sync_in_background(self, fetch: Callable[[str], list[dict[str, Any]]]) -> bool:
+        """Start a sync on a daemon thread unless one is already running.
+
+        Returns:
+            True if a new sync was started
+        """
+        with self._lock:
+            if self._sync_thread is not None and self._sync_thread.is_alive():
+                return False
+
+            def run() -> None:
+                try:
+                    self.sync(fetch)
+                except Exception as e:  # noqa: BLE001 - searches fall back to the API
+                    logger.warning(f"Jira mirror sync failed: {e}")
+
+            self._sync_thread = threading.Thread(
+                target=run, name="jira-mirror-sync", daemon=True
+            )
+            self._sync_thread.start()
+            return True
+
+    def wait_for_sync(self, timeout: float | None = None) -> None:
+        """Wait for a running background sync to finish."""
+        thread = self._sync_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _store(
+        self, project: str, issues: list[dict[str, Any]], started: float, *, full: bool
+    ) -> None:
+        rows = []
+        labels = []
+        for issue in issues:
+            key = str(issue.get("key", "")).upper()
+            if not key:
+                continue
+            fields = issue.get("fields") or {}
+            assignee = fields.get("assignee") or {}
+            status = fields.get("status") or {}
+            issue_project = (fields.get("project") or {}).get("key") or key.split("-")[
+                0
+            ]
+            number = key.rsplit("-", 1)[-1]
+            rows.append(
+                (
+                    key,
+                    str(issue.get("id", "")),
+                    str(issue_project).upper(),
+                    int(number) if number.isdigit() else None,
+                    status.get("name"),
+                    assignee.get("accountId") or assignee.get("name"),
+                    assignee.get("displayName"),
+                    assignee.get("emailAddress"),
+                    _plain_text(fields.get("summary")),
+                    _plain_text(fields.get("description")),
+                    _timestamp(fields.get("created")),
+                    _timestamp(fields.get("updated")),
+                    json.dumps(issue),
+                )
+            )
+            labels.extend((key, label) for label in fields.get("labels") or [])
+
+        keys = [(row[0],) for row in rows]
+        with self._lock, self._connection:
+            if full:
+                self._connection.execute(
+                    "DELETE FROM issue_labels WHERE issue_key IN "
+                    "(SELECT issue_key FROM issues WHERE project = ?)",
+                    (project,),
+                )
+                self._connection.execute(
+                    "DELETE FROM issues WHERE project = ?", (project,)
+                )
+            self._connection.executemany(
+                "DELETE FROM issue_labels WHERE issue_key = ?", keys
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO issues VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.executemany(
+                "INSERT INTO issue_labels (issue_key, label) VALUES (?, ?)", labels
+            )
+            self._connection.execute(
+                "INSERT INTO sync_state (project, last_sync, last_full_sync) "
+                "VALUES (?, ?, ?) ON CONFLICT(project) DO UPDATE SET "
+                "last_sync = excluded.last_sync, "
+                "last_full_sync = COALESCE(excluded.last_full_sync, last_full_sync)",
+                (project, started, started if full else None),
+            )
+
+    def forget(self, issue_keys: list[str]) -> None:
+        """Remove issues from the mirror (e.g. after they were deleted)."""
+        keys = [(key.upper(),) for key in issue_keys]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM issue_labels WHERE issue_key = ?", keys
+            )
+            self._connection.executemany("DELETE FROM issues WHERE issue_key = ?", keys)
+
+    # Queries
+
+    def search(
+        self, jql: str, start: int = 0, limit: int = 50
+    ) -> tuple[list[dict[str, Any]], int] | None:
+        """Answer a JQL query locally if possible.
+
+        Args:
+            jql: JQL query string
+            start: Index of the first issue to return
+            limit: Maximum issues to return
+
+        Returns:
+            Tuple of (raw issues, total matches), or None if the query must
+            go to the live API
+        """
+        try:
+            query = parse_jql(jql)
+        except UnsupportedJQLError as e:
+            logger.debug(f"Mirror cannot answer JQL '{jql}': {e}")
+            MIRROR_QUERIES.inc(result="remote", reason="unsupported")
+            return None
+        if not query.projects or not query.projects <= set(self.projects):
+            MIRROR_QUERIES.inc(result="remote", reason="unmirrored")
+            return None
+        lag = self.lag()
+        if any(lag[project] > self.max_lag for project in query.projects):
+            MIRROR_QUERIES.inc(result="remote", reason="stale")
+            return None
+
+        where = " AND ".join(query.where) or "1 = 1"
+        order = ", ".join(query.order_by or ["project DESC", "issue_num DESC"])
+        with self._lock:
+            total = self._connection.execute(
+                f"SELECT COUNT(*) FROM issues WHERE {where}",  # noqa: S608
+                query.params,
+            ).fetchone()[0]
+            rows = self._connection.execute(
+                f"SELECT data FROM issues WHERE {where} ORDER BY {order} "  # noqa: S608
+                "LIMIT ? OFFSET ?",
+                [*query.params, limit, start],
+            ).fetchall()
+        MIRROR_QUERIES.inc(result="local", reason="ok")
+        return [json.loads(row["data"]) for row in rows], total
+
+    def issue_counts(self) -> dict[str, int]:
+        """Return the number of mirrored issues per project."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT project, COUNT(*) AS count FROM issues GROUP BY project"
+            ).fetchall()
+        return {row["project"]: row["count"] for row in rows}
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        self.wait_for_sync(timeout=5)
+        with self._lock:
+            self._connection.close()
+
+
+_MIRRORS: dict[tuple[str, str], IssueMirror] = {}
+_MIRRORS_LOCK = threading.Lock()
+
+
+def get_issue_mirror(config: Any) -> IssueMirror | None:
+    """Return the process-wide mirror for a Jira config, if mirroring is enabled.
+
+    Mirrors are kept per site and credential so that issues synced with one
+    identity's permissions are never served to another. Only the server's
+    configured credentials mirror; configs built for per-request user tokens
+    have ``mirror_projects`` cleared.
+
+    Args:
+        config: The JiraConfig of the fetcher
+
+    Returns:
+        The mirror, or None if ``mirror_projects`` is not configured
+    """
+    projects_setting = getattr(config, "mirror_projects", None)
+    if not isinstance(projects_setting, str) or not projects_setting.strip():
+        return None
+    scope = credential_scope(config)
+    key = (config.url, scope)
+    with _MIRRORS_LOCK:
+        mirror = _MIRRORS.get(key)
+        if mirror is None:
+            path = ":memory:"
+            if config.mirror_path:
+                os.makedirs(config.mirror_path, exist_ok=True)
+                path = os.path.join(config.mirror_path, f"jira-mirror-{scope}.sqlite3")
+            mirror = IssueMirror(
+                path,
+                projects=projects_setting.split(","),
+                sync_interval=config.mirror_sync_interval,
+                max_lag=config.mirror_max_lag,
+            )
+            _MIRRORS[key] = mirror
+            logger.info(f"Jira issue mirror enabled for projects {mirror.projects}")
+        return mirror
+
+
+def forget_mirrored_issues(issue_url: str, issue_keys: list[str]) -> int:
+    """Remove issues from the mirrors of one site (e.g. after a delete webhook).
+
+    Args:
+        issue_url: REST ``self`` link of an issue, identifying its site
+        issue_keys: Keys of the issues that no longer exist under that key
+
+    Returns:
+        The number of mirrors the issues were removed from
+    """
+    if not issue_keys:
+        return 0
+    with _MIRRORS_LOCK:
+        mirrors = [
+            mirror
+            for (site_url, _scope), mirror in _MIRRORS.items()
+            if issue_url.startswith(site_url.rstrip("/") + "/")
+        ]
+    for mirror in mirrors:
+        mirror.forget(issue_keys)
+    return len(mirrors)
+
+
+def close_issue_mirrors() -> None:
+    """Close and forget every mirror (used on shutdown and in tests)."""
+    with _MIRRORS_LOCK:
+        mirrors = list(_MIRRORS.values())
+        _MIRRORS.clear()
+    for mirror in mirrors:
+        mirror.close()
+
+
+def get_mirror_stats() -> dict[str, Any]:
+    """Return local/remote answer counts, the local hit rate and sync lag."""
+    local = sum(
+        v for labels, v in MIRROR_QUERIES.samples() if labels["result"] == "local"
+    )
+    remote = sum(
+        v for labels, v in MIRROR_QUERIES.samples() if labels["result"] == "remote"
+    )
+    with _MIRRORS_LOCK:
+        mirrors = list(_MIRRORS.values())
+    lag: dict[str, float] = {}
+    for mirror in mirrors:
+        for project, seconds in mirror.lag().items():
+            lag[project] = max(lag.get(project, 0.0), seconds)
+    total = local + remote
+    return {
+        "local": local,
+        "remote": remote,
+        "hit_rate": local / total if total else 0.0,
+        "lag_seconds": lag,
+    }
+
+
+def _collect_mirror_metrics() -> None:
+    with _MIRRORS_LOCK:
+        mirrors = list(_MIRRORS.values())
+    MIRROR_LAG.clear()
+    MIRROR_ISSUES.clear()
+    for mirror in mirrors:
+        for project, seconds in mirror.lag().items():
+            if math.isfinite(seconds):
+                MIRROR_LAG.set(
+                    max(seconds, MIRROR_LAG.value(project=project)), project=project
+                )
+        for project, count in mirror.issue_counts().items():
+            MIRROR_ISSUES.inc(count, project=project)
+
+
+register_collector(_collect_mirror_metrics)
@@ -1,16 +1,62 @@
 """Module for Jira project operations."""
 
+import copy
 import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from typing import Any
 
 from ..models import JiraProject
 from ..models.jira.search import JiraSearchResult
 from ..models.jira.version import JiraVersion
+from ..utils.cache import (
+    JIRA_PROJECTS_TAG,
+    credential_scope,
+    get_cache,
+    invalidate_tags,
+    jira_project_tag,
+)
+from ..utils.metrics import counter
 from .client import JiraClient
 from .protocols import SearchOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Stale catalog entries are kept this long so they can be revalidated with
+# their ETag instead of being downloaded again
+PROJECT_CATALOG_RETENTION = 24 * 60 * 60
+PROJECT_CATALOG_MAXSIZE = 2048
+
+PROJECT_CATALOG_FETCHES = counter(
+    "jira_project_catalog_fetches_total",
+    "Project catalog loads from Jira by kind and result "
+    "('full' downloaded the data, 'not_modified' revalidated it with an ETag).",
+    ("kind", "result"),
+)
+
+
+@dataclass(frozen=True)
+class _CatalogEntry:
+    """A cached catalog value with the time it was last confirmed current."""
+
+    value: Any
+    fetched_at: float
+    etag: str | None = None
+
+
+class _IncompleteCatalogError(Exception):
+    """Raised by a catalog loader whose partial result must not be cached."""
+
+    def __init__(self, value: Any) -> None:
+        super().__init__("Incomplete catalog result")
+        self.value = value
+
+
+# A catalog loader takes the cached ETag (if any) and returns the fresh value
+# and its ETag, or None when Jira answered 304 Not Modified
+CatalogLoader = Callable[[str | None], tuple[Any, str | None] | None]
+
 
 class ProjectsMixin(JiraClient, SearchOperationsProto):
     """Mixin for Jira project operations.
@@ -19,28 +65,180 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
     including project details, components, versions, and other project-related operations.
     """
 
-    def get_all_projects(self, include_archived: bool = False) -> list[dict[str, Any]]:
+    def get_all_projects(
+        self, include_archived: bool = False, refresh: bool = False
+    ) -> list[dict[str, Any]]:
         """
         Get all projects visible to the current user.
 
+        The list is served from the project catalog cache for
+        ``project_cache_ttl`` seconds.
+
         Args:
             include_archived: Whether to include archived projects
+            refresh: Bypass the cache and fetch the list from Jira
 
         Returns:
             List of project data dictionaries
         """
         try:
-            params = {}
-            if include_archived:
-                params["includeArchived"] = "true"
-
-            projects = self.jira.projects(included_archived=include_archived)
-            return projects if isinstance(projects, list) else []
+            return self._cached_catalog(
+                ("projects", include_archived),
+                [JIRA_PROJECTS_TAG],
+                lambda etag: self._load_projects(include_archived, etag),
+                refresh=refresh,
+            )
 
         except Exception as e:
             logger.error(f"Error getting all projects: {str(e)}")
             return []
 
+    def _load_projects(
+        self, include_archived: bool, etag: str | None
+    ) -> tuple[list[dict[str, Any]], str | None] | None:
+        """Load the project list, conditionally where it is a single request."""
+        if self.config.is_cloud:
+            # Cloud pages through project/search, which has no single ETag
+            projects = self.jira.projects(included_archived=include_archived)
+            if not isinstance(projects, list):
+                msg = f"Unexpected return value type from `jira.projects`: {type(projects)}"
+                raise TypeError(msg)
+            return projects, None
+        params = {"includeArchived": "true"} if include_archived else None
+        return self._get_catalog_list(self.jira.resource_url("project"), etag, params)
+
+    def _get_catalog_list(
+        self, path: str, etag: str | None, params: dict[str, Any] | None = None
+    ) -> tuple[list[dict[str, Any]], str | None] | None:
+        """GET a list resource, sending If-None-Match when an ETag is known.
+
+        Args:
+            path: API path of the resource
+            etag: ETag of the cached copy, if any
+            params: Optional query parameters
+
+        Returns:
+            Tuple of (list, ETag) or None if Jira answered 304 Not Modified
+
+        Raises:
+            requests.HTTPError: If the request failed
+            TypeError: If the response is not a JSON list
+        """
+        headers = dict(self.jira.default_headers or {})
+        if etag:
+            headers["If-None-Match"] = etag
+        response = self.jira.get(
+            path, params=params, headers=headers, advanced_mode=True
+        )
+        if etag and response.status_code == 304:
+            return None
+        response.raise_for_status()
+        data = response.json()
+        if not isinstance(data, list):
+            msg = f"Unexpected response type from {path}: {type(data)}"
+            raise TypeError(msg)
+        return data, response.headers.get("ETag")
+
+    def _cached_catalog(
+        self,
+        key: tuple,
+        tags: Iterable[str],
+        loader: CatalogLoader,
+        refresh: bool = False,
+        value_tags: Callable[[Any], Iterable[str]] | None = None,
+    ) -> Any:
+        """Return project catalog data from the cache, revalidating stale entries.
+
+        Entries younger than ``project_cache_ttl`` are served directly. Older
+        entries are revalidated with their ETag when they have one, so an
+        unchanged catalog costs a 304 instead of a full download.
+
+        Args:
+            key: Cache key within the current credential scope
+            tags: Tags that invalidate the entry
+            loader: Callable fetching the data (see CatalogLoader)
+            refresh: Skip the cache and download the data again
+            value_tags: Callable returning further tags for the loaded value
+
+        Returns:
+            A copy of the cached or freshly loaded value
+        """
+        ttl = self.config.project_cache_ttl
+        kind = key[0]
+        if not isinstance(ttl, int | float) or ttl <= 0:
+            PROJECT_CATALOG_FETCHES.inc(kind=kind, result="full")
+            return loader(None)[0]
+
+        cache = get_cache(
+            "jira-project-catalog",
+            maxsize=PROJECT_CATALOG_MAXSIZE,
+            ttl=PROJECT_CATALOG_RETENTION,
+        )
+        cache_key = (credential_scope(self.config), *key)
+        entry: _CatalogEntry | None = None if refresh else cache.get(cache_key)
+        now = time.monotonic()
+        if entry is not None and now - entry.fetched_at < ttl:
+            return copy.deepcopy(entry.value)
+
+        loaded = loader(entry.etag if entry else None)
+        if loaded is None and entry is not None:
+            PROJECT_CATALOG_FETCHES.inc(kind=kind, result="not_modified")
+            entry = _CatalogEntry(entry.value, now, entry.etag)
+        else:
+            PROJECT_CATALOG_FETCHES.inc(kind=kind, result="full")
+            value, etag = loaded
+            entry = _CatalogEntry(value, now, etag)
+        if value_tags is not None:
+            tags = [*tags, *value_tags(entry.value)]
+        cache.set(cache_key, entry, tags)
+        return copy.deepcopy(entry.value)
+
+    def invalidate_project_catalog(self, project_key: str | None = None) -> int:
+        """
+        Drop cached project catalog data so the next read fetches it again.
+
+        Args:
+            project_key: Only drop data of this project (components, versions,
+                issue count); None drops the project lists as well
+
+        Returns:
+            Number of cache entries removed
+        """
+        if project_key:
+            return invalidate_tags([jira_project_tag(project_key)])
+        return invalidate_tags([JIRA_PROJECTS_TAG])
+
+    def _project_id_tags(
+        self, project_key: str, items: Iterable[Any] = ()
+    ) -> list[str]:
+        """Return the tags of a project's numeric ID.
+
+        Version and component webhooks identify the project only by ID, so
+        per-project catalog entries carry its ID tag next to the key tag. The
+        ID comes from the ``projectId`` of the loaded items, or from the
+        (cached) project list when there are none.
+
+        Args:
+            project_key: The project key
+            items: Loaded components or versions
+
+        Returns:
+            Tags of the project ID, empty if it is unknown
+        """
+        ids = {
+            str(item["projectId"])
+            for item in items
+            if isinstance(item, dict) and item.get("projectId") is not None
+        }
+        if not ids:
+            ids = {
+                str(project["id"])
+                for project in self.get_all_projects()
+                if str(project.get("key", "")).upper() == project_key.upper()
+                and project.get("id") is not None
+            }
+        return [jira_project_tag(project_id) for project_id in ids]
+
     def get_project(self, project_key: str) -> dict[str, Any] | None:
         """
         Get project information by key.
@@ -106,8 +304,13 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             List of component data dictionaries
         """
         try:
-            components = self.jira.get_project_components(key=project_key)
-            return components if isinstance(components, list) else []
+            path = f"{self.jira.resource_url('project')}/{project_key}/components"
+            return self._cached_catalog(
+                ("components", project_key.upper()),
+                [jira_project_tag(project_key)],
+                lambda etag: self._get_catalog_list(path, etag),
+                value_tags=lambda items: self._project_id_tags(project_key, items),
+            )
 
         except Exception as e:
             logger.error(
@@ -126,9 +329,13 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             List of version data dictionaries
         """
         try:
-            raw_versions = self.jira.get_project_versions(key=project_key)
-            if not isinstance(raw_versions, list):
-                return []
+            path = f"{self.jira.resource_url('project')}/{project_key}/versions"
+            raw_versions = self._cached_catalog(
+                ("versions", project_key.upper()),
+                [jira_project_tag(project_key)],
+                lambda etag: self._get_catalog_list(path, etag),
+                value_tags=lambda items: self._project_id_tags(project_key, items),
+            )
             versions: list[dict[str, Any]] = []
             for v in raw_versions:
                 ver = JiraVersion.from_api_response(v)
@@ -275,6 +482,9 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         """
         Get the total number of issues in a project.
 
+        The count is cached like the rest of the project catalog, so it may
+        lag behind Jira by up to ``project_cache_ttl`` seconds.
+
         Args:
             project_key: The project key
 
@@ -282,20 +492,28 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             Count of issues in the project
         """
         try:
-            # Use JQL to count issues in the project
-            jql = f'project = "{project_key}"'
-            result = self.jira.jql(jql=jql, fields="key", limit=1)
-            if not isinstance(result, dict):
-                msg = f"Unexpected return value type from `jira.jql`: {type(result)}"
-                logger.error(msg)
-                raise TypeError(msg)
-
-            # Extract total from the response
-            total = 0
-            if isinstance(result, dict) and "total" in result:
-                total = result.get("total", 0)
 
-            return total
+            def count_issues(_etag: str | None) -> tuple[int, None]:
+                # Use JQL to count issues in the project
+                jql = f'project = "{project_key}"'
+                result = self.jira.jql(jql=jql, fields="key", limit=1)
+                if not isinstance(result, dict):
+                    msg = (
+                        f"Unexpected return value type from `jira.jql`: {type(result)}"
+                    )
+                    logger.error(msg)
+                    raise TypeError(msg)
+                if "total" not in result:
+                    msg = "Search response has no issue total"
+                    raise ValueError(msg)
+                return result["total"], None
+
+            return self._cached_catalog(
+                ("issue_count", project_key.upper()),
+                [jira_project_tag(project_key)],
+                count_issues,
+                value_tags=lambda _count: self._project_id_tags(project_key),
+            )
 
         except Exception as e:
             logger.error(
@@ -386,6 +604,10 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         """
         Get projects that a specific user can access.
 
+        Results are cached per user with the project catalog, since checking
+        takes one permission request per project. Lookups where the project
+        list or a permission check failed are returned but not cached.
+
         Args:
             username: The username to check access for
 
@@ -393,47 +615,67 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             List of accessible project data dictionaries
         """
         try:
-            # This requires admin permissions
-            # For non-admins, a different approach might be needed
-            all_projects = self.get_all_projects()
-            accessible_projects = []
-
-            for project in all_projects:
-                project_key = project.get("key")
-                if not project_key:
-                    continue
-
-                try:
-                    # Check if user has browse permission for this project
-                    browse_users = (
-                        self.jira.get_users_with_browse_permission_to_a_project(
-                            username=username, project_key=project_key, limit=1
-                        )
-                    )
-
-                    # If the user is in the list, they have access
-                    user_has_access = False
-                    if isinstance(browse_users, list):
-                        for user in browse_users:
-                            if isinstance(user, dict) and user.get("name") == username:
-                                user_has_access = True
-                                break
-
-                    if user_has_access:
-                        accessible_projects.append(project)
-
-                except Exception:
-                    # Skip projects that cause errors
-                    continue
-
-            return accessible_projects
+            return self._cached_catalog(
+                ("accessible", username),
+                [JIRA_PROJECTS_TAG],
+                lambda _etag: (self._find_user_accessible_projects(username), None),
+            )
 
+        except _IncompleteCatalogError as e:
+            return e.value
         except Exception as e:
             logger.error(
                 f"Error getting accessible projects for user {username}: {str(e)}"
             )
             return []
 
+    def _find_user_accessible_projects(self, username: str) -> list[dict[str, Any]]:
+        """Check browse permission for the user on every project.
+
+        Raises:
+            _IncompleteCatalogError: With the projects found so far, if the
+                project list came back empty (it does when loading fails) or
+                a permission check failed
+        """
+        # This requires admin permissions
+        # For non-admins, a different approach might be needed
+        all_projects = self.get_all_projects()
+        if not all_projects:
+            raise _IncompleteCatalogError([])
+        accessible_projects = []
+        complete = True
+
+        for project in all_projects:
+            project_key = project.get("key")
+            if not project_key:
+                continue
+
+            try:
+                # Check if user has browse permission for this project
+                browse_users = self.jira.get_users_with_browse_permission_to_a_project(
+                    username=username, project_key=project_key, limit=1
+                )
+
+                # If the user is in the list, they have access
+                user_has_access = False
+                if isinstance(browse_users, list):
+                    for user in browse_users:
+                        if isinstance(user, dict) and user.get("name") == username:
+                            user_has_access = True
+                            break
+
+                if user_has_access:
+                    accessible_projects.append(project)
+
+            except Exception:
+                # Skip projects that cause errors
+                complete = False
+                continue
+
+        if not complete:
+            raise _IncompleteCatalogError(accessible_projects)
+        return accessible_projects
+
     def create_project_version(
         self,
         project_key: str,
@@ -455,10 +697,12 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         Returns:
             The created version object as returned by Jira
         """
-        return self.create_version(
+        version = self.create_version(
             project=project_key,
             name=name,
             start_date=start_date,
             release_date=release_date,
             description=description,
         )
+        self.invalidate_project_catalog(project_key)
+        return version
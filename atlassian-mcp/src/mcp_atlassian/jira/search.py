@@ -1,6 +1,7 @@
 """Module for Jira search operations."""
 
 import logging
+from typing import Any
 
 import requests
 from requests.exceptions import HTTPError
@@ -9,10 +10,15 @@ from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.jira import JiraSearchResult
 from .client import JiraClient
 from .constants import DEFAULT_READ_JIRA_FIELDS
+from .mirror import get_issue_mirror
 from .protocols import IssueOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Page size and per-project cap for issue mirror syncs
+MIRROR_SYNC_PAGE_SIZE = 100
+MIRROR_SYNC_MAX_ISSUES = 50000
+
 
 class SearchMixin(JiraClient, IssueOperationsProto):
     """Mixin for Jira search operations."""
@@ -85,74 +91,32 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             else:
                 fields_param = fields
 
-            if self.config.is_cloud:
-                actual_total = -1
-                try:
-                    # Call 1: Get metadata (including total) using standard search API
-                    metadata_params = {"jql": jql, "maxResults": 0}
-                    metadata_response = self.jira.get(
-                        self.jira.resource_url("search"), params=metadata_params
-                    )
-
-                    if (
-                        isinstance(metadata_response, dict)
-                        and "total" in metadata_response
-                    ):
-                        try:
-                            actual_total = int(metadata_response["total"])
-                        except (ValueError, TypeError):
-                            logger.warning(
-                                f"Could not parse 'total' from metadata response for JQL: {jql}. Received: {metadata_response.get('total')}"
-                            )
-                    else:
-                        logger.warning(
-                            f"Could not retrieve total count from metadata response for JQL: {jql}. Response type: {type(metadata_response)}"
-                        )
-                except Exception as meta_err:
-                    logger.error(
-                        f"Error fetching metadata for JQL '{jql}': {str(meta_err)}"
-                    )
-
-                # Call 2: Get the actual issues using the enhanced method
-                issues_response_list = self.jira.enhanced_jql_get_list_of_tickets(
-                    jql, fields=fields_param, limit=limit, expand=expand
+            if expand is None:
+                mirrored_result = self._search_issue_mirror(
+                    jql, fields_param, start, limit
                 )
+                if mirrored_result is not None:
+                    return mirrored_result
 
-                if not isinstance(issues_response_list, list):
-                    msg = f"Unexpected return value type from `jira.enhanced_jql_get_list_of_tickets`: {type(issues_response_list)}"
-                    logger.error(msg)
-                    raise TypeError(msg)
-
-                response_dict_for_model = {
-                    "issues": issues_response_list,
-                    "total": actual_total,
-                }
-
-                search_result = JiraSearchResult.from_api_response(
-                    response_dict_for_model,
-                    base_url=self.config.url,
-                    requested_fields=fields_param,
-                )
-
-                # Return the full search result object
-                return search_result
-            else:
+            if not self.config.is_cloud:
                 limit = min(limit, 50)
-                response = self.jira.jql(
-                    jql, fields=fields_param, start=start, limit=limit, expand=expand
-                )
-                if not isinstance(response, dict):
-                    msg = f"Unexpected return value type from `jira.jql`: {type(response)}"
-                    logger.error(msg)
-                    raise TypeError(msg)
-
-                # Convert the response to a search result model
-                search_result = JiraSearchResult.from_api_response(
-                    response, base_url=self.config.url, requested_fields=fields_param
-                )
+            issues, total, start_at, max_results = self._search_issues_raw(
+                jql, fields_param, start, limit, expand
+            )
+            response_dict_for_model: dict[str, Any] = {
+                "issues": issues,
+                "total": total,
+            }
+            if not self.config.is_cloud:
+                response_dict_for_model["startAt"] = start_at
+                response_dict_for_model["maxResults"] = max_results
 
-                # Return the full search result object
-                return search_result
+            # Convert the response to a search result model
+            return JiraSearchResult.from_api_response(
+                response_dict_for_model,
+                base_url=self.config.url,
+                requested_fields=fields_param,
+            )
 
         except HTTPError as http_err:
             if http_err.response is not None and http_err.response.status_code in [
@@ -172,6 +136,145 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
             raise Exception(f"Error searching issues: {str(e)}") from e
 
+    def _search_issues_raw(
+        self,
+        jql: str,
+        fields_param: str | None,
+        start: int,
+        limit: int,
+        expand: str | None,
+    ) -> tuple[list[dict[str, Any]], int, Any, Any]:
+        """
+        Run a JQL search and return the raw issue dictionaries.
+
+        Args:
+            jql: JQL query string (filters already applied)
+            fields_param: Comma-separated fields to return
+            start: Starting index (ignored on Cloud)
+            limit: Maximum issues to return
+            expand: Optional items to expand (comma-separated)
+
+        Returns:
+            Tuple of (issues, total, startAt, maxResults); total is -1 when
+            unknown and startAt/maxResults are None on Cloud
+        """
+        if self.config.is_cloud:
+            actual_total = -1
+            try:
+                # Call 1: Get metadata (including total) using standard search API
+                metadata_params = {"jql": jql, "maxResults": 0}
+                metadata_response = self.jira.get(
+                    self.jira.resource_url("search"), params=metadata_params
+                )
+
+                if isinstance(metadata_response, dict) and "total" in metadata_response:
+                    try:
+                        actual_total = int(metadata_response["total"])
+                    except (ValueError, TypeError):
+                        logger.warning(
+                            f"Could not parse 'total' from metadata response for JQL: {jql}. Received: {metadata_response.get('total')}"
+                        )
+                else:
+                    logger.warning(
+                        f"Could not retrieve total count from metadata response for JQL: {jql}. Response type: {type(metadata_response)}"
+                    )
+            except Exception as meta_err:
+                logger.error(
+                    f"Error fetching metadata for JQL '{jql}': {str(meta_err)}"
+                )
+
+            # Call 2: Get the actual issues using the enhanced method
+            issues_response_list = self.jira.enhanced_jql_get_list_of_tickets(
+                jql, fields=fields_param, limit=limit, expand=expand
+            )
+
+            if not isinstance(issues_response_list, list):
+                msg = f"Unexpected return value type from `jira.enhanced_jql_get_list_of_tickets`: {type(issues_response_list)}"
+                logger.error(msg)
+                raise TypeError(msg)
+
+            return issues_response_list, actual_total, None, None
+
+        response = self.jira.jql(
+            jql, fields=fields_param, start=start, limit=limit, expand=expand
+        )
+        if not isinstance(response, dict):
+            msg = f"Unexpected return value type from `jira.jql`: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        return (
+            response.get("issues", []),
+            response.get("total", -1),
+            response.get("startAt"),
+            response.get("maxResults"),
+        )
+
+    def _fetch_issues_for_mirror(self, jql: str) -> list[dict[str, Any]]:
+        """
+        Fetch every issue matching a JQL query with all fields, for mirror syncs.
+
+        Args:
+            jql: JQL query string
+
+        Returns:
+            List of raw issue dictionaries
+        """
+        if self.config.is_cloud:
+            # Cloud pages internally with nextPageToken up to the limit
+            issues, _, _, _ = self._search_issues_raw(
+                jql, "*all", 0, MIRROR_SYNC_MAX_ISSUES, None
+            )
+            return issues
+
+        issues = []
+        start = 0
+        while True:
+            page, total, _, _ = self._search_issues_raw(
+                jql, "*all", start, MIRROR_SYNC_PAGE_SIZE, None
+            )
+            issues.extend(page)
+            start += len(page)
+            if not page or 0 <= total <= start or len(issues) >= MIRROR_SYNC_MAX_ISSUES:
+                return issues
+
+    def _search_issue_mirror(
+        self, jql: str, fields_param: str | None, start: int, limit: int
+    ) -> JiraSearchResult | None:
+        """
+        Answer a search from the local issue mirror when possible.
+
+        Also starts a background delta sync when the mirror is due for one.
+
+        Args:
+            jql: JQL query string (filters already applied)
+            fields_param: Comma-separated fields to return
+            start: Starting index
+            limit: Maximum issues to return
+
+        Returns:
+            JiraSearchResult built from mirrored issues, or None to use the API
+        """
+        mirror = get_issue_mirror(self.config)
+        if mirror is None:
+            return None
+        if mirror.needs_sync():
+            mirror.sync_in_background(self._fetch_issues_for_mirror)
+        local = mirror.search(jql, start=start, limit=limit)
+        if local is None:
+            return None
+        issues, total = local
+        logger.debug(f"Answered JQL '{jql}' from the local issue mirror")
+        return JiraSearchResult.from_api_response(
+            {
+                "issues": issues,
+                "total": total,
+                "startAt": start,
+                "maxResults": limit,
+            },
+            base_url=self.config.url,
+            requested_fields=fields_param,
+        )
+
     def get_board_issues(
         self,
         board_id: str,
@@ -189,7 +292,8 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             jql: JQL query string
             fields: Fields to return (comma-separated string or "*all")
             start: Starting index
-            limit: Maximum issues to return
+            limit: Maximum issues to return; pages beyond the first are
+                fetched concurrently (capped at AGILE_MAX_ITEMS)
             expand: Optional items to expand (comma-separated)
 
         Returns:
@@ -204,18 +308,19 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             if fields_param is None:
                 fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
 
-            response = self.jira.get_issues_for_board(
-                board_id=board_id,
-                jql=jql,
-                fields=fields_param,
+            response = self.get_offset_paged(
+                lambda page_start, page_limit: self.jira.get_issues_for_board(
+                    board_id=board_id,
+                    jql=jql,
+                    fields=fields_param,
+                    start=page_start,
+                    limit=page_limit,
+                    expand=expand,
+                ),
                 start=start,
                 limit=limit,
-                expand=expand,
+                values_key="issues",
             )
-            if not isinstance(response, dict):
-                msg = f"Unexpected return value type from `jira.get_issues_for_board`: {type(response)}"
-                logger.error(msg)
-                raise TypeError(msg)
 
             # Convert the response to a search result model
             search_result = JiraSearchResult.from_api_response(
@@ -249,7 +354,8 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             sprint_id: The ID of the sprint
             fields: Fields to return (comma-separated string or "*all")
             start: Starting index
-            limit: Maximum issues to return
+            limit: Maximum issues to return; pages beyond the first are
+                fetched concurrently (capped at AGILE_MAX_ITEMS)
 
         Returns:
             JiraSearchResult object containing sprint issues and metadata
@@ -263,15 +369,16 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             if fields_param is None:
                 fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
 
-            response = self.jira.get_sprint_issues(
-                sprint_id=sprint_id,
+            response = self.get_offset_paged(
+                lambda page_start, page_limit: self.jira.get_sprint_issues(
+                    sprint_id=sprint_id,
+                    start=page_start,
+                    limit=page_limit,
+                ),
                 start=start,
                 limit=limit,
+                values_key="issues",
             )
-            if not isinstance(response, dict):
-                msg = f"Unexpected return value type from `jira.get_sprint_issues`: {type(response)}"
-                logger.error(msg)
-                raise TypeError(msg)
 
             # Convert the response to a search result model
             search_result = JiraSearchResult.from_api_response(
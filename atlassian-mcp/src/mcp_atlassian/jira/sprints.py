@@ -26,19 +26,24 @@ class SprintsMixin(JiraClient):
             board_id: Board ID
             state: Sprint state (e.g., active, future, closed) if None, return all state sprints
             start: Start index
-            limit: Maximum number of sprints to return
+            limit: Maximum number of sprints to return; further pages are
+                followed until the board's last sprint (capped at AGILE_MAX_ITEMS)
 
         Returns:
             List of sprints
         """
         try:
-            sprints = self.jira.get_all_sprints_from_board(
-                board_id=board_id,
-                state=state,
+            sprints = self.get_offset_paged(
+                lambda page_start, page_limit: self.jira.get_all_sprints_from_board(
+                    board_id=board_id,
+                    state=state,
+                    start=page_start,
+                    limit=page_limit,
+                ),
                 start=start,
                 limit=limit,
             )
-            return sprints.get("values", []) if isinstance(sprints, dict) else []
+            return sprints.get("values", [])
         except requests.HTTPError as e:
             logger.error(
                 f"Error getting all sprints from board: {str(e.response.content)}"
@@ -2,14 +2,31 @@
 
 import logging
 import re
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 from ..models import JiraWorklog
 from ..utils import parse_date
+from ..utils.concurrency import map_concurrently
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
 
+# Worklog aggregation limits: issues considered, concurrent worklog requests,
+# worklog IDs per ``worklog/list`` call (API maximum) and search page size
+WORKLOG_AGGREGATION_MAX_ISSUES = 1000
+WORKLOG_FETCH_CONCURRENCY = 8
+WORKLOG_LIST_BATCH_SIZE = 1000
+WORKLOG_SEARCH_PAGE_SIZE = 100
+
+# The Cloud bulk endpoints scan every worklog updated on the site since the
+# range started (a worklog for the range can be added or edited at any later
+# time), so they are only used for larger issue sets and give up (falling back
+# to per-issue requests) past a number of worklog IDs
+WORKLOG_BULK_MIN_ISSUES = 50
+WORKLOG_BULK_MAX_IDS = 20000
+
 
 class WorklogMixin(JiraClient):
     """Mixin for Jira worklog operations."""
@@ -232,3 +249,310 @@ class WorklogMixin(JiraClient):
         except Exception as e:
             logger.error(f"Error getting worklogs for issue {issue_key}: {str(e)}")
             raise Exception(f"Error getting worklogs: {str(e)}") from e
+
+    def aggregate_worklogs(
+        self,
+        jql: str,
+        start_date: str,
+        end_date: str,
+        max_issues: int = WORKLOG_AGGREGATION_MAX_ISSUES,
+    ) -> dict[str, Any]:
+        """
+        Sum the time logged on the issues matching a JQL query within a date range.
+
+        When many issues match on Cloud, the worklogs are loaded with the bulk
+        ``worklog/updated`` and ``worklog/list`` endpoints, reading every
+        worklog updated since ``start_date`` (falling back to per-issue
+        requests when that is too many); otherwise the worklogs of the
+        matching issues are fetched concurrently. Only the totals by author,
+        issue and day are returned.
+
+        Args:
+            jql: JQL query selecting the issues
+            start_date: First day of the range (YYYY-MM-DD, inclusive)
+            end_date: Last day of the range (YYYY-MM-DD, inclusive)
+            max_issues: Maximum number of matching issues to include
+
+        Returns:
+            Dictionary with overall totals and per-author, per-issue and
+            per-day breakdowns
+
+        Raises:
+            ValueError: If the dates are invalid
+            Exception: If there is an error fetching issues or worklogs
+        """
+        try:
+            start_day = date.fromisoformat(start_date)
+            end_day = date.fromisoformat(end_date)
+        except ValueError as e:
+            error_msg = f"Dates must use the YYYY-MM-DD format: {str(e)}"
+            raise ValueError(error_msg) from e
+        if end_day < start_day:
+            error_msg = "end_date must not be before start_date"
+            raise ValueError(error_msg)
+
+        try:
+            # One extra issue tells whether the limit cut the results short
+            issues = self._find_issues_with_worklogs(
+                jql, start_date, end_date, max_issues + 1
+            )
+            truncated = len(issues) > max_issues
+            issues = issues[:max_issues]
+            issues_by_id = {str(issue.get("id")): issue for issue in issues}
+
+            worklogs = None
+            if self.config.is_cloud and len(issues) >= WORKLOG_BULK_MIN_ISSUES:
+                since = datetime.combine(start_day, datetime.min.time()).replace(
+                    tzinfo=timezone.utc
+                ) - timedelta(days=1)
+                worklogs = self._get_worklogs_updated_since(
+                    int(since.timestamp() * 1000)
+                )
+            if worklogs is not None:
+                source = "bulk"
+            else:
+                worklogs = self._get_issue_worklogs(issues)
+                source = "per_issue"
+        except Exception as e:
+            logger.error(f"Error aggregating worklogs for JQL '{jql}': {str(e)}")
+            raise Exception(f"Error aggregating worklogs: {str(e)}") from e
+
+        summary = _summarize_worklogs(worklogs, issues_by_id, start_day, end_day)
+        summary.update(
+            {
+                "jql": jql,
+                "start_date": start_date,
+                "end_date": end_date,
+                "source": source,
+                "issues_searched": len(issues),
+                "truncated": truncated,
+            }
+        )
+        return summary
+
+    def _find_issues_with_worklogs(
+        self, jql: str, start_date: str, end_date: str, max_issues: int
+    ) -> list[dict[str, Any]]:
+        """
+        Find the issues matching a JQL query that have work logged in a range.
+
+        Args:
+            jql: JQL query selecting the issues
+            start_date: First day of the range (YYYY-MM-DD)
+            end_date: Last day of the range (YYYY-MM-DD)
+            max_issues: Maximum number of issues to return
+
+        Returns:
+            Raw issue dictionaries with id, key and summary
+        """
+        query, order_by = _split_order_by(jql)
+        date_filter = f'worklogDate >= "{start_date}" AND worklogDate <= "{end_date}"'
+        query = f"({query}) AND {date_filter}" if query else date_filter
+        if order_by:
+            query = f"{query} {order_by}"
+
+        if self.config.is_cloud:
+            issues = self.jira.enhanced_jql_get_list_of_tickets(
+                query, fields="summary", limit=max_issues
+            )
+            if not isinstance(issues, list):
+                msg = f"Unexpected return value type from `jira.enhanced_jql_get_list_of_tickets`: {type(issues)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return issues[:max_issues]
+
+        issues = []
+        while len(issues) < max_issues:
+            response = self.jira.jql(
+                query,
+                fields="summary",
+                start=len(issues),
+                limit=min(WORKLOG_SEARCH_PAGE_SIZE, max_issues - len(issues)),
+            )
+            if not isinstance(response, dict):
+                msg = f"Unexpected return value type from `jira.jql`: {type(response)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            page = response.get("issues", [])
+            issues.extend(page)
+            if not page or len(issues) >= response.get("total", 0):
+                break
+        return issues
+
+    def _get_issue_worklogs(self, issues: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Load the worklogs of each issue, fetching issues concurrently.
+
+        Args:
+            issues: Raw issue dictionaries with id and key
+
+        Returns:
+            Raw worklog dictionaries (including ``issueId``)
+        """
+        per_issue = map_concurrently(
+            lambda issue: (self.jira.issue_get_worklog(issue["key"]) or {}).get(
+                "worklogs", []
+            ),
+            issues,
+            max_workers=WORKLOG_FETCH_CONCURRENCY,
+            thread_name_prefix="jira-worklog",
+        )
+        worklogs = []
+        for issue, issue_worklogs in zip(issues, per_issue, strict=True):
+            for worklog in issue_worklogs:
+                worklogs.append({**worklog, "issueId": str(issue.get("id"))})
+        return worklogs
+
+    def _get_worklogs_updated_since(self, since_ms: int) -> list[dict[str, Any]] | None:
+        """
+        Load the worklogs updated since a point in time using the Cloud bulk endpoints.
+
+        Args:
+            since_ms: UNIX timestamp in milliseconds to start from
+
+        Returns:
+            Raw worklog dictionaries (including ``issueId``), or None if more
+            than ``WORKLOG_BULK_MAX_IDS`` worklogs were updated since then
+        """
+        worklog_ids: list[int] = []
+        since = since_ms
+        while True:
+            response = self.jira.get(
+                self.jira.resource_url("worklog/updated"), params={"since": since}
+            )
+            if not isinstance(response, dict):
+                msg = f"Unexpected return value type from `worklog/updated`: {type(response)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            worklog_ids.extend(
+                value["worklogId"]
+                for value in response.get("values", [])
+                if "worklogId" in value
+            )
+            if len(worklog_ids) > WORKLOG_BULK_MAX_IDS:
+                logger.info(
+                    f"More than {WORKLOG_BULK_MAX_IDS} worklogs updated since "
+                    f"{since_ms}; fetching worklogs per issue instead"
+                )
+                return None
+            if response.get("lastPage", True) or not response.get("until"):
+                break
+            since = response["until"]
+
+        def fetch_chunk(ids: list[int]) -> list[dict[str, Any]]:
+            result = self.jira.post(
+                self.jira.resource_url("worklog/list"), data={"ids": ids}
+            )
+            return result if isinstance(result, list) else []
+
+        chunks = [
+            worklog_ids[i : i + WORKLOG_LIST_BATCH_SIZE]
+            for i in range(0, len(worklog_ids), WORKLOG_LIST_BATCH_SIZE)
+        ]
+        results = map_concurrently(
+            fetch_chunk,
+            chunks,
+            max_workers=WORKLOG_FETCH_CONCURRENCY,
+            thread_name_prefix="jira-worklog",
+        )
+        return [worklog for chunk in results for worklog in chunk]
+
+
+def _split_order_by(jql: str) -> tuple[str, str]:
+    """Split a JQL query into its filter and ``ORDER BY`` clause."""
+    match = re.search(r"\border\s+by\b", jql, flags=re.IGNORECASE)
+    if not match:
+        return jql.strip(), ""
+    return jql[: match.start()].strip(), jql[match.start() :].strip()
+
+
+def _worklog_day(started: str) -> date | None:
+    """Return the calendar day a worklog started on, in its own time zone."""
+    for date_format in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(started, date_format).date()  # noqa: DTZ007
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def _summarize_worklogs(
+    worklogs: list[dict[str, Any]],
+    issues_by_id: dict[str, dict[str, Any]],
+    start_day: date,
+    end_day: date,
+) -> dict[str, Any]:
+    """
+    Aggregate worklogs of the given issues by author, issue and day.
+
+    Args:
+        worklogs: Raw worklog dictionaries including ``issueId``
+        issues_by_id: Issues to include, keyed by issue ID
+        start_day: First day of the range (inclusive)
+        end_day: Last day of the range (inclusive)
+
+    Returns:
+        Dictionary with totals and sorted breakdowns
+    """
+    by_author: dict[str, dict[str, Any]] = {}
+    by_issue: dict[str, dict[str, Any]] = {}
+    by_day: dict[str, int] = defaultdict(int)
+    total_seconds = 0
+    count = 0
+
+    for worklog in worklogs:
+        issue = issues_by_id.get(str(worklog.get("issueId")))
+        day = _worklog_day(str(worklog.get("started", "")))
+        if issue is None or day is None or not start_day <= day <= end_day:
+            continue
+        seconds = int(worklog.get("timeSpentSeconds") or 0)
+        author = worklog.get("author") or {}
+        author_id = (
+            author.get("accountId")
+            or author.get("name")
+            or author.get("displayName")
+            or "unknown"
+        )
+
+        author_totals = by_author.setdefault(
+            author_id,
+            {
+                "author": author.get("displayName", "Unknown"),
+                "account_id": author_id,
+                "seconds": 0,
+            },
+        )
+        author_totals["seconds"] += seconds
+        issue_totals = by_issue.setdefault(
+            issue["key"],
+            {
+                "key": issue["key"],
+                "summary": (issue.get("fields") or {}).get("summary", ""),
+                "seconds": 0,
+            },
+        )
+        issue_totals["seconds"] += seconds
+        by_day[day.isoformat()] += seconds
+        total_seconds += seconds
+        count += 1
+
+    def with_hours(entry: dict[str, Any]) -> dict[str, Any]:
+        return {**entry, "hours": round(entry["seconds"] / 3600, 2)}
+
+    return {
+        "total_seconds": total_seconds,
+        "total_hours": round(total_seconds / 3600, 2),
+        "worklog_count": count,
+        "by_author": [
+            with_hours(entry)
+            for entry in sorted(by_author.values(), key=lambda e: -e["seconds"])
+        ],
+        "by_issue": [
+            with_hours(entry)
+            for entry in sorted(by_issue.values(), key=lambda e: -e["seconds"])
+        ],
+        "by_day": [
+            with_hours({"date": day, "seconds": seconds})
+            for day, seconds in sorted(by_day.items())
+        ],
+    }
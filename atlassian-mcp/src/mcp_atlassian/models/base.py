@@ -11,6 +11,7 @@ from typing import Any, TypeVar
 
 from pydantic import BaseModel
 
+from ..utils.tracing import PARSE_SPAN, SERIALIZE_SPAN, traced
 from .constants import EMPTY_STRING
 
 # Type variable for the return type of from_api_response
@@ -26,6 +27,17 @@ class ApiModel(BaseModel):
     for API responses.
     """
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Time every model's parsing and serialization as trace spans."""
+        super().__pydantic_init_subclass__(**kwargs)
+        parse = cls.__dict__.get("from_api_response")
+        if isinstance(parse, classmethod):
+            cls.from_api_response = classmethod(traced(PARSE_SPAN)(parse.__func__))  # type: ignore[method-assign]
+        serialize = cls.__dict__.get("to_simplified_dict")
+        if callable(serialize):
+            cls.to_simplified_dict = traced(SERIALIZE_SPAN)(serialize)  # type: ignore[method-assign]
+
     @classmethod
     def from_api_response(cls: type[T], data: dict[str, Any], **kwargs: Any) -> T:
         """
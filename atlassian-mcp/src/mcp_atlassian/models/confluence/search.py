@@ -27,6 +27,7 @@ class ConfluenceSearchResult(ApiModel, TimestampMixin):
     results: list[ConfluencePage] = Field(default_factory=list)
     cql_query: str | None = None
     search_duration: int | None = None
+    next_page_token: str | None = None
 
     @classmethod
     def from_api_response(
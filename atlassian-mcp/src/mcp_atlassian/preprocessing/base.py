@@ -1,15 +1,35 @@
 """Base preprocessing module."""
 
+import hashlib
 import logging
 import re
 import warnings
+from collections.abc import Iterable, Mapping
 from typing import Any, Protocol
 
 from bs4 import BeautifulSoup, Tag
 from markdownify import markdownify as md
 
+from ..utils.cache import get_cache
+from ..utils.concurrency import map_concurrently
+from ..utils.tracing import PREPROCESS_SPAN, traced
+
 logger = logging.getLogger("mcp-atlassian")
 
+# Display names resolved for mentions, shared by every preprocessor
+USER_CACHE_TTL = 60 * 60
+USER_CACHE_MAXSIZE = 4096
+USER_LOOKUP_CONCURRENCY = 8
+USER_BULK_BATCH_SIZE = 100  # Account IDs per Cloud bulk user request
+
+# Kinds of user reference found in storage format
+ACCOUNT_ID = "accountid"
+USERNAME = "username"
+
+UserRef = tuple[str, str]  # (ACCOUNT_ID or USERNAME, identifier)
+
+_MISSING = object()
+
 
 class ConfluenceClient(Protocol):
     """Protocol for Confluence client."""
@@ -23,6 +43,70 @@ class ConfluenceClient(Protocol):
         ...
 
 
+def _client_scope(confluence_client: Any) -> str | None:
+    """Return a cache scope for a client's site and credentials.
+
+    Clients without a site URL (e.g. test doubles) get None and do not
+    share cached users.
+    """
+    url = getattr(confluence_client, "url", None)
+    if not isinstance(url, str) or not url:
+        return None
+    session = getattr(confluence_client, "_session", None)
+    headers = getattr(session, "headers", None) or {}
+    parts = [
+        url,
+        str(headers.get("Authorization", "")),
+        str(getattr(session, "auth", "") or ""),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()[:16]
+
+
+def _lookup_display_name(
+    confluence_client: ConfluenceClient, ref: UserRef
+) -> str | None:
+    """Fetch one user's display name; None if the lookup failed."""
+    kind, identifier = ref
+    try:
+        if kind == ACCOUNT_ID:
+            details = confluence_client.get_user_details_by_accountid(identifier)
+        else:
+            # For Confluence Server/DC, userkey might be the username
+            details = confluence_client.get_user_details_by_username(identifier)
+    except Exception as e:
+        logger.warning(f"Error fetching user details for {identifier}: {e}")
+        return None
+    return (details or {}).get("displayName") or ""
+
+
+def _bulk_display_names(
+    confluence_client: Any, account_ids: list[str]
+) -> dict[str, str]:
+    """Resolve account IDs with the Cloud bulk user endpoint.
+
+    Returns the names found; IDs missing from the result (including all of
+    them on Server/DC or when a request fails) are left to single lookups.
+    """
+    get = getattr(confluence_client, "get", None)
+    if not getattr(confluence_client, "cloud", False) or not callable(get):
+        return {}
+    names: dict[str, str] = {}
+    for start in range(0, len(account_ids), USER_BULK_BATCH_SIZE):
+        batch = account_ids[start : start + USER_BULK_BATCH_SIZE]
+        try:
+            response = get("rest/api/user/bulk", params={"accountId": batch})
+        except Exception as e:
+            logger.debug(
+                f"Bulk user lookup failed, falling back to single lookups: {e}"
+            )
+            break
+        results = response.get("results", []) if isinstance(response, dict) else []
+        for user in results:
+            if isinstance(user, dict) and user.get("accountId"):
+                names[user["accountId"]] = user.get("displayName") or ""
+    return names
+
+
 class BasePreprocessor:
     """Base class for text preprocessing operations."""
 
@@ -35,6 +119,7 @@ class BasePreprocessor:
         """
         self.base_url = base_url.rstrip("/") if base_url else ""
 
+    @traced(PREPROCESS_SPAN)
     def process_html_content(
         self,
         html_content: str,
@@ -56,9 +141,14 @@ class BasePreprocessor:
             # Parse the HTML content
             soup = BeautifulSoup(html_content, "html.parser")
 
-            # Process user mentions
-            self._process_user_mentions_in_soup(soup, confluence_client)
-            self._process_user_profile_macros_in_soup(soup, confluence_client)
+            # Resolve every referenced user once, then replace the mentions
+            display_names = self._resolve_user_display_names(
+                self._collect_user_refs(soup), confluence_client
+            )
+            self._process_user_mentions_in_soup(soup, confluence_client, display_names)
+            self._process_user_profile_macros_in_soup(
+                soup, confluence_client, display_names
+            )
 
             # Convert to string and markdown
             processed_html = str(soup)
@@ -70,8 +160,117 @@ class BasePreprocessor:
             logger.error(f"Error in process_html_content: {str(e)}")
             raise
 
+    @staticmethod
+    def _mention_account_id(user_element: Tag) -> str | None:
+        """Return the account ID of an ac:link user mention, if it is one."""
+        user_ref = user_element.find("ri:user")
+        account_id = user_ref.get("ri:account-id") if user_ref else None
+        return account_id if isinstance(account_id, str) and account_id else None
+
+    @staticmethod
+    def _profile_macro_user(macro_element: Tag) -> tuple[Any, Any] | None:
+        """Return the (account ID, userkey) of a profile macro, None if malformed."""
+        user_param = macro_element.find("ac:parameter", attrs={"ac:name": "user"})
+        user_ref = user_param.find("ri:user") if user_param else None
+        if not user_ref:
+            return None
+        return user_ref.get("ri:account-id"), user_ref.get("ri:userkey")
+
+    def _collect_user_refs(self, soup: BeautifulSoup) -> set[UserRef]:
+        """Return the distinct users referenced by mentions and profile macros."""
+        refs: set[UserRef] = set()
+        for user_element in soup.find_all("ac:link"):
+            account_id = self._mention_account_id(user_element)
+            if account_id:
+                refs.add((ACCOUNT_ID, account_id))
+        for macro_element in soup.find_all(
+            "ac:structured-macro", attrs={"ac:name": "profile"}
+        ):
+            user = self._profile_macro_user(macro_element)
+            if user is None:
+                continue
+            account_id, userkey = user
+            if account_id and isinstance(account_id, str):
+                refs.add((ACCOUNT_ID, account_id))
+            elif userkey and isinstance(userkey, str):
+                refs.add((USERNAME, userkey))
+        return refs
+
+    def _resolve_user_display_names(
+        self,
+        refs: Iterable[UserRef],
+        confluence_client: ConfluenceClient | None,
+    ) -> dict[UserRef, str]:
+        """Look up the display names of users, reusing previously resolved ones.
+
+        Names are cached per site and credentials across preprocessors. Users
+        not in the cache are fetched together: account IDs through the bulk
+        user endpoint on Cloud, anything left with concurrent single lookups.
+
+        Args:
+            refs: Users to resolve
+            confluence_client: Confluence client for user lookups
+
+        Returns:
+            Display names of the users that could be resolved
+        """
+        pending = sorted(set(refs))
+        if not pending or confluence_client is None:
+            return {}
+
+        scope = _client_scope(confluence_client)
+        cache = (
+            get_cache(
+                "confluence-user-names", maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL
+            )
+            if scope
+            else None
+        )
+        resolved: dict[UserRef, str] = {}
+        missing: list[UserRef] = []
+        for ref in pending:
+            cached = (
+                cache.get((scope, *ref), _MISSING) if cache is not None else _MISSING
+            )
+            if cached is _MISSING:
+                missing.append(ref)
+            else:
+                resolved[ref] = cached
+
+        if missing:
+            bulk = _bulk_display_names(
+                confluence_client,
+                [ident for kind, ident in missing if kind == ACCOUNT_ID],
+            )
+            fetched: dict[UserRef, str | None] = {
+                (ACCOUNT_ID, account_id): name for account_id, name in bulk.items()
+            }
+            singles = [ref for ref in missing if ref not in fetched]
+            names = map_concurrently(
+                lambda ref: _lookup_display_name(confluence_client, ref),
+                singles,
+                max_workers=USER_LOOKUP_CONCURRENCY,
+                thread_name_prefix="confluence-users",
+            )
+            fetched.update(zip(singles, names, strict=True))
+            logger.debug(
+                f"Resolved {len(missing)} users ({len(bulk)} in bulk), "
+                f"{len(pending) - len(missing)} from cache"
+            )
+            for ref, name in fetched.items():
+                if name is None:
+                    continue  # Failed lookups are retried next time
+                if cache is not None:
+                    cache.set((scope, *ref), name)
+                resolved[ref] = name
+
+        return {ref: name for ref, name in resolved.items() if name}
+
     def _process_user_mentions_in_soup(
-        self, soup: BeautifulSoup, confluence_client: ConfluenceClient | None = None
+        self,
+        soup: BeautifulSoup,
+        confluence_client: ConfluenceClient | None = None,
+        display_names: Mapping[UserRef, str] | None = None,
     ) -> None:
         """
         Process user mentions in BeautifulSoup object.
@@ -79,34 +278,25 @@ class BasePreprocessor:
         Args:
             soup: BeautifulSoup object containing HTML
             confluence_client: Optional Confluence client for user lookups
+            display_names: Names already resolved for the soup's users
         """
         # Find all ac:link elements that might contain user mentions
         user_mentions = soup.find_all("ac:link")
+        if display_names is None:
+            display_names = self._resolve_user_display_names(
+                self._collect_user_refs(soup), confluence_client
+            )
 
         for user_element in user_mentions:
-            user_ref = user_element.find("ri:user")
-            if user_ref and user_ref.get("ri:account-id"):
-                # Case 1: Direct user reference without link-body
-                account_id = user_ref.get("ri:account-id")
-                if isinstance(account_id, str):
-                    self._replace_user_mention(
-                        user_element, account_id, confluence_client
-                    )
-                    continue
-
-            # Case 2: User reference with link-body containing @
-            link_body = user_element.find("ac:link-body")
-            if link_body and "@" in link_body.get_text(strip=True):
-                user_ref = user_element.find("ri:user")
-                if user_ref and user_ref.get("ri:account-id"):
-                    account_id = user_ref.get("ri:account-id")
-                    if isinstance(account_id, str):
-                        self._replace_user_mention(
-                            user_element, account_id, confluence_client
-                        )
+            account_id = self._mention_account_id(user_element)
+            if account_id:
+                self._replace_user_mention(user_element, account_id, display_names)
 
     def _process_user_profile_macros_in_soup(
-        self, soup: BeautifulSoup, confluence_client: ConfluenceClient | None = None
+        self,
+        soup: BeautifulSoup,
+        confluence_client: ConfluenceClient | None = None,
+        display_names: Mapping[UserRef, str] | None = None,
     ) -> None:
         """
         Process Confluence User Profile macros in BeautifulSoup object.
@@ -116,55 +306,36 @@ class BasePreprocessor:
         Args:
             soup: BeautifulSoup object containing HTML
             confluence_client: Optional Confluence client for user lookups
+            display_names: Names already resolved for the soup's users
         """
         profile_macros = soup.find_all(
             "ac:structured-macro", attrs={"ac:name": "profile"}
         )
+        if profile_macros and confluence_client is None:
+            logger.warning(
+                "Confluence client not available for User Profile Macro processing."
+            )
+        if display_names is None:
+            display_names = self._resolve_user_display_names(
+                self._collect_user_refs(soup), confluence_client
+            )
 
         for macro_element in profile_macros:
-            user_param = macro_element.find("ac:parameter", attrs={"ac:name": "user"})
-            if not user_param:
+            user = self._profile_macro_user(macro_element)
+            if user is None:
                 logger.debug(
-                    "User profile macro found without a 'user' parameter. Replacing with placeholder."
+                    "User profile macro found without a 'user' parameter or 'ri:user' tag. Replacing with placeholder."
                 )
                 macro_element.replace_with("[User Profile Macro (Malformed)]")
                 continue
 
-            user_ref = user_param.find("ri:user")
-            if not user_ref:
-                logger.debug(
-                    "User profile macro's 'user' parameter found without 'ri:user' tag. Replacing with placeholder."
-                )
-                macro_element.replace_with("[User Profile Macro (Malformed)]")
-                continue
-
-            account_id = user_ref.get("ri:account-id")
-            userkey = user_ref.get("ri:userkey")  # Fallback for Confluence Server/DC
-
+            account_id, userkey = user  # userkey is the fallback for Server/DC
             user_identifier_for_log = account_id or userkey
             display_name = None
-
-            if confluence_client and user_identifier_for_log:
-                try:
-                    if account_id and isinstance(account_id, str):
-                        user_details = confluence_client.get_user_details_by_accountid(
-                            account_id
-                        )
-                        display_name = user_details.get("displayName")
-                    elif userkey and isinstance(userkey, str):
-                        # For Confluence Server/DC, userkey might be the username
-                        user_details = confluence_client.get_user_details_by_username(
-                            userkey
-                        )
-                        display_name = user_details.get("displayName")
-                except Exception as e:
-                    logger.warning(
-                        f"Error fetching user details for profile macro (user: {user_identifier_for_log}): {e}"
-                    )
-            elif not confluence_client:
-                logger.warning(
-                    "Confluence client not available for User Profile Macro processing."
-                )
+            if account_id and isinstance(account_id, str):
+                display_name = display_names.get((ACCOUNT_ID, account_id))
+            elif userkey and isinstance(userkey, str):
+                display_name = display_names.get((USERNAME, userkey))
 
             if display_name:
                 replacement_text = f"@{display_name}"
@@ -183,7 +354,7 @@ class BasePreprocessor:
         self,
         user_element: Tag,
         account_id: str,
-        confluence_client: ConfluenceClient | None = None,
+        display_names: Mapping[UserRef, str],
     ) -> None:
         """
         Replace a user mention with the user's display name.
@@ -191,25 +362,14 @@ class BasePreprocessor:
         Args:
             user_element: The HTML element containing the user mention
             account_id: The user's account ID
-            confluence_client: Optional Confluence client for user lookups
+            display_names: Names resolved for the content's users
         """
-        try:
-            # Only attempt to get user details if we have a valid confluence client
-            if confluence_client is not None:
-                user_details = confluence_client.get_user_details_by_accountid(
-                    account_id
-                )
-                display_name = user_details.get("displayName", "")
-                if display_name:
-                    new_text = f"@{display_name}"
-                    user_element.replace_with(new_text)
-                    return
-            # If we don't have a confluence client or couldn't get user details,
-            # use fallback
-            self._use_fallback_user_mention(user_element, account_id)
-        except Exception as e:
-            logger.warning(f"Error processing user mention: {str(e)}")
-            self._use_fallback_user_mention(user_element, account_id)
+        display_name = display_names.get((ACCOUNT_ID, account_id))
+        if display_name:
+            user_element.replace_with(f"@{display_name}")
+            return
+        # If the user could not be resolved, use fallback
+        self._use_fallback_user_mention(user_element, account_id)
 
     def _use_fallback_user_mention(self, user_element: Tag, account_id: str) -> None:
         """
@@ -1,22 +1,103 @@
 """Confluence-specific text preprocessing module."""
 
+import atexit
 import logging
 import shutil
 import tempfile
+import threading
 from pathlib import Path
 
+import markdown
 from md2conf.converter import (
     ConfluenceConverterOptions,
     ConfluenceStorageFormatConverter,
     elements_from_string,
     elements_to_string,
-    markdown_to_html,
+    emoji_generator,
 )
 
+from ..utils.tracing import PREPROCESS_SPAN, traced
 from .base import BasePreprocessor
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Same extensions as md2conf.converter.markdown_to_html
+MARKDOWN_EXTENSIONS = [
+    "admonition",
+    "markdown.extensions.tables",
+    "markdown.extensions.fenced_code",
+    "pymdownx.emoji",
+    "pymdownx.magiclink",
+    "pymdownx.tilde",
+    "sane_lists",
+    "md_in_html",
+]
+MARKDOWN_EXTENSION_CONFIGS = {"pymdownx.emoji": {"emoji_generator": emoji_generator}}
+
+
+class MarkdownStorageConverter:
+    """Converts markdown to Confluence storage format, reusing setup between calls.
+
+    Building a ``markdown.Markdown`` instance loads all its extensions, which
+    costs more than converting a typical page, so one instance is kept per
+    thread and reset between documents. md2conf only touches the filesystem to
+    resolve relative links and images against the document's directory; all
+    conversions share one empty directory, created on first use, instead of a
+    temporary directory per call.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._options = {
+            anchors: ConfluenceConverterOptions(
+                ignore_invalid_url=True,
+                heading_anchors=anchors,
+                render_mermaid=False,
+            )
+            for anchors in (False, True)
+        }
+        self._root_dir: Path | None = None
+        self._lock = threading.Lock()
+
+    def _document_root(self) -> Path:
+        with self._lock:
+            if self._root_dir is None:
+                root = Path(tempfile.mkdtemp(prefix="mcp-atlassian-md2conf-"))
+                atexit.register(shutil.rmtree, root, ignore_errors=True)
+                self._root_dir = root
+            return self._root_dir
+
+    def to_html(self, markdown_content: str) -> str:
+        """Convert markdown to HTML with the md2conf extension set."""
+        converter = getattr(self._local, "markdown", None)
+        if converter is None:
+            converter = markdown.Markdown(
+                extensions=MARKDOWN_EXTENSIONS,
+                extension_configs=MARKDOWN_EXTENSION_CONFIGS,
+            )
+            self._local.markdown = converter
+        return converter.reset().convert(markdown_content)
+
+    def html_to_storage(
+        self, html_content: str, *, enable_heading_anchors: bool = False
+    ) -> str:
+        """Convert HTML produced by ``to_html`` to Confluence storage format."""
+        root = elements_from_string(html_content)
+        root_dir = self._document_root()
+        # The converter collects per-document links and images, so it is
+        # created for each conversion; only its options are shared
+        converter = ConfluenceStorageFormatConverter(
+            options=self._options[enable_heading_anchors],
+            path=root_dir / "page.md",
+            root_dir=root_dir,
+            page_metadata={},
+        )
+        converter.visit(root)
+        return str(elements_to_string(root))
+
+
+STORAGE_CONVERTER = MarkdownStorageConverter()
+
 
 class ConfluencePreprocessor(BasePreprocessor):
     """Handles text preprocessing for Confluence content."""
@@ -30,6 +111,7 @@ class ConfluencePreprocessor(BasePreprocessor):
         """
         super().__init__(base_url=base_url)
 
+    @traced(PREPROCESS_SPAN)
     def markdown_to_confluence_storage(
         self, markdown_content: str, *, enable_heading_anchors: bool = False
     ) -> str:
@@ -43,49 +125,20 @@ class ConfluencePreprocessor(BasePreprocessor):
         Returns:
             Confluence storage format (XHTML) string
         """
+        html_content = None
         try:
-            # First convert markdown to HTML
-            html_content = markdown_to_html(markdown_content)
-
-            # Create a temporary directory for any potential attachments
-            temp_dir = tempfile.mkdtemp()
-
-            try:
-                # Parse the HTML into an element tree
-                root = elements_from_string(html_content)
-
-                # Create converter options
-                options = ConfluenceConverterOptions(
-                    ignore_invalid_url=True,
-                    heading_anchors=enable_heading_anchors,
-                    render_mermaid=False,
-                )
-
-                # Create a converter
-                converter = ConfluenceStorageFormatConverter(
-                    options=options,
-                    path=Path(temp_dir) / "temp.md",
-                    root_dir=Path(temp_dir),
-                    page_metadata={},
-                )
-
-                # Transform the HTML to Confluence storage format
-                converter.visit(root)
-
-                # Convert the element tree back to a string
-                storage_format = elements_to_string(root)
-
-                return str(storage_format)
-            finally:
-                # Clean up the temporary directory
-                shutil.rmtree(temp_dir, ignore_errors=True)
-
+            # First convert markdown to HTML, then HTML to storage format
+            html_content = STORAGE_CONVERTER.to_html(markdown_content)
+            return STORAGE_CONVERTER.html_to_storage(
+                html_content, enable_heading_anchors=bool(enable_heading_anchors)
+            )
         except Exception as e:
             logger.error(f"Error converting markdown to Confluence storage format: {e}")
             logger.exception(e)
 
             # Fall back to a simpler method if the conversion fails
-            html_content = markdown_to_html(markdown_content)
+            if html_content is None:
+                html_content = STORAGE_CONVERTER.to_html(markdown_content)
 
             # Use a different approach that doesn't rely on the HTML macro
             # This creates a proper Confluence storage format document
@@ -4,6 +4,7 @@ import logging
 import re
 from typing import Any
 
+from ..utils.tracing import PREPROCESS_SPAN, traced
 from .base import BasePreprocessor
 
 logger = logging.getLogger("mcp-atlassian")
@@ -22,6 +23,7 @@ class JiraPreprocessor(BasePreprocessor):
         """
         super().__init__(base_url=base_url, **kwargs)
 
+    @traced(PREPROCESS_SPAN)
     def clean_jira_text(self, text: str) -> str:
         """
         Clean Jira text content by:
@@ -101,6 +103,7 @@ class JiraPreprocessor(BasePreprocessor):
 
         return text
 
+    @traced(PREPROCESS_SPAN)
     def jira_to_markdown(self, input_text: str) -> str:
         """
         Convert Jira markup to Markdown format.
@@ -230,6 +233,7 @@ class JiraPreprocessor(BasePreprocessor):
 
         return output
 
+    @traced(PREPROCESS_SPAN)
     def markdown_to_jira(self, input_text: str) -> str:
         """
         Convert Markdown syntax to Jira markup syntax.
@@ -69,6 +69,28 @@ async def search(
             default=None,
         ),
     ] = None,
+    page_token: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Continuation token from the 'next_page_token' of a previous "
+                "call with the same query, to fetch the next page of results"
+            ),
+            default=None,
+        ),
+    ] = None,
+    include_content: Annotated[
+        int,
+        Field(
+            description=(
+                "(Optional) Number of top results to return with their full page content "
+                "in Markdown instead of the search excerpt (0-10)"
+            ),
+            default=0,
+            ge=0,
+            le=10,
+        ),
+    ] = 0,
 ) -> str:
     """Search Confluence content using simple terms or CQL.
 
@@ -77,9 +99,12 @@ async def search(
         query: Search query - can be simple text or a CQL query string.
         limit: Maximum number of results (1-50).
         spaces_filter: Comma-separated list of space keys to filter by.
+        page_token: Continuation token from a previous call with the same query.
+        include_content: Number of top results to return with full page content.
 
     Returns:
-        JSON string representing a list of simplified Confluence page objects.
+        JSON string with the simplified Confluence page objects under 'results'
+        and the token for the next page under 'next_page_token'.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     # Check if the query is a simple search term or already a CQL query
@@ -92,22 +117,37 @@ async def search(
             logger.info(
                 f"Converting simple search term to CQL using siteSearch: {query}"
             )
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            search_result = confluence_fetcher.search_page(
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
+                page_token=page_token,
+                include_content=include_content,
             )
         except Exception as e:
             logger.warning(f"siteSearch failed ('{e}'), falling back to text search.")
             query = f'text ~ "{original_query}"'
             logger.info(f"Falling back to text search with CQL: {query}")
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            search_result = confluence_fetcher.search_page(
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
+                page_token=page_token,
+                include_content=include_content,
             )
     else:
-        pages = confluence_fetcher.search(
-            query, limit=limit, spaces_filter=spaces_filter
+        search_result = confluence_fetcher.search_page(
+            query,
+            limit=limit,
+            spaces_filter=spaces_filter,
+            page_token=page_token,
+            include_content=include_content,
         )
-    search_results = [page.to_simplified_dict() for page in pages]
-    return json.dumps(search_results, indent=2, ensure_ascii=False)
+    result = {
+        "results": [page.to_simplified_dict() for page in search_result.results],
+        "next_page_token": search_result.next_page_token,
+    }
+    return json.dumps(result, indent=2, ensure_ascii=False)
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -314,6 +354,117 @@ async def get_page_children(
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
+@confluence_mcp.tool(tags={"confluence", "read"})
+async def get_page_tree(
+    ctx: Context,
+    page_id: Annotated[
+        str,
+        Field(
+            description=(
+                "The ID of the root page. This is the numeric ID that can be found in the "
+                "page URL (e.g., 'https://example.atlassian.net/wiki/spaces/TEAM/pages/123456789/Page+Title' "
+                "has ID '123456789')"
+            ),
+        ),
+        BeforeValidator(lambda x: str(x) if x is not None else None),
+    ],
+    max_depth: Annotated[
+        int,
+        Field(
+            description="(Optional) Number of levels below the root page to include (1-10)",
+            default=3,
+            ge=1,
+            le=10,
+        ),
+    ] = 3,
+    max_pages: Annotated[
+        int,
+        Field(
+            description="(Optional) Maximum number of descendant pages to include (1-5000)",
+            default=500,
+            ge=1,
+            le=5000,
+        ),
+    ] = 500,
+) -> str:
+    """Get the hierarchy of pages below a Confluence page.
+
+    Args:
+        ctx: The FastMCP context.
+        page_id: The ID of the root page.
+        max_depth: Number of levels below the root page to include.
+        max_pages: Maximum number of descendant pages to include.
+
+    Returns:
+        JSON string with the page tree: every node has its id, title, version,
+        child count and children.
+    """
+    confluence_fetcher = await get_confluence_fetcher(ctx)
+    try:
+        result = confluence_fetcher.get_page_tree(
+            page_id, max_depth=max_depth, max_pages=max_pages
+        )
+    except Exception as e:
+        logger.error(f"Error getting page tree for page ID {page_id}: {e}")
+        result = {"error": f"Failed to get page tree: {e}"}
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
+@confluence_mcp.tool(tags={"confluence", "write"})
+@check_write_access
+async def export_space(
+    ctx: Context,
+    space_key: Annotated[
+        str,
+        Field(
+            description="The key of the space to export (e.g., 'DEV', 'TEAM', or '~username')"
+        ),
+    ],
+    target_dir: Annotated[
+        str,
+        Field(
+            description=(
+                "Directory to write the Markdown files and manifest.json to, inside "
+                "the server's configured export directory (CONFLUENCE_EXPORT_DIR); "
+                "relative paths are resolved against it. "
+                "Exporting into a directory that holds an earlier export of the same "
+                "space only re-exports pages that changed since then, and deletes "
+                "the files of pages listed in its manifest that no longer exist"
+            )
+        ),
+    ],
+    force: Annotated[
+        bool,
+        Field(
+            description="(Optional) Re-export every page even if the manifest shows it unchanged",
+            default=False,
+        ),
+    ] = False,
+) -> str:
+    """Export all pages of a Confluence space to Markdown files on the server.
+
+    Files are only written inside the configured export directory. Re-running
+    into the same directory deletes the Markdown files of pages that were
+    removed from the space or renamed since the last export.
+
+    Args:
+        ctx: The FastMCP context.
+        space_key: The key of the space to export.
+        target_dir: Directory to write the Markdown files and manifest to.
+        force: Whether to re-export pages the manifest shows unchanged.
+
+    Returns:
+        JSON string with the export counts and the pages that failed.
+    """
+    confluence_fetcher = await get_confluence_fetcher(ctx)
+    try:
+        result = confluence_fetcher.export_space(space_key, target_dir, force=force)
+    except Exception as e:
+        logger.error(f"Error exporting space {space_key} to {target_dir}: {e}")
+        result = {"error": f"Failed to export space: {e}"}
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
 @confluence_mcp.tool(tags={"confluence", "read"})
 async def get_comments(
     ctx: Context,
@@ -437,6 +588,13 @@ async def create_page(
             default=False,
         ),
     ] = False,
+    return_content: Annotated[
+        bool,
+        Field(
+            description="(Optional) Whether to include the page content in the result. Set to false to return only the page ID, version and URL",
+            default=True,
+        ),
+    ] = True,
 ) -> str:
     """Create a new Confluence page.
 
@@ -448,6 +606,7 @@ async def create_page(
         parent_id: Optional parent page ID.
         content_format: The format of the content ('markdown', 'wiki', or 'storage').
         enable_heading_anchors: Whether to enable heading anchors (markdown only).
+        return_content: Whether to include the page content in the result.
 
     Returns:
         JSON string representing the created page object.
@@ -481,8 +640,16 @@ async def create_page(
         if content_format == "markdown"
         else False,
         content_representation=content_representation,
+        return_content=return_content,
     )
-    result = page.to_simplified_dict()
+    if return_content:
+        result = page.to_simplified_dict()
+    else:
+        result = {
+            "id": page.id,
+            "version": page.version.number if page.version else None,
+            "url": page.url,
+        }
     return json.dumps(
         {"message": "Page created successfully", "page": result},
         indent=2,
@@ -527,6 +694,13 @@ async def update_page(
             default=False,
         ),
     ] = False,
+    return_content: Annotated[
+        bool,
+        Field(
+            description="(Optional) Whether to include the page content in the result. Set to false to return only the page ID, version and URL",
+            default=True,
+        ),
+    ] = True,
 ) -> str:
     """Update an existing Confluence page.
 
@@ -540,6 +714,7 @@ async def update_page(
         parent_id: Optional new parent page ID.
         content_format: The format of the content ('markdown', 'wiki', or 'storage').
         enable_heading_anchors: Whether to enable heading anchors (markdown only).
+        return_content: Whether to include the page content in the result.
 
     Returns:
         JSON string representing the updated page object.
@@ -575,8 +750,16 @@ async def update_page(
         if content_format == "markdown"
         else False,
         content_representation=content_representation,
+        return_content=return_content,
     )
-    page_data = updated_page.to_simplified_dict()
+    if return_content:
+        page_data = updated_page.to_simplified_dict()
+    else:
+        page_data = {
+            "id": updated_page.id,
+            "version": updated_page.version.number if updated_page.version else None,
+            "url": updated_page.url,
+        }
     return json.dumps(
         {"message": "Page updated successfully", "page": page_data},
         indent=2,
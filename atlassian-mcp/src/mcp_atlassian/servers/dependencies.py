@@ -6,27 +6,125 @@ Provides get_jira_fetcher and get_confluence_fetcher for use in tool functions.
 from __future__ import annotations
 
 import dataclasses
+import hashlib
+import importlib
 import logging
+import sys
+import threading
 from typing import TYPE_CHECKING, Any
 
+from cachetools import TTLCache
 from fastmcp import Context
 from fastmcp.server.dependencies import get_http_request
 from starlette.requests import Request
 
-from mcp_atlassian.confluence import ConfluenceConfig, ConfluenceFetcher
-from mcp_atlassian.jira import JiraConfig, JiraFetcher
+from mcp_atlassian.confluence import ConfluenceConfig
+from mcp_atlassian.jira import JiraConfig
 from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.utils.env import get_env_int
+from mcp_atlassian.utils.metrics import counter
 from mcp_atlassian.utils.oauth import OAuthConfig
 
 if TYPE_CHECKING:
+    from mcp_atlassian.confluence import ConfluenceFetcher
     from mcp_atlassian.confluence.config import (
         ConfluenceConfig as UserConfluenceConfigType,
     )
+    from mcp_atlassian.jira import JiraFetcher
     from mcp_atlassian.jira.config import JiraConfig as UserJiraConfigType
 
 logger = logging.getLogger("mcp-atlassian.servers.dependencies")
 
 
+# The fetcher classes load the whole client stack, so they are only imported
+# when the first tool call needs one
+_LAZY_FETCHERS = {
+    "JiraFetcher": "mcp_atlassian.jira",
+    "ConfluenceFetcher": "mcp_atlassian.confluence",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_FETCHERS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _fetcher_class(name: str) -> Any:
+    """Return a fetcher class through the module, importing it on first use."""
+    return getattr(sys.modules[__name__], name)
+
+
+TOKEN_VALIDATIONS = counter(
+    "mcp_token_validation_total",
+    "User token validations, by whether the validation cache was used.",
+    ("service", "result"),
+)
+
+# Validated user tokens, keyed by a hash of the token and its scope. Created
+# lazily so the size/TTL can be tuned through the environment.
+_token_validation_cache: TTLCache[str, Any] | None = None
+_token_validation_lock = threading.Lock()
+
+
+def _get_token_validation_cache() -> TTLCache[str, Any] | None:
+    """Return the validated-token cache, or None if caching is disabled.
+
+    Configured with MCP_TOKEN_VALIDATION_CACHE_SIZE (default 10000 entries) and
+    MCP_TOKEN_VALIDATION_CACHE_TTL (default 300 seconds, 0 disables caching).
+    """
+    global _token_validation_cache
+    with _token_validation_lock:
+        if _token_validation_cache is None:
+            ttl = get_env_int("MCP_TOKEN_VALIDATION_CACHE_TTL", 300, minimum=0)
+            if ttl == 0:
+                return None
+            maxsize = get_env_int("MCP_TOKEN_VALIDATION_CACHE_SIZE", 10000, minimum=1)
+            _token_validation_cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        return _token_validation_cache
+
+
+def clear_token_validation_cache() -> None:
+    """Forget all validated user tokens (e.g. after a credential rotation)."""
+    global _token_validation_cache
+    with _token_validation_lock:
+        _token_validation_cache = None
+
+
+def _token_validation_key(
+    service: str,
+    auth_type: str,
+    token: str,
+    base_config: JiraConfig | ConfluenceConfig,
+    cloud_id: str | None,
+) -> str:
+    """Build the validation cache key without keeping the raw token around."""
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    return f"{service}:{auth_type}:{base_config.url}:{cloud_id or ''}:{token_hash}"
+
+
+def _get_validated_user(key: str) -> Any | None:
+    """Return the cached validation result for a token, if still fresh."""
+    cache = _get_token_validation_cache()
+    if cache is None:
+        return None
+    with _token_validation_lock:
+        return cache.get(key)
+
+
+def _remember_validated_user(key: str, user: Any) -> None:
+    """Cache the validation result for a token."""
+    cache = _get_token_validation_cache()
+    if cache is None or user is None:
+        return
+    with _token_validation_lock:
+        cache[key] = user
+
+
 def _create_user_config_for_fetcher(
     base_config: JiraConfig | ConfluenceConfig,
     auth_type: str,
@@ -139,8 +237,10 @@ def _create_user_config_for_fetcher(
         )
 
     if isinstance(base_config, JiraConfig):
+        # The issue mirror is only kept for the server's own credentials;
+        # per-request tokens would each need a database and a full sync.
         user_jira_config: UserJiraConfigType = dataclasses.replace(
-            base_config, **common_args
+            base_config, **common_args, mirror_projects=None
         )
         user_jira_config.projects_filter = base_config.projects_filter
         return user_jira_config
@@ -219,12 +319,30 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
                 credentials=credentials,
                 cloud_id=user_cloud_id,
             )
+            validation_key = _token_validation_key(
+                "jira",
+                user_auth_type,
+                user_token,
+                app_lifespan_ctx.full_jira_config,
+                user_cloud_id,
+            )
             try:
-                user_jira_fetcher = JiraFetcher(config=user_specific_config)
-                current_user_id = user_jira_fetcher.get_current_user_account_id()
-                logger.debug(
-                    f"get_jira_fetcher: Validated Jira token for user ID: {current_user_id}"
+                user_jira_fetcher = _fetcher_class("JiraFetcher")(
+                    config=user_specific_config
                 )
+                current_user_id = _get_validated_user(validation_key)
+                if current_user_id is not None:
+                    TOKEN_VALIDATIONS.inc(service="jira", result="cached")
+                    logger.debug(
+                        f"get_jira_fetcher: Using cached validation for user ID: {current_user_id}"
+                    )
+                else:
+                    current_user_id = user_jira_fetcher.get_current_user_account_id()
+                    TOKEN_VALIDATIONS.inc(service="jira", result="validated")
+                    _remember_validated_user(validation_key, current_user_id)
+                    logger.debug(
+                        f"get_jira_fetcher: Validated Jira token for user ID: {current_user_id}"
+                    )
                 request.state.jira_fetcher = user_jira_fetcher
                 return user_jira_fetcher
             except Exception as e:
@@ -253,7 +371,9 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
             "get_jira_fetcher: Using global JiraFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_jira_config.auth_type}"
         )
-        return JiraFetcher(config=app_lifespan_ctx_global.full_jira_config)
+        return _fetcher_class("JiraFetcher")(
+            config=app_lifespan_ctx_global.full_jira_config
+        )
     logger.error("Jira configuration could not be resolved.")
     raise ValueError(
         "Jira client (fetcher) not available. Ensure server is configured correctly."
@@ -326,9 +446,24 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
                 credentials=credentials,
                 cloud_id=user_cloud_id,
             )
+            validation_key = _token_validation_key(
+                "confluence",
+                user_auth_type,
+                user_token,
+                app_lifespan_ctx.full_confluence_config,
+                user_cloud_id,
+            )
             try:
-                user_confluence_fetcher = ConfluenceFetcher(config=user_specific_config)
-                current_user_data = user_confluence_fetcher.get_current_user_info()
+                user_confluence_fetcher = _fetcher_class("ConfluenceFetcher")(
+                    config=user_specific_config
+                )
+                current_user_data = _get_validated_user(validation_key)
+                if current_user_data is not None:
+                    TOKEN_VALIDATIONS.inc(service="confluence", result="cached")
+                else:
+                    current_user_data = user_confluence_fetcher.get_current_user_info()
+                    TOKEN_VALIDATIONS.inc(service="confluence", result="validated")
+                    _remember_validated_user(validation_key, current_user_data)
                 # Try to get email from Confluence if not provided (can happen with PAT)
                 derived_email = (
                     current_user_data.get("email")
@@ -377,7 +512,9 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
             "get_confluence_fetcher: Using global ConfluenceFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_confluence_config.auth_type}"
         )
-        return ConfluenceFetcher(config=app_lifespan_ctx_global.full_confluence_config)
+        return _fetcher_class("ConfluenceFetcher")(
+            config=app_lifespan_ctx_global.full_confluence_config
+        )
     logger.error("Confluence configuration could not be resolved.")
     raise ValueError(
         "Confluence client (fetcher) not available. Ensure server is configured correctly."
@@ -10,7 +10,6 @@ from requests.exceptions import HTTPError
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
-from mcp_atlassian.models.jira.common import JiraUser
 from mcp_atlassian.servers.dependencies import get_jira_fetcher
 from mcp_atlassian.utils.decorators import check_write_access
 
@@ -47,7 +46,7 @@ async def get_user_profile(
     """
     jira = await get_jira_fetcher(ctx)
     try:
-        user: JiraUser = jira.get_user_profile_by_identifier(user_identifier)
+        user = jira.get_user_profile_by_identifier(user_identifier)
         result = user.to_simplified_dict()
         response_data = {"success": True, "user": result}
     except Exception as e:
@@ -356,6 +355,58 @@ async def get_worklog(
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
+@jira_mcp.tool(tags={"jira", "read"})
+async def aggregate_worklogs(
+    ctx: Context,
+    jql: Annotated[
+        str,
+        Field(
+            description=(
+                "JQL query selecting the issues to report on, e.g. "
+                "'sprint = 42' or 'project = PROJ AND assignee = currentUser()'"
+            )
+        ),
+    ],
+    start_date: Annotated[
+        str,
+        Field(description="First day of the period (YYYY-MM-DD, inclusive)"),
+    ],
+    end_date: Annotated[
+        str,
+        Field(description="Last day of the period (YYYY-MM-DD, inclusive)"),
+    ],
+    max_issues: Annotated[
+        int,
+        Field(
+            description="Maximum number of matching issues to include (1-1000)",
+            default=1000,
+            ge=1,
+            le=1000,
+        ),
+    ] = 1000,
+) -> str:
+    """Summarize time logged on the issues matching a JQL query within a date range.
+
+    Totals are aggregated server-side by author, issue and day, so only the
+    summary is returned instead of every worklog entry.
+
+    Args:
+        ctx: The FastMCP context.
+        jql: JQL query selecting the issues.
+        start_date: First day of the period (YYYY-MM-DD).
+        end_date: Last day of the period (YYYY-MM-DD).
+        max_issues: Maximum number of matching issues to include.
+
+    Returns:
+        JSON string with total time and per-author, per-issue and per-day totals.
+    """
+    jira = await get_jira_fetcher(ctx)
+    result = jira.aggregate_worklogs(
+        jql=jql, start_date=start_date, end_date=end_date, max_issues=max_issues
+    )
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
 @jira_mcp.tool(tags={"jira", "read"})
 async def download_attachments(
     ctx: Context,
@@ -465,7 +516,9 @@ async def get_board_issues(
     ] = 0,
     limit: Annotated[
         int,
-        Field(description="Maximum number of results (1-50)", default=10, ge=1, le=50),
+        Field(
+            description="Maximum number of results (1-200)", default=10, ge=1, le=200
+        ),
     ] = 10,
     expand: Annotated[
         str,
@@ -520,7 +573,9 @@ async def get_sprints_from_board(
     ] = 0,
     limit: Annotated[
         int,
-        Field(description="Maximum number of results (1-50)", default=10, ge=1, le=50),
+        Field(
+            description="Maximum number of results (1-200)", default=10, ge=1, le=200
+        ),
     ] = 10,
 ) -> str:
     """Get jira sprints from board by state.
@@ -564,7 +619,9 @@ async def get_sprint_issues(
     ] = 0,
     limit: Annotated[
         int,
-        Field(description="Maximum number of results (1-50)", default=10, ge=1, le=50),
+        Field(
+            description="Maximum number of results (1-200)", default=10, ge=1, le=200
+        ),
     ] = 10,
 ) -> str:
     """Get jira issues from sprint.
@@ -1478,12 +1535,22 @@ async def get_all_projects(
             default=False,
         ),
     ] = False,
+    refresh: Annotated[
+        bool,
+        Field(
+            description=(
+                "Fetch the project list from Jira instead of the short-lived cache"
+            ),
+            default=False,
+        ),
+    ] = False,
 ) -> str:
     """Get all Jira projects accessible to the current user.
 
     Args:
         ctx: The FastMCP context.
         include_archived: Whether to include archived projects.
+        refresh: Whether to bypass the project catalog cache.
 
     Returns:
         JSON string representing a list of project objects accessible to the user.
@@ -1495,7 +1562,9 @@ async def get_all_projects(
     """
     try:
         jira = await get_jira_fetcher(ctx)
-        projects = jira.get_all_projects(include_archived=include_archived)
+        projects = jira.get_all_projects(
+            include_archived=include_archived, refresh=refresh
+        )
     except (MCPAtlassianAuthenticationError, HTTPError, OSError, ValueError) as e:
         error_message = ""
         log_level = logging.ERROR
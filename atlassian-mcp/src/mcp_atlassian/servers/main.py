@@ -1,28 +1,54 @@
 """Main FastMCP server setup for Atlassian integration."""
 
+import hmac
+import json
 import logging
+import os
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any, Literal, Optional
 
-from cachetools import TTLCache
+import anyio
 from fastmcp import FastMCP
+from fastmcp.exceptions import NotFoundError
 from fastmcp.tools import Tool as FastMCPTool
+from mcp.types import EmbeddedResource, ImageContent, TextContent
 from mcp.types import Tool as MCPTool
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, PlainTextResponse
 
-from mcp_atlassian.confluence import ConfluenceFetcher
 from mcp_atlassian.confluence.config import ConfluenceConfig
-from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.jira.mirror import close_issue_mirrors, forget_mirrored_issues
+from mcp_atlassian.utils.env import is_env_truthy
 from mcp_atlassian.utils.environment import get_available_services
+from mcp_atlassian.utils.http import close_connection_pools
 from mcp_atlassian.utils.io import is_read_only_mode
 from mcp_atlassian.utils.logging import mask_sensitive
+from mcp_atlassian.utils.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    counter,
+    histogram,
+    render_prometheus,
+)
+from mcp_atlassian.utils.oauth import TOKEN_REFRESH_COORDINATOR
+from mcp_atlassian.utils.profiling import (
+    MAX_PROFILE_SECONDS,
+    ProfilerBusyError,
+    format_collapsed,
+    sample_stacks,
+)
 from mcp_atlassian.utils.tools import get_enabled_tools, should_include_tool
+from mcp_atlassian.utils.tracing import trace_call
+from mcp_atlassian.utils.webhooks import (
+    handle_webhook,
+    jira_removed_issue_keys,
+    verify_webhook_signature,
+)
 
 from .confluence import confluence_mcp
 from .context import MainAppContext
@@ -30,11 +56,92 @@ from .jira import jira_mcp
 
 logger = logging.getLogger("mcp-atlassian.server.main")
 
+TOOL_CALLS = counter(
+    "mcp_tool_calls_total",
+    "MCP tool calls by tool name and outcome (success/error).",
+    ("tool", "outcome"),
+)
+TOOL_CALL_DURATION = histogram(
+    "mcp_tool_call_duration_seconds",
+    "Wall-clock time spent handling MCP tool calls, by tool name.",
+    ("tool",),
+)
+
 
 async def health_check(request: Request) -> JSONResponse:
     return JSONResponse({"status": "ok"})
 
 
+async def metrics_handler(request: Request) -> PlainTextResponse:
+    """Serve the in-process metrics in the Prometheus text format."""
+    return PlainTextResponse(render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+async def profile_handler(request: Request) -> PlainTextResponse | JSONResponse:
+    """Sample all thread stacks for ``?seconds=N`` and return collapsed stacks.
+
+    Disabled (404) unless ``MCP_PROFILER_TOKEN`` is set; callers must send
+    the token in the ``X-Profiler-Token`` header.
+    """
+    token = os.getenv("MCP_PROFILER_TOKEN")
+    if not token:
+        return JSONResponse({"error": "not found"}, status_code=404)
+    supplied = request.headers.get("X-Profiler-Token", "")
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        return JSONResponse({"error": "forbidden"}, status_code=403)
+    try:
+        seconds = float(request.query_params.get("seconds", "10"))
+    except ValueError:
+        seconds = 0.0
+    if not 0 < seconds <= MAX_PROFILE_SECONDS:
+        return JSONResponse(
+            {"error": f"seconds must be between 0 and {MAX_PROFILE_SECONDS:g}"},
+            status_code=400,
+        )
+    try:
+        stacks = await anyio.to_thread.run_sync(sample_stacks, seconds)
+    except ProfilerBusyError:
+        return JSONResponse({"error": "profiling already in progress"}, status_code=409)
+    return PlainTextResponse(format_collapsed(stacks))
+
+
+async def webhook_handler(request: Request) -> JSONResponse:
+    """Invalidate cached Atlassian data in response to a Jira/Confluence webhook.
+
+    When ``MCP_WEBHOOK_SECRET`` is set, the request must carry a matching
+    ``X-Hub-Signature`` HMAC of the body. Without a secret, only caches are
+    invalidated; deleted issues are removed from the issue mirror of the
+    sending site only for signed webhooks.
+    """
+    product = request.path_params["product"]
+    body = await request.body()
+    secret = os.getenv("MCP_WEBHOOK_SECRET")
+    if secret and not verify_webhook_signature(
+        secret, body, request.headers.get("X-Hub-Signature")
+    ):
+        logger.warning(f"Rejected {product} webhook with invalid signature")
+        return JSONResponse({"error": "invalid signature"}, status_code=401)
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return JSONResponse({"error": "invalid JSON payload"}, status_code=400)
+    if not isinstance(payload, dict):
+        return JSONResponse({"error": "invalid JSON payload"}, status_code=400)
+    result = handle_webhook(product, payload)
+    removed_keys = jira_removed_issue_keys(payload) if product == "jira" else []
+    if removed_keys and not secret:
+        logger.warning(
+            "Ignoring issue removals from an unsigned Jira webhook; "
+            "set MCP_WEBHOOK_SECRET to keep the issue mirror in sync"
+        )
+    elif removed_keys:
+        # Delta syncs never see deleted issues, so drop them from the mirror
+        issue_url = str((payload.get("issue") or {}).get("self") or "")
+        if issue_url and forget_mirrored_issues(issue_url, removed_keys):
+            result["mirror_removed"] = removed_keys
+    return JSONResponse(result)
+
+
 @asynccontextmanager
 async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
     logger.info("Main Atlassian MCP server lifespan starting...")
@@ -98,14 +205,70 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
                 logger.debug("Cleaning up Jira resources...")
             if loaded_confluence_config:
                 logger.debug("Cleaning up Confluence resources...")
+            close_connection_pools()
+            close_issue_mirrors()
+            TOKEN_REFRESH_COORDINATOR.shutdown()
         except Exception as e:
             logger.error(f"Error during cleanup: {e}", exc_info=True)
         logger.info("Main Atlassian MCP server lifespan shutdown complete.")
 
 
+# (read_only, enabled tools, jira configured, confluence configured, has context)
+ToolProfile = tuple[bool, tuple[str, ...] | None, bool, bool, bool]
+# (registered name, tool object identity) for every registered tool
+ToolRegistryFingerprint = tuple[tuple[str, int], ...]
+
+
 class AtlassianMCP(FastMCP[MainAppContext]):
     """Custom FastMCP server class for Atlassian integration with tool filtering."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Filtered tool lists per profile, rebuilt when the registry changes.
+        # The tool objects are kept alive so their ids cannot be reused.
+        self._tool_list_cache: dict[
+            ToolProfile,
+            tuple[ToolRegistryFingerprint, list[FastMCPTool], list[MCPTool]],
+        ] = {}
+
+    async def _mcp_call_tool(
+        self, key: str, arguments: dict[str, Any]
+    ) -> list[TextContent | ImageContent | EmbeddedResource]:
+        """Call a tool, tracing where its time goes if MCP_TRACE_TOOL_CALLS is set."""
+        if not is_env_truthy("MCP_TRACE_TOOL_CALLS"):
+            return await self._call_tool_with_metrics(key, arguments)
+
+        try:
+            with trace_call(key) as trace:
+                result = await self._call_tool_with_metrics(key, arguments)
+        finally:
+            summary = trace.summary()
+            logger.info(f"Tool call trace: {json.dumps(summary)}")
+        if is_env_truthy("MCP_TRACE_IN_RESPONSE"):
+            result = [
+                *result,
+                TextContent(type="text", text=json.dumps({"trace": summary})),
+            ]
+        return result
+
+    async def _call_tool_with_metrics(
+        self, key: str, arguments: dict[str, Any]
+    ) -> list[TextContent | ImageContent | EmbeddedResource]:
+        """Call a tool, recording its outcome and latency."""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await super()._mcp_call_tool(key, arguments)
+            outcome = "success"
+            return result
+        except NotFoundError:
+            # Keep arbitrary client-supplied names out of the metric labels
+            key = "unknown"
+            raise
+        finally:
+            TOOL_CALLS.inc(tool=key, outcome=outcome)
+            TOOL_CALL_DURATION.observe(time.perf_counter() - started, tool=key)
+
     async def _mcp_list_tools(self) -> list[MCPTool]:
         # Filter tools based on enabled_tools, read_only mode, and service configuration from the lifespan context.
         req_context = self._mcp_server.request_context
@@ -131,11 +294,44 @@ class AtlassianMCP(FastMCP[MainAppContext]):
             if app_lifespan_state
             else None
         )
+
+        all_tools: dict[str, FastMCPTool] = await self.get_tools()
+        # Tools are re-registered as new objects, so identities reveal changes
+        fingerprint = tuple((name, id(tool)) for name, tool in all_tools.items())
+        profile: ToolProfile = (
+            bool(read_only),
+            tuple(sorted(enabled_tools_filter))
+            if enabled_tools_filter is not None
+            else None,
+            bool(app_lifespan_state and app_lifespan_state.full_jira_config),
+            bool(app_lifespan_state and app_lifespan_state.full_confluence_config),
+            app_lifespan_state is not None,
+        )
+        cached = self._tool_list_cache.get(profile)
+        if cached is not None and cached[0] == fingerprint:
+            return list(cached[2])
+
         logger.debug(
-            f"_main_mcp_list_tools: read_only={read_only}, enabled_tools_filter={enabled_tools_filter}"
+            f"_main_mcp_list_tools: building tool list for read_only={read_only}, enabled_tools_filter={enabled_tools_filter}"
         )
+        filtered_tools = self._filter_tools(
+            all_tools, read_only, enabled_tools_filter, app_lifespan_state
+        )
+        self._tool_list_cache[profile] = (
+            fingerprint,
+            list(all_tools.values()),
+            filtered_tools,
+        )
+        return list(filtered_tools)
 
-        all_tools: dict[str, FastMCPTool] = await self.get_tools()
+    def _filter_tools(
+        self,
+        all_tools: dict[str, FastMCPTool],
+        read_only: bool,
+        enabled_tools_filter: list[str] | None,
+        app_lifespan_state: MainAppContext | None,
+    ) -> list[MCPTool]:
+        """Build the MCP tool list visible under one filter profile."""
         logger.debug(
             f"Aggregated {len(all_tools)} tools before filtering: {list(all_tools.keys())}"
         )
@@ -201,11 +397,6 @@ class AtlassianMCP(FastMCP[MainAppContext]):
         return app
 
 
-token_validation_cache: TTLCache[
-    int, tuple[bool, str | None, JiraFetcher | None, ConfluenceFetcher | None]
-] = TTLCache(maxsize=100, ttl=300)
-
-
 class UserTokenMiddleware(BaseHTTPMiddleware):
     """Middleware to extract Atlassian user tokens/credentials from Authorization headers."""
 
@@ -336,3 +527,22 @@ async def _health_check_route(request: Request) -> JSONResponse:
 
 
 logger.info("Added /healthz endpoint for Kubernetes probes")
+
+
+@main_mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+async def _metrics_route(request: Request) -> PlainTextResponse:
+    return await metrics_handler(request)
+
+
+@main_mcp.custom_route("/debug/profile", methods=["GET"], include_in_schema=False)
+async def _profile_route(request: Request) -> PlainTextResponse | JSONResponse:
+    return await profile_handler(request)
+
+
+@main_mcp.custom_route(
+    "/webhooks/{product:str}", methods=["POST"], include_in_schema=False
+)
+async def _webhook_route(request: Request) -> JSONResponse:
+    if request.path_params["product"] not in ("jira", "confluence"):
+        return JSONResponse({"error": "unknown product"}, status_code=404)
+    return await webhook_handler(request)
@@ -1,22 +1,49 @@
 """
 Utility functions for the MCP Atlassian integration.
 This package provides various utility functions used throughout the codebase.
+
+The re-exported names are resolved on first access, so importing a single
+utility module (e.g. ``mcp_atlassian.utils.env``) does not load the HTTP,
+OAuth and date-parsing stacks as well.
 """
 
-from .date import parse_date
-from .io import is_read_only_mode
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .date import parse_date
+    from .io import is_read_only_mode
+    from .lifecycle import ensure_clean_exit, setup_signal_handlers
+    from .logging import setup_logging
+    from .oauth import OAuthConfig, configure_oauth_session
+    from .ssl import SSLIgnoreAdapter, configure_ssl_verification
+    from .urls import is_atlassian_cloud_url
+
+_LAZY_IMPORTS = {
+    "parse_date": ".date",
+    "is_read_only_mode": ".io",
+    # Export lifecycle utilities
+    "ensure_clean_exit": ".lifecycle",
+    "setup_signal_handlers": ".lifecycle",
+    "setup_logging": ".logging",
+    # Export OAuth utilities
+    "OAuthConfig": ".oauth",
+    "configure_oauth_session": ".oauth",
+    "SSLIgnoreAdapter": ".ssl",
+    "configure_ssl_verification": ".ssl",
+    "is_atlassian_cloud_url": ".urls",
+}
+
 
-# Export lifecycle utilities
-from .lifecycle import (
-    ensure_clean_exit,
-    setup_signal_handlers,
-)
-from .logging import setup_logging
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Export OAuth utilities
-from .oauth import OAuthConfig, configure_oauth_session
-from .ssl import SSLIgnoreAdapter, configure_ssl_verification
-from .urls import is_atlassian_cloud_url
 
 # Export all utility functions for backward compatibility
 __all__ = [
@@ -0,0 +1,249 @@
+"""Tagged TTL caches with process-wide invalidation.
+
+Fetchers are recreated for every tool call, so caches that should survive
+between calls live at module level and are registered here by name. Every
+entry carries a set of tags (e.g. ``jira:issue:PROJ-1``), which lets webhook
+handlers and write paths invalidate precisely the entries affected by a
+change across all caches at once.
+
+Entries are also scoped by ``credential_scope`` in their keys so that data
+fetched with one user's permissions is never served to another user.
+"""
+
+import hashlib
+import logging
+import threading
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+from cachetools import TTLCache
+
+from .metrics import counter, gauge, register_collector
+
+logger = logging.getLogger("mcp-atlassian.utils.cache")
+
+CACHE_REQUESTS = counter(
+    "mcp_cache_requests_total",
+    "Cache lookups by cache name and result (hit/miss).",
+    ("cache", "result"),
+)
+CACHE_INVALIDATIONS = counter(
+    "mcp_cache_invalidated_entries_total",
+    "Cache entries removed by tag invalidation, by cache name.",
+    ("cache",),
+)
+CACHE_HIT_RATIO = gauge(
+    "mcp_cache_hit_ratio",
+    "Share of lookups answered from the cache since startup, by cache name.",
+    ("cache",),
+)
+CACHE_ENTRIES = gauge(
+    "mcp_cache_entries",
+    "Entries currently held, by cache name.",
+    ("cache",),
+)
+
+_MISSING = object()
+
+
+class TaggedTTLCache:
+    """Thread-safe TTL cache whose entries can be invalidated by tag."""
+
+    def __init__(self, name: str, maxsize: int, ttl: float) -> None:
+        self.name = name
+        self._data: TTLCache[Hashable, tuple[Any, frozenset[str]]] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        """Seconds an entry stays valid."""
+        return self._data.ttl
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for a key, recording a hit or miss."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            CACHE_REQUESTS.inc(cache=self.name, result="miss")
+            return default
+        CACHE_REQUESTS.inc(cache=self.name, result="hit")
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[str] = ()) -> None:
+        """Store a value with the tags that should invalidate it."""
+        with self._lock:
+            self._data[key] = (value, frozenset(tags))
+
+    def get_or_load(
+        self, key: Hashable, loader: Callable[[], Any], tags: Iterable[str] = ()
+    ) -> Any:
+        """Return the cached value, calling ``loader`` and caching it on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value, tags)
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a single entry."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Remove every entry carrying any of the tags; return how many."""
+        tag_set = set(tags)
+        if not tag_set:
+            return 0
+        with self._lock:
+            stale = [
+                key
+                for key, (_, entry_tags) in self._data.items()
+                if not entry_tags.isdisjoint(tag_set)
+            ]
+            for key in stale:
+                self._data.pop(key, None)
+        if stale:
+            CACHE_INVALIDATIONS.inc(len(stale), cache=self.name)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class CacheRegistry:
+    """Named caches shared by the whole process."""
+
+    def __init__(self) -> None:
+        self._caches: dict[str, TaggedTTLCache] = {}
+        self._lock = threading.Lock()
+
+    def get_cache(self, name: str, maxsize: int, ttl: float) -> TaggedTTLCache:
+        """Return the cache with this name, creating it on first use."""
+        with self._lock:
+            cache = self._caches.get(name)
+            if cache is None:
+                cache = TaggedTTLCache(name, maxsize=maxsize, ttl=ttl)
+                self._caches[name] = cache
+            return cache
+
+    def caches(self) -> list[TaggedTTLCache]:
+        """Return all registered caches."""
+        with self._lock:
+            return list(self._caches.values())
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate the tags in every cache; return the entries removed."""
+        tag_list = list(tags)
+        removed = sum(cache.invalidate_tags(tag_list) for cache in self.caches())
+        logger.debug(f"Invalidated {removed} cache entries for tags {tag_list}")
+        return removed
+
+    def clear(self) -> None:
+        """Empty every registered cache."""
+        for cache in self.caches():
+            cache.clear()
+
+
+CACHE_REGISTRY = CacheRegistry()
+
+
+def _collect_cache_metrics() -> None:
+    CACHE_HIT_RATIO.clear()
+    CACHE_ENTRIES.clear()
+    lookups: dict[str, dict[str, float]] = {}
+    for labels, value in CACHE_REQUESTS.samples():
+        lookups.setdefault(labels["cache"], {})[labels["result"]] = value
+    for name, results in lookups.items():
+        total = results.get("hit", 0.0) + results.get("miss", 0.0)
+        if total:
+            CACHE_HIT_RATIO.set(results.get("hit", 0.0) / total, cache=name)
+    for cache in CACHE_REGISTRY.caches():
+        CACHE_ENTRIES.set(len(cache), cache=cache.name)
+
+
+register_collector(_collect_cache_metrics)
+
+
+def get_cache(name: str, maxsize: int, ttl: float) -> TaggedTTLCache:
+    """Return (creating if needed) a named cache from the global registry."""
+    return CACHE_REGISTRY.get_cache(name, maxsize=maxsize, ttl=ttl)
+
+
+def invalidate_tags(tags: Iterable[str]) -> int:
+    """Invalidate tags across every registered cache."""
+    return CACHE_REGISTRY.invalidate_tags(tags)
+
+
+def credential_scope(config: Any) -> str:
+    """Return a stable, non-reversible identifier of a config's credentials.
+
+    Used as part of cache keys so cached responses are only reused by
+    callers with the same identity (and therefore the same permissions).
+
+    Args:
+        config: A JiraConfig or ConfluenceConfig
+
+    Returns:
+        A short hash of the site URL, auth type and credential material
+    """
+    oauth_config = getattr(config, "oauth_config", None)
+    parts = [
+        str(getattr(config, "url", "") or ""),
+        str(getattr(config, "auth_type", "") or ""),
+        str(getattr(config, "username", "") or ""),
+        str(getattr(config, "api_token", "") or ""),
+        str(getattr(config, "personal_token", "") or ""),
+        str(getattr(oauth_config, "cloud_id", "") or ""),
+        # Refreshable OAuth tokens rotate, so the app's client ID identifies
+        # that (single) identity; user-supplied tokens identify themselves.
+        str(
+            getattr(oauth_config, "client_id", "")
+            if getattr(oauth_config, "refresh_token", None)
+            else getattr(oauth_config, "access_token", "")
+        ),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()[:16]
+
+
+# Tag helpers, shared by caches and the webhook handlers
+
+
+def jira_issue_tag(issue_key_or_id: str) -> str:
+    """Tag for everything derived from a single Jira issue."""
+    return f"jira:issue:{str(issue_key_or_id).upper()}"
+
+
+def jira_project_tag(project_key_or_id: str) -> str:
+    """Tag for project-level data (components, versions, counts)."""
+    return f"jira:project:{str(project_key_or_id).upper()}"
+
+
+JIRA_PROJECTS_TAG = "jira:projects"  # The project catalog itself
+JIRA_FIELDS_TAG = "jira:fields"  # Field metadata
+
+
+def confluence_page_tag(page_id: str) -> str:
+    """Tag for everything derived from a single Confluence page."""
+    return f"confluence:page:{page_id}"
+
+
+def confluence_page_version_tag(page_id: str) -> str:
+    """Tag for the last known version of a Confluence page.
+
+    Kept apart from the page tag, which the server's own writes invalidate
+    right after recording the version they produced.
+    """
+    return f"confluence:page-version:{page_id}"
+
+
+def confluence_space_tag(space_key_or_id: str) -> str:
+    """Tag for space-level data (space lookups, page listings)."""
+    return f"confluence:space:{str(space_key_or_id).upper()}"
@@ -0,0 +1,195 @@
+"""Coalescing of identical concurrent GET requests to Atlassian.
+
+Several agents often ask for the same issue, page or field list at the same
+moment. The adapter in this module lets the first request for a given
+(credential, URL) go upstream and makes identical requests that arrive while
+it is in flight wait for its response instead of sending their own. The key
+includes a hash of the ``Authorization`` header, so responses are only shared
+between callers using the same credentials and never across users with
+different permissions.
+"""
+
+import copy
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any
+from urllib.parse import urlparse
+
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .metrics import counter
+from .rate_limit import tenant_prefix
+
+logger = logging.getLogger("mcp-atlassian.utils.coalesce")
+
+COALESCED_REQUESTS = counter(
+    "atlassian_http_coalesced_requests_total",
+    "GET requests by coalescing role: 'leader' went upstream, 'follower' "
+    "reused an in-flight leader's response.",
+    ("site", "role"),
+)
+
+CoalesceKey = tuple[str, str, str, str]
+
+_CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+# Set on responses handed to followers so request metrics skip them
+_COALESCED_ATTR = "_mcp_coalesced"
+
+
+class RequestCoalescer:
+    """Tracks in-flight GET requests shared by every session in the process."""
+
+    def __init__(self) -> None:
+        self._in_flight: dict[CoalesceKey, Future] = {}
+        self._lock = threading.Lock()
+
+    def key_for(self, request: PreparedRequest) -> CoalesceKey | None:
+        """Return the coalescing key for a request, or None if not eligible.
+
+        Only body-less, unconditional GETs carrying credentials are
+        coalesced; anonymous requests are skipped because their permission
+        scope is unknown.
+        """
+        if (request.method or "").upper() != "GET" or request.body:
+            return None
+        authorization = request.headers.get("Authorization")
+        if not authorization or not request.url:
+            return None
+        if any(header in request.headers for header in _CONDITIONAL_HEADERS):
+            # A 304 answer is only meaningful to the caller holding the ETag
+            return None
+        credential = hashlib.sha256(authorization.encode()).hexdigest()
+        accept = request.headers.get("Accept", "")
+        return (urlparse(request.url).netloc, credential, request.url, accept)
+
+    def join(self, key: CoalesceKey) -> tuple[Future, bool]:
+        """Return the in-flight future for a key and whether the caller leads."""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._in_flight[key] = future
+            return future, True
+
+    def finish(self, key: CoalesceKey) -> None:
+        """Stop sharing a key so later requests go upstream again."""
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def in_flight(self) -> int:
+        """Return the number of distinct requests currently in flight."""
+        with self._lock:
+            return len(self._in_flight)
+
+
+REQUEST_COALESCER = RequestCoalescer()
+
+
+def _clone_response(response: Response, request: PreparedRequest) -> Response:
+    """Return a copy of a fully read response bound to another request."""
+    clone = copy.copy(response)
+    clone.headers = CaseInsensitiveDict(response.headers)
+    clone.cookies = response.cookies.copy()
+    clone.history = list(response.history)
+    clone.request = request
+    setattr(clone, _COALESCED_ATTR, True)
+    return clone
+
+
+def is_coalesced_response(response: Response) -> bool:
+    """Return True if the response was shared from another in-flight request."""
+    return getattr(response, _COALESCED_ATTR, False)
+
+
+class CoalescingAdapter(BaseAdapter):
+    """Transport adapter collapsing identical in-flight GETs into one request.
+
+    It wraps the adapter previously mounted for the site (normally the
+    rate-limit adapter), so a coalesced follower neither consumes rate-limit
+    tokens nor opens a connection.
+    """
+
+    def __init__(
+        self,
+        inner: BaseAdapter,
+        site: str,
+        coalescer: RequestCoalescer = REQUEST_COALESCER,
+    ) -> None:
+        super().__init__()
+        self.inner = inner
+        self.site = site
+        self.coalescer = coalescer
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        """Send the request, sharing the response of an identical in-flight GET."""
+        key = None if kwargs.get("stream") else self.coalescer.key_for(request)
+        if key is None:
+            return self.inner.send(request, **kwargs)
+
+        future, is_leader = self.coalescer.join(key)
+        if not is_leader:
+            COALESCED_REQUESTS.inc(site=self.site, role="follower")
+            logger.debug(f"Coalescing GET {request.url} with in-flight request")
+            return _clone_response(future.result(), request)
+
+        COALESCED_REQUESTS.inc(site=self.site, role="leader")
+        try:
+            response = self.inner.send(request, **kwargs)
+            # Read the body now so it can be handed to every waiter
+            _ = response.content
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            self.coalescer.finish(key)
+
+    def close(self) -> None:
+        """Close the wrapped adapter."""
+        self.inner.close()
+
+
+def configure_request_coalescing(service_name: str, url: str, session: Session) -> None:
+    """Mount a coalescing adapter for a service's site on the session.
+
+    Must run last, after ``configure_rate_limiting``, so coalesced requests
+    bypass rate limiting and retries entirely.
+
+    Args:
+        service_name: Name of the service for logging (e.g., "Jira")
+        url: Base URL of the service API
+        session: The requests session to configure
+    """
+    mount = tenant_prefix(url) if url else None
+    if not mount:
+        return
+    prefix, site = mount
+    inner = session.get_adapter(prefix)
+    if isinstance(inner, CoalescingAdapter):
+        inner = inner.inner
+    session.mount(prefix, CoalescingAdapter(inner, site))
+    logger.debug(f"{service_name} request coalescing enabled for {site}")
+
+
+def get_coalescing_stats() -> dict[str, dict[str, float]]:
+    """Return leader/follower counts and the coalescing ratio per site.
+
+    The ratio is the share of eligible GETs that were served from another
+    request's response instead of going upstream.
+    """
+    stats: dict[str, dict[str, float]] = {}
+    for labels, value in COALESCED_REQUESTS.samples():
+        site_stats = stats.setdefault(labels["site"], {"leader": 0.0, "follower": 0.0})
+        site_stats[labels["role"]] = value
+    for site_stats in stats.values():
+        total = site_stats["leader"] + site_stats["follower"]
+        site_stats["ratio"] = site_stats["follower"] / total if total else 0.0
+    return stats
@@ -0,0 +1,149 @@
+"""Bounded thread-pool helpers for fanning out blocking Atlassian API calls."""
+
+import contextvars
+import logging
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, TypeVar
+
+from .metrics import gauge
+
+logger = logging.getLogger("mcp-atlassian.utils.concurrency")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+POOL_QUEUED_TASKS = gauge(
+    "mcp_thread_pool_queued_tasks",
+    "Tasks submitted to worker pools and waiting for a thread, by pool name.",
+    ("pool",),
+)
+POOL_ACTIVE_TASKS = gauge(
+    "mcp_thread_pool_active_tasks",
+    "Tasks currently running on worker pool threads, by pool name.",
+    ("pool",),
+)
+
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool publishing its queued and running task counts as gauges.
+
+    Pools are labelled by their thread name prefix, so the short-lived pools
+    created for each fan-out add up to one series per kind of work. Tasks run
+    in a copy of the submitter's context, so per-call state such as the
+    active trace follows them into the worker threads.
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, thread_name_prefix: str = ""
+    ) -> None:
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self.pool_name = thread_name_prefix or "default"
+
+    def submit(self, fn: Callable[..., R], /, *args: Any, **kwargs: Any) -> Future[R]:
+        """Schedule ``fn``, counting it as queued until a worker picks it up."""
+        pool = self.pool_name
+
+        def run() -> R:
+            POOL_QUEUED_TASKS.dec(pool=pool)
+            POOL_ACTIVE_TASKS.inc(pool=pool)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                POOL_ACTIVE_TASKS.dec(pool=pool)
+
+        POOL_QUEUED_TASKS.inc(pool=pool)
+        try:
+            future = super().submit(contextvars.copy_context().run, run)
+        except BaseException:
+            POOL_QUEUED_TASKS.dec(pool=pool)
+            raise
+        # Cancelled tasks never reach a worker, so leave the queue here
+        future.add_done_callback(
+            lambda f: POOL_QUEUED_TASKS.dec(pool=pool) if f.cancelled() else None
+        )
+        return future
+
+
+def map_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    thread_name_prefix: str = "mcp-atlassian",
+) -> list[R]:
+    """Apply ``func`` to every item using at most ``max_workers`` threads.
+
+    The Jira and Confluence clients are synchronous ``requests`` based clients,
+    so independent calls are fanned out to a short-lived thread pool. Results
+    are returned in the same order as ``items``. Exceptions raised by ``func``
+    propagate to the caller, so callers that need per-item error reporting
+    should catch them inside ``func``.
+
+    Args:
+        func: Callable applied to each item
+        items: Items to process
+        max_workers: Upper bound on the number of concurrent calls
+        thread_name_prefix: Prefix for the worker thread names
+
+    Returns:
+        List of results in input order
+    """
+    item_list = list(items)
+    if not item_list:
+        return []
+
+    workers = max(1, min(max_workers, len(item_list)))
+    if workers == 1:
+        return [func(item) for item in item_list]
+
+    logger.debug(f"Running {len(item_list)} calls with {workers} worker threads")
+    with InstrumentedThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix=thread_name_prefix
+    ) as executor:
+        return list(executor.map(func, item_list))
+
+
+def first_accepted(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    accept: Callable[[R], bool],
+    max_workers: int,
+    thread_name_prefix: str = "mcp-atlassian",
+) -> tuple[T, R] | None:
+    """Race ``func`` over the items and return the first accepted result.
+
+    Results are considered in completion order. Calls that raise are logged
+    and treated as not accepted. Once a result is accepted, queued calls are
+    cancelled and calls already running are left to finish in the background.
+
+    Args:
+        func: Callable applied to each item
+        items: Candidate items to race
+        accept: Predicate deciding whether a result wins the race
+        max_workers: Upper bound on the number of concurrent calls
+        thread_name_prefix: Prefix for the worker thread names
+
+    Returns:
+        Tuple of (winning item, its result), or None if no result was accepted
+    """
+    item_list = list(items)
+    if not item_list:
+        return None
+
+    executor = InstrumentedThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(item_list))),
+        thread_name_prefix=thread_name_prefix,
+    )
+    try:
+        futures = {executor.submit(func, item): item for item in item_list}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:  # noqa: BLE001 - a failed candidate just loses
+                logger.debug(f"Candidate {futures[future]!r} failed: {e}")
+                continue
+            if accept(result):
+                return futures[future], result
+        return None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
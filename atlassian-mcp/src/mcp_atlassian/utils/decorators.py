@@ -44,6 +44,27 @@ def check_write_access(func: F) -> F:
     return wrapper  # type: ignore
 
 
+def raise_for_auth_error(http_err: HTTPError, service_name: str) -> None:
+    """
+    Raise MCPAtlassianAuthenticationError if an HTTP error is a 401 or 403.
+
+    Args:
+        http_err: The HTTPError raised by the API client
+        service_name: Name of the service for the error message (e.g., "Jira API")
+
+    Raises:
+        MCPAtlassianAuthenticationError: If the response status is 401 or 403
+    """
+    if http_err.response is not None and http_err.response.status_code in [401, 403]:
+        error_msg = (
+            f"Authentication failed for {service_name} "
+            f"({http_err.response.status_code}). "
+            "Token may be expired or invalid. Please verify credentials."
+        )
+        logger.error(error_msg)
+        raise MCPAtlassianAuthenticationError(error_msg) from http_err
+
+
 def handle_atlassian_api_errors(service_name: str = "Atlassian API") -> Callable:
     """
     Decorator to handle common Atlassian API exceptions (Jira, Confluence, etc.).
@@ -58,24 +79,16 @@ def handle_atlassian_api_errors(service_name: str = "Atlassian API") -> Callable
             try:
                 return func(self, *args, **kwargs)
             except HTTPError as http_err:
-                if http_err.response is not None and http_err.response.status_code in [
-                    401,
-                    403,
-                ]:
-                    error_msg = (
-                        f"Authentication failed for {service_name} "
-                        f"({http_err.response.status_code}). "
-                        "Token may be expired or invalid. Please verify credentials."
-                    )
-                    logger.error(error_msg)
-                    raise MCPAtlassianAuthenticationError(error_msg) from http_err
-                else:
-                    operation_name = getattr(func, "__name__", "API operation")
-                    logger.error(
-                        f"HTTP error during {operation_name}: {http_err}",
-                        exc_info=False,
-                    )
-                    raise http_err
+                raise_for_auth_error(http_err, service_name)
+                operation_name = getattr(func, "__name__", "API operation")
+                logger.error(
+                    f"HTTP error during {operation_name}: {http_err}",
+                    exc_info=False,
+                )
+                raise http_err
+            except MCPAtlassianAuthenticationError:
+                # Already mapped by a nested call, e.g. a shared page fetcher
+                raise
             except KeyError as e:
                 operation_name = getattr(func, "__name__", "API operation")
                 logger.error(f"Missing key in {operation_name} results: {str(e)}")
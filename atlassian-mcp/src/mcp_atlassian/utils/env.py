@@ -51,6 +51,56 @@ def is_env_ssl_verify(env_var_name: str, default: str = "true") -> bool:
     return os.getenv(env_var_name, default).lower() not in ("false", "0", "no")
 
 
+def get_env_int(env_var_name: str, default: int, minimum: int | None = None) -> int:
+    """Read an integer setting from the environment.
+
+    Unset, empty or non-numeric values fall back to the default so that a
+    typo in a tuning knob never prevents the server from starting.
+
+    Args:
+        env_var_name: Name of the environment variable to read
+        default: Value used when the variable is unset or invalid
+        minimum: Optional lower bound applied to the parsed value
+
+    Returns:
+        The parsed integer, clamped to ``minimum`` if given
+    """
+    raw_value = os.getenv(env_var_name, "").strip()
+    try:
+        value = int(raw_value) if raw_value else default
+    except ValueError:
+        value = default
+    if minimum is not None:
+        value = max(minimum, value)
+    return value
+
+
+def get_env_float(
+    env_var_name: str, default: float | None, minimum: float | None = None
+) -> float | None:
+    """Read a floating point setting from the environment.
+
+    Behaves like ``get_env_int``: unset, empty or invalid values fall back to
+    the default.
+
+    Args:
+        env_var_name: Name of the environment variable to read
+        default: Value used when the variable is unset or invalid
+        minimum: Optional lower bound applied to the parsed value
+
+    Returns:
+        The parsed float (or the default), clamped to ``minimum`` if given
+    """
+    raw_value = os.getenv(env_var_name, "").strip()
+    try:
+        value = float(raw_value) if raw_value else default
+    except ValueError:
+        value = default
+    if value is not None and minimum is not None:
+        value = max(minimum, value)
+    return value
+
+
 def get_custom_headers(env_var_name: str) -> dict[str, str]:
     """Parse custom headers from environment variable containing comma-separated key=value pairs.
 
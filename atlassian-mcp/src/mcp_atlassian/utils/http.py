@@ -0,0 +1,359 @@
+"""Connection pooling and request metrics for the Atlassian HTTP sessions.
+
+The server builds a new Jira/Confluence client (and therefore a new
+``requests.Session``) for every tool call. With the default ``HTTPAdapter``
+each of those sessions owns a private pool, so connections and TLS sessions
+were never reused across calls. The adapters created here are shared by all
+sessions that talk to the same site with the same pool settings, which keeps
+connections warm between tool calls while credentials stay per session
+(authentication is applied when requests are prepared, not by the adapter).
+"""
+
+import logging
+import re
+import socket
+import threading
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+from urllib.parse import urlparse
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.sessions import Session
+from urllib3.connection import HTTPConnection
+
+from .coalesce import is_coalesced_response
+from .metrics import counter, gauge, histogram, register_collector
+from .ssl import SSLIgnoreAdapter
+from .tracing import HTTP_SPAN, record_span
+
+logger = logging.getLogger("mcp-atlassian.utils.http")
+
+POOL_MAXSIZE = gauge(
+    "atlassian_http_pool_maxsize",
+    "Maximum number of connections kept per host pool.",
+    ("host",),
+)
+POOL_IN_USE = gauge(
+    "atlassian_http_pool_connections_in_use",
+    "Connections currently checked out of the host pool.",
+    ("host",),
+)
+POOL_IDLE = gauge(
+    "atlassian_http_pool_connections_idle",
+    "Open connections waiting in the host pool for reuse.",
+    ("host",),
+)
+POOL_CONNECTIONS_CREATED = gauge(
+    "atlassian_http_pool_connections_created",
+    "Connections opened by the host pool since it was created.",
+    ("host",),
+)
+POOL_REQUESTS = gauge(
+    "atlassian_http_pool_requests",
+    "Requests sent through the host pool since it was created.",
+    ("host",),
+)
+HTTP_REQUESTS = counter(
+    "atlassian_http_requests_total",
+    "Responses received from Atlassian by service, method, endpoint and status.",
+    ("service", "method", "endpoint", "status"),
+)
+HTTP_REQUEST_DURATION = histogram(
+    "atlassian_http_request_duration_seconds",
+    "Time until Atlassian answered a request, by service, method and endpoint.",
+    ("service", "method", "endpoint"),
+)
+
+# Path segments that identify a single resource rather than an endpoint:
+# anything containing a digit (IDs, issue keys, account IDs) or an upper-case
+# key such as a Confluence space key. API versions following one of the API
+# roots (``/rest/api/2``, ``/rest/agile/1.0``, ``/wiki/api/v2``) are kept.
+_ID_SEGMENT = re.compile(r".*\d")
+_KEY_SEGMENT = re.compile(r"~.+|[A-Z][A-Z0-9_]+")
+_VERSION_SEGMENT = re.compile(r"v?\d+(\.\d+)?|latest")
+_API_ROOTS = frozenset({"api", "agile", "dev-status", "servicedeskapi"})
+
+
+@dataclass(frozen=True)
+class ConnectionPoolSettings:
+    """Connection pool and timeout tuning for one service."""
+
+    pool_connections: int = 10  # Number of host pools cached per adapter
+    pool_maxsize: int = 20  # Connections kept open per host
+    pool_block: bool = False  # Wait for a free connection instead of opening extra
+    keep_alive: bool = True  # Reuse connections and enable TCP keep-alive probes
+    connect_timeout: float | None = None  # Seconds; None keeps the client default
+    read_timeout: float | None = None  # Seconds; None keeps the client default
+
+    def request_timeout(
+        self, requested: float | tuple[float | None, float | None] | None
+    ) -> float | tuple[float | None, float | None] | None:
+        """Return the timeout for a request, overriding only the configured parts.
+
+        Args:
+            requested: The timeout the caller passed to ``requests``, either a
+                single value for both phases or a (connect, read) tuple
+
+        Returns:
+            ``requested`` when no timeout is configured, otherwise a
+            (connect, read) tuple whose unset parts come from ``requested``
+        """
+        if self.connect_timeout is None and self.read_timeout is None:
+            return requested
+        if isinstance(requested, tuple):
+            connect, read = requested
+        else:
+            connect = read = requested
+        return (
+            connect if self.connect_timeout is None else self.connect_timeout,
+            read if self.read_timeout is None else self.read_timeout,
+        )
+
+
+def keepalive_socket_options() -> list[tuple[int, int, int]]:
+    """Socket options enabling TCP keep-alive on pooled connections.
+
+    Keep-alive probes let the OS notice connections silently dropped by load
+    balancers, so a request does not pick a dead connection from the pool.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (
+        ("TCP_KEEPIDLE", 60),
+        ("TCP_KEEPINTVL", 15),
+        ("TCP_KEEPCNT", 4),
+    ):
+        option = getattr(socket, name, None)
+        if option is not None:
+            options.append((socket.IPPROTO_TCP, option, value))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter configured from ``ConnectionPoolSettings``."""
+
+    def __init__(self, settings: ConnectionPoolSettings) -> None:
+        self.settings = settings
+        super().__init__(
+            pool_connections=settings.pool_connections,
+            pool_maxsize=settings.pool_maxsize,
+            pool_block=settings.pool_block,
+        )
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        """Initialize the pool manager, adding keep-alive socket options."""
+        if self.settings.keep_alive:
+            pool_kwargs.setdefault("socket_options", keepalive_socket_options())
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        """Send the request, applying the configured timeouts and keep-alive."""
+        kwargs["timeout"] = self.settings.request_timeout(kwargs.get("timeout"))
+        if not self.settings.keep_alive:
+            request.headers["Connection"] = "close"
+        return super().send(request, **kwargs)
+
+    def close(self) -> None:
+        """Keep shared pools open when a single session is closed.
+
+        Shared adapters outlive the sessions they are mounted on; use
+        ``close_connection_pools`` to release them at shutdown.
+        """
+
+    def close_pools(self) -> None:
+        """Close every pooled connection held by this adapter."""
+        super().close()
+
+
+class PooledSSLIgnoreAdapter(PooledHTTPAdapter, SSLIgnoreAdapter):
+    """Pooled adapter that skips SSL verification (see ``SSLIgnoreAdapter``)."""
+
+
+_shared_adapters: dict[tuple[str, bool, ConnectionPoolSettings], PooledHTTPAdapter] = {}
+_shared_adapters_lock = threading.Lock()
+
+
+def _get_shared_adapter(
+    site: str, settings: ConnectionPoolSettings, *, ssl_ignore: bool
+) -> PooledHTTPAdapter:
+    key = (site, ssl_ignore, settings)
+    with _shared_adapters_lock:
+        adapter = _shared_adapters.get(key)
+        if adapter is None:
+            adapter_cls = PooledSSLIgnoreAdapter if ssl_ignore else PooledHTTPAdapter
+            adapter = adapter_cls(settings)
+            _shared_adapters[key] = adapter
+        return adapter
+
+
+def configure_connection_pool(
+    service_name: str,
+    url: str,
+    session: Session,
+    settings: ConnectionPoolSettings,
+) -> None:
+    """Mount a shared, pooled adapter for a service's site on the session.
+
+    Must run after ``configure_ssl_verification`` (so a disabled-verification
+    adapter is preserved) and before ``configure_rate_limiting`` (which wraps
+    whatever adapter is mounted for the site).
+
+    Args:
+        service_name: Name of the service for logging (e.g., "Jira")
+        url: Base URL of the service API
+        session: The requests session to configure
+        settings: Pool size, keep-alive and timeout tuning
+    """
+    if not url:
+        return
+    site = urlparse(url).netloc
+    if not site:
+        return
+    current = session.get_adapter(f"https://{site}")
+    ssl_ignore = isinstance(current, SSLIgnoreAdapter)
+    adapter = _get_shared_adapter(site, settings, ssl_ignore=ssl_ignore)
+    session.mount(f"https://{site}", adapter)
+    session.mount(f"http://{site}", adapter)
+    logger.debug(
+        f"{service_name} connection pool configured for {site}: "
+        f"maxsize={settings.pool_maxsize}, block={settings.pool_block}, "
+        f"keep_alive={settings.keep_alive}, connect_timeout={settings.connect_timeout}, "
+        f"read_timeout={settings.read_timeout}"
+    )
+
+
+def normalize_endpoint(path: str) -> str:
+    """Collapse resource identifiers in a URL path into placeholders.
+
+    Keeps the ``endpoint`` metric label to a bounded set of API routes, e.g.
+    ``/rest/api/2/issue/PROJ-1/comment`` becomes
+    ``/rest/api/2/issue/{id}/comment``.
+
+    Args:
+        path: URL path, optionally with a query string
+
+    Returns:
+        The path without query string and with identifiers replaced
+    """
+    segments: list[str] = []
+    for segment in path.split("?", 1)[0].split("/"):
+        if (
+            segments
+            and segments[-1] in _API_ROOTS
+            and _VERSION_SEGMENT.fullmatch(segment)
+        ):
+            segments.append(segment)
+        elif _ID_SEGMENT.match(segment):
+            segments.append("{id}")
+        elif _KEY_SEGMENT.fullmatch(segment):
+            segments.append("{key}")
+        else:
+            segments.append(segment)
+    return "/".join(segments) or "/"
+
+
+def _record_response(service: str, response: Response, **kwargs: Any) -> None:
+    # The caller waited for the response even when it was shared
+    record_span(HTTP_SPAN, response.elapsed.total_seconds())
+    if is_coalesced_response(response):
+        # Served from another caller's in-flight request, not from upstream
+        return
+    request = response.request
+    method = (request.method or "GET").upper() if request else "GET"
+    endpoint = normalize_endpoint(request.path_url if request else "/")
+    HTTP_REQUESTS.inc(
+        service=service,
+        method=method,
+        endpoint=endpoint,
+        status=str(response.status_code),
+    )
+    HTTP_REQUEST_DURATION.observe(
+        response.elapsed.total_seconds(),
+        service=service,
+        method=method,
+        endpoint=endpoint,
+    )
+
+
+def configure_request_metrics(service_name: str, session: Session) -> None:
+    """Record the count and latency of every response received on the session.
+
+    The latency is the time until the response headers arrived, as reported
+    by ``Response.elapsed``, so it measures the Atlassian API rather than the
+    time spent reading large bodies.
+
+    Args:
+        service_name: Name of the service, used as the ``service`` label
+        session: The requests session to configure
+    """
+    hooks = session.hooks.setdefault("response", [])
+    for hook in hooks:
+        if isinstance(hook, partial) and hook.func is _record_response:
+            return
+    hooks.append(partial(_record_response, service_name.lower()))
+
+
+def get_connection_pool_stats() -> list[dict[str, Any]]:
+    """Return usage statistics for every shared host pool.
+
+    Returns:
+        One entry per host pool with its size, checked-out and idle
+        connections, and the number of connections opened and requests sent
+    """
+    with _shared_adapters_lock:
+        adapters = list(_shared_adapters.values())
+
+    stats = []
+    for adapter in adapters:
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            queued = list(pool.pool.queue)
+            maxsize = pool.pool.maxsize
+            stats.append(
+                {
+                    "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                    "maxsize": maxsize,
+                    "in_use": max(0, maxsize - len(queued)),
+                    "idle": sum(1 for conn in queued if conn is not None),
+                    "connections_created": pool.num_connections,
+                    "requests": pool.num_requests,
+                }
+            )
+    return stats
+
+
+def _collect_pool_metrics() -> None:
+    for gauge_metric in (
+        POOL_MAXSIZE,
+        POOL_IN_USE,
+        POOL_IDLE,
+        POOL_CONNECTIONS_CREATED,
+        POOL_REQUESTS,
+    ):
+        gauge_metric.clear()
+    for entry in get_connection_pool_stats():
+        host = entry["host"]
+        POOL_MAXSIZE.set(entry["maxsize"], host=host)
+        POOL_IN_USE.set(entry["in_use"], host=host)
+        POOL_IDLE.set(entry["idle"], host=host)
+        POOL_CONNECTIONS_CREATED.set(entry["connections_created"], host=host)
+        POOL_REQUESTS.set(entry["requests"], host=host)
+
+
+register_collector(_collect_pool_metrics)
+
+
+def close_connection_pools() -> None:
+    """Close and forget all shared adapters (used at shutdown and in tests)."""
+    with _shared_adapters_lock:
+        adapters = list(_shared_adapters.values())
+        _shared_adapters.clear()
+    for adapter in adapters:
+        adapter.close_pools()
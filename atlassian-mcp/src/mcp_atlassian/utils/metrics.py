@@ -0,0 +1,359 @@
+"""In-process metrics for MCP Atlassian.
+
+A deliberately small, dependency-free metrics registry. Components record
+counters, gauges and histograms here, and callers can read a point-in-time
+snapshot with ``get_metrics_snapshot`` or the Prometheus text exposition
+format with ``render_prometheus`` (served on ``/metrics`` by the HTTP
+transports). Metrics are process-global so that values survive the
+per-request fetcher instances created by the server.
+"""
+
+import logging
+import math
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+logger = logging.getLogger("mcp-atlassian.utils.metrics")
+
+LabelValues = tuple[str, ...]
+
+# Latency buckets in seconds, covering fast cache hits up to slow bulk calls
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    metric_type = "untyped"
+
+    def __init__(
+        self, name: str, description: str, label_names: Iterable[str] = ()
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.label_names: tuple[str, ...] = tuple(label_names)
+        self._values: dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.label_names):
+            error_msg = (
+                f"Metric '{self.name}' expects labels {self.label_names}, "
+                f"got {tuple(labels)}"
+            )
+            raise ValueError(error_msg)
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for the given label set (0 if unset)."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[tuple[dict[str, str], float]]:
+        """Return all recorded label sets with their values."""
+        with self._lock:
+            return [
+                (dict(zip(self.label_names, key, strict=True)), value)
+                for key, value in self._values.items()
+            ]
+
+    def clear(self) -> None:
+        """Drop all recorded values."""
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    """A monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for the given label set."""
+        if amount < 0:
+            raise ValueError("Counters can only be increased")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """A value that can go up and down."""
+
+    metric_type = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for the given label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the gauge for the given label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the gauge for the given label set."""
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, with their sum.
+
+    ``value`` and ``samples`` report the number of observations; the bucket
+    counts and sum are available through ``buckets`` and ``sum``.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, description, label_names)
+        if "le" in self.label_names:
+            raise ValueError("Histograms cannot use the reserved label 'le'")
+        self.upper_bounds: tuple[float, ...] = tuple(sorted(set(buckets)))
+        if not self.upper_bounds:
+            raise ValueError("Histograms need at least one bucket")
+        self._sums: dict[LabelValues, float] = {}
+        self._bucket_counts: dict[LabelValues, list[int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for the given label set."""
+        key = self._key(labels)
+        with self._lock:
+            counts = self._bucket_counts.get(key)
+            if counts is None:
+                counts = self._bucket_counts[key] = [0] * len(self.upper_bounds)
+            for index, bound in enumerate(self.upper_bounds):
+                if value <= bound:
+                    counts[index] += 1
+            self._values[key] = self._values.get(key, 0.0) + 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def sum(self, **labels: str) -> float:
+        """Return the sum of the observations for the given label set."""
+        with self._lock:
+            return self._sums.get(self._key(labels), 0.0)
+
+    def buckets(self, **labels: str) -> list[tuple[float, int]]:
+        """Return cumulative ``(upper bound, count)`` pairs, ending with +Inf."""
+        key = self._key(labels)
+        with self._lock:
+            counts = self._bucket_counts.get(key, [0] * len(self.upper_bounds))
+            total = int(self._values.get(key, 0))
+        return [*zip(self.upper_bounds, counts, strict=True), (math.inf, total)]
+
+    def clear(self) -> None:
+        """Drop all recorded observations."""
+        with self._lock:
+            self._values.clear()
+            self._sums.clear()
+            self._bucket_counts.clear()
+
+
+class MetricsRegistry:
+    """Holds every metric registered in the process."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(
+        self,
+        metric_cls: type[_Metric],
+        name: str,
+        description: str,
+        label_names: Iterable[str],
+        **kwargs: Any,
+    ) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, metric_cls):
+                    error_msg = (
+                        f"Metric '{name}' is already registered as "
+                        f"{existing.metric_type}"
+                    )
+                    raise ValueError(error_msg)
+                return existing
+            metric = metric_cls(name, description, label_names, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(
+        self, name: str, description: str, label_names: Iterable[str] = ()
+    ) -> Counter:
+        """Return the counter with this name, creating it if needed."""
+        return self._get_or_create(Counter, name, description, label_names)  # type: ignore[return-value]
+
+    def gauge(
+        self, name: str, description: str, label_names: Iterable[str] = ()
+    ) -> Gauge:
+        """Return the gauge with this name, creating it if needed."""
+        return self._get_or_create(Gauge, name, description, label_names)  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram with this name, creating it if needed."""
+        return self._get_or_create(  # type: ignore[return-value]
+            Histogram, name, description, label_names, buckets=buckets
+        )
+
+    def register_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges right before they are read.
+
+        Collectors let components publish state that is cheaper to sample on
+        demand (e.g. connection pool usage) than to track on every change.
+        """
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def collect(self) -> None:
+        """Run every registered collector, logging (not raising) failures."""
+        with self._lock:
+            collectors = list(self._collectors)
+        for collector in collectors:
+            try:
+                collector()
+            except Exception as e:  # noqa: BLE001 - metrics must never break callers
+                logger.warning(f"Metrics collector {collector!r} failed: {e}")
+
+    def metrics(self) -> list[_Metric]:
+        """Return all registered metrics sorted by name."""
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+    def snapshot(self) -> dict[str, list[tuple[dict[str, str], float]]]:
+        """Return the current samples of every metric, keyed by name."""
+        self.collect()
+        return {metric.name: metric.samples() for metric in self.metrics()}
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        self.collect()
+        lines: list[str] = []
+        for metric in self.metrics():
+            samples = metric.samples()
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.description)}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            for labels, value in sorted(samples, key=lambda s: sorted(s[0].items())):
+                if isinstance(metric, Histogram):
+                    for bound, count in metric.buckets(**labels):
+                        bucket_labels = {**labels, "le": _format_value(bound)}
+                        lines.append(
+                            f"{metric.name}_bucket{_format_labels(bucket_labels)} "
+                            f"{count}"
+                        )
+                    rendered = _format_labels(labels)
+                    lines.append(
+                        f"{metric.name}_sum{rendered} "
+                        f"{_format_value(metric.sum(**labels))}"
+                    )
+                    lines.append(
+                        f"{metric.name}_count{rendered} {_format_value(value)}"
+                    )
+                else:
+                    lines.append(
+                        f"{metric.name}{_format_labels(labels)} {_format_value(value)}"
+                    )
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def reset(self) -> None:
+        """Clear all recorded values (registrations are kept)."""
+        for metric in self.metrics():
+            metric.clear()
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(str(value))}"' for name, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+REGISTRY = MetricsRegistry()
+
+
+def counter(name: str, description: str, label_names: Iterable[str] = ()) -> Counter:
+    """Register (or fetch) a counter in the global registry."""
+    return REGISTRY.counter(name, description, label_names)
+
+
+def gauge(name: str, description: str, label_names: Iterable[str] = ()) -> Gauge:
+    """Register (or fetch) a gauge in the global registry."""
+    return REGISTRY.gauge(name, description, label_names)
+
+
+def histogram(
+    name: str,
+    description: str,
+    label_names: Iterable[str] = (),
+    buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+) -> Histogram:
+    """Register (or fetch) a histogram in the global registry."""
+    return REGISTRY.histogram(name, description, label_names, buckets=buckets)
+
+
+def get_metrics_snapshot() -> dict[str, list[tuple[dict[str, str], float]]]:
+    """Return the current samples of every metric in the global registry."""
+    return REGISTRY.snapshot()
+
+
+def register_collector(collector: Callable[[], None]) -> None:
+    """Register a collector callback in the global registry."""
+    REGISTRY.register_collector(collector)
+
+
+def render_prometheus() -> str:
+    """Render the global registry in the Prometheus text exposition format."""
+    return REGISTRY.render_prometheus()
@@ -11,15 +11,19 @@ import json
 import logging
 import os
 import pprint
+import threading
 import time
 import urllib.parse
+from collections.abc import Callable
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
-import keyring
 import requests
 
+from .concurrency import InstrumentedThreadPoolExecutor
+
 # Configure logging
 logger = logging.getLogger("mcp-atlassian.oauth")
 
@@ -28,9 +32,128 @@ TOKEN_URL = "https://auth.atlassian.com/oauth/token"  # noqa: S105 - This is a p
 AUTHORIZE_URL = "https://auth.atlassian.com/authorize"
 CLOUD_ID_URL = "https://api.atlassian.com/oauth/token/accessible-resources"
 TOKEN_EXPIRY_MARGIN = 300  # 5 minutes in seconds
+# Background renewal runs this long before the request path would refresh
+PROACTIVE_REFRESH_LEAD = 120  # 2 minutes in seconds
 KEYRING_SERVICE_NAME = "mcp-atlassian-oauth"
 
 
+class TokenRefreshCoordinator:
+    """Coordinates OAuth token refreshes across threads and config instances.
+
+    Jira and Confluence each load their own ``OAuthConfig`` for the same OAuth
+    app, and every tool call may try to refresh concurrently. Atlassian rotates
+    refresh tokens, so two simultaneous refreshes can invalidate each other.
+    The coordinator provides:
+
+    - one lock per client ID so only a single refresh is in flight,
+    - the most recently refreshed tokens per client ID, so waiting threads and
+      other config instances adopt them instead of refreshing again,
+    - a background timer that renews tokens shortly before they expire,
+    - a single writer thread persisting tokens to keyring/file off the
+      request path (in refresh order).
+    """
+
+    def __init__(self) -> None:
+        self._guard = threading.Lock()
+        self._locks: dict[str, threading.Lock] = {}
+        self._latest: dict[str, dict[str, Any]] = {}
+        self._timers: dict[str, threading.Timer] = {}
+        self._persist_executor: InstrumentedThreadPoolExecutor | None = None
+        self._pending_persist: list[Future] = []
+
+    def lock_for(self, client_id: str) -> threading.Lock:
+        """Return the refresh lock for an OAuth client ID."""
+        with self._guard:
+            lock = self._locks.get(client_id)
+            if lock is None:
+                lock = threading.Lock()
+                self._locks[client_id] = lock
+            return lock
+
+    def latest_tokens(self, client_id: str) -> dict[str, Any] | None:
+        """Return the newest tokens published for a client ID, if any."""
+        with self._guard:
+            tokens = self._latest.get(client_id)
+            return dict(tokens) if tokens else None
+
+    def publish_tokens(self, client_id: str, token_data: dict[str, Any]) -> None:
+        """Record freshly refreshed tokens for a client ID."""
+        with self._guard:
+            self._latest[client_id] = dict(token_data)
+
+    def persist_async(self, save: Callable[[], None]) -> Future:
+        """Run a token save on the background writer thread."""
+        with self._guard:
+            if self._persist_executor is None:
+                self._persist_executor = InstrumentedThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="mcp-atlassian-oauth-persist"
+                )
+            future = self._persist_executor.submit(save)
+            self._pending_persist = [
+                f for f in self._pending_persist if not f.done()
+            ] + [future]
+            return future
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Wait for pending token saves to finish."""
+        with self._guard:
+            pending = list(self._pending_persist)
+        for future in pending:
+            try:
+                future.result(timeout=timeout)
+            except Exception as e:  # noqa: BLE001 - saves log their own errors
+                logger.debug(f"Background token save failed: {e}")
+
+    def schedule_renewal(self, config: "OAuthConfig") -> None:
+        """(Re)schedule proactive renewal of a config's access token."""
+        if not config.client_id or not config.refresh_token or not config.expires_at:
+            return
+        delay = (
+            config.expires_at
+            - time.time()
+            - TOKEN_EXPIRY_MARGIN
+            - PROACTIVE_REFRESH_LEAD
+        )
+        if delay <= 0:
+            # Too close to expiry; the request path will refresh instead
+            return
+        timer = threading.Timer(delay, config.renew_token_in_background)
+        timer.daemon = True
+        timer.name = f"mcp-atlassian-oauth-renew-{config.client_id[:8]}"
+        with self._guard:
+            previous = self._timers.get(config.client_id)
+            if previous is not None:
+                previous.cancel()
+            self._timers[config.client_id] = timer
+        timer.start()
+        logger.debug(f"Scheduled proactive OAuth token renewal in {delay:.0f}s")
+
+    def has_renewal(self, client_id: str) -> bool:
+        """Return whether a renewal timer is pending for a client ID."""
+        with self._guard:
+            timer = self._timers.get(client_id)
+            return timer is not None and timer.is_alive()
+
+    def reset(self) -> None:
+        """Cancel timers and forget shared tokens (used by tests)."""
+        self.shutdown()
+        with self._guard:
+            self._latest.clear()
+            self._locks.clear()
+
+    def shutdown(self, timeout: float | None = 5.0) -> None:
+        """Cancel renewal timers and flush pending token saves."""
+        with self._guard:
+            timers = list(self._timers.values())
+            self._timers.clear()
+        for timer in timers:
+            timer.cancel()
+        self.flush(timeout=timeout)
+
+
+TOKEN_REFRESH_COORDINATOR = TokenRefreshCoordinator()
+
+
 @dataclass
 class OAuthConfig:
     """OAuth 2.0 configuration for Atlassian Cloud.
@@ -211,8 +334,11 @@ class OAuthConfig:
                 self.refresh_token = token_data["refresh_token"]
             self.expires_at = time.time() + token_data["expires_in"]
 
-            # Save the tokens
-            self._save_tokens()
+            # Share the new tokens with other instances for this OAuth app,
+            # then persist them off the request path
+            TOKEN_REFRESH_COORDINATOR.publish_tokens(self.client_id, self._token_data())
+            TOKEN_REFRESH_COORDINATOR.persist_async(self._save_tokens)
+            TOKEN_REFRESH_COORDINATOR.schedule_renewal(self)
 
             return True
         except Exception as e:
@@ -222,12 +348,59 @@ class OAuthConfig:
     def ensure_valid_token(self) -> bool:
         """Ensure the access token is valid, refreshing if necessary.
 
+        Concurrent callers for the same OAuth app wait for a single refresh
+        and then reuse its result.
+
         Returns:
             True if the token is valid (or was refreshed successfully), False otherwise.
         """
+        if self.is_token_expired:
+            self._adopt_shared_tokens()
         if not self.is_token_expired:
+            if not TOKEN_REFRESH_COORDINATOR.has_renewal(self.client_id):
+                TOKEN_REFRESH_COORDINATOR.schedule_renewal(self)
             return True
-        return self.refresh_access_token()
+        with TOKEN_REFRESH_COORDINATOR.lock_for(self.client_id):
+            # Another thread may have refreshed while we waited for the lock
+            self._adopt_shared_tokens()
+            if not self.is_token_expired:
+                return True
+            return self.refresh_access_token()
+
+    def renew_token_in_background(self) -> None:
+        """Refresh the access token ahead of expiry (run by the renewal timer)."""
+        with TOKEN_REFRESH_COORDINATOR.lock_for(self.client_id):
+            self._adopt_shared_tokens()
+            remaining = (self.expires_at or 0) - time.time()
+            if remaining > TOKEN_EXPIRY_MARGIN + PROACTIVE_REFRESH_LEAD:
+                # Already renewed by someone else; the timer was rescheduled then
+                return
+            logger.debug("Proactively renewing OAuth access token")
+            if not self.refresh_access_token():
+                logger.warning(
+                    "Proactive OAuth token renewal failed; "
+                    "the next request will retry the refresh"
+                )
+
+    def _adopt_shared_tokens(self) -> None:
+        """Take over tokens refreshed by another instance of the same OAuth app."""
+        shared = TOKEN_REFRESH_COORDINATOR.latest_tokens(self.client_id)
+        if not shared or (shared.get("expires_at") or 0) <= (self.expires_at or 0):
+            return
+        self.access_token = shared.get("access_token")
+        self.refresh_token = shared.get("refresh_token") or self.refresh_token
+        self.expires_at = shared.get("expires_at")
+        if not self.cloud_id and shared.get("cloud_id"):
+            self.cloud_id = shared["cloud_id"]
+
+    def _token_data(self) -> dict[str, Any]:
+        """Return the token fields that are persisted and shared."""
+        return {
+            "refresh_token": self.refresh_token,
+            "access_token": self.access_token,
+            "expires_at": self.expires_at,
+            "cloud_id": self.cloud_id,
+        }
 
     def _get_cloud_id(self) -> None:
         """Get the cloud ID for the Atlassian instance.
@@ -282,7 +455,10 @@ class OAuthConfig:
                 "cloud_id": self.cloud_id,
             }
 
-            # Store the token data in the system keyring
+            # Store the token data in the system keyring (slow to import, so
+            # only loaded when tokens are actually persisted)
+            import keyring
+
             keyring.set_password(KEYRING_SERVICE_NAME, username, json.dumps(token_data))
 
             logger.debug(f"Saved OAuth tokens to keyring for {username}")
@@ -340,6 +516,8 @@ class OAuthConfig:
 
         # Try to load tokens from keyring first
         try:
+            import keyring
+
             token_json = keyring.get_password(KEYRING_SERVICE_NAME, username)
             if token_json:
                 logger.debug(f"Loaded OAuth tokens from keyring for {username}")
@@ -0,0 +1,90 @@
+"""On-demand sampling profiler producing collapsed stacks.
+
+``sample_stacks`` periodically snapshots the Python stack of every thread for
+a fixed duration. The result is rendered by ``format_collapsed`` in the
+"collapsed stack" format understood by flamegraph.pl, speedscope and
+similar tools: one ``frame;frame;frame count`` line per distinct stack,
+root first.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+logger = logging.getLogger("mcp-atlassian.utils.profiling")
+
+DEFAULT_SAMPLE_INTERVAL = 0.005  # Seconds between stack snapshots
+MAX_PROFILE_SECONDS = 120.0  # Upper bound on a single profiling run
+
+_profile_lock = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profiling run is already in progress."""
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)})"
+
+
+def _collapse(frame: FrameType | None, thread_name: str) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    return ";".join(reversed(labels))
+
+
+def sample_stacks(
+    seconds: float, interval: float = DEFAULT_SAMPLE_INTERVAL
+) -> Counter[str]:
+    """Sample the stacks of all other threads for a number of seconds.
+
+    Only one run may be in progress at a time, since concurrent runs would
+    sample each other and double the overhead.
+
+    Args:
+        seconds: How long to sample, capped at ``MAX_PROFILE_SECONDS``
+        interval: Seconds between snapshots
+
+    Returns:
+        Number of samples seen for each collapsed stack
+
+    Raises:
+        ProfilerBusyError: If another profiling run is in progress
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profiling run is already in progress")
+    try:
+        duration = min(max(seconds, 0.0), MAX_PROFILE_SECONDS)
+        own_thread = threading.get_ident()
+        stacks: Counter[str] = Counter()
+        samples = 0
+        deadline = time.monotonic() + duration
+        while True:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                stacks[_collapse(frame, names.get(thread_id, str(thread_id)))] += 1
+            samples += 1
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(interval)
+        logger.info(
+            f"Profiled {duration:.1f}s: {samples} snapshots, {len(stacks)} stacks"
+        )
+        return stacks
+    finally:
+        _profile_lock.release()
+
+
+def format_collapsed(stacks: Counter[str]) -> str:
+    """Render sampled stacks as collapsed-stack lines, most frequent first."""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
@@ -0,0 +1,525 @@
+"""Adaptive rate limiting, retry and circuit breaking for Atlassian sessions.
+
+Atlassian Cloud enforces per-site and per-user rate limits and answers with
+``429 Too Many Requests`` plus ``Retry-After``/``X-RateLimit-*`` headers when a
+client goes over them. This module provides a transport adapter that is
+mounted on the ``requests`` sessions used by the Jira and Confluence clients:
+
+- a token bucket per (site, credential) that paces outgoing requests and is
+  paused whenever the server asks us to back off,
+- jittered exponential retries for idempotent requests (and for any request
+  rejected with 429, which Atlassian guarantees was not processed),
+- a circuit breaker per site that fails fast while a site keeps erroring.
+
+Buckets and breakers live in a process-wide registry, so they are shared by
+every fetcher instance talking to the same site with the same credentials.
+"""
+
+import hashlib
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlparse
+
+from cachetools import TTLCache
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
+
+from .metrics import counter
+
+logger = logging.getLogger("mcp-atlassian.utils.rate_limit")
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Remaining-quota fraction below which the bucket slows down pre-emptively
+NEAR_LIMIT_FRACTION = 0.1
+
+THROTTLED_REQUESTS = counter(
+    "atlassian_http_throttled_total",
+    "Requests delayed by the client-side rate limiter.",
+    ("site",),
+)
+THROTTLE_WAIT_SECONDS = counter(
+    "atlassian_http_throttle_wait_seconds_total",
+    "Total time requests spent waiting for the client-side rate limiter.",
+    ("site",),
+)
+RATE_LIMITED_RESPONSES = counter(
+    "atlassian_http_rate_limited_total",
+    "Responses received with HTTP 429 from Atlassian.",
+    ("site",),
+)
+RETRIES = counter(
+    "atlassian_http_retries_total",
+    "Requests retried by the rate-limit adapter.",
+    ("site", "reason"),
+)
+CIRCUIT_OPENED = counter(
+    "atlassian_circuit_breaker_opened_total",
+    "Times the circuit breaker for a site opened.",
+    ("site",),
+)
+CIRCUIT_REJECTED = counter(
+    "atlassian_circuit_breaker_rejected_total",
+    "Requests rejected without being sent because the circuit was open.",
+    ("site",),
+)
+
+
+class CircuitOpenError(RequestsConnectionError):
+    """Raised when a request is rejected because the site's circuit is open."""
+
+
+@dataclass(frozen=True)
+class RateLimitSettings:
+    """Tuning for the rate-limit adapter of one service."""
+
+    requests_per_second: float | None = None  # Steady rate; None means unlimited
+    burst: int = 10  # Bucket capacity
+    max_retries: int = 3  # Retries per request
+    backoff_base: float = 0.5  # First retry delay in seconds
+    backoff_max: float = 30.0  # Upper bound for a single wait
+    circuit_failure_threshold: int = 5  # Consecutive failures before opening
+    circuit_reset_timeout: float = 30.0  # Seconds before a half-open probe
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header into a delay in seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (never negative), or None if the value is unusable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _parse_reset_header(value: str | None) -> float | None:
+    """Parse ``X-RateLimit-Reset`` (ISO timestamp or epoch) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        number = float(value)
+    except ValueError:
+        try:
+            reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if reset_at.tzinfo is None:
+            reset_at = reset_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+    # Large values are epoch timestamps, small ones are relative seconds
+    if number > 1_000_000_000:
+        return max(0.0, number - time.time())
+    return max(0.0, number)
+
+
+class TokenBucket:
+    """Thread-safe token bucket that adapts to server rate-limit signals.
+
+    The bucket refills at ``rate`` tokens per second up to ``capacity``. When
+    the server reports throttling, the effective rate is halved and the bucket
+    is paused until the advertised reset time; successful responses slowly
+    restore the configured rate (additive increase, multiplicative decrease).
+    """
+
+    def __init__(self, rate: float | None, capacity: int) -> None:
+        self.configured_rate = rate
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self.rate is None:
+            self._tokens = float(self.capacity)
+        else:
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, self._paused_until - now)
+            if self.rate is None:
+                return wait
+            self._tokens -= 1.0
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` and slow the refill rate."""
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            if self.rate is not None:
+                floor = (self.configured_rate or 1.0) / 16
+                self.rate = max(floor, self.rate / 2)
+                self._tokens = min(self._tokens, 0.0)
+
+    def slow_down(self) -> None:
+        """Halve the refill rate without pausing (used on near-limit warnings)."""
+        with self._lock:
+            if self.rate is not None:
+                floor = (self.configured_rate or 1.0) / 16
+                self.rate = max(floor, self.rate / 2)
+
+    def recover(self) -> None:
+        """Move the refill rate back towards the configured rate."""
+        with self._lock:
+            if self.rate is not None and self.configured_rate is not None:
+                step = self.configured_rate / 10
+                self.rate = min(self.configured_rate, self.rate + step)
+
+
+class CircuitBreaker:
+    """Per-site circuit breaker (closed -> open -> half-open -> closed)."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be sent right now."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = "half-open"
+                self._probe_in_flight = False
+            # Half-open: let a single probe through
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful response."""
+        with self._lock:
+            self.state = "closed"
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; return True if this call opened the circuit."""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self.state == "half-open" or (
+                self.state == "closed" and self._failures >= self.failure_threshold
+            ):
+                self.state = "open"
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+
+class RateLimitRegistry:
+    """Process-wide store of token buckets and circuit breakers."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600) -> None:
+        self._buckets: TTLCache[tuple[str, str], TokenBucket] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        self._breakers: TTLCache[str, CircuitBreaker] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        self._lock = threading.Lock()
+
+    def bucket(
+        self, site: str, credential: str, settings: RateLimitSettings
+    ) -> TokenBucket:
+        """Return the bucket for a (site, credential) pair."""
+        with self._lock:
+            key = (site, credential)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(settings.requests_per_second, settings.burst)
+                self._buckets[key] = bucket
+            return bucket
+
+    def breaker(self, site: str, settings: RateLimitSettings) -> CircuitBreaker:
+        """Return the circuit breaker for a site."""
+        with self._lock:
+            breaker = self._breakers.get(site)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    settings.circuit_failure_threshold, settings.circuit_reset_timeout
+                )
+                self._breakers[site] = breaker
+            return breaker
+
+    def circuit_states(self) -> dict[str, str]:
+        """Return the current circuit state of every known site."""
+        with self._lock:
+            return {site: breaker.state for site, breaker in self._breakers.items()}
+
+    def clear(self) -> None:
+        """Forget all buckets and breakers."""
+        with self._lock:
+            self._buckets.clear()
+            self._breakers.clear()
+
+
+RATE_LIMIT_REGISTRY = RateLimitRegistry()
+
+
+def credential_fingerprint(request: PreparedRequest) -> str:
+    """Return a short, non-reversible identifier of the request's credentials."""
+    authorization = request.headers.get("Authorization")
+    if not authorization:
+        return "anonymous"
+    return hashlib.sha256(authorization.encode()).hexdigest()[:16]
+
+
+class RateLimitAdapter(BaseAdapter):
+    """Transport adapter adding pacing, retries and circuit breaking.
+
+    It wraps the adapter that was previously mounted for the site (the default
+    ``HTTPAdapter`` or ``SSLIgnoreAdapter``), so connection handling and SSL
+    configuration are unchanged.
+    """
+
+    def __init__(
+        self,
+        inner: BaseAdapter,
+        site: str,
+        settings: RateLimitSettings,
+        registry: RateLimitRegistry = RATE_LIMIT_REGISTRY,
+    ) -> None:
+        super().__init__()
+        self.inner = inner
+        self.site = site
+        self.settings = settings
+        self.registry = registry
+
+    def _backoff(self, attempt: int) -> float:
+        delay = self.settings.backoff_base * (2**attempt)
+        # Full jitter keeps concurrent clients from retrying in lockstep
+        return min(self.settings.backoff_max, random.uniform(0, delay))  # noqa: S311
+
+    def _can_replay(self, request: PreparedRequest) -> bool:
+        return request.body is None or isinstance(request.body, bytes | str)
+
+    def _sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        """Send the request, pacing and retrying it as configured."""
+        breaker = self.registry.breaker(self.site, self.settings)
+        bucket = self.registry.bucket(
+            self.site, credential_fingerprint(request), self.settings
+        )
+        method = (request.method or "GET").upper()
+        idempotent = method in IDEMPOTENT_METHODS
+        replayable = self._can_replay(request)
+        attempt = 0
+
+        while True:
+            if not breaker.allow_request():
+                CIRCUIT_REJECTED.inc(site=self.site)
+                error_msg = (
+                    f"Circuit breaker open for {self.site}: too many consecutive "
+                    "failures, requests are temporarily rejected"
+                )
+                raise CircuitOpenError(error_msg, request=request)
+
+            wait = bucket.reserve()
+            if wait > 0:
+                wait = min(wait, self.settings.backoff_max)
+                THROTTLED_REQUESTS.inc(site=self.site)
+                THROTTLE_WAIT_SECONDS.inc(wait, site=self.site)
+                logger.debug(f"Throttling {method} {request.url} for {wait:.2f}s")
+                self._sleep(wait)
+
+            try:
+                response = self.inner.send(request, **kwargs)
+            except (RequestsConnectionError, Timeout) as e:
+                if breaker.record_failure():
+                    CIRCUIT_OPENED.inc(site=self.site)
+                    logger.warning(f"Circuit breaker opened for {self.site}: {e}")
+                if idempotent and attempt < self.settings.max_retries:
+                    delay = self._backoff(attempt)
+                    attempt += 1
+                    RETRIES.inc(site=self.site, reason="connection")
+                    logger.info(
+                        f"Retrying {method} {request.url} after connection error "
+                        f"(attempt {attempt}/{self.settings.max_retries}, "
+                        f"waiting {delay:.2f}s): {e}"
+                    )
+                    self._sleep(delay)
+                    continue
+                raise
+
+            self._observe_headers(bucket, response)
+            status = response.status_code
+
+            if status not in RETRY_STATUS_CODES:
+                if status < 500:
+                    breaker.record_success()
+                    bucket.recover()
+                elif breaker.record_failure():
+                    CIRCUIT_OPENED.inc(site=self.site)
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if status == 429:
+                RATE_LIMITED_RESPONSES.inc(site=self.site)
+                bucket.pause(
+                    retry_after
+                    if retry_after is not None
+                    else self._backoff(attempt + 1)
+                )
+                # A throttled site is healthy, just busy
+                breaker.record_success()
+            elif breaker.record_failure():
+                CIRCUIT_OPENED.inc(site=self.site)
+
+            retryable = replayable and (status == 429 or idempotent)
+            if not retryable or attempt >= self.settings.max_retries:
+                return response
+
+            delay = retry_after if retry_after is not None else self._backoff(attempt)
+            if delay > self.settings.backoff_max:
+                # The server wants us to wait longer than we are willing to
+                # block a tool call; surface the response instead.
+                return response
+            attempt += 1
+            RETRIES.inc(site=self.site, reason=str(status))
+            logger.info(
+                f"Retrying {method} {request.url} after HTTP {status} "
+                f"(attempt {attempt}/{self.settings.max_retries}, "
+                f"waiting {delay:.2f}s)"
+            )
+            response.close()
+            # The bucket pause already covers Retry-After for 429 responses
+            if status != 429:
+                self._sleep(delay)
+
+    def _observe_headers(self, bucket: TokenBucket, response: Response) -> None:
+        """Slow down ahead of time when the server says we are near the limit."""
+        headers = response.headers
+        near_limit = headers.get("X-RateLimit-NearLimit", "").lower() == "true"
+        remaining = headers.get("X-RateLimit-Remaining")
+        limit = headers.get("X-RateLimit-Limit")
+        try:
+            if remaining is not None and limit:
+                near_limit = near_limit or (
+                    float(remaining) <= float(limit) * NEAR_LIMIT_FRACTION
+                )
+                if float(remaining) <= 0 and response.status_code != 429:
+                    reset = _parse_reset_header(headers.get("X-RateLimit-Reset"))
+                    if reset:
+                        bucket.pause(min(reset, self.settings.backoff_max))
+        except ValueError:
+            pass
+        if near_limit:
+            bucket.slow_down()
+
+    def close(self) -> None:
+        """Close the wrapped adapter."""
+        self.inner.close()
+
+
+def tenant_prefix(url: str) -> tuple[str, str] | None:
+    """Return the mount prefix and site label for a service's base URL.
+
+    OAuth clients of every tenant and product share ``api.atlassian.com``,
+    so for gateway URLs the ``/ex/{product}/{cloud_id}`` path is part of the
+    site; otherwise the site is the host.
+
+    Args:
+        url: Base URL of the service API
+
+    Returns:
+        ``(prefix, site)``, or None when the URL has no host
+    """
+    parsed = urlparse(url)
+    if not parsed.netloc:
+        return None
+    site = parsed.netloc
+    parts = parsed.path.strip("/").split("/")
+    if len(parts) >= 3 and parts[0] == "ex":
+        site = f"{site}/{'/'.join(parts[:3])}"
+    return f"{parsed.scheme}://{site}", site
+
+
+def configure_rate_limiting(
+    service_name: str,
+    url: str,
+    session: Session,
+    settings: RateLimitSettings,
+) -> None:
+    """Mount a rate-limit adapter for a service's base URL.
+
+    The adapter wraps whichever adapter is currently responsible for the URL,
+    so this must run after SSL and connection-pool configuration.
+
+    Args:
+        service_name: Name of the service for logging (e.g., "Jira")
+        url: Base URL of the service API
+        session: The requests session to configure
+        settings: Rate limiting and retry tuning
+    """
+    mount = tenant_prefix(url) if url else None
+    if not mount:
+        return
+    prefix, site = mount
+    inner = session.get_adapter(prefix)
+    if isinstance(inner, RateLimitAdapter):
+        inner = inner.inner
+    session.mount(prefix, RateLimitAdapter(inner, site, settings))
+    logger.debug(
+        f"{service_name} rate limiting configured for {site}: "
+        f"rps={settings.requests_per_second or 'unlimited'}, "
+        f"burst={settings.burst}, max_retries={settings.max_retries}"
+    )
+
+
+def get_rate_limit_stats() -> dict[str, Any]:
+    """Return throttle, retry and circuit-breaker counts per site."""
+    return {
+        "throttled": THROTTLED_REQUESTS.samples(),
+        "throttle_wait_seconds": THROTTLE_WAIT_SECONDS.samples(),
+        "rate_limited": RATE_LIMITED_RESPONSES.samples(),
+        "retries": RETRIES.samples(),
+        "circuit_opened": CIRCUIT_OPENED.samples(),
+        "circuit_rejected": CIRCUIT_REJECTED.samples(),
+        "circuit_states": RATE_LIMIT_REGISTRY.circuit_states(),
+    }
@@ -0,0 +1,140 @@
+"""Lightweight per-call tracing of where tool call time is spent.
+
+A trace is started around a tool call with ``trace_call``; while it is active,
+code marked with ``span``/``traced`` (preprocessing, model parsing and
+serialization) and the HTTP response hook add their durations to it, grouped
+by span name. Without an active trace every span is a cheap no-op.
+
+The active trace lives in a context variable, so it follows the call into
+worker threads started through ``InstrumentedThreadPoolExecutor``. Spans of
+the same name do not nest (only the outermost is timed), but spans of
+different names can: time spent in an HTTP call made while preprocessing
+counts towards both.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Span names used across the code base
+HTTP_SPAN = "http"
+PREPROCESS_SPAN = "preprocess"
+PARSE_SPAN = "parse"
+SERIALIZE_SPAN = "serialize"
+
+
+class CallTrace:
+    """Span durations collected for one tool call."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.started = time.perf_counter()
+        self.finished: float | None = None
+        self._spans: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, span_name: str, seconds: float) -> None:
+        """Add one occurrence of a span to the trace."""
+        with self._lock:
+            entry = self._spans.setdefault(span_name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds from the start of the call until it finished (or now)."""
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    def summary(self) -> dict[str, Any]:
+        """Return the call duration and per-span counts and milliseconds."""
+        with self._lock:
+            spans = {
+                name: {"count": int(count), "ms": round(seconds * 1000, 3)}
+                for name, (count, seconds) in sorted(self._spans.items())
+            }
+        return {
+            "name": self.name,
+            "total_ms": round(self.elapsed * 1000, 3),
+            "spans": spans,
+        }
+
+
+_current_trace: ContextVar[CallTrace | None] = ContextVar(
+    "mcp_atlassian_trace", default=None
+)
+_active_spans: ContextVar[frozenset[str]] = ContextVar(
+    "mcp_atlassian_active_spans", default=frozenset()
+)
+
+
+def current_trace() -> CallTrace | None:
+    """Return the trace of the call in progress, if tracing is active."""
+    return _current_trace.get()
+
+
+@contextmanager
+def trace_call(name: str) -> Iterator[CallTrace]:
+    """Collect spans for everything run inside the block.
+
+    Args:
+        name: Name of the traced call (e.g., the tool name)
+
+    Yields:
+        The trace, complete once the block exits
+    """
+    trace = CallTrace(name)
+    trace_token = _current_trace.set(trace)
+    spans_token = _active_spans.set(frozenset())
+    try:
+        yield trace
+    finally:
+        trace.finished = time.perf_counter()
+        _active_spans.reset(spans_token)
+        _current_trace.reset(trace_token)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the block as a span of the active trace (no-op without one)."""
+    trace = _current_trace.get()
+    active = _active_spans.get()
+    if trace is None or name in active:
+        yield
+        return
+    token = _active_spans.set(active | {name})
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, time.perf_counter() - started)
+        _active_spans.reset(token)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator timing every call of the function as a span."""
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _current_trace.get() is None:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def record_span(name: str, seconds: float) -> None:
+    """Add an already measured duration to the active trace, if any."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(name, seconds)
@@ -0,0 +1,201 @@
+"""Translate Jira and Confluence webhook events into cache invalidations."""
+
+import hashlib
+import hmac
+import logging
+from typing import Any
+
+from .cache import (
+    JIRA_FIELDS_TAG,
+    JIRA_PROJECTS_TAG,
+    confluence_page_tag,
+    confluence_page_version_tag,
+    confluence_space_tag,
+    invalidate_tags,
+    jira_issue_tag,
+    jira_project_tag,
+)
+from .metrics import counter
+
+logger = logging.getLogger("mcp-atlassian.utils.webhooks")
+
+WEBHOOK_EVENTS = counter(
+    "mcp_webhook_events_total",
+    "Webhook events received, by product, event and outcome.",
+    ("product", "event", "outcome"),
+)
+
+# Confluence events that add or remove content from a space's listings
+_SPACE_LISTING_EVENTS = frozenset(
+    {
+        "page_created",
+        "page_removed",
+        "page_trashed",
+        "page_restored",
+        "page_moved",
+        "blog_created",
+        "blog_removed",
+    }
+)
+
+
+def verify_webhook_signature(secret: str, body: bytes, signature: str | None) -> bool:
+    """Check an ``X-Hub-Signature`` header (``sha256=<hex>``) against the body.
+
+    Args:
+        secret: Shared secret configured on the webhook
+        body: Raw request body
+        signature: Header value sent by Atlassian
+
+    Returns:
+        True if the signature matches
+    """
+    if not signature or "=" not in signature:
+        return False
+    method, _, received = signature.partition("=")
+    digestmod = {"sha256": hashlib.sha256, "sha1": hashlib.sha1}.get(method.lower())
+    if digestmod is None:
+        return False
+    expected = hmac.new(secret.encode(), body, digestmod).hexdigest()
+    return hmac.compare_digest(expected, received.strip())
+
+
+def _issue_tags(issue: dict[str, Any]) -> set[str]:
+    tags = set()
+    for field in ("key", "id"):
+        if issue.get(field):
+            tags.add(jira_issue_tag(issue[field]))
+    project = (issue.get("fields") or {}).get("project") or {}
+    if project.get("key"):
+        # Issue counts and listings cached per project go stale as well
+        tags.add(jira_project_tag(project["key"]))
+    return tags
+
+
+def jira_event_tags(payload: dict[str, Any]) -> tuple[str, set[str]]:
+    """Return the event name and cache tags affected by a Jira webhook.
+
+    Args:
+        payload: Decoded webhook JSON body
+
+    Returns:
+        Tuple of (event name, tags to invalidate); tags is empty for
+        events that do not affect cached data
+    """
+    event = str(payload.get("webhookEvent") or "unknown")
+    tags: set[str] = set()
+
+    if event.startswith("jira:issue_") or event.startswith(
+        ("comment_", "worklog_", "issuelink_", "attachment_")
+    ):
+        if isinstance(payload.get("issue"), dict):
+            tags |= _issue_tags(payload["issue"])
+        for link_side in ("sourceIssueId", "destinationIssueId"):
+            link = payload.get("issueLink") or {}
+            if link.get(link_side):
+                tags.add(jira_issue_tag(link[link_side]))
+        worklog = payload.get("worklog") or {}
+        if worklog.get("issueId"):
+            tags.add(jira_issue_tag(worklog["issueId"]))
+    elif event.startswith("project_"):
+        project = payload.get("project") or {}
+        tags.add(JIRA_PROJECTS_TAG)
+        for field in ("key", "id"):
+            if project.get(field):
+                tags.add(jira_project_tag(project[field]))
+    elif event.startswith(("jira:version_", "component_")):
+        item = payload.get("version") or payload.get("component") or {}
+        for field in ("projectId", "projectKey", "project"):
+            if item.get(field):
+                tags.add(jira_project_tag(item[field]))
+    elif event.startswith(("field_", "customfield_", "jira:field_")):
+        tags.add(JIRA_FIELDS_TAG)
+
+    return event, tags
+
+
+def jira_removed_issue_keys(payload: dict[str, Any]) -> list[str]:
+    """Return the issue keys a Jira webhook says no longer exist.
+
+    Deleted issues lose their key, and so do moved issues, which Jira reports
+    as an update whose changelog changes the ``Key`` field.
+
+    Args:
+        payload: Decoded webhook JSON body
+
+    Returns:
+        The removed issue keys, possibly empty
+    """
+    event = payload.get("webhookEvent")
+    issue = payload.get("issue") if isinstance(payload.get("issue"), dict) else {}
+    if event == "jira:issue_deleted":
+        return [issue["key"]] if issue.get("key") else []
+    if event != "jira:issue_updated":
+        return []
+    items = (payload.get("changelog") or {}).get("items") or []
+    return [
+        item["fromString"]
+        for item in items
+        if isinstance(item, dict)
+        and str(item.get("field", "")).lower() == "key"
+        and item.get("fromString")
+    ]
+
+
+def confluence_event_tags(payload: dict[str, Any]) -> tuple[str, set[str]]:
+    """Return the event name and cache tags affected by a Confluence webhook.
+
+    Args:
+        payload: Decoded webhook JSON body
+
+    Returns:
+        Tuple of (event name, tags to invalidate)
+    """
+    event = str(payload.get("event") or payload.get("webhookEvent") or "unknown")
+    tags: set[str] = set()
+
+    content = payload.get("page") or payload.get("blog") or {}
+    if isinstance(content, dict) and content:
+        if content.get("id"):
+            tags.add(confluence_page_tag(str(content["id"])))
+            # Edits made elsewhere also change the version writes start from
+            tags.add(confluence_page_version_tag(str(content["id"])))
+        space_key = content.get("spaceKey") or (content.get("space") or {}).get("key")
+        if space_key and event in _SPACE_LISTING_EVENTS:
+            # Space listings change when pages appear or disappear
+            tags.add(confluence_space_tag(space_key))
+    attached_to = payload.get("attachedTo")
+    if isinstance(attached_to, dict) and attached_to.get("id"):
+        # Attachment events refer to the page they belong to
+        tags.add(confluence_page_tag(str(attached_to["id"])))
+    if event.startswith("space_"):
+        space = payload.get("space") or {}
+        if space.get("key"):
+            tags.add(confluence_space_tag(space["key"]))
+
+    return event, tags
+
+
+def handle_webhook(product: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """Invalidate cached data affected by a webhook event.
+
+    Args:
+        product: "jira" or "confluence"
+        payload: Decoded webhook JSON body
+
+    Returns:
+        Summary with the event name, invalidated tags and removed entry count
+    """
+    if product == "jira":
+        event, tags = jira_event_tags(payload)
+    else:
+        event, tags = confluence_event_tags(payload)
+
+    removed = invalidate_tags(tags) if tags else 0
+    WEBHOOK_EVENTS.inc(
+        product=product, event=event, outcome="invalidated" if tags else "ignored"
+    )
+    logger.debug(
+        f"{product} webhook '{event}': invalidated {removed} entries for {sorted(tags)}"
+    )
+    return {"event": event, "tags": sorted(tags), "invalidated": removed}
@@ -0,0 +1 @@
+"""Offline micro-benchmarks for parsing, preprocessing and serialization."""
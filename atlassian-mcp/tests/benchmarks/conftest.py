@@ -0,0 +1,55 @@
+"""Fixtures for the offline micro-benchmarks.
+
+The benchmarks need the ``pytest-benchmark`` plugin, which is not part of the
+default dev environment; without it this directory is skipped entirely. Run
+them with ``scripts/run_benchmarks.sh`` (see ``tests/benchmarks/README.md``).
+"""
+
+import importlib.util
+
+import pytest
+
+from mcp_atlassian.preprocessing import ConfluencePreprocessor, JiraPreprocessor
+from tests.fixtures.confluence_mocks import MOCK_PAGE_RESPONSE
+from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE, MOCK_JIRA_JQL_RESPONSE
+
+from . import payloads
+
+if importlib.util.find_spec("pytest_benchmark") is None:
+    collect_ignore_glob = ["test_*.py"]
+
+BASE_URL = "https://example.atlassian.net"
+
+
+@pytest.fixture(scope="session")
+def jira_preprocessor():
+    return JiraPreprocessor(base_url=BASE_URL)
+
+
+@pytest.fixture(scope="session")
+def confluence_preprocessor():
+    return ConfluencePreprocessor(base_url=f"{BASE_URL}/wiki")
+
+
+@pytest.fixture(scope="session", params=["fixture", "large"], ids=["fixture", "large"])
+def jira_issue_payload(request):
+    """The recorded issue and a synthetic one with long text and many comments."""
+    if request.param == "fixture":
+        return MOCK_JIRA_ISSUE_RESPONSE
+    return payloads.large_jira_issue()
+
+
+@pytest.fixture(scope="session", params=["fixture", "large"], ids=["fixture", "large"])
+def jira_search_payload(request):
+    """The recorded JQL response and a synthetic page of many issues."""
+    if request.param == "fixture":
+        return MOCK_JIRA_JQL_RESPONSE
+    return payloads.large_jira_search()
+
+
+@pytest.fixture(scope="session", params=["fixture", "large"], ids=["fixture", "large"])
+def confluence_page_payload(request):
+    """The recorded page and a synthetic runbook-sized page."""
+    if request.param == "fixture":
+        return MOCK_PAGE_RESPONSE
+    return payloads.large_confluence_page()
@@ -0,0 +1,123 @@
+"""Synthetic large payloads built from the recorded fixtures.
+
+Sizes are chosen to resemble the heavy responses seen in practice (long
+descriptions, issues with hundreds of comments, runbook-sized pages) while
+keeping each benchmark round in the millisecond range.
+"""
+
+import copy
+from typing import Any
+
+from tests.fixtures.confluence_mocks import MOCK_PAGE_RESPONSE
+from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE, MOCK_JIRA_JQL_RESPONSE
+
+
+def jira_wiki_text(sections: int = 50) -> str:
+    """Jira wiki markup mixing headings, lists, code, tables and mentions."""
+    parts = []
+    for i in range(sections):
+        parts.append(
+            f"h2. Section {i}\n"
+            f"Some *bold* and _italic_ text with a {{{{monospace}}}} value, "
+            f"a [link|https://example.com/{i}] and [~accountid:user{i}].\n"
+            "* first item\n"
+            "** nested item\n"
+            "# numbered item\n"
+            "{code:python}\n"
+            f"def handler_{i}(event):\n"
+            "    return event\n"
+            "{code}\n"
+            "||Name||Value||\n"
+            f"|key-{i}|value-{i}|\n"
+            "{quote}Quoted text{quote}\n"
+        )
+    return "\n".join(parts)
+
+
+def markdown_document(sections: int = 50) -> str:
+    """Markdown resembling a generated design doc or runbook."""
+    parts = ["# Runbook\n"]
+    for i in range(sections):
+        parts.append(
+            f"## Step {i}\n\n"
+            f"Run the **check** for `service-{i}` and see "
+            f"[the dashboard](https://example.com/d/{i}).\n\n"
+            "- verify the queue depth\n"
+            "  - escalate if above threshold\n"
+            "1. drain the node\n"
+            "2. restart the service\n\n"
+            "```bash\n"
+            f"kubectl rollout restart deploy/service-{i}\n"
+            "```\n\n"
+            "| Metric | Threshold |\n"
+            "| ------ | --------- |\n"
+            f"| latency_{i} | 250ms |\n\n"
+            "> Note: page the on-call engineer first.\n"
+        )
+    return "\n".join(parts)
+
+
+def markdown_corpus(documents: int = 20) -> list[str]:
+    """Pages of varying size as written by a doc-sync job, small to large."""
+    return [markdown_document(sections=5 + 15 * (i % 6)) for i in range(documents)]
+
+
+def storage_html(sections: int = 50) -> str:
+    """Confluence storage format with macros, tables and page links."""
+    parts = []
+    for i in range(sections):
+        parts.append(
+            f"<h2>Section {i}</h2>"
+            f"<p>Paragraph with <strong>bold</strong>, <em>italic</em> and "
+            f'<a href="https://example.com/{i}">a link</a>.</p>'
+            "<ul><li><p>first</p></li><li><p>second</p></li></ul>"
+            '<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">'
+            "python</ac:parameter><ac:plain-text-body><![CDATA["
+            f"print({i})]]></ac:plain-text-body></ac:structured-macro>"
+            "<table><tbody><tr><th>Key</th><th>Value</th></tr>"
+            f"<tr><td>k{i}</td><td>v{i}</td></tr></tbody></table>"
+            f'<p><ac:link><ri:page ri:content-title="Page {i}" /></ac:link></p>'
+        )
+    return "".join(parts)
+
+
+def large_jira_issue(comments: int = 200, sections: int = 50) -> dict[str, Any]:
+    """The recorded issue with a long description and many comments."""
+    issue = copy.deepcopy(MOCK_JIRA_ISSUE_RESPONSE)
+    fields = issue["fields"]
+    fields["description"] = jira_wiki_text(sections)
+    template = copy.deepcopy(fields["comment"]["comments"][0])
+    comment_list = []
+    for i in range(comments):
+        comment = copy.deepcopy(template)
+        comment["id"] = str(10000 + i)
+        comment["body"] = jira_wiki_text(1)
+        comment_list.append(comment)
+    fields["comment"] = {
+        "comments": comment_list,
+        "maxResults": comments,
+        "total": comments,
+        "startAt": 0,
+    }
+    return issue
+
+
+def large_jira_search(issues: int = 500) -> dict[str, Any]:
+    """A JQL response page containing many copies of the recorded issue."""
+    response = copy.deepcopy(MOCK_JIRA_JQL_RESPONSE)
+    template = response["issues"][0]
+    issue_list = []
+    for i in range(issues):
+        issue = copy.deepcopy(template)
+        issue["id"] = str(20000 + i)
+        issue["key"] = f"PROJ-{1000 + i}"
+        issue_list.append(issue)
+    response.update({"issues": issue_list, "maxResults": issues, "total": issues * 4})
+    return response
+
+
+def large_confluence_page(sections: int = 200) -> dict[str, Any]:
+    """The recorded page with a runbook-sized storage body."""
+    page = copy.deepcopy(MOCK_PAGE_RESPONSE)
+    page["body"]["storage"]["value"] = storage_html(sections)
+    return page
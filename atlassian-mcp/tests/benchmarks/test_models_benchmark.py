@@ -0,0 +1,31 @@
+"""Benchmarks for building API models from raw responses."""
+
+import pytest
+
+from mcp_atlassian.models.confluence import ConfluencePage
+from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
+
+pytestmark = pytest.mark.benchmark(group="models")
+
+
+def test_jira_issue_from_api_response(benchmark, jira_issue_payload):
+    issue = benchmark(JiraIssue.from_api_response, jira_issue_payload)
+
+    assert issue.key
+
+
+def test_jira_search_result_from_api_response(benchmark, jira_search_payload):
+    result = benchmark(JiraSearchResult.from_api_response, jira_search_payload)
+
+    assert len(result.issues) == len(jira_search_payload["issues"])
+
+
+def test_confluence_page_from_api_response(benchmark, confluence_page_payload):
+    page = benchmark(
+        ConfluencePage.from_api_response,
+        confluence_page_payload,
+        base_url="https://example.atlassian.net/wiki",
+        is_cloud=True,
+    )
+
+    assert page.id == confluence_page_payload["id"]
@@ -0,0 +1,57 @@
+"""Benchmarks for Jira and Confluence text conversion."""
+
+import pytest
+
+from . import payloads
+
+pytestmark = pytest.mark.benchmark(group="preprocessing")
+
+JIRA_TEXT = payloads.jira_wiki_text()
+MARKDOWN = payloads.markdown_document()
+STORAGE_HTML = payloads.storage_html()
+MARKDOWN_CORPUS = payloads.markdown_corpus()
+
+
+def test_clean_jira_text(benchmark, jira_preprocessor):
+    result = benchmark(jira_preprocessor.clean_jira_text, JIRA_TEXT)
+
+    assert "Section 0" in result
+
+
+def test_jira_to_markdown(benchmark, jira_preprocessor):
+    result = benchmark(jira_preprocessor.jira_to_markdown, JIRA_TEXT)
+
+    assert "## Section 0" in result
+
+
+def test_markdown_to_jira(benchmark, jira_preprocessor):
+    result = benchmark(jira_preprocessor.markdown_to_jira, MARKDOWN)
+
+    assert "h2. Step 0" in result
+
+
+def test_process_html_content(benchmark, confluence_preprocessor):
+    _, markdown = benchmark(
+        confluence_preprocessor.process_html_content, STORAGE_HTML, "PROJ"
+    )
+
+    assert "Section 0" in markdown
+
+
+def test_markdown_to_confluence_storage(benchmark, confluence_preprocessor):
+    result = benchmark(confluence_preprocessor.markdown_to_confluence_storage, MARKDOWN)
+
+    assert "Step 0" in result
+
+
+def test_markdown_to_confluence_storage_corpus(benchmark, confluence_preprocessor):
+    def convert_corpus():
+        return [
+            confluence_preprocessor.markdown_to_confluence_storage(document)
+            for document in MARKDOWN_CORPUS
+        ]
+
+    results = benchmark(convert_corpus)
+
+    assert len(results) == len(MARKDOWN_CORPUS)
+    assert all("Step 0" in result for result in results)
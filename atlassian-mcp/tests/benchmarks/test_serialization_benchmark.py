@@ -0,0 +1,46 @@
+"""Benchmarks for turning models into tool results.
+
+Tools return ``json.dumps(model.to_simplified_dict(), indent=2,
+ensure_ascii=False)``; these benchmarks time that step on its own.
+"""
+
+import json
+
+import pytest
+
+from mcp_atlassian.models.confluence import ConfluencePage
+from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
+
+pytestmark = pytest.mark.benchmark(group="serialization")
+
+
+def _encode_tool_result(model):
+    return json.dumps(model.to_simplified_dict(), indent=2, ensure_ascii=False)
+
+
+def test_encode_jira_issue(benchmark, jira_issue_payload):
+    issue = JiraIssue.from_api_response(jira_issue_payload)
+
+    encoded = benchmark(_encode_tool_result, issue)
+
+    assert json.loads(encoded)["key"] == issue.key
+
+
+def test_encode_jira_search_result(benchmark, jira_search_payload):
+    result = JiraSearchResult.from_api_response(jira_search_payload)
+
+    encoded = benchmark(_encode_tool_result, result)
+
+    assert len(json.loads(encoded)["issues"]) == len(result.issues)
+
+
+def test_encode_confluence_page(benchmark, confluence_page_payload):
+    page = ConfluencePage.from_api_response(
+        confluence_page_payload,
+        base_url="https://example.atlassian.net/wiki",
+        is_cloud=True,
+    )
+
+    encoded = benchmark(_encode_tool_result, page)
+
+    assert json.loads(encoded)["id"] == page.id
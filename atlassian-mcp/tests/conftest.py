@@ -316,6 +316,35 @@ def parametrized_auth_env(request):
         raise ValueError(f"Unknown auth type: {auth_type}")
 
 
+# ============================================================================
+# Process-Wide State Isolation
+# ============================================================================
+
+
+@pytest.fixture(autouse=True)
+def reset_process_wide_auth_state():
+    """
+    Reset process-wide caches so tests cannot leak state to each other.
+
+    OAuth refresh coordination, user token validation, the tagged data
+    caches and Jira issue mirrors are shared across fetcher instances by design, which would
+    otherwise carry state between tests.
+    """
+    from mcp_atlassian.jira.mirror import close_issue_mirrors
+    from mcp_atlassian.servers.dependencies import clear_token_validation_cache
+    from mcp_atlassian.utils.cache import CACHE_REGISTRY
+    from mcp_atlassian.utils.oauth import TOKEN_REFRESH_COORDINATOR
+
+    TOKEN_REFRESH_COORDINATOR.reset()
+    clear_token_validation_cache()
+    CACHE_REGISTRY.clear()
+    yield
+    TOKEN_REFRESH_COORDINATOR.reset()
+    clear_token_validation_cache()
+    CACHE_REGISTRY.clear()
+    close_issue_mirrors()
+
+
 # ============================================================================
 # Session Validation and Health Checks
 # ============================================================================
@@ -0,0 +1,108 @@
+"""Sample Jira and Confluence webhook payloads for replay in tests.
+
+Trimmed to the fields the cache invalidation handlers read, following the
+shapes documented for Jira Cloud/Server webhooks and Confluence webhooks.
+"""
+
+JIRA_ISSUE_UPDATED = {
+    "timestamp": 1704204600000,
+    "webhookEvent": "jira:issue_updated",
+    "issue_event_type_name": "issue_generic",
+    "user": {"accountId": "5b10a2844c20165700ede21g", "displayName": "Test User"},
+    "issue": {
+        "id": "12345",
+        "self": "https://example.atlassian.net/rest/api/2/issue/12345",
+        "key": "PROJ-123",
+        "fields": {
+            "summary": "Test Issue Summary",
+            "project": {"id": "10000", "key": "PROJ", "name": "Project"},
+        },
+    },
+    "changelog": {
+        "id": "10100",
+        "items": [{"field": "status", "fromString": "To Do", "toString": "Done"}],
+    },
+}
+
+JIRA_ISSUE_DELETED = {
+    "timestamp": 1704204700000,
+    "webhookEvent": "jira:issue_deleted",
+    "issue": {
+        "id": "12346",
+        "self": "https://example.atlassian.net/rest/api/2/issue/12346",
+        "key": "PROJ-124",
+        "fields": {"project": {"id": "10000", "key": "PROJ"}},
+    },
+}
+
+JIRA_ISSUE_MOVED = {
+    "timestamp": 1704204800000,
+    "webhookEvent": "jira:issue_updated",
+    "issue_event_type_name": "issue_moved",
+    "issue": {
+        "id": "12347",
+        "self": "https://example.atlassian.net/rest/api/2/issue/12347",
+        "key": "OTHER-7",
+        "fields": {"project": {"id": "10001", "key": "OTHER"}},
+    },
+    "changelog": {
+        "id": "10101",
+        "items": [
+            {"field": "Key", "fromString": "PROJ-125", "toString": "OTHER-7"},
+            {"field": "project", "fromString": "Project", "toString": "Other"},
+        ],
+    },
+}
+
+JIRA_COMMENT_CREATED = {
+    "timestamp": 1704204800000,
+    "webhookEvent": "comment_created",
+    "comment": {"id": "20000", "body": "Looks good"},
+    "issue": {
+        "id": "12345",
+        "key": "PROJ-123",
+        "fields": {"project": {"id": "10000", "key": "PROJ"}},
+    },
+}
+
+JIRA_PROJECT_UPDATED = {
+    "timestamp": 1704204900000,
+    "webhookEvent": "project_updated",
+    "project": {"id": 10000, "key": "PROJ", "name": "Renamed Project"},
+}
+
+JIRA_VERSION_RELEASED = {
+    "timestamp": 1704205000000,
+    "webhookEvent": "jira:version_released",
+    "version": {"id": "10200", "name": "1.0", "projectId": 10000},
+}
+
+JIRA_FIELD_CREATED = {
+    "timestamp": 1704205100000,
+    "webhookEvent": "field_created",
+    "field": {"id": "customfield_10100", "name": "Team"},
+}
+
+JIRA_UNRELATED_EVENT = {
+    "timestamp": 1704205200000,
+    "webhookEvent": "user_created",
+    "user": {"accountId": "5b10a2844c20165700ede21h"},
+}
+
+CONFLUENCE_PAGE_UPDATED = {
+    "timestamp": 1704205300000,
+    "event": "page_updated",
+    "userAccountId": "5b10a2844c20165700ede21g",
+    "page": {
+        "id": 987654321,
+        "title": "Example Meeting Notes",
+        "spaceKey": "PROJ",
+        "version": 2,
+    },
+}
+
+CONFLUENCE_PAGE_REMOVED = {
+    "timestamp": 1704205400000,
+    "event": "page_removed",
+    "page": {"id": 987654322, "title": "Old Notes", "spaceKey": "PROJ"},
+}
@@ -55,6 +55,8 @@ class TestMCPProtocolIntegration:
         config.is_auth_configured.return_value = True
         config.url = "https://test.atlassian.net/wiki"
         config.auth_type = "oauth"
+        config.page_cache = True
+        config.page_cache_ttl = 0.0
         return config
 
     @pytest.fixture
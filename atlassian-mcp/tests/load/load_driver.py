@@ -0,0 +1,321 @@
+"""End-to-end load driver for the MCP server.
+
+Starts the mock Atlassian server and ``mcp-atlassian`` with the
+streamable-http transport pointed at it (or reuses running instances via
+``--mock-url``/``--mcp-url``), then calls each tool from a number of
+concurrent MCP clients. For every tool it reports throughput, latency
+percentiles, errors and the number of upstream requests each call made,
+taken from the mock's request counters.
+
+Run from the project root::
+
+    uv run python -m tests.load.load_driver --concurrency 8 --calls 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastmcp import Client
+from fastmcp.client.transports import StreamableHttpTransport
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Tool calls exercised by default, one load phase each
+DEFAULT_SCENARIOS: dict[str, dict[str, Any]] = {
+    "jira_get_issue": {"issue_key": "PROJ-123"},
+    "jira_search": {"jql": "project = PROJ ORDER BY updated DESC", "limit": 20},
+    "jira_get_agile_boards": {"project_key": "PROJ"},
+    "jira_get_board_issues": {"board_id": "1000", "jql": "status = Open"},
+    "jira_get_sprints_from_board": {"board_id": "1000"},
+    "jira_get_all_projects": {},
+    "confluence_search": {"query": "type=page AND space=PROJ"},
+    "confluence_get_page": {"page_id": "987654321"},
+    "confluence_get_page_children": {"parent_id": "987654321"},
+    "confluence_get_page_tree": {"page_id": "987654321"},
+    "confluence_get_comments": {"page_id": "987654321"},
+    "confluence_get_labels": {"page_id": "987654321"},
+}
+
+
+@dataclass
+class PhaseResult:
+    """Measurements for one tool's load phase."""
+
+    tool: str
+    concurrency: int
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    upstream_requests: int | None = None
+    first_error: str | None = None
+
+    @property
+    def calls(self) -> int:
+        return len(self.latencies)
+
+    def summary(self) -> dict[str, Any]:
+        """Return the phase measurements as a JSON-serializable dict."""
+        return {
+            "tool": self.tool,
+            "concurrency": self.concurrency,
+            "calls": self.calls,
+            "errors": self.errors,
+            "throughput": round(self.calls / self.elapsed, 2) if self.elapsed else 0.0,
+            "p50_ms": round(percentile(self.latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(self.latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(self.latencies, 99) * 1000, 2),
+            "upstream_per_call": (
+                round(self.upstream_requests / self.calls, 2)
+                if self.upstream_requests is not None and self.calls
+                else None
+            ),
+            "first_error": self.first_error,
+        }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the linearly interpolated percentile of the values (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def format_report(results: list[PhaseResult]) -> str:
+    """Render phase summaries as a fixed-width table."""
+    header = (
+        f"{'tool':<30} {'calls':>6} {'err':>5} {'rps':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'upstream':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        row = result.summary()
+        upstream = row["upstream_per_call"]
+        lines.append(
+            f"{row['tool']:<30} {row['calls']:>6} {row['errors']:>5} "
+            f"{row['throughput']:>8.1f} {row['p50_ms']:>8.1f} "
+            f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} "
+            f"{'-' if upstream is None else f'{upstream:.2f}':>9}"
+        )
+    return "\n".join(lines)
+
+
+async def run_phase(
+    mcp_url: str,
+    tool: str,
+    arguments: dict[str, Any],
+    concurrency: int,
+    calls: int,
+) -> PhaseResult:
+    """Make ``calls`` calls to one tool from ``concurrency`` MCP clients."""
+    result = PhaseResult(tool=tool, concurrency=concurrency)
+    remaining = calls
+
+    async def worker() -> None:
+        nonlocal remaining
+        async with Client(StreamableHttpTransport(mcp_url)) as client:
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                try:
+                    await client.call_tool(tool, arguments)
+                except Exception as e:  # noqa: BLE001 - counted and reported
+                    result.errors += 1
+                    result.first_error = result.first_error or str(e)[:200]
+                result.latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+async def run_load(
+    mcp_url: str,
+    mock_url: str | None,
+    scenarios: dict[str, dict[str, Any]],
+    concurrency: int,
+    calls: int,
+    warmup: int,
+) -> list[PhaseResult]:
+    """Run one phase per scenario, counting upstream requests on the mock."""
+    results = []
+    async with httpx.AsyncClient(base_url=mock_url or "http://unused") as mock:
+        for tool, arguments in scenarios.items():
+            if warmup:
+                await run_phase(mcp_url, tool, arguments, 1, warmup)
+            if mock_url:
+                await mock.post("/__mock__/reset")
+            result = await run_phase(mcp_url, tool, arguments, concurrency, calls)
+            if mock_url:
+                stats = (await mock.get("/__mock__/stats")).json()
+                result.upstream_requests = stats["total"] + sum(
+                    stats["injected"].values()
+                )
+            results.append(result)
+    return results
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_ready(url: str, process: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            msg = f"Process serving {url} exited with {process.returncode}"
+            raise RuntimeError(msg)
+        try:
+            if httpx.get(url, timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    msg = f"{url} did not become ready within {timeout:.0f}s"
+    raise TimeoutError(msg)
+
+
+def _spawn(command: list[str], env: dict[str, str], ready_url: str) -> subprocess.Popen:
+    process = subprocess.Popen(  # noqa: S603 - fixed command line
+        command,
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_until_ready(ready_url, process, timeout=30)
+    except Exception:
+        process.terminate()
+        raise
+    return process
+
+
+def start_mock(args: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    """Start the mock Atlassian server with the requested fault injection."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}"
+    command = [
+        sys.executable,
+        "-m",
+        "tests.load.mock_atlassian",
+        "--port",
+        str(port),
+        "--latency",
+        str(args.latency),
+        "--jitter",
+        str(args.jitter),
+        "--error-rate",
+        str(args.error_rate),
+        "--throttle-rate",
+        str(args.throttle_rate),
+        "--seed",
+        str(args.seed),
+    ]
+    env = {**os.environ, "PYTHONPATH": _pythonpath()}
+    return _spawn(command, env, f"{url}/__mock__/stats"), url
+
+
+def start_server(mock_url: str) -> tuple[subprocess.Popen, str]:
+    """Start mcp-atlassian over streamable-http against the mock."""
+    port = _free_port()
+    command = [
+        sys.executable,
+        "-c",
+        "from mcp_atlassian import main; main()",
+        "--transport",
+        "streamable-http",
+        "--port",
+        str(port),
+    ]
+    env = {
+        **os.environ,
+        "PYTHONPATH": _pythonpath(),
+        "JIRA_URL": mock_url,
+        "JIRA_PERSONAL_TOKEN": "load-test",
+        "CONFLUENCE_URL": f"{mock_url}/wiki",
+        "CONFLUENCE_PERSONAL_TOKEN": "load-test",
+    }
+    base = f"http://127.0.0.1:{port}"
+    return _spawn(command, env, f"{base}/healthz"), f"{base}/mcp/"
+
+
+def _pythonpath() -> str:
+    paths = [str(PROJECT_ROOT), str(PROJECT_ROOT / "src")]
+    if os.environ.get("PYTHONPATH"):
+        paths.append(os.environ["PYTHONPATH"])
+    return os.pathsep.join(paths)
+
+
+def main() -> None:
+    """Parse arguments, start the servers and print the load report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=100, help="Calls per tool")
+    parser.add_argument("--warmup", type=int, default=2, help="Warm-up calls per tool")
+    parser.add_argument(
+        "--tools", help="Comma-separated tools to run (default: all scenarios)"
+    )
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--mock-url", help="Use a running mock server")
+    parser.add_argument("--mcp-url", help="Use a running MCP server (…/mcp/)")
+    parser.add_argument("--json", type=Path, help="Also write results as JSON")
+    args = parser.parse_args()
+
+    scenarios = DEFAULT_SCENARIOS
+    if args.tools:
+        wanted = [name.strip() for name in args.tools.split(",") if name.strip()]
+        unknown = [name for name in wanted if name not in DEFAULT_SCENARIOS]
+        if unknown:
+            parser.error(f"unknown tools: {', '.join(unknown)}")
+        scenarios = {name: DEFAULT_SCENARIOS[name] for name in wanted}
+
+    with ExitStack() as stack:
+        mock_url = args.mock_url
+        if mock_url is None and args.mcp_url is None:
+            process, mock_url = start_mock(args)
+            stack.callback(process.terminate)
+        mcp_url = args.mcp_url
+        if mcp_url is None:
+            process, mcp_url = start_server(mock_url)
+            stack.callback(process.terminate)
+
+        results = asyncio.run(
+            run_load(
+                mcp_url, mock_url, scenarios, args.concurrency, args.calls, args.warmup
+            )
+        )
+
+    print(format_report(results))
+    for result in results:
+        if result.first_error:
+            print(f"{result.tool}: first error: {result.first_error}")
+    if args.json:
+        args.json.write_text(
+            json.dumps([result.summary() for result in results], indent=2) + "\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,422 @@
+"""ASGI mock of the Jira and Confluence REST endpoints used by the fetchers.
+
+Serves the canned payloads from ``tests/fixtures`` (with identifiers
+substituted) for Jira REST v2/v3, Jira Agile 1.0 and Confluence REST, both
+at the root and under the ``/wiki`` context path. Latency, 5xx errors and
+429 throttling can be injected to reproduce slow or overloaded sites.
+
+Requests are counted per route so a load test can report how many upstream
+calls each tool makes. Control endpoints live under ``/__mock__``:
+
+- ``GET /__mock__/stats``: request counts per route and unmatched paths
+- ``POST /__mock__/reset``: clear the counters
+- ``POST /__mock__/config``: change the fault injection settings (JSON body
+  with any of the ``MockSettings`` fields)
+
+Run standalone with ``python -m tests.load.mock_atlassian --port 9000``.
+"""
+
+import argparse
+import asyncio
+import copy
+import random
+import threading
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, fields
+from typing import Any
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from tests.fixtures.confluence_mocks import (
+    MOCK_COMMENTS_RESPONSE,
+    MOCK_CQL_SEARCH_RESPONSE,
+    MOCK_LABELS_RESPONSE,
+    MOCK_PAGE_RESPONSE,
+    MOCK_PAGES_FROM_SPACE_RESPONSE,
+    MOCK_SPACES_RESPONSE,
+)
+from tests.fixtures.jira_mocks import (
+    MOCK_JIRA_COMMENTS,
+    MOCK_JIRA_ISSUE_RESPONSE,
+    MOCK_JIRA_JQL_RESPONSE,
+)
+
+CONTROL_PREFIX = "/__mock__"
+CONFLUENCE_PREFIXES = ("", "/wiki")
+
+
+@dataclass
+class MockSettings:
+    """Fault injection applied to every non-control request."""
+
+    latency: float = 0.0  # Seconds added to every response
+    jitter: float = 0.0  # Extra uniformly random seconds, 0..jitter
+    error_rate: float = 0.0  # Share of requests answered with a 500
+    throttle_rate: float = 0.0  # Share of requests answered with a 429
+    retry_after: float = 1.0  # Retry-After seconds sent with a 429
+    search_total: int = 200  # Issues reported by Jira search and board queries
+    seed: int | None = None  # Seed for reproducible fault injection
+
+
+class MockState:
+    """Request counters and settings shared by all handlers."""
+
+    def __init__(self, settings: MockSettings) -> None:
+        self.settings = settings
+        self.random = random.Random(settings.seed)  # noqa: S311 - not for security
+        self.requests: Counter[str] = Counter()
+        self.unmatched: Counter[str] = Counter()
+        self.injected: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, route: str) -> None:
+        with self._lock:
+            self.requests[route] += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "total": sum(self.requests.values()),
+                "requests": dict(self.requests),
+                "unmatched": dict(self.unmatched),
+                "injected": dict(self.injected),
+                "settings": asdict(self.settings),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.unmatched.clear()
+            self.injected.clear()
+
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+def _issue(key: str) -> dict[str, Any]:
+    issue = copy.deepcopy(MOCK_JIRA_ISSUE_RESPONSE)
+    issue["key"] = key.upper() if not key.isdigit() else f"PROJ-{key}"
+    issue["id"] = key if key.isdigit() else str(10000 + sum(map(ord, key)))
+    return issue
+
+
+def _page_window(request: Request, default_limit: int = 50) -> tuple[int, int]:
+    start = int(
+        request.query_params.get("startAt", request.query_params.get("start", 0))
+    )
+    limit = int(
+        request.query_params.get(
+            "maxResults", request.query_params.get("limit", default_limit)
+        )
+    )
+    return start, limit
+
+
+def _jira_issue_page(
+    request: Request, state: MockState, values_key: str = "issues"
+) -> dict[str, Any]:
+    start, limit = _page_window(request)
+    total = state.settings.search_total
+    template = MOCK_JIRA_JQL_RESPONSE["issues"][0]
+    issues = []
+    for index in range(start, min(start + limit, total)):
+        issue = copy.deepcopy(template)
+        issue["id"] = str(20000 + index)
+        issue["key"] = f"PROJ-{index + 1}"
+        issues.append(issue)
+    return {
+        "expand": "schema,names",
+        "startAt": start,
+        "maxResults": limit,
+        "total": total,
+        values_key: issues,
+    }
+
+
+def _confluence_page(page_id: str) -> dict[str, Any]:
+    page = copy.deepcopy(MOCK_PAGE_RESPONSE)
+    page["id"] = page_id
+    return page
+
+
+def build_routes(state: MockState) -> list[Route]:
+    """Return the mocked API routes, counted under their path templates."""
+
+    async def issue(request: Request) -> Response:
+        return JSONResponse(_issue(request.path_params["key"]))
+
+    async def issue_comments(request: Request) -> Response:
+        return JSONResponse(MOCK_JIRA_COMMENTS)
+
+    async def search(request: Request) -> Response:
+        return JSONResponse(_jira_issue_page(request, state))
+
+    async def fields_list(request: Request) -> Response:
+        return JSONResponse(
+            [
+                {"id": "summary", "name": "Summary", "custom": False},
+                {"id": "status", "name": "Status", "custom": False},
+                {
+                    "id": "customfield_10014",
+                    "name": "Epic Link",
+                    "custom": True,
+                    "schema": {"custom": "com.pyxis.greenhopper.jira:gh-epic-link"},
+                },
+            ]
+        )
+
+    async def projects(request: Request) -> Response:
+        return JSONResponse(
+            [{"id": "10000", "key": "PROJ", "name": "Project"}]
+            + [
+                {"id": str(10001 + i), "key": f"P{i}", "name": f"Project {i}"}
+                for i in range(20)
+            ]
+        )
+
+    async def project(request: Request) -> Response:
+        key = request.path_params["key"]
+        return JSONResponse({"id": "10000", "key": key.upper(), "name": "Project"})
+
+    async def empty_list(request: Request) -> Response:
+        return JSONResponse([])
+
+    async def myself(request: Request) -> Response:
+        return JSONResponse(
+            {"name": "loadtest", "displayName": "Load Test", "accountId": "load-1"}
+        )
+
+    async def server_info(request: Request) -> Response:
+        return JSONResponse({"version": "9.12.0", "deploymentType": "Server"})
+
+    async def boards(request: Request) -> Response:
+        start, limit = _page_window(request)
+        values = [
+            {"id": 1000 + i, "name": f"Board {i}", "type": "scrum"}
+            for i in range(start, min(start + limit, 30))
+        ]
+        return JSONResponse(
+            {
+                "startAt": start,
+                "maxResults": limit,
+                "total": 30,
+                "isLast": start + limit >= 30,
+                "values": values,
+            }
+        )
+
+    async def sprints(request: Request) -> Response:
+        start, limit = _page_window(request)
+        values = [
+            {
+                "id": 500 + i,
+                "name": f"Sprint {i}",
+                "state": "closed" if i < 11 else "active",
+                "startDate": "2024-01-01T00:00:00.000Z",
+                "endDate": "2024-01-14T00:00:00.000Z",
+            }
+            for i in range(start, min(start + limit, 12))
+        ]
+        return JSONResponse(
+            {"maxResults": limit, "startAt": start, "isLast": True, "values": values}
+        )
+
+    async def agile_issues(request: Request) -> Response:
+        return JSONResponse(_jira_issue_page(request, state))
+
+    async def page(request: Request) -> Response:
+        return JSONResponse(_confluence_page(request.path_params["page_id"]))
+
+    async def page_children(request: Request) -> Response:
+        results = copy.deepcopy(MOCK_PAGES_FROM_SPACE_RESPONSE)
+        return JSONResponse(
+            {"results": results, "start": 0, "limit": 25, "size": len(results)}
+        )
+
+    async def page_comments(request: Request) -> Response:
+        return JSONResponse(MOCK_COMMENTS_RESPONSE)
+
+    async def page_labels(request: Request) -> Response:
+        return JSONResponse(MOCK_LABELS_RESPONSE)
+
+    async def cql_search(request: Request) -> Response:
+        return JSONResponse(MOCK_CQL_SEARCH_RESPONSE)
+
+    async def spaces(request: Request) -> Response:
+        return JSONResponse(MOCK_SPACES_RESPONSE)
+
+    async def user(request: Request) -> Response:
+        account = request.query_params.get(
+            "accountId", request.query_params.get("username", "user")
+        )
+        return JSONResponse(
+            {
+                "accountId": account,
+                "username": account,
+                "displayName": f"User {account}",
+            }
+        )
+
+    jira: list[tuple[str, Handler, list[str]]] = [
+        ("/issue/{key}", issue, ["GET"]),
+        ("/issue/{key}/comment", issue_comments, ["GET"]),
+        ("/search", search, ["GET", "POST"]),
+        ("/search/jql", search, ["GET", "POST"]),
+        ("/field", fields_list, ["GET"]),
+        ("/project", projects, ["GET"]),
+        ("/project/{key}", project, ["GET"]),
+        ("/project/{key}/components", empty_list, ["GET"]),
+        ("/project/{key}/versions", empty_list, ["GET"]),
+        ("/myself", myself, ["GET"]),
+        ("/serverInfo", server_info, ["GET"]),
+    ]
+    agile: list[tuple[str, Handler, list[str]]] = [
+        ("/board", boards, ["GET"]),
+        ("/board/{board_id}/sprint", sprints, ["GET"]),
+        ("/board/{board_id}/issue", agile_issues, ["GET"]),
+        ("/sprint/{sprint_id}/issue", agile_issues, ["GET"]),
+    ]
+    confluence: list[tuple[str, Handler, list[str]]] = [
+        ("/content/{page_id}", page, ["GET"]),
+        ("/content/{page_id}/child/page", page_children, ["GET"]),
+        ("/content/{page_id}/child/comment", page_comments, ["GET"]),
+        ("/content/{page_id}/label", page_labels, ["GET"]),
+        ("/content/search", cql_search, ["GET"]),
+        ("/search", cql_search, ["GET"]),
+        ("/space", spaces, ["GET"]),
+        ("/user", user, ["GET"]),
+    ]
+
+    def counted(template: str, handler: Handler) -> Handler:
+        async def endpoint(request: Request) -> Response:
+            state.record(f"{request.method} {template}")
+            return await handler(request)
+
+        return endpoint
+
+    routes = []
+    for version in ("2", "3"):
+        for path, handler, methods in jira:
+            template = f"/rest/api/{version}{path}"
+            routes.append(Route(template, counted(template, handler), methods=methods))
+    for path, handler, methods in agile:
+        template = f"/rest/agile/1.0{path}"
+        routes.append(Route(template, counted(template, handler), methods=methods))
+    for prefix in CONFLUENCE_PREFIXES:
+        for path, handler, methods in confluence:
+            template = f"{prefix}/rest/api{path}"
+            routes.append(Route(template, counted(template, handler), methods=methods))
+    return routes
+
+
+def create_app(settings: MockSettings | None = None) -> Starlette:
+    """Build the mock server application.
+
+    Args:
+        settings: Fault injection settings (defaults to no faults)
+
+    Returns:
+        The ASGI application; its ``state.mock`` holds the ``MockState``
+    """
+    state = MockState(settings or MockSettings())
+
+    async def stats(request: Request) -> Response:
+        return JSONResponse(state.stats())
+
+    async def reset(request: Request) -> Response:
+        state.reset()
+        return JSONResponse(state.stats())
+
+    async def configure(request: Request) -> Response:
+        updates = await request.json()
+        known = {field.name for field in fields(MockSettings)}
+        unknown = set(updates) - known
+        if unknown:
+            return JSONResponse(
+                {"error": f"unknown settings: {sorted(unknown)}"}, status_code=400
+            )
+        for name, value in updates.items():
+            setattr(state.settings, name, value)
+        if "seed" in updates:
+            state.random.seed(updates["seed"])
+        return JSONResponse(asdict(state.settings))
+
+    async def unmatched(request: Request) -> Response:
+        state.unmatched[f"{request.method} {request.url.path}"] += 1
+        return JSONResponse(
+            {"errorMessages": [f"No mock for {request.url.path}"]}, status_code=404
+        )
+
+    routes = [
+        Route(f"{CONTROL_PREFIX}/stats", stats, methods=["GET"]),
+        Route(f"{CONTROL_PREFIX}/reset", reset, methods=["POST"]),
+        Route(f"{CONTROL_PREFIX}/config", configure, methods=["POST"]),
+        *build_routes(state),
+        Route("/{path:path}", unmatched, methods=["GET", "POST", "PUT", "DELETE"]),
+    ]
+
+    async def inject_faults(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        if request.url.path.startswith(CONTROL_PREFIX):
+            return await call_next(request)
+        settings = state.settings
+        delay = settings.latency + state.random.uniform(0, settings.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        roll = state.random.random()
+        if roll < settings.throttle_rate:
+            state.injected["429"] += 1
+            return JSONResponse(
+                {"errorMessages": ["Rate limit exceeded"]},
+                status_code=429,
+                headers={"Retry-After": f"{settings.retry_after:g}"},
+            )
+        if roll < settings.throttle_rate + settings.error_rate:
+            state.injected["500"] += 1
+            return JSONResponse(
+                {"errorMessages": ["Injected server error"]}, status_code=500
+            )
+        return await call_next(request)
+
+    app = Starlette(
+        routes=routes,
+        middleware=[Middleware(BaseHTTPMiddleware, dispatch=inject_faults)],
+    )
+    app.state.mock = state
+    return app
+
+
+def main() -> None:
+    """Serve the mock with uvicorn."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    for field in fields(MockSettings):
+        if field.name == "seed":
+            parser.add_argument("--seed", type=int, default=None)
+            continue
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}",
+            type=type(field.default),
+            default=field.default,
+        )
+    args = parser.parse_args()
+    settings = MockSettings(
+        **{field.name: getattr(args, field.name) for field in fields(MockSettings)}
+    )
+    uvicorn.run(
+        create_app(settings), host=args.host, port=args.port, log_level="warning"
+    )
+
+
+if __name__ == "__main__":
+    main()
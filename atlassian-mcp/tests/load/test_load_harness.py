@@ -0,0 +1,99 @@
+"""Tests for the mock Atlassian server and the load driver helpers."""
+
+import httpx
+import pytest
+
+from tests.load.load_driver import PhaseResult, format_report, percentile
+from tests.load.mock_atlassian import MockSettings, create_app
+
+
+def _client(app):
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://mock"
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/rest/api/2/issue/PROJ-7",
+        "/rest/api/3/issue/PROJ-7",
+        "/rest/agile/1.0/board/1/sprint",
+        "/rest/api/content/123",
+        "/wiki/rest/api/content/123",
+    ],
+)
+async def test_serves_fixtures_and_counts_by_template(path):
+    """Known endpoints answer with fixtures and are counted per route."""
+    app = create_app()
+    async with _client(app) as client:
+        response = await client.get(path)
+        stats = (await client.get("/__mock__/stats")).json()
+
+    assert response.status_code == 200
+    assert stats["total"] == 1
+    assert list(stats["requests"])[0].startswith("GET /")
+    assert "{" in list(stats["requests"])[0]
+
+
+@pytest.mark.anyio
+async def test_search_pages_through_configured_total():
+    """Jira search honors startAt/maxResults against the configured total."""
+    app = create_app(MockSettings(search_total=30))
+    async with _client(app) as client:
+        response = await client.get(
+            "/rest/api/2/search", params={"startAt": 25, "maxResults": 10}
+        )
+
+    body = response.json()
+    assert body["total"] == 30
+    assert [issue["key"] for issue in body["issues"]] == [
+        f"PROJ-{n}" for n in range(26, 31)
+    ]
+
+
+@pytest.mark.anyio
+async def test_fault_injection_and_reset():
+    """Throttling returns 429 with Retry-After; reset clears the counters."""
+    app = create_app(MockSettings(throttle_rate=1.0, retry_after=3, seed=1))
+    async with _client(app) as client:
+        throttled = await client.get("/rest/api/2/issue/PROJ-1")
+        assert throttled.status_code == 429
+        assert throttled.headers["Retry-After"] == "3"
+
+        await client.post("/__mock__/config", json={"throttle_rate": 0.0})
+        assert (await client.get("/rest/api/2/issue/PROJ-1")).status_code == 200
+        assert (await client.get("/rest/api/2/nothing")).status_code == 404
+
+        stats = (await client.post("/__mock__/reset")).json()
+        bad = await client.post("/__mock__/config", json={"bogus": 1})
+
+    assert stats["total"] == 0
+    assert stats["injected"] == {}
+    assert bad.status_code == 400
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) == 0.0
+    assert percentile([1.0], 99) == 1.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == pytest.approx(2.5)
+    assert percentile(list(range(101)), 95) == pytest.approx(95)
+
+
+def test_report_includes_upstream_calls_per_tool():
+    result = PhaseResult(
+        tool="jira_get_issue",
+        concurrency=2,
+        elapsed=2.0,
+        latencies=[0.1, 0.2, 0.3, 0.4],
+        upstream_requests=8,
+    )
+
+    summary = result.summary()
+    report = format_report([result])
+
+    assert summary["throughput"] == 2.0
+    assert summary["upstream_per_call"] == 2.0
+    assert "jira_get_issue" in report
+    assert "2.00" in report
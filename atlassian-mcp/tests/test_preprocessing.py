@@ -509,3 +509,170 @@ More content.
     # Note: md2conf may use different anchor formats, so we check for presence of id attributes
     assert "<h1>" in result_with_anchors
     assert "<h2>" in result_with_anchors
+
+
+class CountingConfluenceClient:
+    """Confluence client double recording every user lookup."""
+
+    def __init__(self, url=None, cloud=False, bulk_users=None, failing=()):
+        self.url = url
+        self.cloud = cloud
+        self.bulk_users = bulk_users or {}
+        self.failing = set(failing)
+        self.lookups = []
+        self.bulk_requests = []
+
+    def get_user_details_by_accountid(self, account_id):
+        self.lookups.append(account_id)
+        if account_id in self.failing:
+            raise RuntimeError("user service unavailable")
+        return {"displayName": f"User {account_id}"}
+
+    def get_user_details_by_username(self, username):
+        self.lookups.append(username)
+        return {"displayName": f"Server {username}"}
+
+    def get(self, path, params=None):
+        self.bulk_requests.append((path, list(params["accountId"])))
+        return {
+            "results": [
+                {"accountId": account_id, "displayName": name}
+                for account_id, name in self.bulk_users.items()
+                if account_id in params["accountId"]
+            ]
+        }
+
+
+MENTIONS_HTML = (
+    '<p><ac:link><ri:user ri:account-id="alice"/></ac:link> '
+    '<ac:link><ri:user ri:account-id="bob"/></ac:link> '
+    '<ac:link><ri:user ri:account-id="alice"/></ac:link> '
+    '<ac:structured-macro ac:name="profile"><ac:parameter ac:name="user">'
+    '<ri:user ri:account-id="alice"/></ac:parameter></ac:structured-macro> '
+    '<ac:structured-macro ac:name="profile"><ac:parameter ac:name="user">'
+    '<ri:user ri:userkey="carol"/></ac:parameter></ac:structured-macro></p>'
+)
+
+
+def test_user_mentions_resolved_once_per_user(preprocessor_with_confluence):
+    """Repeated mentions of a user cost a single lookup."""
+    client = CountingConfluenceClient()
+
+    processed_html, _ = preprocessor_with_confluence.process_html_content(
+        MENTIONS_HTML, confluence_client=client
+    )
+
+    assert sorted(client.lookups) == ["alice", "bob", "carol"]
+    assert processed_html.count("@User alice") == 3
+    assert "@User bob" in processed_html
+    assert "@Server carol" in processed_html
+
+
+def test_user_names_cached_per_site(preprocessor_with_confluence):
+    """Resolved names are reused by later calls for the same site only."""
+    client = CountingConfluenceClient(url="https://example.atlassian.net/wiki")
+    preprocessor_with_confluence.process_html_content(
+        MENTIONS_HTML, confluence_client=client
+    )
+    client.lookups.clear()
+
+    processed_html, _ = preprocessor_with_confluence.process_html_content(
+        MENTIONS_HTML, confluence_client=client
+    )
+    other_site = CountingConfluenceClient(url="https://other.atlassian.net/wiki")
+    preprocessor_with_confluence.process_html_content(
+        MENTIONS_HTML, confluence_client=other_site
+    )
+
+    assert client.lookups == []
+    assert "@User bob" in processed_html
+    assert sorted(other_site.lookups) == ["alice", "bob", "carol"]
+
+
+def test_user_mentions_use_bulk_lookup_on_cloud(preprocessor_with_confluence):
+    """Cloud resolves account IDs in bulk and looks up only what is missing."""
+    client = CountingConfluenceClient(
+        url="https://example.atlassian.net/wiki",
+        cloud=True,
+        bulk_users={"alice": "Alice A"},
+    )
+
+    processed_html, _ = preprocessor_with_confluence.process_html_content(
+        MENTIONS_HTML, confluence_client=client
+    )
+
+    assert client.bulk_requests == [("rest/api/user/bulk", ["alice", "bob"])]
+    assert sorted(client.lookups) == ["bob", "carol"]
+    assert processed_html.count("@Alice A") == 3
+
+
+def test_failed_user_lookup_falls_back_and_retries(preprocessor_with_confluence):
+    """A failed lookup uses the fallback text and is not cached."""
+    client = CountingConfluenceClient(
+        url="https://example.atlassian.net/wiki", failing={"bob"}
+    )
+
+    processed_html, _ = preprocessor_with_confluence.process_html_content(
+        MENTIONS_HTML, confluence_client=client
+    )
+    client.lookups.clear()
+    preprocessor_with_confluence.process_html_content(
+        MENTIONS_HTML, confluence_client=client
+    )
+
+    assert "@user_bob" in processed_html
+    assert "@User alice" in processed_html
+    assert client.lookups == ["bob"]
+
+
+def test_storage_converter_shares_one_document_root():
+    """Conversions reuse one md2conf document directory instead of one per call."""
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+    from unittest.mock import patch
+
+    from mcp_atlassian.preprocessing.confluence import MarkdownStorageConverter
+
+    converter = MarkdownStorageConverter()
+    documents = [f"# Page {i}\n\n| a | b |\n|---|---|\n| {i} | x |" for i in range(8)]
+
+    with patch(
+        "mcp_atlassian.preprocessing.confluence.tempfile.mkdtemp",
+        wraps=tempfile.mkdtemp,
+    ) as mkdtemp:
+        sequential = [
+            converter.html_to_storage(converter.to_html(doc)) for doc in documents
+        ]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            threaded = list(
+                pool.map(
+                    lambda doc: converter.html_to_storage(converter.to_html(doc)),
+                    documents,
+                )
+            )
+
+    assert mkdtemp.call_count == 1
+    assert threaded == sequential
+    assert "<td>3</td>" in sequential[3]
+
+
+def test_markdown_to_confluence_storage_fallback_reuses_html(
+    preprocessor_with_confluence,
+):
+    """A failed storage conversion falls back without re-rendering the markdown."""
+    from unittest.mock import patch
+
+    from mcp_atlassian.preprocessing.confluence import STORAGE_CONVERTER
+
+    with (
+        patch.object(
+            STORAGE_CONVERTER, "html_to_storage", side_effect=ValueError("bad")
+        ),
+        patch.object(
+            STORAGE_CONVERTER, "to_html", wraps=STORAGE_CONVERTER.to_html
+        ) as to_html,
+    ):
+        result = preprocessor_with_confluence.markdown_to_confluence_storage("# Title")
+
+    assert to_html.call_count == 1
+    assert result.startswith("<p><h1")
@@ -240,6 +240,7 @@ def mock_atlassian_confluence(
     """
     with patch("mcp_atlassian.confluence.client.Confluence") as mock:
         confluence_instance = mock.return_value
+        confluence_instance.cloud = True
 
         # Use original mock data to maintain backward compatibility for existing tests
         confluence_instance.get_all_spaces.return_value = MOCK_SPACES_RESPONSE
@@ -326,6 +327,7 @@ def mock_atlassian_confluence_with_session_data(
     """
     with patch("mcp_atlassian.confluence.client.Confluence") as mock:
         confluence_instance = mock.return_value
+        confluence_instance.cloud = True
 
         # Use session-scoped data for improved performance
         confluence_instance.get_all_spaces.return_value = {
@@ -453,6 +455,7 @@ def oauth_confluence_client(mock_preprocessor):
 
                 # Create the mock Confluence instance
                 mock_confluence_instance = MagicMock()
+                mock_confluence_instance.cloud = True
                 mock_confluence_class.return_value = mock_confluence_instance
 
                 # Set up OAuth-specific mock responses
@@ -105,6 +105,9 @@ def test_init_from_env():
         patch("mcp_atlassian.confluence.client.Confluence") as mock_confluence,
         patch("mcp_atlassian.preprocessing.confluence.ConfluencePreprocessor"),
         patch("mcp_atlassian.confluence.client.configure_ssl_verification"),
+        patch("mcp_atlassian.confluence.client.configure_connection_pool"),
+        patch("mcp_atlassian.confluence.client.configure_rate_limiting"),
+        patch("mcp_atlassian.confluence.client.configure_request_coalescing"),
     ):
         mock_config = MagicMock()
         mock_from_env.return_value = mock_config
@@ -127,6 +130,9 @@ def test_process_html_content():
             "mcp_atlassian.preprocessing.confluence.ConfluencePreprocessor"
         ) as mock_preprocessor_class,
         patch("mcp_atlassian.confluence.client.configure_ssl_verification"),
+        patch("mcp_atlassian.confluence.client.configure_connection_pool"),
+        patch("mcp_atlassian.confluence.client.configure_rate_limiting"),
+        patch("mcp_atlassian.confluence.client.configure_request_coalescing"),
     ):
         mock_preprocessor = mock_preprocessor_class.return_value
         mock_preprocessor.process_html_content.return_value = (
@@ -155,6 +161,9 @@ def test_get_user_details_by_accountid():
         patch("mcp_atlassian.confluence.client.Confluence") as mock_confluence_class,
         patch("mcp_atlassian.preprocessing.confluence.ConfluencePreprocessor"),
         patch("mcp_atlassian.confluence.client.configure_ssl_verification"),
+        patch("mcp_atlassian.confluence.client.configure_connection_pool"),
+        patch("mcp_atlassian.confluence.client.configure_rate_limiting"),
+        patch("mcp_atlassian.confluence.client.configure_request_coalescing"),
     ):
         mock_confluence = mock_confluence_class.return_value
         mock_confluence.get_user_details_by_accountid.return_value = {
@@ -0,0 +1,204 @@
+"""Unit tests for the ExportMixin class."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from mcp_atlassian.confluence.export import EXPORT_LIST_PAGE_SIZE, ExportMixin
+
+
+def _listed(page_id, version, title=None):
+    return {
+        "id": page_id,
+        "title": title or f"Page {page_id}",
+        "version": {"number": version},
+    }
+
+
+class TestExportMixin:
+    """Tests for the ExportMixin class."""
+
+    @pytest.fixture
+    def export_mixin(self, confluence_client, tmp_path):
+        """Create an ExportMixin instance exporting below tmp_path."""
+        with patch(
+            "mcp_atlassian.confluence.export.ConfluenceClient.__init__"
+        ) as mock_init:
+            mock_init.return_value = None
+            mixin = ExportMixin()
+            mixin.confluence = confluence_client.confluence
+            mixin.config = confluence_client.config
+            mixin.config.export_dir = str(tmp_path)
+            mixin.preprocessor = confluence_client.preprocessor
+            mixin.preprocessor.process_html_content.side_effect = lambda html, **_: (
+                html,
+                f"converted {html}",
+            )
+            return mixin
+
+    @pytest.fixture
+    def space(self, export_mixin):
+        """Serve a space listing and page bodies that tests can change."""
+        listing = [_listed("1", 3), _listed("2", 1, "Second / Page")]
+
+        def get_page_by_id(page_id, expand):
+            page = next(p for p in listing if p["id"] == page_id)
+            return {
+                **page,
+                "body": {"storage": {"value": f"<p>{page_id}</p>"}},
+                "ancestors": [{"id": "100"}],
+            }
+
+        export_mixin.confluence.get_all_pages_from_space.side_effect = (
+            lambda space, start, **kwargs: listing[start:]
+        )
+        export_mixin.confluence.get_page_by_id.side_effect = get_page_by_id
+        return listing
+
+    def test_export_writes_pages_and_manifest(self, export_mixin, space, tmp_path):
+        """The first export writes every page and records its version."""
+        result = export_mixin.export_space("TEST", str(tmp_path))
+
+        assert result["success"] is True
+        assert (result["total"], result["exported"], result["unchanged"]) == (2, 2, 0)
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert manifest["space_key"] == "TEST"
+        entries = {entry["id"]: entry for entry in manifest["pages"]}
+        assert entries["2"]["path"] == "second-page-2.md"
+        assert entries["2"]["version"]["number"] == 1
+        assert entries["2"]["parent_id"] == "100"
+        text = (tmp_path / "page-1-1.md").read_text()
+        assert text.startswith('---\ntitle: "Page 1"\nconfluence_id: "1"\nversion: 3\n')
+        assert text.endswith("converted <p>1</p>\n")
+
+    def test_reexport_only_fetches_changed_pages(self, export_mixin, space, tmp_path):
+        """Later runs skip unchanged versions and drop deleted pages."""
+        export_mixin.export_space("TEST", str(tmp_path))
+        export_mixin.confluence.get_page_by_id.reset_mock()
+
+        space[0]["version"]["number"] = 4
+        del space[1]
+        space.append(_listed("3", 1))
+        result = export_mixin.export_space("TEST", str(tmp_path))
+
+        fetched = sorted(
+            c.kwargs["page_id"]
+            for c in export_mixin.confluence.get_page_by_id.call_args_list
+        )
+        assert fetched == ["1", "3"]
+        assert (result["exported"], result["unchanged"], result["removed"]) == (2, 0, 1)
+        assert not (tmp_path / "second-page-2.md").exists()
+        assert "version: 4" in (tmp_path / "page-1-1.md").read_text()
+
+        export_mixin.confluence.get_page_by_id.reset_mock()
+        result = export_mixin.export_space("TEST", str(tmp_path))
+        export_mixin.confluence.get_page_by_id.assert_not_called()
+        assert result["unchanged"] == 2
+
+    def test_failed_pages_keep_their_entry(self, export_mixin, space, tmp_path):
+        """A page that fails is reported and retried on the next run."""
+        export_mixin.export_space("TEST", str(tmp_path))
+        space[0]["version"]["number"] = 4
+        export_mixin.confluence.get_page_by_id.side_effect = Exception("boom")
+
+        result = export_mixin.export_space("TEST", str(tmp_path))
+
+        assert result["success"] is False
+        assert result["failed"] == [{"id": "1", "error": "boom"}]
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        versions = {e["id"]: e["version"]["number"] for e in manifest["pages"]}
+        assert versions == {"1": 3, "2": 1}
+
+    def test_listing_pages_through_the_space(self, export_mixin, tmp_path):
+        """Space listings are requested until a short batch comes back."""
+        listing = [_listed(str(n), 1) for n in range(EXPORT_LIST_PAGE_SIZE + 1)]
+        export_mixin.confluence.get_all_pages_from_space.side_effect = (
+            lambda space, start, limit, **kwargs: listing[start : start + limit]
+        )
+
+        pages = export_mixin._list_space_pages("TEST")
+
+        assert len(pages) == EXPORT_LIST_PAGE_SIZE + 1
+        assert export_mixin.confluence.get_all_pages_from_space.call_count == 2
+
+    def test_refuses_directory_of_another_space(self, export_mixin, tmp_path):
+        (tmp_path / "manifest.json").write_text(
+            json.dumps({"format": 1, "space_key": "OTHER", "pages": []})
+        )
+
+        with pytest.raises(ValueError, match="OTHER"):
+            export_mixin.export_space("TEST", str(tmp_path))
+
+    def test_ignores_manifest_paths_outside_the_directory(
+        self, export_mixin, space, tmp_path
+    ):
+        """Manifest entries never lead to files outside the export directory."""
+        outside = tmp_path / "keep.md"
+        outside.write_text("keep")
+        target = tmp_path / "export"
+        target.mkdir()
+        (target / "manifest.json").write_text(
+            json.dumps(
+                {
+                    "format": 1,
+                    "space_key": "TEST",
+                    "pages": [{"id": "9", "path": "../keep.md", "version": {}}],
+                }
+            )
+        )
+
+        result = export_mixin.export_space("TEST", str(target))
+
+        assert outside.exists()
+        assert result["removed"] == 0
+
+    @pytest.mark.parametrize(
+        "manifest",
+        [
+            "{not json",
+            json.dumps([]),
+            json.dumps({"space_key": "TEST", "pages": []}),
+            json.dumps({"format": 1, "space_key": "TEST", "pages": {"id": "1"}}),
+            json.dumps({"format": 1, "space_key": "TEST", "pages": [{"path": "a"}]}),
+        ],
+    )
+    def test_refuses_to_overwrite_foreign_manifest(
+        self, export_mixin, space, tmp_path, manifest
+    ):
+        """A manifest.json this exporter did not write is left untouched."""
+        (tmp_path / "manifest.json").write_text(manifest)
+
+        with pytest.raises(ValueError, match="Refusing to overwrite"):
+            export_mixin.export_space("TEST", str(tmp_path))
+
+        assert (tmp_path / "manifest.json").read_text() == manifest
+        export_mixin.confluence.get_page_by_id.assert_not_called()
+
+    def test_relative_target_dir_resolves_under_export_dir(
+        self, export_mixin, space, tmp_path
+    ):
+        """Relative directories are taken relative to the export root."""
+        result = export_mixin.export_space("TEST", "spaces/test")
+
+        assert result["target_dir"] == str(tmp_path / "spaces" / "test")
+        assert (tmp_path / "spaces" / "test" / "manifest.json").is_file()
+
+    @pytest.mark.parametrize("target", ["..", "../elsewhere", "/"])
+    def test_refuses_target_dir_outside_export_dir(
+        self, export_mixin, space, tmp_path, target
+    ):
+        """Paths that resolve outside the export root are rejected."""
+        with pytest.raises(ValueError, match="inside the export directory"):
+            export_mixin.export_space("TEST", target)
+
+        export_mixin.confluence.get_all_pages_from_space.assert_not_called()
+
+    def test_export_disabled_without_export_dir(self, export_mixin, tmp_path):
+        """Without CONFLUENCE_EXPORT_DIR nothing is written."""
+        export_mixin.config.export_dir = None
+
+        with pytest.raises(ValueError, match="CONFLUENCE_EXPORT_DIR"):
+            export_mixin.export_space("TEST", str(tmp_path))
+
+        assert not (tmp_path / "manifest.json").exists()
@@ -1,11 +1,14 @@
 """Unit tests for the PagesMixin class."""
 
+import copy
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from mcp_atlassian.confluence.pages import PagesMixin
 from mcp_atlassian.models.confluence import ConfluencePage
+from mcp_atlassian.utils.cache import confluence_page_tag, invalidate_tags
+from tests.fixtures.confluence_mocks import MOCK_PAGE_RESPONSE
 
 
 class TestPagesMixin:
@@ -154,6 +157,80 @@ class TestPagesMixin:
         # Assert HTML processing was used
         assert result.content == "<p>Processed HTML</p>"
 
+    @staticmethod
+    def _serve_page_version(pages_mixin, version):
+        """Answer get_page_by_id with the page at the given version."""
+
+        def get_page_by_id(page_id, expand):
+            page = copy.deepcopy(MOCK_PAGE_RESPONSE)
+            page["version"]["number"] = version
+            if "body.storage" not in expand:
+                del page["body"]
+            return page
+
+        pages_mixin.confluence.get_page_by_id.side_effect = get_page_by_id
+
+    def test_get_page_content_reuses_conversion_when_unchanged(self, pages_mixin):
+        """An unchanged version is confirmed without the body or a conversion."""
+        self._serve_page_version(pages_mixin, 7)
+
+        first = pages_mixin.get_page_content("987654321")
+        second = pages_mixin.get_page_content("987654321")
+
+        assert second.content == first.content == "Processed Markdown"
+        assert second.title == first.title
+        assert pages_mixin.preprocessor.process_html_content.call_count == 1
+        assert pages_mixin.confluence.get_page_by_id.call_args_list[-1].kwargs == {
+            "page_id": "987654321",
+            "expand": "version",
+        }
+
+    def test_get_page_content_reconverts_changed_version(self, pages_mixin):
+        """A new page version is downloaded and converted again."""
+        self._serve_page_version(pages_mixin, 7)
+        pages_mixin.get_page_content("987654321")
+        self._serve_page_version(pages_mixin, 8)
+
+        result = pages_mixin.get_page_content("987654321")
+
+        assert result.version.number == 8
+        assert pages_mixin.preprocessor.process_html_content.call_count == 2
+
+    def test_get_page_content_cache_per_conversion(self, pages_mixin):
+        """Markdown and HTML conversions are cached separately."""
+        self._serve_page_version(pages_mixin, 7)
+
+        markdown = pages_mixin.get_page_content("987654321")
+        html = pages_mixin.get_page_content("987654321", convert_to_markdown=False)
+
+        assert markdown.content == "Processed Markdown"
+        assert html.content == "<p>Processed HTML</p>"
+        assert pages_mixin.preprocessor.process_html_content.call_count == 2
+
+    def test_get_page_content_ttl_skips_version_check(self, pages_mixin):
+        """Within the TTL no request is made until a webhook drops the entry."""
+        self._serve_page_version(pages_mixin, 7)
+        pages_mixin.config.page_cache_ttl = 60.0
+
+        pages_mixin.get_page_content("987654321")
+        pages_mixin.get_page_content("987654321")
+        assert pages_mixin.confluence.get_page_by_id.call_count == 1
+
+        invalidate_tags([confluence_page_tag("987654321")])
+        pages_mixin.get_page_content("987654321")
+        assert pages_mixin.confluence.get_page_by_id.call_count == 2
+        assert pages_mixin.preprocessor.process_html_content.call_count == 2
+
+    def test_get_page_content_cache_disabled(self, pages_mixin):
+        """With the page cache disabled every call downloads the page."""
+        self._serve_page_version(pages_mixin, 7)
+        pages_mixin.config.page_cache = False
+
+        pages_mixin.get_page_content("987654321")
+        pages_mixin.get_page_content("987654321")
+
+        assert pages_mixin.preprocessor.process_html_content.call_count == 2
+
     def test_get_page_by_title_success(self, pages_mixin):
         """Test getting a page by title when it exists."""
         # Setup
@@ -269,17 +346,7 @@ class TestPagesMixin:
         body = "<p>Test content</p>"
         parent_id = "987654321"
 
-        # Mock get_page_content to return a ConfluencePage
-        with patch.object(
-            pages_mixin,
-            "get_page_content",
-            return_value=ConfluencePage(
-                id="123456789",
-                title=title,
-                content="Page content",
-                space={"key": space_key, "name": "Project"},
-            ),
-        ):
+        with patch.object(pages_mixin, "get_page_content") as mock_get_page_content:
             # Act - specify is_markdown=False since we're directly providing storage format
             result = pages_mixin.create_page(
                 space_key, title, body, parent_id, is_markdown=False
@@ -294,11 +361,16 @@ class TestPagesMixin:
                 representation="storage",
             )
 
-            # Verify result is a ConfluencePage
+            # The result comes from the create response and the body we sent
+            mock_get_page_content.assert_not_called()
+            pages_mixin.preprocessor.process_html_content.assert_called_once_with(
+                body, space_key="TEST", confluence_client=pages_mixin.confluence
+            )
             assert isinstance(result, ConfluencePage)
             assert result.id == "123456789"
             assert result.title == title
-            assert result.content == "Page content"
+            assert result.content == "Processed Markdown"
+            assert result.version.number == 1
 
     def test_create_page_error(self, pages_mixin):
         """Test error handling when creating a page."""
@@ -315,18 +387,11 @@ class TestPagesMixin:
         space_key = "PROJ"
         title = "Wiki Format Test Page"
         wiki_body = "h1. This is a heading\n\n* Item 1\n* Item 2"
+        storage = pages_mixin.confluence.create_page.return_value["body"]["storage"][
+            "value"
+        ]
 
-        # Mock get_page_content to return a ConfluencePage
-        with patch.object(
-            pages_mixin,
-            "get_page_content",
-            return_value=ConfluencePage(
-                id="wiki123",
-                title=title,
-                content="Wiki page content",
-                space={"key": space_key, "name": "Project"},
-            ),
-        ):
+        with patch.object(pages_mixin, "get_page_content") as mock_get_page_content:
             # Act - use wiki format
             result = pages_mixin.create_page(
                 space_key,
@@ -348,9 +413,35 @@ class TestPagesMixin:
             # Verify no markdown conversion happened
             pages_mixin.preprocessor.markdown_to_confluence_storage.assert_not_called()
 
-            # Verify result is a ConfluencePage
+            # The storage form of wiki markup comes from the response
+            mock_get_page_content.assert_not_called()
+            pages_mixin.preprocessor.process_html_content.assert_called_once_with(
+                storage, space_key="TEST", confluence_client=pages_mixin.confluence
+            )
             assert isinstance(result, ConfluencePage)
-            assert result.id == "wiki123"
+            assert result.id == "123456789"
+
+    def test_create_page_with_wiki_format_without_response_body(self, pages_mixin):
+        """Wiki markup falls back to reading the page when no body comes back."""
+        pages_mixin.confluence.create_page.return_value = {
+            "id": "wiki123",
+            "title": "Wiki Page",
+        }
+        page = ConfluencePage(id="wiki123", title="Wiki Page", content="Wiki")
+
+        with patch.object(
+            pages_mixin, "get_page_content", return_value=page
+        ) as mock_get_page_content:
+            result = pages_mixin.create_page(
+                "PROJ",
+                "Wiki Page",
+                "h1. Heading",
+                is_markdown=False,
+                content_representation="wiki",
+            )
+
+        mock_get_page_content.assert_called_once_with("wiki123")
+        assert result is page
 
     def test_update_page_success(self, pages_mixin):
         """Test updating an existing page."""
@@ -585,6 +676,99 @@ class TestPagesMixin:
         # Assert - should return empty list on error, not raise exception
         assert len(results) == 0
 
+    @staticmethod
+    def _tree_page(page_id, *ancestor_ids):
+        return {
+            "id": page_id,
+            "title": f"Page {page_id}",
+            "version": {"number": 1},
+            "ancestors": [{"id": ancestor} for ancestor in ancestor_ids],
+        }
+
+    def test_get_page_tree_from_descendant_search(self, pages_mixin):
+        """A subtree within max_pages is built from the CQL ancestor search."""
+        pages_mixin.confluence.get_page_by_id.return_value = self._tree_page("1")
+        first = [
+            {"content": self._tree_page("2", "0", "1")},
+            {"content": self._tree_page("3", "0", "1")},
+        ]
+        second = [
+            {"content": self._tree_page("4", "0", "1", "2")},
+            {"content": self._tree_page("5", "0", "1", "2", "4")},
+        ]
+        pages_mixin.confluence.get.side_effect = [
+            {
+                "results": first,
+                "start": 0,
+                "size": 2,
+                "totalSize": 4,
+                "_links": {"next": "/rest/api/search?cursor=abc"},
+            },
+            {"results": second, "start": 2, "size": 2, "totalSize": 4},
+        ]
+
+        tree = pages_mixin.get_page_tree("1", max_depth=2)
+
+        assert pages_mixin.confluence.get.call_count == 2
+        params = pages_mixin.confluence.get.call_args.kwargs["params"]
+        assert params["cql"] == "ancestor = 1 AND type = page"
+        assert params["cursor"] == "abc"
+        pages_mixin.confluence.get_page_child_by_type.assert_not_called()
+        assert tree["method"] == "cql"
+        assert tree["page_count"] == 3
+        root = tree["root"]
+        assert root["child_count"] == 2
+        assert [child["id"] for child in root["children"]] == ["2", "3"]
+        page_2 = root["children"][0]
+        assert [child["id"] for child in page_2["children"]] == ["4"]
+        # Page 4 sits at max_depth: counted but not expanded
+        assert page_2["children"][0]["child_count"] == 1
+        assert page_2["children"][0]["children"] == []
+
+    def test_get_page_tree_walks_children_for_large_subtrees(self, pages_mixin):
+        """Subtrees above max_pages are listed level by level up to the limit."""
+        pages_mixin.confluence.get_page_by_id.return_value = self._tree_page("1")
+        pages_mixin.confluence.get.return_value = {"results": [], "totalSize": 5000}
+        children = {
+            "1": [self._tree_page("2"), self._tree_page("3")],
+            "2": [self._tree_page("4"), self._tree_page("5")],
+            "3": [self._tree_page("6")],
+        }
+        pages_mixin.confluence.get_page_child_by_type.side_effect = (
+            lambda page_id, **kwargs: children.get(page_id, [])
+        )
+
+        tree = pages_mixin.get_page_tree("1", max_depth=3, max_pages=4)
+
+        assert tree["method"] == "children"
+        assert tree["truncated"] is True
+        assert tree["page_count"] == 4
+        root = tree["root"]
+        assert [child["id"] for child in root["children"]] == ["2", "3"]
+        assert [child["id"] for child in root["children"][0]["children"]] == [
+            "4",
+            "5",
+        ]
+        assert root["children"][1]["child_count"] == 1
+        assert root["children"][1]["children"] == []
+
+    def test_get_page_tree_one_level_skips_search(self, pages_mixin):
+        """max_depth=1 only lists the root's children."""
+        pages_mixin.confluence.get_page_by_id.return_value = self._tree_page("1")
+        pages_mixin.confluence.get_page_child_by_type.return_value = [
+            self._tree_page("2")
+        ]
+
+        tree = pages_mixin.get_page_tree("1", max_depth=1)
+
+        pages_mixin.confluence.get.assert_not_called()
+        assert tree["truncated"] is False
+        assert tree["root"]["children"][0]["child_count"] is None
+
+    def test_get_page_tree_rejects_non_numeric_ids(self, pages_mixin):
+        with pytest.raises(ValueError, match="Invalid page ID"):
+            pages_mixin.get_page_tree("1 OR ancestor = 2")
+
     def test_get_page_success(self, pages_mixin):
         """Test successful page retrieval."""
         # Setup
@@ -763,6 +947,61 @@ class TestPagesMixin:
                 always_update=True,
             )
 
+    def test_update_page_builds_result_from_response(self, pages_mixin):
+        """The update response and the markdown input make up the result."""
+        page_id = "987654321"
+        markdown_body = "# Updated\n\nNew *content*."
+        pages_mixin.confluence.update_page.return_value = {
+            "id": page_id,
+            "title": "Updated Page",
+            "space": {"key": "PROJ", "name": "Project"},
+            "version": {"number": 8},
+        }
+
+        with patch.object(pages_mixin, "get_page_content") as mock_get_page_content:
+            result = pages_mixin.update_page(page_id, "Updated Page", markdown_body)
+
+        mock_get_page_content.assert_not_called()
+        pages_mixin.preprocessor.process_html_content.assert_not_called()
+        assert result.id == page_id
+        assert result.content == markdown_body
+        assert result.content_format == "markdown"
+        assert result.version.number == 8
+        assert result.space.key == "PROJ"
+
+    def test_write_without_content(self, pages_mixin):
+        """return_content=False skips the conversion and leaves the content empty."""
+        pages_mixin.confluence.update_page.return_value = {
+            "id": "987654321",
+            "title": "Updated Page",
+            "space": {"key": "PROJ", "name": "Project"},
+            "version": {"number": 3},
+        }
+
+        with patch.object(pages_mixin, "get_page_content") as mock_get_page_content:
+            updated = pages_mixin.update_page(
+                "987654321",
+                "Updated Page",
+                "<p>Body</p>",
+                is_markdown=False,
+                return_content=False,
+            )
+            created = pages_mixin.create_page(
+                "PROJ",
+                "New Page",
+                "<p>Body</p>",
+                is_markdown=False,
+                return_content=False,
+            )
+
+        mock_get_page_content.assert_not_called()
+        pages_mixin.preprocessor.process_html_content.assert_not_called()
+        assert updated.content == ""
+        assert updated.version.number == 3
+        assert updated.url.endswith("/pages/987654321")
+        assert created.id == "123456789"
+        assert created.content == ""
+
     def test_update_page_with_parent_id(self, pages_mixin):
         """Test updating a page and changing its parent."""
         # Arrange
@@ -816,34 +1055,29 @@ class TestPagesMixin:
         space_key = "PROJ"
         title = "New V1 Test Page"
         body = "<p>Test content for V1</p>"
+        pages_mixin.confluence.create_page.return_value = {
+            "id": "v1_123456789",
+            "title": title,
+            "space": {"key": space_key, "name": "Project"},
+            "version": {"number": 1},
+        }
 
-        # Mock get_page_content to return a ConfluencePage
-        with patch.object(
-            pages_mixin,
-            "get_page_content",
-            return_value=ConfluencePage(
-                id="v1_123456789",
-                title=title,
-                content="V1 page content",
-                space={"key": space_key, "name": "Project"},
-            ),
-        ):
-            # Act
-            result = pages_mixin.create_page(space_key, title, body, is_markdown=False)
+        # Act
+        result = pages_mixin.create_page(space_key, title, body, is_markdown=False)
 
-            # Assert that v1 API was used
-            pages_mixin.confluence.create_page.assert_called_once_with(
-                space=space_key,
-                title=title,
-                body=body,
-                parent_id=None,
-                representation="storage",
-            )
+        # Assert that v1 API was used
+        pages_mixin.confluence.create_page.assert_called_once_with(
+            space=space_key,
+            title=title,
+            body=body,
+            parent_id=None,
+            representation="storage",
+        )
 
-            # Verify result is a ConfluencePage
-            assert isinstance(result, ConfluencePage)
-            assert result.id == "v1_123456789"
-            assert result.title == title
+        # Verify result is a ConfluencePage
+        assert isinstance(result, ConfluencePage)
+        assert result.id == "v1_123456789"
+        assert result.title == title
 
 
 class TestPagesOAuthMixin:
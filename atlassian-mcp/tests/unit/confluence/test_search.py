@@ -268,6 +268,145 @@ class TestSearchMixin:
         assert isinstance(results, list)
         assert len(results) == 0
 
+    @staticmethod
+    def _hits(*page_ids):
+        return [
+            {
+                "content": {"id": page_id, "type": "page", "title": f"Page {page_id}"},
+                "excerpt": f"excerpt {page_id}",
+            }
+            for page_id in page_ids
+        ]
+
+    def test_search_page_follows_next_links(self, search_mixin):
+        """Short result pages are topped up from the cursor in _links.next."""
+        search_mixin.config.spaces_filter = None
+        search_mixin.confluence.cql.return_value = {
+            "results": self._hits("1", "2"),
+            "start": 0,
+            "size": 2,
+            "_links": {"next": "/rest/api/search?cql=type%3Dpage&cursor=c1&limit=2"},
+        }
+        search_mixin.confluence.get.return_value = {
+            "results": self._hits("3", "4", "5"),
+            "start": 2,
+            "size": 3,
+            "_links": {"next": "/rest/api/search?cql=type%3Dpage&cursor=c2&start=5"},
+        }
+
+        result = search_mixin.search_page("type=page", limit=5)
+
+        search_mixin.confluence.get.assert_called_once_with(
+            "rest/api/search",
+            params={"cql": "type=page", "limit": 3, "start": 2, "cursor": "c1"},
+        )
+        assert [page.id for page in result.results] == ["1", "2", "3", "4", "5"]
+        assert result.next_page_token
+
+        # The token resumes at the position of the last next link
+        search_mixin.confluence.get.reset_mock()
+        search_mixin.confluence.get.return_value = {
+            "results": self._hits("6"),
+            "start": 5,
+            "size": 1,
+        }
+        last = search_mixin.search_page(
+            "type=page", limit=5, page_token=result.next_page_token
+        )
+
+        search_mixin.confluence.get.assert_called_once_with(
+            "rest/api/search",
+            params={"cql": "type=page", "limit": 5, "start": 5, "cursor": "c2"},
+        )
+        assert [page.id for page in last.results] == ["6"]
+        assert last.next_page_token is None
+
+    def test_search_page_uses_total_size_without_next_link(self, search_mixin):
+        """Server responses without a next link continue from the offset."""
+        search_mixin.config.spaces_filter = None
+        search_mixin.confluence.cql.return_value = {
+            "results": self._hits("1", "2"),
+            "start": 0,
+            "size": 2,
+            "totalSize": 3,
+        }
+
+        result = search_mixin.search_page("type=page", limit=2)
+
+        search_mixin.confluence.get.return_value = {
+            "results": self._hits("3"),
+            "start": 2,
+            "size": 1,
+            "totalSize": 3,
+        }
+        last = search_mixin.search_page(
+            "type=page", limit=2, page_token=result.next_page_token
+        )
+        search_mixin.confluence.get.assert_called_once_with(
+            "rest/api/search", params={"cql": "type=page", "limit": 2, "start": 2}
+        )
+        assert last.next_page_token is None
+
+    @pytest.mark.parametrize(
+        "token", ["not-a-token", "eyJjcWwiOiJvdGhlciIsInN0YXJ0IjoyfQ"]
+    )
+    def test_search_page_rejects_foreign_tokens(self, search_mixin, token):
+        """Malformed tokens and tokens of another query are refused."""
+        search_mixin.config.spaces_filter = None
+
+        with pytest.raises(ValueError, match="page_token"):
+            search_mixin.search_page("type=page", page_token=token)
+        search_mixin.confluence.get.assert_not_called()
+
+    @pytest.mark.parametrize("status_code", [401, 403])
+    def test_search_page_auth_errors_match_search(self, search_mixin, status_code):
+        """search_page and search report authentication failures identically."""
+        mock_response = MagicMock()
+        mock_response.status_code = status_code
+        http_error = HTTPError(f"HTTP {status_code}")
+        http_error.response = mock_response
+        search_mixin.confluence.cql.side_effect = http_error
+
+        with pytest.raises(MCPAtlassianAuthenticationError) as page_error:
+            search_mixin.search_page("type=page")
+        with pytest.raises(MCPAtlassianAuthenticationError) as search_error:
+            search_mixin.search("type=page")
+
+        assert str(page_error.value) == str(search_error.value)
+        assert f"Confluence API ({status_code})" in str(page_error.value)
+
+    def test_search_page_includes_content_of_top_hits(self, search_mixin):
+        """The first include_content hits carry their converted page content."""
+        search_mixin.config.spaces_filter = None
+        search_mixin.confluence.cql.return_value = {
+            "results": self._hits("1", "2", "3")
+        }
+        search_mixin.preprocessor.process_html_content.side_effect = lambda html, **_: (
+            html,
+            html,
+        )
+
+        def get_page_content(page_id):
+            if page_id == "2":
+                raise Exception("gone")
+            return MagicMock(content=f"full {page_id}", content_format="markdown")
+
+        search_mixin.get_page_content = MagicMock(side_effect=get_page_content)
+
+        result = search_mixin.search_page("type=page", include_content=2)
+
+        assert sorted(
+            c.args[0] for c in search_mixin.get_page_content.call_args_list
+        ) == [
+            "1",
+            "2",
+        ]
+        assert [page.content for page in result.results] == [
+            "full 1",
+            "excerpt 2",
+            "excerpt 3",
+        ]
+
     def test_search_user_success(self, search_mixin):
         """Test search_user with successful results."""
         # Prepare the mock response
@@ -7,6 +7,7 @@ import requests
 from requests.exceptions import HTTPError
 
 from mcp_atlassian.confluence.v2_adapter import ConfluenceV2Adapter
+from mcp_atlassian.utils.cache import confluence_page_tag, invalidate_tags
 
 
 class TestConfluenceV2Adapter:
@@ -135,3 +136,115 @@ class TestConfluenceV2Adapter:
 
         # Verify we still get a result
         assert result["id"] == "123456"
+
+    @staticmethod
+    def _response(payload, status_code=200):
+        response = Mock()
+        response.status_code = status_code
+        response.json.return_value = payload
+        if status_code >= 400:
+            response.raise_for_status.side_effect = HTTPError(response=response)
+        return response
+
+    def test_space_ids_are_cached_in_both_directions(self, v2_adapter, mock_session):
+        """A space key lookup also answers later ID-to-key lookups."""
+        mock_session.get.return_value = self._response(
+            {"results": [{"id": "789", "key": "TEST"}]}
+        )
+        mock_session.post.return_value = self._response(
+            {"id": "1", "spaceId": "789", "version": {"number": 1}}
+        )
+
+        v2_adapter.create_page(space_key="TEST", title="A", body="<p>a</p>")
+        v2_adapter.create_page(space_key="TEST", title="B", body="<p>b</p>")
+        other_adapter = ConfluenceV2Adapter(
+            session=mock_session, base_url="https://example.atlassian.net/wiki"
+        )
+
+        assert other_adapter._get_space_key_from_id("789") == "TEST"
+        assert mock_session.get.call_count == 1
+        assert mock_session.post.call_count == 2
+
+    def test_update_uses_version_from_last_read(self, v2_adapter, mock_session):
+        """After a read, an update is a single PUT built on the read version."""
+        mock_session.get.side_effect = [
+            self._response(
+                {"id": "123", "spaceId": "789", "version": {"number": 4}, "body": {}}
+            ),
+            self._response({"key": "TEST"}),
+        ]
+        mock_session.put.return_value = self._response(
+            {"id": "123", "spaceId": "789", "title": "T", "version": {"number": 5}}
+        )
+        v2_adapter.get_page("123")
+
+        result = v2_adapter.update_page(page_id="123", title="T", body="<p>x</p>")
+
+        assert mock_session.get.call_count == 2  # Only the read itself
+        assert mock_session.put.call_args.kwargs["json"]["version"]["number"] == 5
+        assert result["space"]["key"] == "TEST"
+        assert result["version"]["number"] == 5
+
+    def test_consecutive_updates_do_not_look_up_the_version_again(
+        self, v2_adapter, mock_session
+    ):
+        """The page tag a write drops afterwards does not drop its version."""
+        mock_session.get.side_effect = [
+            self._response({"version": {"number": 2}}),
+            self._response({"key": "TEST"}),
+        ]
+        mock_session.put.side_effect = [
+            self._response({"id": "123", "spaceId": "789", "version": {"number": 3}}),
+            self._response({"id": "123", "spaceId": "789", "version": {"number": 4}}),
+        ]
+
+        for _ in range(2):
+            v2_adapter.update_page(page_id="123", title="T", body="<p>x</p>")
+            # What PagesMixin.update_page does after every write
+            invalidate_tags([confluence_page_tag("123")])
+
+        assert mock_session.get.call_count == 2  # Version and space, first time only
+        assert mock_session.put.call_args.kwargs["json"]["version"]["number"] == 4
+
+    def test_update_retries_once_on_version_conflict(self, v2_adapter, mock_session):
+        """A stale cached version is refreshed after a 409 and the PUT retried."""
+        v2_adapter._remember_page_version("123", 4)
+        v2_adapter._remember_space("TEST", "789")
+        mock_session.get.return_value = self._response({"version": {"number": 6}})
+        responses = iter(
+            [
+                self._response({"message": "Version conflict"}, status_code=409),
+                self._response(
+                    {"id": "123", "spaceId": "789", "version": {"number": 7}}
+                ),
+            ]
+        )
+        versions = []
+
+        def put(url, json):
+            versions.append(json["version"]["number"])
+            return next(responses)
+
+        mock_session.put.side_effect = put
+
+        result = v2_adapter.update_page(page_id="123", title="T", body="<p>x</p>")
+
+        assert versions == [5, 7]
+        mock_session.get.assert_called_once_with(
+            "https://example.atlassian.net/wiki/api/v2/pages/123"
+        )
+        assert result["version"]["number"] == 7
+
+    def test_update_without_known_version_looks_it_up(self, v2_adapter, mock_session):
+        """Without a tracked version the current one is fetched first."""
+        mock_session.get.side_effect = [
+            self._response({"version": {"number": 2}}),
+            self._response({"key": "TEST"}),
+        ]
+        mock_session.put.return_value = self._response(
+            {"id": "123", "spaceId": "789", "version": {"number": 3}}
+        )
+
+        v2_adapter.update_page(page_id="123", title="T", body="<p>x</p>")
+
+        assert mock_session.put.call_args.kwargs["json"]["version"]["number"] == 3
@@ -1,11 +1,13 @@
 """Tests for the Jira attachments module."""
 
+import threading
+import time
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
 from mcp_atlassian.jira import JiraFetcher
-from mcp_atlassian.jira.attachments import AttachmentsMixin
+from mcp_atlassian.jira.attachments import AttachmentsMixin, MultipartFileStream
 
 # Test scenarios for AttachmentsMixin
 #
@@ -44,6 +46,11 @@ from mcp_atlassian.jira.attachments import AttachmentsMixin
 #    - Error cases:
 #      - Empty list of file paths
 #      - No issue key provided
+#    - Concurrency: uploads run in parallel up to the configured cap
+#    - Batching: several files are sent in one multipart request
+#
+# 5. Streaming multipart body (MultipartFileStream):
+#    - Encodes every file as a "file" part with the advertised length
 
 
 class TestAttachmentsMixin:
@@ -452,7 +459,9 @@ class TestAttachmentsMixin:
             "filename": "test_file.txt",
             "size": 100,
         }
-        attachments_mixin.jira.add_attachment.return_value = mock_attachment_response
+        attachments_mixin.jira._session.post.return_value.json.return_value = [
+            mock_attachment_response
+        ]
 
         # Mock file operations
         with (
@@ -461,7 +470,6 @@ class TestAttachmentsMixin:
             patch("os.path.isabs") as mock_isabs,
             patch("os.path.abspath") as mock_abspath,
             patch("os.path.basename") as mock_basename,
-            patch("builtins.open", mock_open(read_data=b"test content")),
         ):
             mock_exists.return_value = True
             mock_getsize.return_value = 100
@@ -480,9 +488,10 @@ class TestAttachmentsMixin:
             assert result["filename"] == "test_file.txt"
             assert result["size"] == 100
             assert result["id"] == "12345"
-            attachments_mixin.jira.add_attachment.assert_called_once_with(
-                issue_key="TEST-123", filename="/absolute/path/test_file.txt"
-            )
+            attachments_mixin.jira._session.post.assert_called_once()
+            _, post_kwargs = attachments_mixin.jira._session.post.call_args
+            assert post_kwargs["headers"]["X-Atlassian-Token"] == "no-check"
+            assert isinstance(post_kwargs["data"], MultipartFileStream)
 
     def test_upload_attachment_relative_path(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with a relative path."""
@@ -492,7 +501,9 @@ class TestAttachmentsMixin:
             "filename": "test_file.txt",
             "size": 100,
         }
-        attachments_mixin.jira.add_attachment.return_value = mock_attachment_response
+        attachments_mixin.jira._session.post.return_value.json.return_value = [
+            mock_attachment_response
+        ]
 
         # Mock file operations
         with (
@@ -501,7 +512,6 @@ class TestAttachmentsMixin:
             patch("os.path.isabs") as mock_isabs,
             patch("os.path.abspath") as mock_abspath,
             patch("os.path.basename") as mock_basename,
-            patch("builtins.open", mock_open(read_data=b"test content")),
         ):
             mock_exists.return_value = True
             mock_getsize.return_value = 100
@@ -516,9 +526,10 @@ class TestAttachmentsMixin:
             assert result["success"] is True
             mock_isabs.assert_called_once_with("test_file.txt")
             mock_abspath.assert_called_once_with("test_file.txt")
-            attachments_mixin.jira.add_attachment.assert_called_once_with(
-                issue_key="TEST-123", filename="/absolute/path/test_file.txt"
-            )
+            attachments_mixin.jira._session.post.assert_called_once()
+            _, post_kwargs = attachments_mixin.jira._session.post.call_args
+            assert post_kwargs["headers"]["X-Atlassian-Token"] == "no-check"
+            assert isinstance(post_kwargs["data"], MultipartFileStream)
 
     def test_upload_attachment_no_issue_key(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with no issue key."""
@@ -527,7 +538,7 @@ class TestAttachmentsMixin:
         # Assertions
         assert result["success"] is False
         assert "No issue key provided" in result["error"]
-        attachments_mixin.jira.add_attachment.assert_not_called()
+        attachments_mixin.jira._session.post.assert_not_called()
 
     def test_upload_attachment_no_file_path(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with no file path."""
@@ -536,7 +547,7 @@ class TestAttachmentsMixin:
         # Assertions
         assert result["success"] is False
         assert "No file path provided" in result["error"]
-        attachments_mixin.jira.add_attachment.assert_not_called()
+        attachments_mixin.jira._session.post.assert_not_called()
 
     def test_upload_attachment_file_not_found(
         self, attachments_mixin: AttachmentsMixin
@@ -547,7 +558,6 @@ class TestAttachmentsMixin:
             patch("os.path.exists") as mock_exists,
             patch("os.path.isabs") as mock_isabs,
             patch("os.path.abspath") as mock_abspath,
-            patch("builtins.open", mock_open(read_data=b"test content")),
         ):
             mock_exists.return_value = False
             mock_isabs.return_value = True
@@ -560,20 +570,20 @@ class TestAttachmentsMixin:
             # Assertions
             assert result["success"] is False
             assert "File not found" in result["error"]
-            attachments_mixin.jira.add_attachment.assert_not_called()
+            attachments_mixin.jira._session.post.assert_not_called()
 
     def test_upload_attachment_api_error(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with an API error."""
         # Mock the Jira API to raise an exception
-        attachments_mixin.jira.add_attachment.side_effect = Exception("API Error")
+        attachments_mixin.jira._session.post.side_effect = Exception("API Error")
 
         # Mock file operations
         with (
             patch("os.path.exists") as mock_exists,
+            patch("os.path.getsize", return_value=100),
             patch("os.path.isabs") as mock_isabs,
             patch("os.path.abspath") as mock_abspath,
             patch("os.path.basename") as mock_basename,
-            patch("builtins.open", mock_open(read_data=b"test content")),
         ):
             mock_exists.return_value = True
             mock_isabs.return_value = True
@@ -590,16 +600,16 @@ class TestAttachmentsMixin:
 
     def test_upload_attachment_no_response(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload when API returns no response."""
-        # Mock the Jira API to return None
-        attachments_mixin.jira.add_attachment.return_value = None
+        # Mock the Jira API to return no attachments
+        attachments_mixin.jira._session.post.return_value.json.return_value = []
 
         # Mock file operations
         with (
             patch("os.path.exists") as mock_exists,
+            patch("os.path.getsize", return_value=100),
             patch("os.path.isabs") as mock_isabs,
             patch("os.path.abspath") as mock_abspath,
             patch("os.path.basename") as mock_basename,
-            patch("builtins.open", mock_open(read_data=b"test content")),
         ):
             mock_exists.return_value = True
             mock_isabs.return_value = True
@@ -637,8 +647,12 @@ class TestAttachmentsMixin:
             for i, ext in enumerate(["txt", "pdf", "jpg"])
         ]
 
+        results_by_path = dict(zip(file_paths, mock_results, strict=True))
+
         with patch.object(
-            attachments_mixin, "upload_attachment", side_effect=mock_results
+            attachments_mixin,
+            "upload_attachment",
+            side_effect=lambda _key, path: results_by_path[path],
         ) as mock_upload:
             # Call the method
             result = attachments_mixin.upload_attachments("TEST-123", file_paths)
@@ -697,8 +711,12 @@ class TestAttachmentsMixin:
             },
         ]
 
+        results_by_path = dict(zip(file_paths, mock_results, strict=True))
+
         with patch.object(
-            attachments_mixin, "upload_attachment", side_effect=mock_results
+            attachments_mixin,
+            "upload_attachment",
+            side_effect=lambda _key, path: results_by_path[path],
         ) as mock_upload:
             # Call the method
             result = attachments_mixin.upload_attachments("TEST-123", file_paths)
@@ -727,6 +745,13 @@ class TestAttachmentsMixin:
             assert result["failed"][0]["filename"] == "file2.pdf"
             assert "File not found" in result["failed"][0]["error"]
 
+            # Verify per-file status is reported in input order
+            assert [r["status"] for r in result["results"]] == [
+                "uploaded",
+                "failed",
+                "uploaded",
+            ]
+
     def test_upload_attachments_empty_list(self, attachments_mixin: AttachmentsMixin):
         """Test upload with an empty list of file paths."""
         # Call the method with an empty list
@@ -744,3 +769,110 @@ class TestAttachmentsMixin:
         # Assertions
         assert result["success"] is False
         assert "No issue key provided" in result["error"]
+
+    def test_upload_attachments_runs_concurrently(
+        self, attachments_mixin: AttachmentsMixin
+    ):
+        """Test that uploads overlap up to the configured concurrency cap."""
+        file_paths = [f"/path/to/file{i}.txt" for i in range(6)]
+        attachments_mixin.config.attachment_upload_concurrency = 3
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def fake_upload(issue_key: str, path: str) -> dict:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return {"success": True, "filename": path.rsplit("/", 1)[-1], "id": path}
+
+        with patch.object(
+            attachments_mixin, "upload_attachment", side_effect=fake_upload
+        ):
+            result = attachments_mixin.upload_attachments("TEST-123", file_paths)
+
+        assert len(result["uploaded"]) == 6
+        assert [r["id"] for r in result["results"]] == file_paths
+        assert 1 < peak <= 3
+
+    def test_upload_attachments_batches_files(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test that files are grouped into multipart requests by batch size."""
+        file_paths = []
+        for i in range(5):
+            path = tmp_path / f"artifact{i}.log"
+            path.write_bytes(b"x" * (i + 1))
+            file_paths.append(str(path))
+        missing = str(tmp_path / "missing.log")
+
+        def fake_post(url, data, **kwargs):
+            response = MagicMock()
+            part_count = data.read().count(b'name="file"')
+            response.json.return_value = [
+                {"id": f"{id(data)}-{i}", "size": 1} for i in range(part_count)
+            ]
+            return response
+
+        attachments_mixin.jira._session.post.side_effect = fake_post
+
+        result = attachments_mixin.upload_attachments(
+            "TEST-123", [*file_paths, missing], batch_size=2
+        )
+
+        assert attachments_mixin.jira._session.post.call_count == 3
+        assert len(result["uploaded"]) == 5
+        assert result["failed"] == [
+            {"filename": "missing.log", "error": f"File not found: {missing}"}
+        ]
+        assert [r["status"] for r in result["results"]] == [
+            "uploaded",
+            "uploaded",
+            "uploaded",
+            "uploaded",
+            "uploaded",
+            "failed",
+        ]
+
+    def test_upload_attachments_batch_failure_marks_all_files(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test that a failed multipart batch reports every file in it."""
+        file_paths = []
+        for i in range(2):
+            path = tmp_path / f"artifact{i}.log"
+            path.write_bytes(b"data")
+            file_paths.append(str(path))
+        attachments_mixin.jira._session.post.side_effect = Exception("413 Too Large")
+
+        result = attachments_mixin.upload_attachments(
+            "TEST-123", file_paths, batch_size=2
+        )
+
+        assert len(result["failed"]) == 2
+        assert all("413" in entry["error"] for entry in result["failed"])
+
+    # Tests for MultipartFileStream
+
+    def test_multipart_file_stream_encoding(self, tmp_path):
+        """Test the streamed multipart body layout and advertised length."""
+        first = tmp_path / 'report "final".txt'
+        first.write_bytes(b"hello")
+        second = tmp_path / "image.png"
+        second.write_bytes(b"\x89PNG" * 10_000)
+
+        stream = MultipartFileStream([str(first), str(second)])
+        chunks = list(stream)
+        body = b"".join(chunks)
+
+        assert len(body) == stream.len == len(stream)
+        assert stream.content_type.endswith(stream.boundary)
+        assert body.count(b'name="file"') == 2
+        assert b'filename="report %22final%22.txt"' in body
+        assert b"Content-Type: image/png" in body
+        assert b"\r\nhello\r\n" in body
+        assert body.endswith(f"--{stream.boundary}--\r\n".encode())
@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, call, patch
 
 import pytest
 
-from mcp_atlassian.jira.client import JiraClient
+from mcp_atlassian.jira.client import AGILE_MAX_ITEMS, JiraClient
 from mcp_atlassian.jira.config import JiraConfig
 
 
@@ -101,6 +101,9 @@ def test_init_from_env():
         patch("mcp_atlassian.jira.config.JiraConfig.from_env") as mock_from_env,
         patch("mcp_atlassian.jira.client.Jira") as mock_jira,
         patch("mcp_atlassian.jira.client.configure_ssl_verification"),
+        patch("mcp_atlassian.jira.client.configure_connection_pool"),
+        patch("mcp_atlassian.jira.client.configure_rate_limiting"),
+        patch("mcp_atlassian.jira.client.configure_request_coalescing"),
     ):
         mock_config = MagicMock()
         mock_config.auth_type = "basic"  # needed for the if condition
@@ -237,6 +240,84 @@ def test_get_paged_without_cloud():
             client.get_paged("get", "/test/url")
 
 
+def _offset_listing(total, server_page_size=None, with_total=True):
+    """Return a fake (startAt, maxResults) page fetcher over `total` items."""
+    calls = []
+
+    def fetch_page(start, limit):
+        calls.append((start, limit))
+        size = min(limit, server_page_size or limit)
+        values = list(range(start, min(start + size, total)))
+        page = {"startAt": start, "maxResults": size, "values": values}
+        if with_total:
+            page["total"] = total
+        else:
+            page["isLast"] = start + size >= total
+        return page
+
+    return fetch_page, calls
+
+
+@pytest.fixture
+def offset_client():
+    with patch("mcp_atlassian.jira.client.configure_ssl_verification"):
+        return JiraClient(
+            config=JiraConfig(
+                url="https://jira.example.com",
+                auth_type="pat",
+                personal_token="test_token",
+            )
+        )
+
+
+def test_get_offset_paged_fetches_remaining_pages(offset_client):
+    """Pages after the first are computed from the total and merged in order."""
+    fetch_page, calls = _offset_listing(total=120)
+
+    result = offset_client.get_offset_paged(fetch_page, start=0, limit=500)
+
+    assert result["values"] == list(range(120))
+    assert result["total"] == 120
+    assert result["startAt"] == 0
+    assert sorted(calls) == [(0, 50), (50, 50), (100, 20)]
+
+
+def test_get_offset_paged_uses_server_page_size(offset_client):
+    """A site capping maxResults below the request still returns every item."""
+    fetch_page, calls = _offset_listing(total=75, server_page_size=25)
+
+    result = offset_client.get_offset_paged(fetch_page, start=10, limit=60)
+
+    assert result["values"] == list(range(10, 70))
+    assert sorted(start for start, _ in calls) == [10, 35, 60]
+
+
+def test_get_offset_paged_follows_is_last_without_total(offset_client):
+    """Listings without a total are followed sequentially until isLast."""
+    fetch_page, calls = _offset_listing(total=110, with_total=False)
+
+    result = offset_client.get_offset_paged(fetch_page, limit=1000)
+
+    assert result["values"] == list(range(110))
+    assert result["isLast"] is True
+    assert calls == [(0, 50), (50, 50), (100, 50)]
+
+
+def test_get_offset_paged_caps_items(offset_client):
+    """Listings never return more than AGILE_MAX_ITEMS items."""
+    fetch_page, _ = _offset_listing(total=5000)
+
+    result = offset_client.get_offset_paged(fetch_page, limit=10_000)
+
+    assert len(result["values"]) == AGILE_MAX_ITEMS
+
+
+def test_iter_offset_pages_rejects_non_dict_pages(offset_client):
+    """A non-JSON-object page raises TypeError."""
+    with pytest.raises(TypeError):
+        list(offset_client.iter_offset_pages(lambda start, limit: "not a dict"))
+
+
 def test_init_sets_proxies_and_no_proxy(monkeypatch):
     """Test that JiraClient sets session proxies and NO_PROXY env var from config."""
     # Patch Jira and its _session
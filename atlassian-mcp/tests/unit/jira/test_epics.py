@@ -1,5 +1,6 @@
 """Tests for the Jira Epics mixin."""
 
+import time
 from unittest.mock import MagicMock, call
 
 import pytest
@@ -648,15 +649,12 @@ class TestEpicsMixin:
         # Call the method with start parameter
         result = epics_mixin.get_epic_issues("EPIC-123", start=5, limit=10)
 
-        # Verify search_issues was called with the right JQL
-        epics_mixin.search_issues.assert_called_once()
-        call_args = epics_mixin.search_issues.call_args[0]
-        assert 'issueFunction in issuesScopedToEpic("EPIC-123")' in call_args[0]
-
-        # Verify keyword arguments for start and limit
-        call_kwargs = epics_mixin.search_issues.call_args[1]
-        assert call_kwargs.get("start") == 5
-        assert call_kwargs.get("limit") == 10
+        # Verify the strategies were raced with the right JQL, start and limit
+        queries = [c.args[0] for c in epics_mixin.search_issues.call_args_list]
+        assert 'issueFunction in issuesScopedToEpic("EPIC-123")' in queries
+        for search_call in epics_mixin.search_issues.call_args_list:
+            assert search_call.kwargs.get("start") == 5
+            assert search_call.kwargs.get("limit") == 10
 
         # Verify result
         assert len(result) == 2
@@ -754,6 +752,77 @@ class TestEpicsMixin:
         assert last_call_kwargs.get("start") == 3
         assert last_call_kwargs.get("limit") == 10
 
+    def test_get_epic_issues_remembers_strategy_per_project(self, epics_mixin):
+        """The strategy that found children is tried alone on the next call."""
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "EPIC-123",
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        epics_mixin.config = MagicMock(url="https://example.atlassian.net")
+
+        class MockSearchResult:
+            def __init__(self, issues):
+                self.issues = issues
+
+        def search_side_effect(jql, **kwargs):
+            if jql.startswith("parent"):
+                return MockSearchResult([JiraIssue(key="CHILD-1", summary="Child")])
+            return MockSearchResult([])
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        first = epics_mixin.get_epic_issues("EPIC-123")
+        assert [issue.key for issue in first] == ["CHILD-1"]
+        # Heuristic strategies are not needed once a precise one succeeds
+        assert not any(
+            "issueLink" in c.args[0] for c in epics_mixin.search_issues.call_args_list
+        )
+
+        epics_mixin.search_issues.reset_mock()
+        second = epics_mixin.get_epic_issues("EPIC-456")
+
+        assert [issue.key for issue in second] == ["CHILD-1"]
+        epics_mixin.search_issues.assert_called_once()
+        assert epics_mixin.search_issues.call_args.args[0] == 'parent = "EPIC-456"'
+
+    def test_get_epic_issues_prefers_direct_children_over_descendants(
+        self, epics_mixin
+    ):
+        """Strategies finding different sets are tried in order, not raced."""
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "EPIC-123",
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        epics_mixin.config = MagicMock(url="https://example.atlassian.net")
+
+        class MockSearchResult:
+            def __init__(self, issues):
+                self.issues = issues
+
+        def search_side_effect(jql, **kwargs):
+            child = JiraIssue(key="CHILD-1", summary="Child")
+            if jql.startswith("parent"):
+                # Slower than the descendants query
+                time.sleep(0.05)
+                return MockSearchResult([child])
+            if "childIssuesOf" in jql:
+                return MockSearchResult(
+                    [child, JiraIssue(key="SUBTASK-1", summary="Sub-task")]
+                )
+            return MockSearchResult([])
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        result = epics_mixin.get_epic_issues("EPIC-123")
+
+        assert [issue.key for issue in result] == ["CHILD-1"]
+        assert not any(
+            "childIssuesOf" in c.args[0]
+            for c in epics_mixin.search_issues.call_args_list
+        )
+
     def test_get_epic_issues_api_error(self, epics_mixin: EpicsMixin):
         """Test get_epic_issues with API error."""
         # Setup mocks - simulate API error
@@ -0,0 +1,189 @@
+"""Tests for the Jira local issue mirror."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.jira.mirror import (
+    IssueMirror,
+    UnsupportedJQLError,
+    get_issue_mirror,
+    get_mirror_stats,
+    parse_jql,
+)
+from mcp_atlassian.utils.metrics import REGISTRY
+
+
+def _issue(key, status="Open", assignee=None, labels=(), updated="2024-01-02", **extra):
+    fields = {
+        "summary": extra.get("summary", f"Summary of {key}"),
+        "description": extra.get("description"),
+        "status": {"name": status},
+        "project": {"key": key.split("-")[0]},
+        "labels": list(labels),
+        "created": "2024-01-01T10:00:00.000+0000",
+        "updated": f"{updated}T10:00:00.000+0000",
+        "assignee": (
+            {"accountId": assignee, "displayName": assignee.title()}
+            if assignee
+            else None
+        ),
+    }
+    return {"id": str(abs(hash(key)) % 100000), "key": key, "fields": fields}
+
+
+ISSUES = [
+    _issue("PROJ-1", status="Done", assignee="alice", labels=["backend"]),
+    _issue("PROJ-2", status="In Progress", assignee="bob", labels=["frontend"]),
+    _issue(
+        "PROJ-3",
+        summary="Login page crashes",
+        description="Crash on submit",
+        updated="2024-02-01",
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    REGISTRY.reset()
+    yield
+    REGISTRY.reset()
+
+
+@pytest.fixture
+def mirror():
+    mirror = IssueMirror(":memory:", ["proj"], sync_interval=60, max_lag=600)
+    mirror.sync(lambda jql: ISSUES)
+    yield mirror
+    mirror.close()
+
+
+def _keys(result):
+    issues, _ = result
+    return [issue["key"] for issue in issues]
+
+
+@pytest.mark.parametrize(
+    "jql",
+    [
+        "project = PROJ OR status = Done",
+        "assignee = currentUser() AND project = PROJ",
+        "priority = High AND project = PROJ",
+        "project = PROJ ORDER BY priority DESC",
+        "updated >= startOfDay() AND project = PROJ",
+    ],
+)
+def test_parse_rejects_unsupported_jql(jql):
+    """Queries outside the supported subset are rejected."""
+    with pytest.raises(UnsupportedJQLError):
+        parse_jql(jql)
+
+
+def test_parse_collects_projects():
+    """Project clauses (including the projects filter wrapper) are tracked."""
+    query = parse_jql('(status = "Done") AND project IN ("PROJ", "OTHER")')
+    assert query.projects == {"PROJ", "OTHER"}
+    assert parse_jql("status = Done").projects is None
+
+
+@pytest.mark.parametrize(
+    ("jql", "expected"),
+    [
+        ("project = PROJ ORDER BY key ASC", ["PROJ-1", "PROJ-2", "PROJ-3"]),
+        ("project = PROJ AND status = done", ["PROJ-1"]),
+        ("project = PROJ AND status NOT IN (Done, 'In Progress')", ["PROJ-3"]),
+        ("project = PROJ AND assignee = Bob", ["PROJ-2"]),
+        ("project = PROJ AND assignee IS EMPTY", ["PROJ-3"]),
+        ("project = PROJ AND assignee != alice", ["PROJ-2"]),
+        (
+            "project = PROJ AND labels IN (backend, frontend) ORDER BY key",
+            ["PROJ-1", "PROJ-2"],
+        ),
+        ("project = PROJ AND labels != backend", ["PROJ-2"]),
+        ('project = PROJ AND updated >= "2024-01-15"', ["PROJ-3"]),
+        ('project = PROJ AND text ~ "crash submit"', ["PROJ-3"]),
+        (
+            "project = PROJ ORDER BY updated DESC, key ASC",
+            ["PROJ-3", "PROJ-1", "PROJ-2"],
+        ),
+    ],
+)
+def test_search_answers_supported_jql_locally(mirror, jql, expected):
+    """Supported queries are answered from SQLite."""
+    assert _keys(mirror.search(jql)) == expected
+
+
+def test_search_paginates(mirror):
+    """start/limit page through results while total counts all matches."""
+    issues, total = mirror.search("project = PROJ ORDER BY key", start=1, limit=1)
+    assert total == 3
+    assert [issue["key"] for issue in issues] == ["PROJ-2"]
+
+
+def test_search_falls_back_for_unmirrored_or_stale_projects(mirror):
+    """Queries must be limited to fresh, mirrored projects."""
+    assert mirror.search("status = Done") is None
+    assert mirror.search("project = OTHER") is None
+
+    mirror.max_lag = 0
+    time.sleep(0.01)
+    assert mirror.search("project = PROJ") is None
+
+    stats = get_mirror_stats()
+    assert stats["local"] == 0
+    assert stats["remote"] == 3
+
+
+def test_delta_sync_uses_updated_watermark(mirror):
+    """After the first full sync, only recently updated issues are fetched."""
+    fetch = MagicMock(return_value=[_issue("PROJ-4", status="Open")])
+
+    mirror.sync(fetch)
+
+    [jql] = [call.args[0] for call in fetch.call_args_list]
+    assert jql.startswith('project = "PROJ" AND updated >= -')
+    assert jql.endswith("m ORDER BY updated ASC")
+    assert len(mirror.search("project = PROJ")[0]) == 4
+
+
+def test_full_sync_drops_deleted_issues(monkeypatch):
+    """A full sync replaces the project, removing issues no longer returned."""
+    monkeypatch.setattr("mcp_atlassian.jira.mirror.FULL_SYNC_INTERVAL", 0)
+    mirror = IssueMirror(":memory:", ["PROJ"])
+    mirror.sync(lambda jql: ISSUES)
+
+    mirror.sync(lambda jql: [ISSUES[0], ISSUES[2]])
+
+    assert _keys(mirror.search("project = PROJ ORDER BY key")) == ["PROJ-1", "PROJ-3"]
+    mirror.forget(["PROJ-3"])
+    assert _keys(mirror.search("project = PROJ")) == ["PROJ-1"]
+    mirror.close()
+
+
+def test_search_issues_uses_mirror(jira_fetcher: JiraFetcher):
+    """search_issues answers mirrored queries without calling Jira."""
+    jira_fetcher.config = MagicMock()
+    jira_fetcher.config.is_cloud = False
+    jira_fetcher.config.projects_filter = None
+    jira_fetcher.config.url = "https://example.atlassian.net"
+    jira_fetcher.config.mirror_projects = "PROJ"
+    jira_fetcher.config.mirror_path = None
+    jira_fetcher.config.mirror_sync_interval = 60
+    jira_fetcher.config.mirror_max_lag = 600
+    jira_fetcher.jira.jql.return_value = {"issues": ISSUES, "total": 3}
+
+    # First search: mirror is empty, so Jira is queried and a sync starts
+    jira_fetcher.search_issues("project = PROJ AND status = Done")
+    mirror = get_issue_mirror(jira_fetcher.config)
+    mirror.wait_for_sync(timeout=5)
+    jira_fetcher.jira.jql.reset_mock()
+
+    result = jira_fetcher.search_issues("project = PROJ AND status = Done")
+
+    jira_fetcher.jira.jql.assert_not_called()
+    assert [issue.key for issue in result.issues] == ["PROJ-1"]
+    assert result.total == 1
+    assert get_mirror_stats()["hit_rate"] == pytest.approx(0.5)
@@ -7,9 +7,11 @@ import pytest
 
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.config import JiraConfig
-from mcp_atlassian.jira.projects import ProjectsMixin
+from mcp_atlassian.jira.projects import PROJECT_CATALOG_FETCHES, ProjectsMixin
 from mcp_atlassian.models.jira.issue import JiraIssue
 from mcp_atlassian.models.jira.search import JiraSearchResult
+from mcp_atlassian.utils.webhooks import handle_webhook
+from tests.fixtures import webhook_payloads as payloads
 
 
 @pytest.fixture
@@ -53,8 +55,8 @@ def mock_projects():
 def mock_components():
     """Fixture to return mock project components."""
     return [
-        {"id": "10000", "name": "Component One"},
-        {"id": "10001", "name": "Component Two"},
+        {"id": "10000", "name": "Component One", "projectId": 10000},
+        {"id": "10001", "name": "Component Two", "projectId": 10000},
     ]
 
 
@@ -62,8 +64,8 @@ def mock_components():
 def mock_versions():
     """Fixture to return mock project versions."""
     return [
-        {"id": "10000", "name": "1.0", "released": True},
-        {"id": "10001", "name": "2.0", "released": False},
+        {"id": "10000", "name": "1.0", "released": True, "projectId": 10000},
+        {"id": "10001", "name": "2.0", "released": False, "projectId": 10000},
     ]
 
 
@@ -235,38 +237,66 @@ def test_project_exists_exception(projects_mixin: ProjectsMixin):
     projects_mixin.jira.project.assert_called_once()
 
 
+def _json_response(data, status_code=200, etag=None):
+    """Build a mock raw response as returned by `jira.get(advanced_mode=True)`."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = data
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+@pytest.fixture
+def catalog_get(projects_mixin: ProjectsMixin) -> MagicMock:
+    """Mock for the raw GET used by the project catalog."""
+    projects_mixin.jira.resource_url.return_value = "rest/api/2/project"
+    projects_mixin.jira.default_headers = {"Accept": "application/json"}
+    return projects_mixin.jira.get
+
+
 def test_get_project_components(
-    projects_mixin: ProjectsMixin, mock_components: list[dict]
+    projects_mixin: ProjectsMixin, catalog_get: MagicMock, mock_components: list[dict]
 ):
     """Test get_project_components method."""
-    projects_mixin.jira.get_project_components.return_value = mock_components
+    catalog_get.return_value = _json_response(mock_components)
 
     result = projects_mixin.get_project_components("PROJ1")
     assert result == mock_components
-    projects_mixin.jira.get_project_components.assert_called_once_with(key="PROJ1")
+    catalog_get.assert_called_once_with(
+        "rest/api/2/project/PROJ1/components",
+        params=None,
+        headers={"Accept": "application/json"},
+        advanced_mode=True,
+    )
 
 
-def test_get_project_components_exception(projects_mixin: ProjectsMixin):
+def test_get_project_components_exception(
+    projects_mixin: ProjectsMixin, catalog_get: MagicMock
+):
     """Test get_project_components method with exception."""
-    projects_mixin.jira.get_project_components.side_effect = Exception("API error")
+    catalog_get.side_effect = Exception("API error")
 
     result = projects_mixin.get_project_components("PROJ1")
     assert result == []
-    projects_mixin.jira.get_project_components.assert_called_once()
+    catalog_get.assert_called_once()
 
 
-def test_get_project_components_non_list_response(projects_mixin: ProjectsMixin):
+def test_get_project_components_non_list_response(
+    projects_mixin: ProjectsMixin, catalog_get: MagicMock
+):
     """Test get_project_components method with non-list response."""
-    projects_mixin.jira.get_project_components.return_value = "not a list"
+    catalog_get.return_value = _json_response("not a list")
 
     result = projects_mixin.get_project_components("PROJ1")
     assert result == []
-    projects_mixin.jira.get_project_components.assert_called_once()
+    catalog_get.assert_called_once()
 
 
-def test_get_project_versions(projects_mixin: ProjectsMixin, mock_versions: list[dict]):
+def test_get_project_versions(
+    projects_mixin: ProjectsMixin, catalog_get: MagicMock, mock_versions: list[dict]
+):
     """Test get_project_versions method."""
-    projects_mixin.jira.get_project_versions.return_value = mock_versions
+    catalog_get.return_value = _json_response(mock_versions)
     # Simplified dicts should include id, name, released and archived
     expected = [
         {
@@ -279,23 +309,27 @@ def test_get_project_versions(projects_mixin: ProjectsMixin, mock_versions: list
     ]
     result = projects_mixin.get_project_versions("PROJ1")
     assert result == expected
-    projects_mixin.jira.get_project_versions.assert_called_once_with(key="PROJ1")
+    assert catalog_get.call_args.args == ("rest/api/2/project/PROJ1/versions",)
 
 
-def test_get_project_versions_exception(projects_mixin: ProjectsMixin):
+def test_get_project_versions_exception(
+    projects_mixin: ProjectsMixin, catalog_get: MagicMock
+):
     """Test get_project_versions method with exception."""
-    projects_mixin.jira.get_project_versions.side_effect = Exception("API error")
+    catalog_get.side_effect = Exception("API error")
     result = projects_mixin.get_project_versions("PROJ1")
     assert result == []
-    projects_mixin.jira.get_project_versions.assert_called_once_with(key="PROJ1")
+    assert catalog_get.call_args.args == ("rest/api/2/project/PROJ1/versions",)
 
 
-def test_get_project_versions_non_list_response(projects_mixin: ProjectsMixin):
+def test_get_project_versions_non_list_response(
+    projects_mixin: ProjectsMixin, catalog_get: MagicMock
+):
     """Test get_project_versions method with non-list response."""
-    projects_mixin.jira.get_project_versions.return_value = "not a list"
+    catalog_get.return_value = _json_response("not a list")
     result = projects_mixin.get_project_versions("PROJ1")
     assert result == []
-    projects_mixin.jira.get_project_versions.assert_called_once_with(key="PROJ1")
+    catalog_get.assert_called_once()
 
 
 def test_get_project_roles(
@@ -746,3 +780,121 @@ def test_create_project_version_error(projects_mixin: ProjectsMixin) -> None:
     ):
         with pytest.raises(Exception):
             projects_mixin.create_project_version("PROJ4", "v6.0")
+
+
+@pytest.fixture
+def catalog_mixin(jira_config_factory, mock_atlassian_jira):
+    """JiraFetcher on a Server/DC config with the catalog cache enabled."""
+    with patch("atlassian.Jira"):
+        mixin = JiraFetcher(
+            config=jira_config_factory(
+                url="https://jira.example.com", project_cache_ttl=60.0
+            )
+        )
+    mixin.jira = mock_atlassian_jira
+    mixin.jira.resource_url.return_value = "rest/api/2/project"
+    mixin.jira.default_headers = {"Accept": "application/json"}
+    return mixin
+
+
+def test_project_catalog_is_cached_until_refresh(
+    catalog_mixin: ProjectsMixin, mock_projects: list[dict]
+):
+    """Repeated reads are served from the cache; refresh goes back to Jira."""
+    catalog_mixin.jira.get.return_value = _json_response(mock_projects)
+
+    assert catalog_mixin.get_all_projects() == mock_projects
+    assert catalog_mixin.get_project_leads() == {"PROJ1": "user1", "PROJ2": "user2"}
+    assert catalog_mixin.jira.get.call_count == 1
+
+    catalog_mixin.get_all_projects(refresh=True)
+    assert catalog_mixin.jira.get.call_count == 2
+
+
+def test_project_catalog_revalidates_with_etag(
+    catalog_mixin: ProjectsMixin, mock_components: list[dict]
+):
+    """Stale entries are revalidated with If-None-Match and kept on a 304."""
+    catalog_mixin.jira.get.side_effect = [
+        _json_response(mock_components, etag='"v1"'),
+        _json_response(None, status_code=304),
+    ]
+
+    with patch("mcp_atlassian.jira.projects.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        catalog_mixin.get_project_components("PROJ1")
+        mock_time.monotonic.return_value = 1061.0
+        result = catalog_mixin.get_project_components("PROJ1")
+
+    assert result == mock_components
+    revalidation = catalog_mixin.jira.get.call_args_list[1]
+    assert revalidation.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert PROJECT_CATALOG_FETCHES.value(kind="components", result="not_modified") >= 1
+
+
+def test_project_issue_count_is_cached_and_invalidated(
+    catalog_mixin: ProjectsMixin,
+):
+    """Issue counts are cached per project and dropped on invalidation."""
+    catalog_mixin.jira.jql.return_value = {"total": 42}
+
+    assert catalog_mixin.get_project_issues_count("PROJ1") == 42
+    catalog_mixin.jira.jql.return_value = {"total": 43}
+    assert catalog_mixin.get_project_issues_count("PROJ1") == 42
+
+    assert catalog_mixin.invalidate_project_catalog("proj1") == 1
+    assert catalog_mixin.get_project_issues_count("PROJ1") == 43
+
+
+def test_version_webhook_with_project_id_drops_cached_versions(
+    catalog_mixin: ProjectsMixin, mock_versions: list[dict]
+):
+    """Version webhooks name the project by ID only and still invalidate it."""
+    catalog_mixin.jira.get.return_value = _json_response(mock_versions)
+    catalog_mixin.get_project_versions("PROJ1")
+
+    result = handle_webhook("jira", payloads.JIRA_VERSION_RELEASED)
+
+    assert result["invalidated"] == 1
+    catalog_mixin.get_project_versions("PROJ1")
+    assert catalog_mixin.jira.get.call_count == 2
+
+
+def test_issue_count_is_tagged_with_project_id_from_project_list(
+    catalog_mixin: ProjectsMixin, mock_projects: list[dict]
+):
+    """Entries without projectId in their data look the ID up in the project list."""
+    catalog_mixin.jira.get.return_value = _json_response(mock_projects)
+    catalog_mixin.jira.jql.return_value = {"total": 42}
+    catalog_mixin.get_project_issues_count("PROJ1")
+
+    result = handle_webhook(
+        "jira",
+        {"webhookEvent": "component_created", "component": {"projectId": 10000}},
+    )
+
+    assert result["invalidated"] == 1
+    catalog_mixin.get_project_issues_count("PROJ1")
+    assert catalog_mixin.jira.jql.call_count == 2
+
+
+def test_failed_accessible_project_lookups_are_not_cached(
+    catalog_mixin: ProjectsMixin, mock_projects: list[dict]
+):
+    """A failed project list or permission check is retried on the next call."""
+    browse = catalog_mixin.jira.get_users_with_browse_permission_to_a_project
+    catalog_mixin.jira.get.side_effect = [
+        Exception("Jira unavailable"),
+        _json_response(mock_projects),
+    ]
+    browse.side_effect = [[{"name": "test_user"}], Exception("Permission error")]
+
+    assert catalog_mixin.get_user_accessible_projects("test_user") == []
+    partial = catalog_mixin.get_user_accessible_projects("test_user")
+    assert [project["key"] for project in partial] == ["PROJ1"]
+
+    browse.side_effect = [[{"name": "test_user"}], [{"name": "test_user"}]]
+    result = catalog_mixin.get_user_accessible_projects("test_user")
+    assert [project["key"] for project in result] == ["PROJ1", "PROJ2"]
+    assert catalog_mixin.get_user_accessible_projects("test_user") == result
+    assert browse.call_count == 4
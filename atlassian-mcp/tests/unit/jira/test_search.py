@@ -505,6 +505,32 @@ class TestSearchMixin:
             search_mixin.get_board_issues("1000", jql="", limit=20)
         assert "API Error content" in str(e.value)
 
+    def test_get_board_issues_fetches_all_pages(self, search_mixin: SearchMixin):
+        """Board issues beyond the first page are fetched and merged."""
+
+        def board_page(**kwargs):
+            start, limit = kwargs["start"], kwargs["limit"]
+            keys = range(start, min(start + limit, 120))
+            return {
+                "issues": [
+                    {"id": str(10000 + i), "key": f"TEST-{i}", "fields": {}}
+                    for i in keys
+                ],
+                "total": 120,
+                "startAt": start,
+                "maxResults": limit,
+            }
+
+        search_mixin.jira.get_issues_for_board.side_effect = board_page
+
+        result = search_mixin.get_board_issues("1000", jql="", limit=200)
+
+        assert [issue.key for issue in result.issues] == [
+            f"TEST-{i}" for i in range(120)
+        ]
+        assert result.total == 120
+        assert search_mixin.jira.get_issues_for_board.call_count == 3
+
     def test_get_sprint_issues(self, search_mixin: SearchMixin):
         """Test get_sprint_issues method."""
         mock_issues = {
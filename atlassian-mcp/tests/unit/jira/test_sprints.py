@@ -115,6 +115,26 @@ def test_get_all_sprints_from_board_non_dict_response(sprints_mixin):
     sprints_mixin.jira.get_all_sprints_from_board.assert_called_once()
 
 
+def test_get_all_sprints_from_board_follows_pages(sprints_mixin, mock_sprints):
+    """Boards with more sprints than one page are followed until isLast."""
+    first = {**mock_sprints, "maxResults": 2, "isLast": False}
+    first["values"] = mock_sprints["values"][:2]
+    last = {**mock_sprints, "startAt": 2, "maxResults": 2, "isLast": True}
+    last["values"] = mock_sprints["values"][2:]
+    sprints_mixin.jira.get_all_sprints_from_board.side_effect = [first, last]
+
+    result = sprints_mixin.get_all_sprints_from_board("1000", state="closed", limit=10)
+
+    assert result == mock_sprints["values"]
+    second_call = sprints_mixin.jira.get_all_sprints_from_board.call_args_list[1]
+    assert second_call.kwargs == {
+        "board_id": "1000",
+        "state": "closed",
+        "start": 2,
+        "limit": 2,
+    }
+
+
 def test_get_all_sprints_from_board_model(sprints_mixin, mock_sprints):
     sprints_mixin.jira.get_all_sprints_from_board.return_value = mock_sprints
 
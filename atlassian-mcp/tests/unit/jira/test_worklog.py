@@ -353,3 +353,196 @@ class TestWorklogMixin:
         # Verify post was still called (worklog added despite estimate error)
         worklog_mixin.jira.post.assert_called_once()
         assert result["original_estimate_updated"] is False
+
+
+class TestAggregateWorklogs:
+    """Tests for WorklogMixin.aggregate_worklogs."""
+
+    ISSUES = [
+        {"id": "1", "key": "TEST-1", "fields": {"summary": "First"}},
+        {"id": "2", "key": "TEST-2", "fields": {"summary": "Second"}},
+    ]
+
+    @staticmethod
+    def _worklog(issue_id, author, started, seconds):
+        return {
+            "issueId": issue_id,
+            "author": {"accountId": author, "displayName": author.title()},
+            "started": started,
+            "timeSpentSeconds": seconds,
+        }
+
+    @pytest.fixture
+    def worklog_mixin(self, jira_client):
+        mixin = WorklogMixin(config=jira_client.config)
+        mixin.jira = jira_client.jira
+        mixin.config = MagicMock()
+        return mixin
+
+    def test_server_fetches_per_issue_and_aggregates(self, worklog_mixin):
+        """Server/DC fetches each issue's worklogs and sums them."""
+        worklog_mixin.config.is_cloud = False
+        worklog_mixin.jira.jql.return_value = {"issues": self.ISSUES, "total": 2}
+        worklogs = {
+            "TEST-1": [
+                self._worklog("1", "alice", "2024-01-02T09:00:00.000+0000", 3600),
+                self._worklog("1", "bob", "2024-01-03T09:00:00.000+0000", 1800),
+                # Outside the range
+                self._worklog("1", "bob", "2023-12-29T09:00:00.000+0000", 7200),
+            ],
+            "TEST-2": [
+                self._worklog("2", "alice", "2024-01-03T23:30:00.000-0500", 5400),
+            ],
+        }
+        worklog_mixin.jira.issue_get_worklog.side_effect = lambda key: {
+            "worklogs": worklogs[key]
+        }
+
+        result = worklog_mixin.aggregate_worklogs(
+            "project = TEST ORDER BY key", "2024-01-01", "2024-01-07"
+        )
+
+        jql = worklog_mixin.jira.jql.call_args.args[0]
+        assert jql == (
+            '(project = TEST) AND worklogDate >= "2024-01-01" '
+            'AND worklogDate <= "2024-01-07" ORDER BY key'
+        )
+        assert result["source"] == "per_issue"
+        assert result["total_seconds"] == 10800
+        assert result["worklog_count"] == 3
+        assert result["by_author"][0] == {
+            "author": "Alice",
+            "account_id": "alice",
+            "seconds": 9000,
+            "hours": 2.5,
+        }
+        assert {entry["key"]: entry["seconds"] for entry in result["by_issue"]} == {
+            "TEST-1": 5400,
+            "TEST-2": 5400,
+        }
+        # Days are taken in the worklog's own time zone
+        assert result["by_day"] == [
+            {"date": "2024-01-02", "seconds": 3600, "hours": 1.0},
+            {"date": "2024-01-03", "seconds": 7200, "hours": 2.0},
+        ]
+
+    def test_cloud_uses_bulk_endpoints(self, worklog_mixin, monkeypatch):
+        """Cloud loads worklogs via worklog/updated and worklog/list."""
+        monkeypatch.setattr("mcp_atlassian.jira.worklog.WORKLOG_BULK_MIN_ISSUES", 2)
+        worklog_mixin.config.is_cloud = True
+        worklog_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = self.ISSUES
+        worklog_mixin.jira.resource_url.side_effect = lambda path: f"/rest/{path}"
+        worklog_mixin.jira.get.side_effect = [
+            {
+                "values": [{"worklogId": 10}, {"worklogId": 11}],
+                "lastPage": False,
+                "until": 5,
+            },
+            {"values": [{"worklogId": 12}], "lastPage": True},
+        ]
+        worklog_mixin.jira.post.return_value = [
+            self._worklog("1", "alice", "2024-01-02T09:00:00.000+0000", 3600),
+            # Not one of the matching issues
+            self._worklog("99", "alice", "2024-01-02T09:00:00.000+0000", 3600),
+        ]
+
+        result = worklog_mixin.aggregate_worklogs(
+            "sprint = 1", "2024-01-01", "2024-01-07"
+        )
+
+        assert worklog_mixin.jira.get.call_args_list[1].kwargs["params"] == {"since": 5}
+        worklog_mixin.jira.post.assert_called_once_with(
+            "/rest/worklog/list", data={"ids": [10, 11, 12]}
+        )
+        worklog_mixin.jira.issue_get_worklog.assert_not_called()
+        assert result["source"] == "bulk"
+        assert result["total_seconds"] == 3600
+
+    def test_cloud_bulk_reads_late_updates_and_caps_ids(
+        self, worklog_mixin, monkeypatch
+    ):
+        """Bulk paging runs to the last page; too many IDs falls back per issue."""
+        monkeypatch.setattr("mcp_atlassian.jira.worklog.WORKLOG_BULK_MIN_ISSUES", 2)
+        worklog_mixin.config.is_cloud = True
+        worklog_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = self.ISSUES
+        worklog_mixin.jira.get.side_effect = [
+            {"values": [{"worklogId": 10}], "lastPage": False, "until": 1704900000000},
+            # Logged for the range a month after it ended
+            {"values": [{"worklogId": 11}], "lastPage": False, "until": 1707300000000},
+            {"values": [{"worklogId": 12}], "lastPage": True, "until": 1709900000000},
+        ]
+        worklog_mixin.jira.post.return_value = [
+            self._worklog("1", "alice", "2024-01-02T09:00:00.000+0000", 3600)
+        ]
+
+        result = worklog_mixin.aggregate_worklogs(
+            "sprint = 1", "2024-01-01", "2024-01-07"
+        )
+
+        assert worklog_mixin.jira.get.call_count == 3
+        worklog_mixin.jira.post.assert_called_once()
+        assert worklog_mixin.jira.post.call_args.kwargs["data"] == {"ids": [10, 11, 12]}
+        assert result["total_seconds"] == 3600
+
+        monkeypatch.setattr("mcp_atlassian.jira.worklog.WORKLOG_BULK_MAX_IDS", 1)
+        worklog_mixin.jira.get.side_effect = [
+            {"values": [{"worklogId": 10}, {"worklogId": 11}], "lastPage": False}
+        ]
+        worklog_mixin.jira.issue_get_worklog.return_value = {"worklogs": []}
+
+        result = worklog_mixin.aggregate_worklogs(
+            "sprint = 1", "2024-01-01", "2024-01-07"
+        )
+
+        assert result["source"] == "per_issue"
+        assert worklog_mixin.jira.issue_get_worklog.call_count == 2
+
+    def test_cloud_small_issue_sets_fetch_per_issue(self, worklog_mixin):
+        """A few matching issues never trigger a site-wide worklog scan."""
+        worklog_mixin.config.is_cloud = True
+        worklog_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = self.ISSUES
+        worklog_mixin.jira.issue_get_worklog.return_value = {
+            "worklogs": [
+                self._worklog("1", "alice", "2024-01-02T09:00:00.000+0000", 600)
+            ]
+        }
+
+        result = worklog_mixin.aggregate_worklogs(
+            "sprint = 1", "2024-01-01", "2024-01-07"
+        )
+
+        worklog_mixin.jira.get.assert_not_called()
+        assert result["source"] == "per_issue"
+        assert result["total_seconds"] == 1200
+
+    @pytest.mark.parametrize(("matching", "truncated"), [(2, False), (3, True)])
+    def test_truncated_only_when_more_issues_match(
+        self, worklog_mixin, matching, truncated
+    ):
+        """Exactly max_issues matches is not reported as truncated."""
+        worklog_mixin.config.is_cloud = False
+        issues = [
+            {"id": str(n), "key": f"TEST-{n}", "fields": {"summary": "S"}}
+            for n in range(matching)
+        ]
+        worklog_mixin.jira.jql.return_value = {"issues": issues, "total": matching}
+        worklog_mixin.jira.issue_get_worklog.return_value = {"worklogs": []}
+
+        result = worklog_mixin.aggregate_worklogs(
+            "project = TEST", "2024-01-01", "2024-01-07", max_issues=2
+        )
+
+        assert worklog_mixin.jira.jql.call_args.kwargs["limit"] == 3
+        assert result["truncated"] is truncated
+        assert result["issues_searched"] == 2
+
+    def test_invalid_dates(self, worklog_mixin):
+        """Malformed or reversed ranges are rejected."""
+        with pytest.raises(ValueError, match="YYYY-MM-DD"):
+            worklog_mixin.aggregate_worklogs(
+                "project = TEST", "01/02/2024", "2024-01-07"
+            )
+        with pytest.raises(ValueError, match="end_date"):
+            worklog_mixin.aggregate_worklogs(
+                "project = TEST", "2024-01-07", "2024-01-01"
+            )
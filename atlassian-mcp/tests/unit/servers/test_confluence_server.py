@@ -41,6 +41,9 @@ def mock_confluence_fetcher():
 
     # Set up mock responses for each method
     mock_fetcher.search.return_value = [mock_page]
+    mock_fetcher.search_page.return_value = MagicMock(
+        results=[mock_page], next_page_token="next-token"
+    )
     mock_fetcher.get_page_content.return_value = mock_page
     mock_fetcher.get_page_children.return_value = [mock_page]
     mock_fetcher.create_page.return_value = mock_page
@@ -122,10 +125,12 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
         add_label,
         create_page,
         delete_page,
+        export_space,
         get_comments,
         get_labels,
         get_page,
         get_page_children,
+        get_page_tree,
         search,
         search_user,
         update_page,
@@ -151,6 +156,8 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
     confluence_sub_mcp.tool()(search)
     confluence_sub_mcp.tool()(get_page)
     confluence_sub_mcp.tool()(get_page_children)
+    confluence_sub_mcp.tool()(get_page_tree)
+    confluence_sub_mcp.tool()(export_space)
     confluence_sub_mcp.tool()(get_comments)
     confluence_sub_mcp.tool()(add_comment)
     confluence_sub_mcp.tool()(get_labels)
@@ -261,16 +268,92 @@ async def test_search(client, mock_confluence_fetcher):
     """Test the search tool with basic query."""
     response = await client.call_tool("confluence_search", {"query": "test search"})
 
-    mock_confluence_fetcher.search.assert_called_once()
-    args, kwargs = mock_confluence_fetcher.search.call_args
+    mock_confluence_fetcher.search_page.assert_called_once()
+    args, kwargs = mock_confluence_fetcher.search_page.call_args
     assert 'siteSearch ~ "test search"' in args[0]
     assert kwargs.get("limit") == 10
     assert kwargs.get("spaces_filter") is None
+    assert kwargs.get("page_token") is None
+    assert kwargs.get("include_content") == 0
 
     result_data = json.loads(response[0].text)
-    assert isinstance(result_data, list)
-    assert len(result_data) > 0
-    assert result_data[0]["title"] == "Test Page Mock Title"
+    assert result_data["next_page_token"] == "next-token"
+    assert len(result_data["results"]) > 0
+    assert result_data["results"][0]["title"] == "Test Page Mock Title"
+
+
+@pytest.mark.anyio
+async def test_search_continues_with_page_token(client, mock_confluence_fetcher):
+    """The continuation token and content count are passed to the fetcher."""
+    await client.call_tool(
+        "confluence_search",
+        {"query": "type=page", "page_token": "abc", "include_content": 3},
+    )
+
+    mock_confluence_fetcher.search_page.assert_called_once_with(
+        "type=page",
+        limit=10,
+        spaces_filter=None,
+        page_token="abc",
+        include_content=3,
+    )
+
+
+@pytest.mark.anyio
+async def test_get_page_tree(client, mock_confluence_fetcher):
+    """The page tree tool passes its limits through and returns the tree."""
+    tree = {
+        "root": {
+            "id": "100",
+            "title": "Root",
+            "version": 2,
+            "child_count": 0,
+            "children": [],
+        },
+        "page_count": 0,
+        "truncated": False,
+        "method": "cql",
+    }
+    mock_confluence_fetcher.get_page_tree.return_value = tree
+
+    response = await client.call_tool(
+        "confluence_get_page_tree", {"page_id": 100, "max_depth": 2}
+    )
+
+    mock_confluence_fetcher.get_page_tree.assert_called_once_with(
+        "100", max_depth=2, max_pages=500
+    )
+    assert json.loads(response[0].text) == tree
+
+
+@pytest.mark.anyio
+async def test_export_space(client, mock_confluence_fetcher, tmp_path):
+    """The export tool hands the space and directory to the fetcher."""
+    mock_confluence_fetcher.export_space.return_value = {"success": True, "total": 2}
+
+    response = await client.call_tool(
+        "confluence_export_space",
+        {"space_key": "TEST", "target_dir": str(tmp_path), "force": True},
+    )
+
+    mock_confluence_fetcher.export_space.assert_called_once_with(
+        "TEST", str(tmp_path), force=True
+    )
+    assert json.loads(response[0].text) == {"success": True, "total": 2}
+
+
+@pytest.mark.anyio
+async def test_export_space_error(client, mock_confluence_fetcher, tmp_path):
+    """Export failures come back as an error object."""
+    mock_confluence_fetcher.export_space.side_effect = ValueError("other space")
+
+    response = await client.call_tool(
+        "confluence_export_space", {"space_key": "TEST", "target_dir": str(tmp_path)}
+    )
+
+    assert json.loads(response[0].text) == {
+        "error": "Failed to export space: other space"
+    }
 
 
 @pytest.mark.anyio
@@ -533,3 +616,34 @@ async def test_update_page_with_string_parent_id(client, mock_confluence_fetcher
     result_data = json.loads(response[0].text)
     assert result_data["message"] == "Page updated successfully"
     assert result_data["page"]["title"] == "Test Page Mock Title"
+
+
+@pytest.mark.anyio
+async def test_update_page_without_content(client, mock_confluence_fetcher):
+    """return_content=false returns only the page ID, version and URL."""
+    mock_confluence_fetcher.update_page.return_value = ConfluencePage(
+        id="999999",
+        title="Updated Page",
+        content="",
+        version={"number": 4},
+        url="https://example.atlassian.net/wiki/spaces/TEST/pages/999999",
+    )
+
+    response = await client.call_tool(
+        "confluence_update_page",
+        {
+            "page_id": "999999",
+            "title": "Updated Page",
+            "content": "Updated content",
+            "return_content": False,
+        },
+    )
+
+    call_kwargs = mock_confluence_fetcher.update_page.call_args.kwargs
+    assert call_kwargs["return_content"] is False
+    result_data = json.loads(response[0].text)
+    assert result_data["page"] == {
+        "id": "999999",
+        "version": 4,
+        "url": "https://example.atlassian.net/wiki/spaces/TEST/pages/999999",
+    }
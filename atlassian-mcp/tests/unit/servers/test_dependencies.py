@@ -210,6 +210,22 @@ class TestCreateUserConfigForFetcher:
         else:
             assert result.spaces_filter == ["TEST"]
 
+    @pytest.mark.parametrize("auth_type", ["oauth", "pat"])
+    def test_user_jira_config_does_not_mirror(self, config_factory, auth_type):
+        """Per-request user tokens never get an issue mirror of their own."""
+        base_config = config_factory.create_jira_config(
+            auth_type=auth_type, mirror_projects="PROJ"
+        )
+
+        result = _create_user_config_for_fetcher(
+            base_config=base_config,
+            auth_type=auth_type,
+            credentials=_create_user_credentials(auth_type, "user-token"),
+        )
+
+        assert result.mirror_projects is None
+        assert base_config.mirror_projects == "PROJ"
+
     def test_oauth_auth_type_minimal_config_success(self):
         """Test OAuth auth type with minimal base config (user-provided tokens mode)."""
         # Setup minimal base config (empty credentials)
@@ -587,6 +603,64 @@ class TestGetJiraFetcher:
         with pytest.raises(ValueError, match=expected_error_match):
             await get_jira_fetcher(mock_context)
 
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.JiraFetcher")
+    async def test_user_token_validation_is_cached(
+        self,
+        mock_jira_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        mock_request,
+        config_factory,
+        auth_scenarios,
+    ):
+        """A validated user token is not re-validated on the next request."""
+        _setup_mock_context(
+            mock_context,
+            config_factory.create_app_context(
+                config_factory.create_jira_config(auth_type="oauth")
+            ),
+        )
+        mock_get_http_request.return_value = mock_request
+        mock_fetcher = _create_mock_fetcher(JiraFetcher)
+        mock_jira_fetcher_class.return_value = mock_fetcher
+
+        for _ in range(3):
+            _setup_mock_request_state(mock_request, auth_scenarios["oauth"])
+            assert await get_jira_fetcher(mock_context) == mock_fetcher
+
+        mock_fetcher.get_current_user_account_id.assert_called_once()
+
+        # A different token is validated separately
+        _setup_mock_request_state(mock_request, auth_scenarios["pat"])
+        await get_jira_fetcher(mock_context)
+        assert mock_fetcher.get_current_user_account_id.call_count == 2
+
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.JiraFetcher")
+    async def test_user_token_validation_cache_disabled(
+        self,
+        mock_jira_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        mock_request,
+        config_factory,
+        auth_scenarios,
+        monkeypatch,
+    ):
+        """Setting the TTL to 0 validates every request."""
+        monkeypatch.setenv("MCP_TOKEN_VALIDATION_CACHE_TTL", "0")
+        _setup_mock_context(mock_context, config_factory.create_app_context())
+        mock_get_http_request.return_value = mock_request
+        mock_fetcher = _create_mock_fetcher(JiraFetcher)
+        mock_jira_fetcher_class.return_value = mock_fetcher
+
+        for _ in range(2):
+            _setup_mock_request_state(mock_request, auth_scenarios["pat"])
+            await get_jira_fetcher(mock_context)
+
+        assert mock_fetcher.get_current_user_account_id.call_count == 2
+
 
 class TestGetConfluenceFetcher:
     """Tests for get_confluence_fetcher function."""
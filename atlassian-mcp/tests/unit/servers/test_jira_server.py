@@ -176,7 +176,7 @@ def mock_jira_fetcher():
     mock_fetcher.get_epic_issues.side_effect = mock_get_epic_issues
 
     # Configure get_all_projects
-    def mock_get_all_projects(include_archived=False):
+    def mock_get_all_projects(include_archived=False, refresh=False):
         projects = [
             {
                 "id": "10000",
@@ -737,7 +737,7 @@ async def test_get_all_projects_tool(jira_client, mock_jira_fetcher):
     # Reset the mock and set specific return value for this test
     mock_jira_fetcher.get_all_projects.reset_mock()
     mock_jira_fetcher.get_all_projects.side_effect = (
-        lambda include_archived=False: mock_projects
+        lambda include_archived=False, refresh=False: mock_projects
     )
 
     # Test with default parameters (include_archived=False)
@@ -761,7 +761,9 @@ async def test_get_all_projects_tool(jira_client, mock_jira_fetcher):
     assert data[1]["name"] == "Project Two"
 
     # Verify the underlying method was called with default parameter
-    mock_jira_fetcher.get_all_projects.assert_called_once_with(include_archived=False)
+    mock_jira_fetcher.get_all_projects.assert_called_once_with(
+        include_archived=False, refresh=False
+    )
 
 
 @pytest.mark.anyio
@@ -786,7 +788,7 @@ async def test_get_all_projects_tool_with_archived(jira_client, mock_jira_fetche
     # Reset the mock and set specific return value for this test
     mock_jira_fetcher.get_all_projects.reset_mock()
     mock_jira_fetcher.get_all_projects.side_effect = (
-        lambda include_archived=False: mock_projects
+        lambda include_archived=False, refresh=False: mock_projects
     )
 
     # Test with include_archived=True
@@ -807,7 +809,9 @@ async def test_get_all_projects_tool_with_archived(jira_client, mock_jira_fetche
     assert data[1]["key"] == "ARCHIVED"
 
     # Verify the underlying method was called with include_archived=True
-    mock_jira_fetcher.get_all_projects.assert_called_once_with(include_archived=True)
+    mock_jira_fetcher.get_all_projects.assert_called_once_with(
+        include_archived=True, refresh=False
+    )
 
 
 @pytest.mark.anyio
@@ -840,7 +844,7 @@ async def test_get_all_projects_tool_with_projects_filter(
     # Set up the mock to return all projects
     mock_jira_fetcher.get_all_projects.reset_mock()
     mock_jira_fetcher.get_all_projects.side_effect = (
-        lambda include_archived=False: all_mock_projects
+        lambda include_archived=False, refresh=False: all_mock_projects
     )
 
     # Set up the projects filter in the config
@@ -869,7 +873,9 @@ async def test_get_all_projects_tool_with_projects_filter(
     assert "OTHER" not in returned_keys
 
     # Verify the underlying method was called (still gets all projects, but then filters)
-    mock_jira_fetcher.get_all_projects.assert_called_once_with(include_archived=False)
+    mock_jira_fetcher.get_all_projects.assert_called_once_with(
+        include_archived=False, refresh=False
+    )
 
 
 @pytest.mark.anyio
@@ -894,7 +900,7 @@ async def test_get_all_projects_tool_no_projects_filter(jira_client, mock_jira_f
     # Set up the mock to return all projects
     mock_jira_fetcher.get_all_projects.reset_mock()
     mock_jira_fetcher.get_all_projects.side_effect = (
-        lambda include_archived=False: all_mock_projects
+        lambda include_archived=False, refresh=False: all_mock_projects
     )
 
     # Ensure no projects filter is set
@@ -922,7 +928,9 @@ async def test_get_all_projects_tool_no_projects_filter(jira_client, mock_jira_f
     assert "OTHER" in returned_keys
 
     # Verify the underlying method was called
-    mock_jira_fetcher.get_all_projects.assert_called_once_with(include_archived=False)
+    mock_jira_fetcher.get_all_projects.assert_called_once_with(
+        include_archived=False, refresh=False
+    )
 
 
 @pytest.mark.anyio
@@ -955,7 +963,7 @@ async def test_get_all_projects_tool_case_insensitive_filter(
     # Set up the mock to return all projects
     mock_jira_fetcher.get_all_projects.reset_mock()
     mock_jira_fetcher.get_all_projects.side_effect = (
-        lambda include_archived=False: all_mock_projects
+        lambda include_archived=False, refresh=False: all_mock_projects
     )
 
     # Set up projects filter with mixed case and whitespace
@@ -984,13 +992,17 @@ async def test_get_all_projects_tool_case_insensitive_filter(
     assert "OTHER" not in returned_keys  # not in filter
 
     # Verify the underlying method was called
-    mock_jira_fetcher.get_all_projects.assert_called_once_with(include_archived=False)
+    mock_jira_fetcher.get_all_projects.assert_called_once_with(
+        include_archived=False, refresh=False
+    )
 
 
 @pytest.mark.anyio
 async def test_get_all_projects_tool_empty_response(jira_client, mock_jira_fetcher):
     """Test tool handles empty list of projects from API."""
-    mock_jira_fetcher.get_all_projects.side_effect = lambda include_archived=False: []
+    mock_jira_fetcher.get_all_projects.side_effect = (
+        lambda include_archived=False, refresh=False: []
+    )
 
     response = await jira_client.call_tool("jira_get_all_projects", {})
 
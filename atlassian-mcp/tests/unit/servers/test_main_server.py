@@ -1,13 +1,28 @@
 """Tests for the main MCP server implementation."""
 
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.client import FastMCPTransport
+from fastmcp.tools import Tool as FastMCPTool
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
-from mcp_atlassian.servers.main import UserTokenMiddleware, main_mcp
+from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.servers.main import (
+    TOOL_CALL_DURATION,
+    TOOL_CALLS,
+    AtlassianMCP,
+    UserTokenMiddleware,
+    main_mcp,
+)
+from mcp_atlassian.utils.metrics import gauge
 
 
 @pytest.mark.anyio
@@ -90,6 +105,21 @@ async def test_streamable_http_app_health_check_endpoint():
         assert response.json() == {"status": "ok"}
 
 
+@pytest.mark.anyio
+async def test_metrics_endpoint_serves_prometheus_text():
+    """The /metrics endpoint exposes the registry in the Prometheus format."""
+    gauge("mcp_test_marker", "Set by the test.").set(1)
+    app = main_mcp.streamable_http_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE mcp_test_marker gauge" in response.text
+    assert "\nmcp_test_marker 1\n" in response.text
+
+
 class TestUserTokenMiddleware:
     """Tests for the UserTokenMiddleware class."""
 
@@ -142,3 +172,128 @@ class TestUserTokenMiddleware:
         # Verify the request was processed normally
         mock_call_next.assert_called_once_with(mock_request)
         assert result is not None
+
+
+def _tool_listing_server(read_only: bool = False) -> AtlassianMCP:
+    """Server with one Jira read tool, one Jira write tool and one generic tool."""
+
+    @asynccontextmanager
+    async def lifespan(app: FastMCP) -> AsyncIterator[dict]:
+        yield {
+            "app_lifespan_context": MainAppContext(
+                full_jira_config=JiraConfig(
+                    url="https://test.atlassian.net",
+                    auth_type="pat",
+                    personal_token="token",
+                ),
+                read_only=read_only,
+            )
+        }
+
+    server = AtlassianMCP("ToolListing", lifespan=lifespan)
+    server.tool(name="jira_read", tags={"jira", "read"})(lambda: "read")
+    server.tool(name="jira_write", tags={"jira", "write"})(lambda: "write")
+    server.tool(name="confluence_read", tags={"confluence", "read"})(lambda: "c")
+    return server
+
+
+@pytest.mark.anyio
+async def test_tool_list_is_built_once_per_profile():
+    """Repeated tools/list calls reuse the filtered list."""
+    server = _tool_listing_server(read_only=True)
+
+    with patch.object(
+        FastMCPTool, "to_mcp_tool", autospec=True, side_effect=FastMCPTool.to_mcp_tool
+    ) as to_mcp_tool:
+        async with Client(transport=FastMCPTransport(server)) as client:
+            first = await client.list_tools()
+            second = await client.list_tools()
+
+    assert [tool.name for tool in first] == ["jira_read"]
+    assert second == first
+    assert to_mcp_tool.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_tool_list_is_rebuilt_when_registry_changes():
+    """Registering a tool invalidates the memoized lists."""
+    server = _tool_listing_server()
+
+    async with Client(transport=FastMCPTransport(server)) as client:
+        before = await client.list_tools()
+        server.tool(name="jira_extra", tags={"jira", "read"})(lambda: "extra")
+        after = await client.list_tools()
+
+    assert {tool.name for tool in before} == {"jira_read", "jira_write"}
+    assert {tool.name for tool in after} == {"jira_read", "jira_write", "jira_extra"}
+
+
+@pytest.mark.anyio
+async def test_tool_calls_are_counted_and_timed():
+    """Every tool call records its outcome and duration."""
+    server = _tool_listing_server()
+
+    def fail() -> str:
+        raise ValueError("boom")
+
+    server.tool(name="jira_fail", tags={"jira", "read"})(fail)
+    successes = TOOL_CALLS.value(tool="jira_read", outcome="success")
+    errors = TOOL_CALLS.value(tool="jira_fail", outcome="error")
+    timed = TOOL_CALL_DURATION.value(tool="jira_read")
+
+    async with Client(transport=FastMCPTransport(server)) as client:
+        await client.call_tool("jira_read", {})
+        with pytest.raises(Exception, match="jira_fail"):
+            await client.call_tool("jira_fail", {})
+
+    assert TOOL_CALLS.value(tool="jira_read", outcome="success") == successes + 1
+    assert TOOL_CALLS.value(tool="jira_fail", outcome="error") == errors + 1
+    assert TOOL_CALL_DURATION.value(tool="jira_read") == timed + 1
+
+
+@pytest.mark.anyio
+async def test_tool_call_trace_is_attached_when_enabled(monkeypatch):
+    """With tracing enabled, the timing summary is added to the result."""
+    monkeypatch.setenv("MCP_TRACE_TOOL_CALLS", "true")
+    monkeypatch.setenv("MCP_TRACE_IN_RESPONSE", "true")
+    server = _tool_listing_server()
+
+    async with Client(transport=FastMCPTransport(server)) as client:
+        result = await client.call_tool("jira_read", {})
+
+    assert result[0].text == "read"
+    trace = json.loads(result[1].text)["trace"]
+    assert trace["name"] == "jira_read"
+    assert trace["total_ms"] >= 0
+
+
+async def _get_profile(query="seconds=0.05", headers=None):
+    transport = httpx.ASGITransport(app=main_mcp.streamable_http_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(f"/debug/profile?{query}", headers=headers or {})
+
+
+@pytest.mark.anyio
+async def test_profile_endpoint_requires_configured_token(monkeypatch):
+    """The profiler is hidden without a token and rejects wrong tokens."""
+    monkeypatch.delenv("MCP_PROFILER_TOKEN", raising=False)
+    assert (await _get_profile()).status_code == 404
+
+    monkeypatch.setenv("MCP_PROFILER_TOKEN", "secret")
+    assert (await _get_profile()).status_code == 403
+    response = await _get_profile(
+        query="seconds=9999", headers={"X-Profiler-Token": "secret"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_profile_endpoint_returns_collapsed_stacks(monkeypatch):
+    """An authorized request returns collapsed stacks as plain text."""
+    monkeypatch.setenv("MCP_PROFILER_TOKEN", "secret")
+
+    response = await _get_profile(headers={"X-Profiler-Token": "secret"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in response.text.splitlines())
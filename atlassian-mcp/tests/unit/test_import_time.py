@@ -0,0 +1,91 @@
+"""Start-up import budget for the MCP server.
+
+Every stdio session spawns a fresh process, so the modules loaded before the
+first ``tools/list`` directly add to session start-up time.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Modules only needed once a tool actually talks to Jira or Confluence
+DEFERRED_MODULES = [
+    "atlassian",
+    "bs4",
+    "markdownify",
+    "md2conf",
+    "keyring",
+    "mcp_atlassian.models",
+    "mcp_atlassian.preprocessing",
+    "mcp_atlassian.jira.fetcher",
+    "mcp_atlassian.confluence.fetcher",
+]
+
+# Budget for the package's own modules (excluding third-party frameworks);
+# generous so that slow CI machines do not flake
+OWN_IMPORT_BUDGET_MS = float(os.getenv("MCP_IMPORT_BUDGET_MS", "1000"))
+
+
+def _import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Import a module in a fresh interpreter and return -X importtime data.
+
+    Returns:
+        Mapping of module name to (self, cumulative) microseconds
+    """
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue  # Header line
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+@pytest.fixture(scope="module")
+def server_import_times() -> dict[str, tuple[int, int]]:
+    return _import_times("mcp_atlassian.servers")
+
+
+@pytest.mark.parametrize("module", DEFERRED_MODULES)
+def test_server_import_defers_client_stack(server_import_times, module):
+    """Importing the server does not load the API client stack."""
+    assert module not in server_import_times
+
+
+def test_server_import_within_budget(server_import_times):
+    """The package's own modules stay within the start-up budget."""
+    own_ms = (
+        sum(
+            self_us
+            for name, (self_us, _) in server_import_times.items()
+            if name.startswith("mcp_atlassian")
+        )
+        / 1000
+    )
+    assert own_ms < OWN_IMPORT_BUDGET_MS
+
+
+def test_lazy_exports_still_resolve():
+    """The package-level re-exports load their modules on first access."""
+    from mcp_atlassian.confluence import ConfluenceFetcher
+    from mcp_atlassian.jira import JiraFetcher
+    from mcp_atlassian.utils import parse_date
+
+    assert JiraFetcher.__name__ == "JiraFetcher"
+    assert ConfluenceFetcher.__name__ == "ConfluenceFetcher"
+    assert callable(parse_date)
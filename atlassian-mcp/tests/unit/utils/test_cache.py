@@ -0,0 +1,92 @@
+"""Tests for the tagged cache utilities module."""
+
+import time
+from unittest.mock import MagicMock
+
+from mcp_atlassian.utils.cache import (
+    CACHE_ENTRIES,
+    CACHE_HIT_RATIO,
+    CACHE_REQUESTS,
+    CacheRegistry,
+    TaggedTTLCache,
+    credential_scope,
+    get_cache,
+    jira_issue_tag,
+)
+from mcp_atlassian.utils.metrics import get_metrics_snapshot
+
+
+def test_get_and_set():
+    """Values are returned until they expire."""
+    cache = TaggedTTLCache("test", maxsize=10, ttl=0.05)
+    cache.set("key", "value", tags=["a"])
+
+    assert cache.get("key") == "value"
+    time.sleep(0.06)
+    assert cache.get("key") is None
+
+
+def test_get_or_load_calls_loader_once():
+    """The loader only runs on a miss."""
+    cache = TaggedTTLCache("test", maxsize=10, ttl=60)
+    loader = MagicMock(return_value={"id": 1})
+
+    assert cache.get_or_load("key", loader) == {"id": 1}
+    assert cache.get_or_load("key", loader) == {"id": 1}
+    loader.assert_called_once()
+
+
+def test_invalidate_tags_removes_only_tagged_entries():
+    """Only entries carrying an invalidated tag are dropped."""
+    cache = TaggedTTLCache("test", maxsize=10, ttl=60)
+    cache.set("one", 1, tags=[jira_issue_tag("proj-1")])
+    cache.set("two", 2, tags=[jira_issue_tag("PROJ-2")])
+    cache.set("three", 3)
+
+    assert cache.invalidate_tags([jira_issue_tag("PROJ-1")]) == 1
+    assert cache.get("one") is None
+    assert cache.get("two") == 2
+    assert cache.get("three") == 3
+
+
+def test_registry_invalidates_across_caches():
+    """Registry invalidation reaches every named cache."""
+    registry = CacheRegistry()
+    first = registry.get_cache("first", maxsize=10, ttl=60)
+    second = registry.get_cache("second", maxsize=10, ttl=60)
+    first.set("a", 1, tags=["t"])
+    second.set("b", 2, tags=["t"])
+
+    assert registry.get_cache("first", maxsize=1, ttl=1) is first
+    assert registry.invalidate_tags(["t"]) == 2
+    assert len(first) == len(second) == 0
+
+
+def test_credential_scope_distinguishes_users():
+    """Different credentials on the same site get different scopes."""
+    alice = MagicMock(
+        url="https://x.atlassian.net", auth_type="basic", username="alice"
+    )
+    bob = MagicMock(url="https://x.atlassian.net", auth_type="basic", username="bob")
+    for config in (alice, bob):
+        config.api_token = "token"
+        config.personal_token = None
+        config.oauth_config = None
+
+    assert credential_scope(alice) == credential_scope(alice)
+    assert credential_scope(alice) != credential_scope(bob)
+
+
+def test_hit_ratio_and_size_are_collected():
+    """Cache hit ratios and sizes are published when metrics are read."""
+    cache = get_cache("ratio-test", maxsize=10, ttl=60)
+    cache.set("key", "value")
+    cache.get("key")
+    cache.get("missing")
+    hits = CACHE_REQUESTS.value(cache="ratio-test", result="hit")
+    misses = CACHE_REQUESTS.value(cache="ratio-test", result="miss")
+
+    get_metrics_snapshot()
+
+    assert CACHE_ENTRIES.value(cache="ratio-test") == 1
+    assert CACHE_HIT_RATIO.value(cache="ratio-test") == hits / (hits + misses)
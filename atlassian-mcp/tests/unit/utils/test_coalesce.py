@@ -0,0 +1,198 @@
+"""Tests for the request coalescing utilities module."""
+
+import io
+import threading
+import time
+
+import pytest
+from requests import Request, Response
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.sessions import Session
+
+from mcp_atlassian.utils.coalesce import (
+    COALESCED_REQUESTS,
+    CoalescingAdapter,
+    RequestCoalescer,
+    configure_request_coalescing,
+    get_coalescing_stats,
+)
+from mcp_atlassian.utils.metrics import REGISTRY
+from mcp_atlassian.utils.rate_limit import (
+    RateLimitAdapter,
+    RateLimitSettings,
+    configure_rate_limiting,
+)
+
+URL = "https://test.atlassian.net/rest/api/2/issue/TEST-1"
+
+
+class BlockingAdapter(BaseAdapter):
+    """Adapter that holds every request until released."""
+
+    def __init__(self, error=None):
+        super().__init__()
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.calls = 0
+        self.error = error
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        if self.error:
+            raise self.error
+        response = Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response.raw = io.BytesIO(b'{"key": "TEST-1"}')
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    REGISTRY.reset()
+    yield
+    REGISTRY.reset()
+
+
+def _prepare(method="GET", auth="Bearer user-a", url=URL, extra_headers=None):
+    headers = {"Authorization": auth} if auth else {}
+    headers.update(extra_headers or {})
+    return Request(method, url, headers=headers).prepare()
+
+
+def _send_concurrently(adapter, requests_to_send):
+    results = [None] * len(requests_to_send)
+
+    def worker(index, request):
+        try:
+            results[index] = adapter.send(request, stream=False)
+        except Exception as e:  # noqa: BLE001
+            results[index] = e
+
+    threads = [
+        threading.Thread(target=worker, args=(i, request))
+        for i, request in enumerate(requests_to_send)
+    ]
+    threads[0].start()
+    adapter.inner.started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    # Wait until every other request has either joined the leader or gone
+    # upstream itself before letting the upstream calls complete
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        followers = COALESCED_REQUESTS.value(site="test.atlassian.net", role="follower")
+        if followers + adapter.inner.calls - 1 >= len(threads) - 1:
+            break
+        time.sleep(0.01)
+    adapter.inner.release.set()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def _adapter(inner):
+    return CoalescingAdapter(inner, "test.atlassian.net", RequestCoalescer())
+
+
+def test_identical_gets_share_one_upstream_request():
+    """Concurrent identical GETs with the same credentials are collapsed."""
+    adapter = _adapter(BlockingAdapter())
+
+    results = _send_concurrently(adapter, [_prepare() for _ in range(5)])
+
+    assert adapter.inner.calls == 1
+    assert all(r.status_code == 200 for r in results)
+    assert all(r.json() == {"key": "TEST-1"} for r in results)
+    # Each caller gets its own response object bound to its own request
+    assert len({id(r) for r in results}) == 5
+    stats = get_coalescing_stats()["test.atlassian.net"]
+    assert stats["leader"] == 1
+    assert stats["follower"] == 4
+    assert stats["ratio"] == pytest.approx(0.8)
+
+
+def test_different_credentials_are_not_shared():
+    """Requests with different credentials always go upstream separately."""
+    adapter = _adapter(BlockingAdapter())
+    adapter.inner.release.set()
+
+    _send_concurrently(
+        adapter, [_prepare(auth="Bearer user-a"), _prepare(auth="Bearer user-b")]
+    )
+
+    assert adapter.inner.calls == 2
+
+
+@pytest.mark.parametrize(
+    "request_kwargs",
+    [
+        {"method": "POST"},
+        {"auth": None},
+        {"extra_headers": {"If-None-Match": '"v1"'}},
+    ],
+    ids=["non-get", "anonymous", "conditional"],
+)
+def test_ineligible_requests_bypass_coalescing(request_kwargs):
+    """Writes, anonymous and conditional requests are never coalesced."""
+    coalescer = RequestCoalescer()
+    assert coalescer.key_for(_prepare(**request_kwargs)) is None
+
+
+def test_streamed_requests_bypass_coalescing():
+    """Streaming responses cannot be shared and go straight through."""
+    inner = BlockingAdapter()
+    inner.release.set()
+    adapter = _adapter(inner)
+
+    adapter.send(_prepare(), stream=True)
+
+    assert adapter.coalescer.in_flight() == 0
+    assert get_coalescing_stats() == {}
+
+
+def test_leader_errors_propagate_to_followers():
+    """Followers see the leader's exception and the key is released."""
+    adapter = _adapter(BlockingAdapter(error=RequestsConnectionError("boom")))
+
+    results = _send_concurrently(adapter, [_prepare() for _ in range(3)])
+
+    assert all(isinstance(r, RequestsConnectionError) for r in results)
+    assert adapter.inner.calls == 1
+    assert adapter.coalescer.in_flight() == 0
+
+
+def test_configure_request_coalescing_wraps_site_adapter():
+    """The coalescing adapter wraps whatever is mounted for the site."""
+    session = Session()
+    original = session.get_adapter("https://test.atlassian.net")
+
+    configure_request_coalescing("Jira", "https://test.atlassian.net", session)
+    configure_request_coalescing("Jira", "https://test.atlassian.net", session)
+
+    adapter = session.get_adapter(URL)
+    assert isinstance(adapter, CoalescingAdapter)
+    assert adapter.inner is original
+
+
+def test_configure_request_coalescing_wraps_tenant_rate_limiter():
+    """On the OAuth gateway coalescing sits on the tenant's rate limiter."""
+    session = Session()
+    url = "https://api.atlassian.com/ex/jira/cloud-a"
+    configure_rate_limiting("Jira", url, session, RateLimitSettings())
+
+    configure_request_coalescing("Jira", url, session)
+
+    adapter = session.get_adapter(f"{url}/rest/api/3/myself")
+    assert isinstance(adapter, CoalescingAdapter)
+    assert isinstance(adapter.inner, RateLimitAdapter)
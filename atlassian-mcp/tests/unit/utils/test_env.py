@@ -1,6 +1,7 @@
 """Tests for environment variable utility functions."""
 
 from mcp_atlassian.utils.env import (
+    get_env_int,
     is_env_extended_truthy,
     is_env_ssl_verify,
     is_env_truthy,
@@ -215,3 +216,26 @@ class TestEdgeCases:
                 assert is_env_truthy("TEST_VAR") is False
                 assert is_env_extended_truthy("TEST_VAR") is False
             assert is_env_ssl_verify("TEST_VAR") is True  # Not in false values
+
+
+class TestGetEnvInt:
+    """Test the get_env_int function."""
+
+    def test_parses_integer(self, monkeypatch):
+        """Test that a valid integer is parsed."""
+        monkeypatch.setenv("TEST_VAR", " 12 ")
+        assert get_env_int("TEST_VAR", 4) == 12
+
+    def test_unset_or_invalid_uses_default(self, monkeypatch):
+        """Test that unset, empty and invalid values fall back to the default."""
+        monkeypatch.delenv("TEST_VAR", raising=False)
+        assert get_env_int("TEST_VAR", 4) == 4
+
+        for value in ["", "abc", "1.5"]:
+            monkeypatch.setenv("TEST_VAR", value)
+            assert get_env_int("TEST_VAR", 4) == 4
+
+    def test_minimum_is_applied(self, monkeypatch):
+        """Test that values below the minimum are clamped."""
+        monkeypatch.setenv("TEST_VAR", "0")
+        assert get_env_int("TEST_VAR", 4, minimum=1) == 1
@@ -0,0 +1,183 @@
+"""Tests for the HTTP connection pooling utilities module."""
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+from requests import Request
+from requests.adapters import HTTPAdapter
+from requests.sessions import Session
+
+from mcp_atlassian.utils.http import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    ConnectionPoolSettings,
+    PooledHTTPAdapter,
+    PooledSSLIgnoreAdapter,
+    close_connection_pools,
+    configure_connection_pool,
+    configure_request_metrics,
+    get_connection_pool_stats,
+    keepalive_socket_options,
+    normalize_endpoint,
+)
+from mcp_atlassian.utils.metrics import get_metrics_snapshot
+from mcp_atlassian.utils.ssl import configure_ssl_verification
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def clean_pools():
+    close_connection_pools()
+    yield
+    close_connection_pools()
+
+
+def test_settings_timeout():
+    """Only the configured parts of the caller's timeout are overridden."""
+    assert ConnectionPoolSettings().request_timeout(75) == 75
+    assert ConnectionPoolSettings().request_timeout(None) is None
+    assert ConnectionPoolSettings(connect_timeout=3).request_timeout(75) == (3, 75)
+    assert ConnectionPoolSettings(read_timeout=30).request_timeout((5, 60)) == (5, 30)
+    assert ConnectionPoolSettings(connect_timeout=3, read_timeout=30).request_timeout(
+        75
+    ) == (3, 30)
+
+
+def test_keepalive_socket_options():
+    """TCP keep-alive is enabled on pooled sockets."""
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in keepalive_socket_options()
+
+
+def test_pooled_adapter_uses_settings():
+    """The adapter's pool manager is sized from the settings."""
+    adapter = PooledHTTPAdapter(ConnectionPoolSettings(pool_maxsize=32))
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+    assert "socket_options" in adapter.poolmanager.connection_pool_kw
+
+
+def test_configure_shares_adapter_across_sessions():
+    """Sessions for the same site and settings share one adapter."""
+    settings = ConnectionPoolSettings()
+    first, second = Session(), Session()
+
+    configure_connection_pool("Jira", "https://test.atlassian.net", first, settings)
+    configure_connection_pool("Jira", "https://test.atlassian.net", second, settings)
+
+    adapter = first.get_adapter("https://test.atlassian.net/rest/api/2/myself")
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert adapter is second.get_adapter("https://test.atlassian.net/rest")
+    # Other hosts keep the session's default adapter
+    assert not isinstance(
+        first.get_adapter("https://other.example.com"), PooledHTTPAdapter
+    )
+
+
+def test_configure_preserves_disabled_ssl_verification():
+    """Sites with SSL verification disabled keep ignoring certificates."""
+    session = Session()
+    configure_ssl_verification("Jira", "https://jira.local", session, ssl_verify=False)
+
+    configure_connection_pool(
+        "Jira", "https://jira.local", session, ConnectionPoolSettings()
+    )
+
+    assert isinstance(session.get_adapter("https://jira.local"), PooledSSLIgnoreAdapter)
+
+
+def test_closing_a_session_keeps_shared_pool(local_server):
+    """Closing one session does not tear down connections other sessions use."""
+    settings = ConnectionPoolSettings()
+    for _ in range(3):
+        session = Session()
+        configure_connection_pool("Jira", local_server, session, settings)
+        assert session.get(f"{local_server}/rest").status_code == 200
+        session.close()
+
+    stats = get_connection_pool_stats()
+    assert len(stats) == 1
+    assert stats[0]["requests"] == 3
+    assert stats[0]["connections_created"] == 1
+    assert stats[0]["idle"] == 1
+    assert stats[0]["in_use"] == 0
+
+
+def test_configured_timeout_overrides_request_timeout():
+    """The configured read timeout replaces only that part of the default."""
+    adapter = PooledHTTPAdapter(ConnectionPoolSettings(read_timeout=5))
+    request = Request("GET", "https://test.atlassian.net").prepare()
+
+    with patch.object(HTTPAdapter, "send") as mock_send:
+        adapter.send(request, timeout=75)
+
+    assert mock_send.call_args.kwargs["timeout"] == (75, 5)
+
+
+def test_pool_metrics_collected(local_server):
+    """Pool usage is published through the metrics snapshot."""
+    session = Session()
+    configure_connection_pool("Jira", local_server, session, ConnectionPoolSettings())
+    session.get(local_server)
+
+    snapshot = get_metrics_snapshot()
+
+    [(labels, value)] = snapshot["atlassian_http_pool_requests"]
+    assert labels["host"].startswith("http://127.0.0.1:")
+    assert value == 1
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/rest/api/2/issue/PROJ-1/comment?expand=x", "/rest/api/2/issue/{id}/comment"),
+        ("/rest/agile/1.0/board/12/sprint", "/rest/agile/1.0/board/{id}/sprint"),
+        ("/wiki/api/v2/pages/123456", "/wiki/api/v2/pages/{id}"),
+        ("/rest/api/space/DEV/content", "/rest/api/space/{key}/content"),
+        ("/rest/api/space/~jsmith", "/rest/api/space/{key}"),
+        ("/rest/api/3/search", "/rest/api/3/search"),
+    ],
+)
+def test_normalize_endpoint(path, expected):
+    """Identifiers are collapsed so endpoint labels stay bounded."""
+    assert normalize_endpoint(path) == expected
+
+
+def test_request_metrics_recorded(local_server):
+    """Responses are counted and timed per normalized endpoint."""
+    session = Session()
+    configure_request_metrics("Jira", session)
+    configure_request_metrics("Jira", session)
+    labels = {"service": "jira", "method": "GET", "endpoint": "/rest/api/2/issue/{id}"}
+    before = HTTP_REQUESTS.value(status="200", **labels)
+    observed = HTTP_REQUEST_DURATION.value(**labels)
+
+    session.get(f"{local_server}/rest/api/2/issue/PROJ-1")
+
+    assert HTTP_REQUESTS.value(status="200", **labels) == before + 1
+    assert HTTP_REQUEST_DURATION.value(**labels) == observed + 1
@@ -0,0 +1,103 @@
+"""Tests for the metrics utilities module."""
+
+import math
+
+import pytest
+
+from mcp_atlassian.utils.metrics import MetricsRegistry
+
+
+def test_counter_increments_per_label_set():
+    """Counters track values separately for each label combination."""
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests.", ("site",))
+
+    requests.inc(site="a")
+    requests.inc(2, site="a")
+    requests.inc(site="b")
+
+    assert requests.value(site="a") == 3
+    assert requests.value(site="b") == 1
+    assert requests.value(site="c") == 0
+
+
+def test_counter_rejects_negative_and_wrong_labels():
+    """Counters only go up and require the declared labels."""
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests.", ("site",))
+
+    with pytest.raises(ValueError):
+        requests.inc(-1, site="a")
+    with pytest.raises(ValueError):
+        requests.inc(other="a")
+
+
+def test_gauge_set_inc_dec():
+    """Gauges can be set and moved in both directions."""
+    registry = MetricsRegistry()
+    in_flight = registry.gauge("in_flight", "In flight.")
+
+    in_flight.set(5)
+    in_flight.inc()
+    in_flight.dec(3)
+
+    assert in_flight.value() == 3
+
+
+def test_registry_reuses_and_validates_metrics():
+    """Registering the same name returns the same metric of the same type."""
+    registry = MetricsRegistry()
+    first = registry.counter("events_total", "Events.")
+
+    assert registry.counter("events_total", "Events.") is first
+    with pytest.raises(ValueError):
+        registry.gauge("events_total", "Events.")
+
+
+def test_snapshot_and_reset():
+    """Snapshots list samples by name; reset clears values."""
+    registry = MetricsRegistry()
+    registry.counter("events_total", "Events.", ("kind",)).inc(kind="x")
+
+    assert registry.snapshot() == {"events_total": [({"kind": "x"}, 1.0)]}
+
+    registry.reset()
+    assert registry.snapshot() == {"events_total": []}
+
+
+def test_histogram_buckets_sum_and_count():
+    """Histograms count observations into cumulative buckets."""
+    registry = MetricsRegistry()
+    latency = registry.histogram(
+        "latency_seconds", "Latency.", ("tool",), buckets=(0.1, 1.0)
+    )
+
+    for value in (0.05, 0.5, 0.5, 3.0):
+        latency.observe(value, tool="a")
+
+    assert latency.value(tool="a") == 4
+    assert latency.sum(tool="a") == pytest.approx(4.05)
+    assert latency.buckets(tool="a") == [(0.1, 1), (1.0, 3), (math.inf, 4)]
+    assert latency.buckets(tool="b") == [(0.1, 0), (1.0, 0), (math.inf, 0)]
+    with pytest.raises(ValueError):
+        registry.histogram("bad_seconds", "Bad.", ("le",))
+
+
+def test_render_prometheus_text_format():
+    """Metrics render as Prometheus text with escaped labels."""
+    registry = MetricsRegistry()
+    registry.counter("calls_total", "Calls.", ("tool",)).inc(2, tool='say "hi"')
+    registry.gauge("unused", "Never set.")
+    registry.histogram("latency_seconds", "Latency.", buckets=(1.0,)).observe(0.25)
+
+    assert registry.render_prometheus() == (
+        "# HELP calls_total Calls.\n"
+        "# TYPE calls_total counter\n"
+        'calls_total{tool="say \\"hi\\""} 2\n'
+        "# HELP latency_seconds Latency.\n"
+        "# TYPE latency_seconds histogram\n"
+        'latency_seconds_bucket{le="1"} 1\n'
+        'latency_seconds_bucket{le="+Inf"} 1\n'
+        "latency_seconds_sum 0.25\n"
+        "latency_seconds_count 1\n"
+    )
@@ -1,6 +1,7 @@
 """Tests for the OAuth utilities."""
 
 import json
+import threading
 import time
 import urllib.parse
 from unittest.mock import MagicMock, patch
@@ -10,6 +11,7 @@ import requests
 from mcp_atlassian.utils.oauth import (
     KEYRING_SERVICE_NAME,
     TOKEN_EXPIRY_MARGIN,
+    TOKEN_REFRESH_COORDINATOR,
     BYOAccessTokenOAuthConfig,
     OAuthConfig,
     configure_oauth_session,
@@ -200,6 +202,8 @@ class TestOAuthConfig:
                 refresh_token="old-refresh-token",
             )
             result = config.refresh_access_token()
+            # Tokens are persisted on a background thread
+            TOKEN_REFRESH_COORDINATOR.flush(timeout=5)
 
             # Check result
             assert result is True
@@ -835,3 +839,119 @@ def test_configure_oauth_session_byo_config_no_refresh_token_direct_use(mock_log
     mock_logger.info.assert_any_call(
         "configure_oauth_session: Using provided OAuth access token directly (no refresh_token)."
     )
+
+
+class TestTokenRefreshCoordination:
+    """Tests for single-flight refresh, renewal and async persistence."""
+
+    @staticmethod
+    def _expired_config(**overrides):
+        defaults = {
+            "client_id": "test-client-id",
+            "client_secret": "test-client-secret",
+            "redirect_uri": "https://example.com/callback",
+            "scope": "read:jira-work offline_access",
+            "refresh_token": "refresh-token",
+            "access_token": "old-access-token",
+            "expires_at": time.time() - 100,
+        }
+        return OAuthConfig(**{**defaults, **overrides})
+
+    def test_concurrent_refreshes_are_single_flight(self):
+        """Concurrent callers across instances trigger exactly one refresh."""
+        configs = [self._expired_config() for _ in range(2)]
+        calls = []
+        start = threading.Barrier(8)
+
+        def fake_post(*args, **kwargs):
+            calls.append(kwargs["data"]["refresh_token"])
+            time.sleep(0.05)
+            response = MagicMock()
+            response.json.return_value = {
+                "access_token": "new-access-token",
+                "refresh_token": "rotated-refresh-token",
+                "expires_in": 3600,
+            }
+            return response
+
+        def worker(config):
+            start.wait()
+            assert config.ensure_valid_token() is True
+
+        with (
+            patch("requests.post", side_effect=fake_post),
+            patch.object(OAuthConfig, "_save_tokens"),
+        ):
+            threads = [
+                threading.Thread(target=worker, args=(configs[i % 2],))
+                for i in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert calls == ["refresh-token"]
+        for config in configs:
+            assert config.access_token == "new-access-token"
+            assert config.refresh_token == "rotated-refresh-token"
+
+    def test_refresh_persists_tokens_off_request_path(self):
+        """The refresh returns before a slow keyring write completes."""
+        config = self._expired_config()
+        saved = threading.Event()
+        release = threading.Event()
+
+        def slow_save():
+            release.wait(5)
+            saved.set()
+
+        response = MagicMock()
+        response.json.return_value = {"access_token": "new", "expires_in": 3600}
+        with (
+            patch("requests.post", return_value=response),
+            patch.object(config, "_save_tokens", side_effect=slow_save),
+        ):
+            assert config.refresh_access_token() is True
+            assert not saved.is_set()
+            release.set()
+            TOKEN_REFRESH_COORDINATOR.flush(timeout=5)
+
+        assert saved.is_set()
+
+    def test_valid_token_schedules_background_renewal(self):
+        """A valid refreshable token gets a renewal timer."""
+        config = self._expired_config(expires_at=time.time() + 3600)
+
+        assert config.ensure_valid_token() is True
+
+        assert TOKEN_REFRESH_COORDINATOR.has_renewal("test-client-id")
+
+    def test_background_renewal_refreshes_before_expiry(self):
+        """The renewal callback refreshes tokens close to expiry."""
+        config = self._expired_config(
+            expires_at=time.time() + TOKEN_EXPIRY_MARGIN + 10,
+        )
+        with patch.object(
+            OAuthConfig, "refresh_access_token", return_value=True
+        ) as mock_refresh:
+            config.renew_token_in_background()
+
+        mock_refresh.assert_called_once()
+
+    def test_background_renewal_skips_recently_renewed_token(self):
+        """Renewal is skipped when another instance already refreshed."""
+        config = self._expired_config(expires_at=time.time() + 60)
+        TOKEN_REFRESH_COORDINATOR.publish_tokens(
+            "test-client-id",
+            {
+                "access_token": "shared-token",
+                "refresh_token": "shared-refresh",
+                "expires_at": time.time() + 3600,
+            },
+        )
+        with patch.object(OAuthConfig, "refresh_access_token") as mock_refresh:
+            config.renew_token_in_background()
+
+        mock_refresh.assert_not_called()
+        assert config.access_token == "shared-token"
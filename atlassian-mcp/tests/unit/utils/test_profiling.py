@@ -0,0 +1,49 @@
+"""Tests for the sampling profiler utilities module."""
+
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from mcp_atlassian.utils import profiling
+from mcp_atlassian.utils.profiling import (
+    ProfilerBusyError,
+    format_collapsed,
+    sample_stacks,
+)
+
+
+def _busy_worker(stop):
+    while not stop.is_set():
+        time.sleep(0.001)
+
+
+def test_sample_stacks_captures_other_threads():
+    """Stacks of running threads are collapsed root first."""
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_worker, args=(stop,), name="busy-worker")
+    worker.start()
+    try:
+        stacks = sample_stacks(0.05, interval=0.005)
+    finally:
+        stop.set()
+        worker.join()
+
+    worker_stacks = [stack for stack in stacks if stack.startswith("busy-worker;")]
+    assert worker_stacks
+    assert any("_busy_worker (test_profiling.py)" in stack for stack in worker_stacks)
+
+
+def test_concurrent_profiling_is_rejected():
+    """Only one profiling run may be active at a time."""
+    with profiling._profile_lock:
+        with pytest.raises(ProfilerBusyError):
+            sample_stacks(0.01)
+
+
+def test_format_collapsed_orders_by_count():
+    """Collapsed output lists the most frequent stacks first."""
+    stacks = Counter({"main;a (x.py)": 1, "main;b (x.py)": 3})
+
+    assert format_collapsed(stacks) == "main;b (x.py) 3\nmain;a (x.py) 1\n"
@@ -0,0 +1,284 @@
+"""Tests for the rate limiting utilities module."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Request, Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.sessions import Session
+
+from mcp_atlassian.utils.metrics import REGISTRY
+from mcp_atlassian.utils.rate_limit import (
+    RATE_LIMITED_RESPONSES,
+    RETRIES,
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimitAdapter,
+    RateLimitRegistry,
+    RateLimitSettings,
+    TokenBucket,
+    configure_rate_limiting,
+    parse_retry_after,
+)
+
+
+class FakeAdapter(BaseAdapter):
+    """Adapter returning queued responses (or raising queued exceptions)."""
+
+    def __init__(self, outcomes):
+        super().__init__()
+        self.outcomes = list(outcomes)
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = Response()
+        status, headers = outcome
+        response.status_code = status
+        response.raw = io.BytesIO(b"")
+        response.headers.update(headers)
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _prepare(method="GET", data=None, auth="Bearer token"):
+    return Request(
+        method,
+        "https://test.atlassian.net/rest/api/2/myself",
+        data=data,
+        headers={"Authorization": auth},
+    ).prepare()
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    REGISTRY.reset()
+    yield
+    REGISTRY.reset()
+
+
+@pytest.fixture
+def no_sleep():
+    with patch("mcp_atlassian.utils.rate_limit.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+def _adapter(outcomes, **settings):
+    inner = FakeAdapter(outcomes)
+    adapter = RateLimitAdapter(
+        inner,
+        "test.atlassian.net",
+        RateLimitSettings(**settings),
+        registry=RateLimitRegistry(),
+    )
+    return adapter, inner
+
+
+def test_parse_retry_after_seconds_and_dates():
+    """Retry-After accepts delta-seconds and HTTP dates."""
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_token_bucket_paces_after_burst():
+    """Requests beyond the burst capacity must wait for refill."""
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_token_bucket_unlimited_only_honors_pause():
+    """Without a configured rate only server-requested pauses apply."""
+    bucket = TokenBucket(rate=None, capacity=1)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    bucket.pause(2)
+    assert bucket.reserve() == pytest.approx(2, abs=0.05)
+
+
+def test_token_bucket_backs_off_and_recovers():
+    """Throttling halves the rate, successes restore it gradually."""
+    bucket = TokenBucket(rate=10, capacity=5)
+    bucket.pause(0)
+    assert bucket.rate == 5
+    for _ in range(10):
+        bucket.recover()
+    assert bucket.rate == 10
+
+
+def test_retries_429_honoring_retry_after(no_sleep):
+    """A 429 is retried after the advertised delay and counted."""
+    adapter, inner = _adapter([(429, {"Retry-After": "1"}), (200, {})])
+
+    response = adapter.send(_prepare())
+
+    assert response.status_code == 200
+    assert len(inner.sent) == 2
+    assert RATE_LIMITED_RESPONSES.value(site="test.atlassian.net") == 1
+    assert RETRIES.value(site="test.atlassian.net", reason="429") == 1
+    # The wait happens through the paused bucket before the retry
+    assert no_sleep.call_args_list[-1].args[0] == pytest.approx(1, abs=0.05)
+
+
+def test_retries_429_for_non_idempotent_methods(no_sleep):
+    """Atlassian does not process throttled requests, so POST is retried."""
+    adapter, inner = _adapter([(429, {"Retry-After": "0"}), (201, {})])
+
+    response = adapter.send(_prepare("POST", data=b'{"a": 1}'))
+
+    assert response.status_code == 201
+    assert len(inner.sent) == 2
+
+
+def test_does_not_retry_post_on_server_error(no_sleep):
+    """Non-idempotent requests are never replayed after a 5xx."""
+    adapter, inner = _adapter([(503, {}), (200, {})])
+
+    response = adapter.send(_prepare("POST", data=b"{}"))
+
+    assert response.status_code == 503
+    assert len(inner.sent) == 1
+
+
+def test_retries_get_on_server_error_with_backoff(no_sleep):
+    """Idempotent requests are retried with jittered exponential backoff."""
+    adapter, inner = _adapter(
+        [(503, {}), (502, {}), (200, {})], backoff_base=0.5, backoff_max=10
+    )
+
+    response = adapter.send(_prepare())
+
+    assert response.status_code == 200
+    assert len(inner.sent) == 3
+    delays = [call.args[0] for call in no_sleep.call_args_list]
+    assert all(0 <= delay <= 10 for delay in delays)
+
+
+def test_gives_up_after_max_retries(no_sleep):
+    """The last response is returned once retries are exhausted."""
+    adapter, inner = _adapter([(429, {"Retry-After": "0"})] * 3, max_retries=2)
+
+    response = adapter.send(_prepare())
+
+    assert response.status_code == 429
+    assert len(inner.sent) == 3
+
+
+def test_retry_after_longer_than_backoff_max_is_returned(no_sleep):
+    """Very long Retry-After values are surfaced instead of blocking."""
+    adapter, inner = _adapter([(429, {"Retry-After": "600"})], backoff_max=30)
+
+    response = adapter.send(_prepare())
+
+    assert response.status_code == 429
+    assert len(inner.sent) == 1
+
+
+def test_connection_errors_are_retried_for_get(no_sleep):
+    """Transient connection errors are retried for idempotent methods."""
+    adapter, inner = _adapter([RequestsConnectionError("reset"), (200, {})])
+
+    response = adapter.send(_prepare())
+
+    assert response.status_code == 200
+    assert RETRIES.value(site="test.atlassian.net", reason="connection") == 1
+
+
+def test_circuit_breaker_opens_and_fails_fast(no_sleep):
+    """A site failing repeatedly is short-circuited."""
+    adapter, inner = _adapter(
+        [(500, {})] * 3, max_retries=0, circuit_failure_threshold=3
+    )
+
+    for _ in range(3):
+        assert adapter.send(_prepare()).status_code == 500
+
+    with pytest.raises(CircuitOpenError):
+        adapter.send(_prepare())
+    assert len(inner.sent) == 3
+
+
+def test_circuit_breaker_half_open_probe():
+    """After the reset timeout a single probe decides the circuit state."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    assert breaker.record_failure() is True
+    assert breaker.state == "open"
+
+    assert breaker.allow_request() is True
+    assert breaker.state == "half-open"
+    assert breaker.allow_request() is False
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_buckets_are_scoped_per_credential():
+    """Different credentials for the same site get independent buckets."""
+    registry = RateLimitRegistry()
+    settings = RateLimitSettings(requests_per_second=1, burst=1)
+    first = registry.bucket("site", "user-a", settings)
+    assert registry.bucket("site", "user-a", settings) is first
+    assert registry.bucket("site", "user-b", settings) is not first
+
+
+def test_configure_rate_limiting_wraps_existing_adapter():
+    """The adapter wraps the one already mounted for the site."""
+    session = Session()
+    configure_rate_limiting(
+        "Jira", "https://test.atlassian.net", session, RateLimitSettings()
+    )
+
+    adapter = session.get_adapter("https://test.atlassian.net/rest/api/2/myself")
+    assert isinstance(adapter, RateLimitAdapter)
+    assert isinstance(adapter.inner, HTTPAdapter)
+
+    # Configuring twice does not nest adapters
+    configure_rate_limiting(
+        "Jira", "https://test.atlassian.net", session, RateLimitSettings()
+    )
+    adapter = session.get_adapter("https://test.atlassian.net/rest/api/2/myself")
+    assert isinstance(adapter.inner, HTTPAdapter)
+
+
+def test_configure_rate_limiting_keys_oauth_gateway_by_tenant():
+    """Each OAuth tenant and product gets its own adapter and circuit breaker."""
+    session = Session()
+    gateway = "https://api.atlassian.com/ex"
+    for url in (
+        f"{gateway}/jira/cloud-a",
+        f"{gateway}/jira/cloud-b",
+        f"{gateway}/confluence/cloud-a",
+    ):
+        configure_rate_limiting("Jira", url, session, RateLimitSettings())
+
+    sites = {
+        session.get_adapter(f"{gateway}/{path}/rest/api/3/myself").site
+        for path in ("jira/cloud-a", "jira/cloud-b", "confluence/cloud-a")
+    }
+
+    assert sites == {
+        "api.atlassian.com/ex/jira/cloud-a",
+        "api.atlassian.com/ex/jira/cloud-b",
+        "api.atlassian.com/ex/confluence/cloud-a",
+    }
+    assert isinstance(
+        session.get_adapter(f"{gateway}/jira/cloud-a/x").inner, HTTPAdapter
+    )
+
+
+def test_configure_rate_limiting_without_url():
+    """Nothing is mounted when the URL is missing."""
+    session = MagicMock()
+    configure_rate_limiting("Jira", "", session, RateLimitSettings())
+    session.mount.assert_not_called()
@@ -0,0 +1,69 @@
+"""Tests for the tracing utilities module."""
+
+from mcp_atlassian.models.jira import JiraIssue
+from mcp_atlassian.utils.concurrency import map_concurrently
+from mcp_atlassian.utils.tracing import (
+    PARSE_SPAN,
+    SERIALIZE_SPAN,
+    current_trace,
+    record_span,
+    span,
+    trace_call,
+    traced,
+)
+from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE
+
+
+def test_spans_are_noops_without_a_trace():
+    """Nothing is recorded outside of a traced call."""
+    with span("http"):
+        record_span("http", 1.0)
+
+    assert current_trace() is None
+
+
+def test_spans_are_grouped_by_name():
+    """Span counts and durations are summed per name."""
+    with trace_call("jira_get_issue") as trace:
+        record_span("http", 0.25)
+        record_span("http", 0.5)
+        with span("preprocess"):
+            pass
+
+    summary = trace.summary()
+    assert summary["name"] == "jira_get_issue"
+    assert summary["spans"]["http"] == {"count": 2, "ms": 750.0}
+    assert summary["spans"]["preprocess"]["count"] == 1
+    assert summary["total_ms"] >= 0
+    assert current_trace() is None
+
+
+def test_nested_spans_of_the_same_name_count_once():
+    """Recursive or nested calls of a traced function are timed once."""
+
+    @traced("parse")
+    def parse(depth):
+        return parse(depth - 1) if depth else None
+
+    with trace_call("tool") as trace:
+        parse(3)
+
+    assert trace.summary()["spans"]["parse"]["count"] == 1
+
+
+def test_trace_follows_calls_into_worker_threads():
+    """Spans recorded on pool threads land in the submitting call's trace."""
+    with trace_call("tool") as trace:
+        map_concurrently(lambda _: record_span("http", 0.001), range(4), 4)
+
+    assert trace.summary()["spans"]["http"]["count"] == 4
+
+
+def test_model_parsing_and_serialization_are_traced():
+    """API models record parse and serialize spans automatically."""
+    with trace_call("tool") as trace:
+        JiraIssue.from_api_response(MOCK_JIRA_ISSUE_RESPONSE).to_simplified_dict()
+
+    spans = trace.summary()["spans"]
+    assert spans[PARSE_SPAN]["count"] == 1
+    assert spans[SERIALIZE_SPAN]["count"] == 1
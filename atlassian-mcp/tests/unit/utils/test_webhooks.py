@@ -0,0 +1,238 @@
+"""Tests for webhook-driven cache invalidation."""
+
+import hashlib
+import hmac
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from mcp_atlassian.jira.mirror import get_issue_mirror
+from mcp_atlassian.servers.main import main_mcp
+from mcp_atlassian.utils.cache import (
+    JIRA_FIELDS_TAG,
+    JIRA_PROJECTS_TAG,
+    confluence_page_tag,
+    confluence_page_version_tag,
+    confluence_space_tag,
+    get_cache,
+    jira_issue_tag,
+    jira_project_tag,
+)
+from mcp_atlassian.utils.metrics import REGISTRY
+from mcp_atlassian.utils.webhooks import (
+    WEBHOOK_EVENTS,
+    confluence_event_tags,
+    jira_event_tags,
+    jira_removed_issue_keys,
+    verify_webhook_signature,
+)
+from tests.fixtures import webhook_payloads as payloads
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    REGISTRY.reset()
+    yield
+    REGISTRY.reset()
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        (
+            payloads.JIRA_ISSUE_UPDATED,
+            {
+                jira_issue_tag("PROJ-123"),
+                jira_issue_tag("12345"),
+                jira_project_tag("PROJ"),
+            },
+        ),
+        (
+            payloads.JIRA_ISSUE_DELETED,
+            {
+                jira_issue_tag("PROJ-124"),
+                jira_issue_tag("12346"),
+                jira_project_tag("PROJ"),
+            },
+        ),
+        (
+            payloads.JIRA_COMMENT_CREATED,
+            {
+                jira_issue_tag("PROJ-123"),
+                jira_issue_tag("12345"),
+                jira_project_tag("PROJ"),
+            },
+        ),
+        (
+            payloads.JIRA_PROJECT_UPDATED,
+            {JIRA_PROJECTS_TAG, jira_project_tag("PROJ"), jira_project_tag("10000")},
+        ),
+        (payloads.JIRA_VERSION_RELEASED, {jira_project_tag("10000")}),
+        (payloads.JIRA_FIELD_CREATED, {JIRA_FIELDS_TAG}),
+        (payloads.JIRA_UNRELATED_EVENT, set()),
+    ],
+)
+def test_jira_event_tags(payload, expected):
+    """Jira events map to the tags of the data they change."""
+    event, tags = jira_event_tags(payload)
+    assert event == payload["webhookEvent"]
+    assert tags == expected
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        (payloads.JIRA_ISSUE_DELETED, ["PROJ-124"]),
+        (payloads.JIRA_ISSUE_MOVED, ["PROJ-125"]),
+        (payloads.JIRA_ISSUE_UPDATED, []),
+        (payloads.JIRA_COMMENT_CREATED, []),
+    ],
+)
+def test_jira_removed_issue_keys(payload, expected):
+    """Deletes and moves report the key that no longer exists."""
+    assert jira_removed_issue_keys(payload) == expected
+
+
+def test_confluence_event_tags():
+    """Page updates touch the page; removals also touch the space listing."""
+    assert confluence_event_tags(payloads.CONFLUENCE_PAGE_UPDATED) == (
+        "page_updated",
+        {confluence_page_tag("987654321"), confluence_page_version_tag("987654321")},
+    )
+    assert confluence_event_tags(payloads.CONFLUENCE_PAGE_REMOVED) == (
+        "page_removed",
+        {
+            confluence_page_tag("987654322"),
+            confluence_page_version_tag("987654322"),
+            confluence_space_tag("PROJ"),
+        },
+    )
+
+
+def test_verify_webhook_signature():
+    """Signatures are checked with HMAC-SHA256."""
+    body = b'{"webhookEvent": "jira:issue_updated"}'
+    digest = hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+
+    assert verify_webhook_signature("secret", body, f"sha256={digest}")
+    assert not verify_webhook_signature("other", body, f"sha256={digest}")
+    assert not verify_webhook_signature("secret", body, None)
+    assert not verify_webhook_signature("secret", body, f"md5={digest}")
+
+
+async def _post(path, payload, headers=None):
+    transport = httpx.ASGITransport(app=main_mcp.streamable_http_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post(path, content=payload, headers=headers or {})
+
+
+@pytest.mark.anyio
+async def test_replayed_jira_webhook_invalidates_matching_entries():
+    """Replaying an issue update drops that issue's entries only."""
+    cache = get_cache("webhook-test", maxsize=10, ttl=60)
+    cache.set("issue", {"key": "PROJ-123"}, tags=[jira_issue_tag("PROJ-123")])
+    cache.set("other", {"key": "OTHER-1"}, tags=[jira_issue_tag("OTHER-1")])
+
+    response = await _post(
+        "/webhooks/jira", json.dumps(payloads.JIRA_ISSUE_UPDATED).encode()
+    )
+
+    assert response.status_code == 200
+    assert response.json()["invalidated"] == 1
+    assert cache.get("issue") is None
+    assert cache.get("other") == {"key": "OTHER-1"}
+    assert (
+        WEBHOOK_EVENTS.value(
+            product="jira", event="jira:issue_updated", outcome="invalidated"
+        )
+        == 1
+    )
+
+
+def _mirror_with_issue(url):
+    config = MagicMock(
+        url=url,
+        mirror_projects="PROJ",
+        mirror_path=None,
+        mirror_sync_interval=60,
+        mirror_max_lag=600,
+    )
+    mirror = get_issue_mirror(config)
+    issue = {"id": "12346", "key": "PROJ-124", "fields": {"project": {"key": "PROJ"}}}
+    mirror.sync(lambda jql: [issue])
+    return mirror
+
+
+def _signed(body, secret="secret"):
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return {"X-Hub-Signature": f"sha256={digest}"}
+
+
+@pytest.mark.anyio
+async def test_jira_delete_webhook_removes_issue_from_site_mirror(monkeypatch):
+    """Signed deletes drop the issue from the mirror of the sending site only."""
+    monkeypatch.setenv("MCP_WEBHOOK_SECRET", "secret")
+    mirror = _mirror_with_issue("https://example.atlassian.net")
+    other_site = _mirror_with_issue("https://other.atlassian.net")
+    body = json.dumps(payloads.JIRA_ISSUE_DELETED).encode()
+
+    response = await _post("/webhooks/jira", body, headers=_signed(body))
+
+    assert response.json()["mirror_removed"] == ["PROJ-124"]
+    assert mirror.search("project = PROJ") == ([], 0)
+    assert other_site.search("project = PROJ")[1] == 1
+
+
+@pytest.mark.anyio
+async def test_unsigned_delete_webhook_keeps_mirror(monkeypatch):
+    """Without a secret, webhooks cannot delete mirrored issues."""
+    monkeypatch.delenv("MCP_WEBHOOK_SECRET", raising=False)
+    mirror = _mirror_with_issue("https://example.atlassian.net")
+
+    response = await _post(
+        "/webhooks/jira", json.dumps(payloads.JIRA_ISSUE_DELETED).encode()
+    )
+
+    assert response.status_code == 200
+    assert "mirror_removed" not in response.json()
+    assert mirror.search("project = PROJ")[1] == 1
+
+
+@pytest.mark.anyio
+async def test_replayed_confluence_webhook_invalidates_page():
+    """Replaying a page update drops the cached page."""
+    cache = get_cache("webhook-test", maxsize=10, ttl=60)
+    cache.set("page", "content", tags=[confluence_page_tag("987654321")])
+
+    response = await _post(
+        "/webhooks/confluence",
+        json.dumps(payloads.CONFLUENCE_PAGE_UPDATED).encode(),
+    )
+
+    assert response.status_code == 200
+    assert cache.get("page") is None
+
+
+@pytest.mark.anyio
+async def test_webhook_rejects_bad_signature(monkeypatch):
+    """With a secret configured, unsigned webhooks are rejected."""
+    monkeypatch.setenv("MCP_WEBHOOK_SECRET", "secret")
+    body = json.dumps(payloads.JIRA_ISSUE_UPDATED).encode()
+
+    response = await _post("/webhooks/jira", body)
+    assert response.status_code == 401
+
+    digest = hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+    response = await _post(
+        "/webhooks/jira", body, headers={"X-Hub-Signature": f"sha256={digest}"}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_webhook_rejects_invalid_requests():
+    """Unknown products and malformed bodies are rejected."""
+    assert (await _post("/webhooks/bitbucket", b"{}")).status_code == 404
+    assert (await _post("/webhooks/jira", b"not json")).status_code == 400